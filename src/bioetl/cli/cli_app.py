@@ -76,8 +76,10 @@ def create_app(
     for command_name, build_config_func in registry.items():
         try:
             command_config = build_config_func()
+            # Путь к классу вместо самого класса: модуль пайплайна импортируется при запуске.
+            pipeline_ref = getattr(command_config, "pipeline_path", None)
             command_func = create_pipeline_command(
-                pipeline_class=command_config.pipeline_class,
+                pipeline_class=pipeline_ref or command_config.pipeline_class,
                 command_config=command_config,
             )
             app.command(name=command_name)(command_func)
@@ -98,7 +100,11 @@ def create_app(
     for tool_name, tool_config in tools.items():
         try:
             entrypoint = _load_tool_entrypoint(tool_config)
-            app.command(name=tool_name)(entrypoint)
+            if isinstance(entrypoint, typer.Typer):
+                # Typer-приложение с подкомандами подключается как группа.
+                cast(Any, app).add_typer(entrypoint, name=tool_name)
+            else:
+                app.command(name=tool_name)(entrypoint)
         except Exception as exc:  # noqa: BLE001
             _log.error(
                 LogEvents.CLI_COMMAND_REGISTRATION_FAILED,
@@ -7,24 +7,22 @@ import uuid
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any, NoReturn, Protocol, cast
+from typing import TYPE_CHECKING, Any, NoReturn, Protocol, cast
 from zoneinfo import ZoneInfo
 
 import typer
 from typer.models import OptionInfo
 
+from bioetl.cli.common import pipeline_logger_config
 from bioetl.config.environment import apply_runtime_overrides, load_environment_settings
 from bioetl.config.loader import load_config
 from bioetl.core.cli_base import CliCommandBase
 from bioetl.core.log_events import LogEvents
-from bioetl.core.logger import LoggerConfig, UnifiedLogger
-from bioetl.pipelines.base import PipelineBase
-from bioetl.pipelines.errors import (
-    PipelineError,
-    PipelineHTTPError,
-    PipelineNetworkError,
-    PipelineTimeoutError,
-)
+from bioetl.core.logger import UnifiedLogger
+
+if TYPE_CHECKING:
+    # Модули пайплайнов (pandas, pandera, HTTP-клиенты) импортируются только при запуске команды.
+    from bioetl.pipelines.base import PipelineBase
 
 __all__ = ["create_pipeline_command", "CommonOptions"]
 
@@ -58,6 +56,7 @@ class CommonOptions:
         fail_on_schema_drift: bool = True,
         validate_columns: bool = True,
         golden: Path | None = None,
+        profile: bool = False,
     ) -> None:
         """Capture shared pipeline CLI options in a normalized container."""
         self.config = config
@@ -71,6 +70,7 @@ class CommonOptions:
         self.fail_on_schema_drift = fail_on_schema_drift
         self.validate_columns = validate_columns
         self.golden = golden
+        self.profile = profile
 
 
 class PipelineCliCommand(CliCommandBase):
@@ -105,6 +105,7 @@ class PipelineCliCommand(CliCommandBase):
         validate_columns: bool,
         golden: Path | None,
         input_file: Path | None,
+        profile: bool = False,
     ) -> None:
         """Execute the pipeline workflow with normalized options."""
         dry_run = cast(bool, _coerce_option_value(dry_run))
@@ -117,6 +118,7 @@ class PipelineCliCommand(CliCommandBase):
         validate_columns = cast(bool, _coerce_option_value(validate_columns))
         golden = cast(Path | None, _coerce_option_value(golden))
         input_file = cast(Path | None, _coerce_option_value(input_file))
+        profile = cast(bool, _coerce_option_value(profile))
 
         if limit is not None and sample is not None:
             raise typer.BadParameter("--limit and --sample are mutually exclusive")
@@ -163,6 +165,7 @@ class PipelineCliCommand(CliCommandBase):
         if input_file is not None:
             pipeline_config.cli.input_file = str(input_file)
         pipeline_config.cli.verbose = verbose
+        pipeline_config.cli.profiling = profile
         pipeline_config.cli.fail_on_schema_drift = fail_on_schema_drift
         pipeline_config.cli.validate_columns = validate_columns
         if not validate_columns:
@@ -171,7 +174,9 @@ class PipelineCliCommand(CliCommandBase):
         pipeline_config.materialization.root = str(output_dir)
 
         log_level = "DEBUG" if verbose else "INFO"
-        UnifiedLogger.configure(LoggerConfig(level=log_level))
+        UnifiedLogger.configure(
+            pipeline_logger_config(getattr(pipeline_config, "logging", None), level=log_level)
+        )
 
         if dry_run:
             typer.echo("Configuration validated successfully (dry-run mode)")
@@ -286,13 +291,20 @@ def _validate_output_dir(output_dir: Path) -> None:
 
 
 def create_pipeline_command(
-    pipeline_class: type[PipelineBase],
+    pipeline_class: type[PipelineBase] | str,
     command_config: Any,  # CommandConfig from registry
 ) -> Callable[..., None]:
-    """Create a Typer command function for a pipeline."""
+    """Create a Typer command function for a pipeline.
 
-    pipeline_module_name = pipeline_class.__module__
-    pipeline_class_name = pipeline_class.__name__
+    ``pipeline_class`` may be the class itself or its dotted import path; in
+    both cases the class is resolved only when the command runs.
+    """
+
+    if isinstance(pipeline_class, str):
+        pipeline_module_name, _, pipeline_class_name = pipeline_class.rpartition(".")
+    else:
+        pipeline_module_name = pipeline_class.__module__
+        pipeline_class_name = pipeline_class.__name__
 
     def command(
         config: Path = typer.Option(
@@ -366,6 +378,11 @@ def create_pipeline_command(
             help="Optional path to input file (CSV/Parquet) containing IDs for batch extraction",
             exists=False,
         ),
+        profile: bool = typer.Option(
+            False,
+            "--profile",
+            help="Profile each stage and write pstats, collapsed stacks and peak memory next to meta.yaml",
+        ),
     ) -> None:
         """Execute the pipeline command."""
         runner = PipelineCliCommand(
@@ -386,6 +403,7 @@ def create_pipeline_command(
             validate_columns=validate_columns,
             golden=golden,
             input_file=input_file,
+            profile=profile,
         )
 
     # Set command metadata
@@ -402,6 +420,8 @@ def _resolve_pipeline_class(
     command_name: str,
 ) -> type[PipelineBase]:
     """Resolve pipeline class lazily to decouple CLI from pipeline modules."""
+    from bioetl.pipelines.base import PipelineBase
+
     try:
         pipeline_module = importlib.import_module(module_name)
         pipeline_cls = getattr(pipeline_module, class_name)
@@ -448,6 +468,12 @@ def _handle_pipeline_exception(
     command_name: str,
 ) -> None:
     """Map runtime exceptions to deterministic exit codes and logs."""
+    from bioetl.pipelines.errors import (
+        PipelineError,
+        PipelineHTTPError,
+        PipelineNetworkError,
+        PipelineTimeoutError,
+    )
 
     if _is_requests_api_error(exc):
         _emit_external_api_failure(
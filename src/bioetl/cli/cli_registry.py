@@ -2,18 +2,20 @@
 
 This module defines the static registry of all available pipeline commands.
 Adding a new pipeline requires explicitly adding its configuration to this registry.
+Pipeline classes are referenced by dotted path and imported on first use, so
+building the registry (``bioetl --help``, ``bioetl list``) does not import any
+pipeline module.
 """
 
 from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cached_property
 from importlib import import_module
 from pathlib import Path
 from typing import Any
 
-from bioetl.pipelines.base import PipelineBase
-
 __all__ = ["CommandConfig", "ToolCommandConfig", "COMMAND_REGISTRY", "TOOL_COMMANDS"]
 
 
@@ -23,9 +25,14 @@ class CommandConfig:
 
     name: str
     description: str
-    pipeline_class: type[Any]
+    pipeline_path: str
     default_config_path: Path | None = None
 
+    @cached_property
+    def pipeline_class(self) -> type[Any]:
+        """Import and return the pipeline class referenced by ``pipeline_path``."""
+        return _load_pipeline_class(self.pipeline_path)
+
 
 @dataclass(frozen=True)
 class ToolCommandConfig:
@@ -135,19 +142,20 @@ def _build_config(
     pipeline_path: str,
     default_config: str | None,
 ) -> CommandConfig:
-    """Resolve the pipeline class and construct a command configuration."""
-    pipeline_class = _load_pipeline_class(pipeline_path)
+    """Construct a command configuration without importing the pipeline module."""
     default_path = Path(default_config) if default_config is not None else None
     return CommandConfig(
         name=command_name,
         description=description,
-        pipeline_class=pipeline_class,
+        pipeline_path=pipeline_path,
         default_config_path=default_path,
     )
 
 
 def _load_pipeline_class(path: str) -> type[Any]:
     """Import and return the pipeline class referenced by the dotted path."""
+    from bioetl.pipelines.base import PipelineBase
+
     module_path, class_name = path.rsplit(".", 1)
     module = import_module(module_path)
     pipeline_cls = getattr(module, class_name)
@@ -186,4 +194,9 @@ TOOL_COMMANDS: dict[str, ToolCommandConfig] = {
         module="bioetl.cli.tools.qc_boundary_check",
         attribute="main",
     ),
+    "cache": ToolCommandConfig(
+        name="bioetl-cache",
+        description="Prefill the release-scoped ChEMBL lookup store shared by pipelines.",
+        module="bioetl.cli.tools.cache",
+    ),
 }
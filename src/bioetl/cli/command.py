@@ -12,12 +12,13 @@ from zoneinfo import ZoneInfo
 
 import typer
 
+from bioetl.cli.common import pipeline_logger_config
 from bioetl.config import (
     apply_runtime_overrides,
     read_environment_settings,
     read_pipeline_config,
 )
-from bioetl.core.logger import LoggerConfig, UnifiedLogger
+from bioetl.core.logger import UnifiedLogger
 from bioetl.pipelines.base import PipelineBase
 
 __all__ = ["create_pipeline_command", "CommonOptions"]
@@ -40,6 +41,7 @@ class CommonOptions:
         fail_on_schema_drift: bool = True,
         validate_columns: bool = True,
         golden: Path | None = None,
+        profile: bool = False,
     ) -> None:
         self.config = config
         self.output_dir = output_dir
@@ -52,6 +54,7 @@ class CommonOptions:
         self.fail_on_schema_drift = fail_on_schema_drift
         self.validate_columns = validate_columns
         self.golden = golden
+        self.profile = profile
 
 
 def _parse_set_overrides(set_overrides: list[str]) -> dict[str, Any]:
@@ -103,6 +106,7 @@ def _update_pipeline_config_from_cli(
     fail_on_schema_drift: bool,
     validate_columns: bool,
     output_dir: Path,
+    profile: bool = False,
 ) -> None:
     """Apply CLI flag values to the mutable pipeline configuration."""
 
@@ -119,6 +123,7 @@ def _update_pipeline_config_from_cli(
         pipeline_config.cli.input_file = str(input_file)
 
     pipeline_config.cli.verbose = verbose
+    pipeline_config.cli.profiling = profile
     pipeline_config.cli.fail_on_schema_drift = fail_on_schema_drift
     pipeline_config.cli.validate_columns = validate_columns
     if not validate_columns:
@@ -227,6 +232,11 @@ def create_pipeline_command(
             help="Optional path to input file (CSV/Parquet) containing IDs for batch extraction",
             exists=False,
         ),
+        profile: bool = typer.Option(
+            False,
+            "--profile",
+            help="Profile each stage and write pstats, collapsed stacks and peak memory next to meta.yaml",
+        ),
     ) -> None:
         """Execute the pipeline command."""
         if limit is not None and sample is not None:
@@ -278,11 +288,14 @@ def create_pipeline_command(
             fail_on_schema_drift=fail_on_schema_drift,
             validate_columns=validate_columns,
             output_dir=output_dir,
+            profile=profile,
         )
 
         # Configure logging
         log_level = "DEBUG" if verbose else "INFO"
-        UnifiedLogger.configure(LoggerConfig(level=log_level))
+        UnifiedLogger.configure(
+            pipeline_logger_config(getattr(pipeline_config, "logging", None), level=log_level)
+        )
 
         if dry_run:
             typer.echo("Configuration validated successfully (dry-run mode)")
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 import typer
 
-from bioetl.core.logger import LoggerConfig, UnifiedLogger
+from bioetl.core.logger import LoggerConfig, LogSamplingRule, UnifiedLogger
 
-__all__ = ["run"]
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from bioetl.config.models.models import LoggingConfig
+
+__all__ = ["pipeline_logger_config", "run"]
 
 _DEFAULT_LOG_LEVEL: Final[str] = "INFO"
 _INTERRUPTED_EXIT_CODE: Final[int] = 130
@@ -32,6 +35,28 @@ def _ensure_logging() -> None:
     )
 
 
+def pipeline_logger_config(settings: LoggingConfig | None, *, level: str) -> LoggerConfig:
+    """Собрать ``LoggerConfig`` из секции ``logging`` конфигурации пайплайна.
+
+    Уровень задаётся CLI (``--verbose``); сэмплирование, порог call-site полей
+    и асинхронный приёмник берутся из ``settings``.
+    """
+
+    if settings is None:
+        return LoggerConfig(level=level)
+    return LoggerConfig(
+        level=level,
+        callsite_level=settings.callsite_level,
+        sampling={
+            name: LogSamplingRule(rate=rule.rate, max_per_second=rule.max_per_second)
+            for name, rule in settings.sampling.items()
+        },
+        async_sink=settings.async_sink,
+        queue_size=settings.queue_size,
+        batch_size=settings.batch_size,
+    )
+
+
 def run(fn: Callable[[], int | None], *, setup_logging: bool = True) -> int:
     """Выполнить CLI-функцию с унифицированной обработкой исключений.
 
@@ -87,5 +112,6 @@ def run(fn: Callable[[], int | None], *, setup_logging: bool = True) -> int:
         return _RUNTIME_ERROR_EXIT_CODE
 
     finally:
+        UnifiedLogger.flush()
         UnifiedLogger.reset()
 
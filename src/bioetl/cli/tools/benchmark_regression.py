@@ -0,0 +1,72 @@
+"""CLI для проверки регрессий производительности по бенчмаркам."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from bioetl.cli.tools import create_app, run_app
+from bioetl.tools.benchmark_regression import (
+    BENCHMARK_BASELINE_PATH,
+    check_benchmark_regressions,
+)
+
+app = create_app(
+    name="bioetl-benchmark-regression",
+    help_text="Запуск бенчмарков стадий пайплайнов и сравнение с JSON baseline",
+)
+
+
+@app.command()
+def main(
+    baseline: Path = typer.Option(BENCHMARK_BASELINE_PATH, help="Путь к JSON baseline"),
+    threshold: float = typer.Option(
+        0.2, min=0.0, help="Допустимое относительное замедление (0.2 = 20%)"
+    ),
+    stat: str = typer.Option("median", help="Статистика для сравнения: median, mean, min"),
+    rows: str | None = typer.Option(
+        None, help="Размеры датасетов, например 10k,100k,1M (BIOETL_BENCHMARK_ROWS)"
+    ),
+    results: Path | None = typer.Option(
+        None, help="Готовый JSON pytest-benchmark вместо нового запуска"
+    ),
+    save_baseline: bool = typer.Option(
+        False, "--save-baseline", help="Сохранить текущие результаты как baseline"
+    ),
+) -> None:
+    """Сравнить результаты бенчмарков с baseline."""
+
+    try:
+        report = check_benchmark_regressions(
+            baseline_path=baseline,
+            threshold=threshold,
+            stat=stat,
+            rows=rows,
+            results_path=results,
+            save_baseline=save_baseline,
+        )
+    except (RuntimeError, KeyError, ValueError, OSError) as exc:
+        typer.secho(str(exc), err=True, fg=typer.colors.RED)
+        raise typer.Exit(code=1) from exc
+
+    for name in report.new_benchmarks:
+        typer.echo(f"Новый бенчмарк без baseline: {name}")
+    if report.baseline_saved:
+        typer.echo(f"Baseline сохранён: {baseline}")
+    if report.regressions:
+        for item in report.regressions:
+            typer.secho(
+                f"{item.name}: {item.baseline:.6f}s -> {item.current:.6f}s (x{item.ratio:.2f})",
+                fg=typer.colors.RED,
+            )
+        typer.secho(
+            f"Обнаружены регрессии: {len(report.regressions)} (порог {threshold:.0%})",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(code=1)
+    typer.echo(f"Регрессий не обнаружено: проверено {len(report.comparisons)} бенчмарков")
+
+
+def run() -> None:
+    run_app(app)
@@ -0,0 +1,79 @@
+"""CLI command group ``bioetl cache`` for the shared ChEMBL lookup store."""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+from typing import Any, cast
+
+from bioetl.cli.tools._typer import TyperApp, create_app, run_app
+
+typer = cast(Any, importlib.import_module("typer"))
+
+__all__ = ["app", "run", "warm"]
+
+_DEFAULT_CONFIG = Path("configs/pipelines/activity/activity_chembl.yaml")
+
+app: TyperApp = create_app(
+    name="cache",
+    help_text="Manage the release-scoped ChEMBL lookup store shared by pipelines.",
+)
+
+
+@app.command()
+def warm(
+    release: str = typer.Option(
+        ..., "--release", help="ChEMBL release to fill, e.g. ChEMBL_34."
+    ),
+    config: Path = typer.Option(
+        _DEFAULT_CONFIG,
+        "--config",
+        help="Pipeline config providing paths.cache_root and the chembl source.",
+    ),
+    entity: list[str] = typer.Option(
+        [],
+        "--entity",
+        help="Lookup to fill (repeatable); all warmable lookups by default.",
+    ),
+) -> None:
+    """Prefill ``<paths.cache_root>/<release>/lookups.sqlite`` from the ChEMBL API."""
+
+    # Тяжёлые модули импортируются только при запуске команды.
+    from bioetl.clients.client_chembl_common import ChemblClient
+    from bioetl.config.loader import read_pipeline_config
+    from bioetl.core.client_factory import APIClientFactory
+    from bioetl.core.lookup_store import LookupStore
+    from bioetl.tools.warm_lookup_store import LookupWarmError, warm_lookup_store
+
+    pipeline_config = read_pipeline_config(config, include_default_profiles=True)
+    source = pipeline_config.sources.get("chembl")
+    parameters = dict(getattr(source, "parameters", None) or {})
+    base_url = str(parameters.get("base_url") or "https://www.ebi.ac.uk/chembl/api/data")
+    http_client = APIClientFactory(pipeline_config).for_source(
+        "chembl", base_url=base_url.rstrip("/")
+    )
+    try:
+        with LookupStore(pipeline_config.paths.cache_root) as store:
+            written = warm_lookup_store(
+                ChemblClient(http_client), store, release=release, entities=entity or None
+            )
+            target = store.path_for(release)
+    except LookupWarmError as exc:
+        typer.secho(str(exc), err=True, fg=typer.colors.RED)
+        raise typer.Exit(code=1) from exc
+    finally:
+        http_client.close()
+
+    for name, count in written.items():
+        typer.echo(f"{name}: {count} records")
+    typer.echo(f"Lookup store written to {target}")
+
+
+def run() -> None:
+    """Execute the Typer application."""
+
+    run_app(app)
+
+
+if __name__ == "__main__":
+    run()
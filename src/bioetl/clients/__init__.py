@@ -1,38 +1,16 @@
-"""HTTP clients for specific upstream APIs."""
+"""HTTP clients for specific upstream APIs.
+
+Public names are resolved lazily on first access so that importing a single
+submodule (for example :mod:`bioetl.clients.client_chembl_base` from
+``bioetl cache warm``) does not load every entity client.
+"""
+
+from __future__ import annotations
 
 import importlib.util
+from importlib import import_module
 from pathlib import Path
-
-from .activity.chembl_activity import ChemblActivityClient
-from .assay.chembl_assay import ChemblAssayClient
-from .assay.chembl_assay_entity import ChemblAssayEntityClient
-from .chembl_base import ChemblEntityFetcher, EntityConfig
-from .chembl_entities import (
-    ChemblAssayClassificationEntityClient,
-    ChemblAssayClassMapEntityClient,
-    ChemblAssayParametersEntityClient,
-    ChemblCompoundRecordEntityClient,
-    ChemblDataValidityEntityClient,
-    ChemblMoleculeEntityClient,
-)
-from .chembl_iterator import ChemblEntityIterator
-from .types import EntityClient
-from .document.chembl_document import ChemblDocumentClient
-from .document.chembl_document_entity import ChemblDocumentTermEntityClient
-from .target.chembl_target import ChemblTargetClient
-from .testitem.chembl_testitem import ChemblTestitemClient
-
-# Импорт ChemblClient из модуля chembl.py (не из пакета chembl/)
-# Используем importlib для импорта из файла напрямую, чтобы избежать циклических зависимостей
-# Это должно быть после обычных импортов, поэтому используем noqa для подавления предупреждения
-_chembl_module_path = Path(__file__).parent / "chembl.py"  # noqa: E402
-_spec = importlib.util.spec_from_file_location("bioetl.clients.chembl_client", _chembl_module_path)  # noqa: E402
-if _spec is None or _spec.loader is None:  # noqa: E402
-    msg = f"Failed to load module from {_chembl_module_path}"
-    raise ImportError(msg)
-_chembl_module = importlib.util.module_from_spec(_spec)  # noqa: E402
-_spec.loader.exec_module(_chembl_module)  # noqa: E402
-ChemblClient = _chembl_module.ChemblClient  # noqa: E402
+from typing import TYPE_CHECKING, Any
 
 __all__ = [
     "ChemblClient",
@@ -55,3 +33,79 @@ __all__ = [
     "ChemblAssayClassificationEntityClient",
     "ChemblCompoundRecordEntityClient",
 ]
+
+_EXPORTS: dict[str, str] = {
+    "ChemblActivityClient": ".activity.chembl_activity",
+    "ChemblAssayClient": ".assay.chembl_assay",
+    "ChemblAssayEntityClient": ".assay.chembl_assay_entity",
+    "ChemblEntityFetcher": ".chembl_base",
+    "EntityConfig": ".chembl_base",
+    "ChemblAssayClassificationEntityClient": ".chembl_entities",
+    "ChemblAssayClassMapEntityClient": ".chembl_entities",
+    "ChemblAssayParametersEntityClient": ".chembl_entities",
+    "ChemblCompoundRecordEntityClient": ".chembl_entities",
+    "ChemblDataValidityEntityClient": ".chembl_entities",
+    "ChemblMoleculeEntityClient": ".chembl_entities",
+    "ChemblEntityIterator": ".chembl_iterator",
+    "EntityClient": ".types",
+    "ChemblDocumentClient": ".document.chembl_document",
+    "ChemblDocumentTermEntityClient": ".document.chembl_document_entity",
+    "ChemblTargetClient": ".target.chembl_target",
+    "ChemblTestitemClient": ".testitem.chembl_testitem",
+}
+
+if TYPE_CHECKING:
+    from .activity.chembl_activity import ChemblActivityClient
+    from .assay.chembl_assay import ChemblAssayClient
+    from .assay.chembl_assay_entity import ChemblAssayEntityClient
+    from .chembl_base import ChemblEntityFetcher, EntityConfig
+    from .chembl_entities import (
+        ChemblAssayClassificationEntityClient,
+        ChemblAssayClassMapEntityClient,
+        ChemblAssayParametersEntityClient,
+        ChemblCompoundRecordEntityClient,
+        ChemblDataValidityEntityClient,
+        ChemblMoleculeEntityClient,
+    )
+    from .chembl_iterator import ChemblEntityIterator
+    from .document.chembl_document import ChemblDocumentClient
+    from .document.chembl_document_entity import ChemblDocumentTermEntityClient
+    from .target.chembl_target import ChemblTargetClient
+    from .testitem.chembl_testitem import ChemblTestitemClient
+    from .types import EntityClient
+
+    ChemblClient: Any
+
+
+def _load_chembl_client() -> Any:
+    # Импорт ChemblClient из модуля chembl.py (не из пакета chembl/)
+    # Используем importlib для импорта из файла напрямую, чтобы избежать циклических зависимостей
+    chembl_module_path = Path(__file__).parent / "chembl.py"
+    spec = importlib.util.spec_from_file_location("bioetl.clients.chembl_client", chembl_module_path)
+    if spec is None or spec.loader is None:
+        msg = f"Failed to load module from {chembl_module_path}"
+        raise ImportError(msg)
+    chembl_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(chembl_module)
+    return chembl_module.ChemblClient
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule exporting ``name`` on first access."""
+
+    if name == "ChemblClient":
+        value = _load_chembl_client()
+    else:
+        module_name = _EXPORTS.get(name)
+        if module_name is None:
+            msg = f"module {__name__!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the lazily available public names."""
+
+    return sorted(set(__all__ + list(globals().keys())))
@@ -7,13 +7,17 @@ from dataclasses import dataclass
 from math import isnan
 from typing import Any, Protocol
 
+from bioetl.core.concurrency import bounded_ordered_map, resolve_worker_count
 from bioetl.core.logger import UnifiedLogger
+from bioetl.core.lookup_store import LookupStore
+from bioetl.core.record_cache import RecordCache
 
 __all__ = [
     "EntityConfig",
     "ChemblEntityFetcherBase",
     "ChemblClientProtocol",
     "make_entity_config",
+    "group_records_by_id",
 ]
 
 
@@ -69,6 +73,12 @@ class EntityConfig:
     base_endpoint_length: int = 0  # Базовая длина endpoint для расчета длины URL
     enable_url_length_check: bool = False  # Включить проверку длины URL
 
+    @property
+    def cache_namespace(self) -> str:
+        """Пространство имён сущности в :class:`~bioetl.core.record_cache.RecordCache`."""
+
+        return f"{self.endpoint}#{self.filter_param}"
+
 
 def make_entity_config(
     *,
@@ -138,6 +148,28 @@ def make_entity_config(
     )
 
 
+def group_records_by_id(
+    records: Iterable[Mapping[str, Any]],
+    id_key: str,
+    requested_ids: Iterable[str],
+) -> dict[str, list[dict[str, Any]]]:
+    """Сгруппировать записи по ID для сохранения в кэше записей.
+
+    Каждый запрошенный ID получает запись в результате; ID без записей
+    получают пустой список (негативный кэш в пределах релиза).
+    """
+
+    grouped: dict[str, list[dict[str, Any]]] = {
+        str(entity_id): [] for entity_id in requested_ids
+    }
+    for record in records:
+        entity_id = record.get(id_key)
+        if entity_id is None:
+            continue
+        bucket = grouped.get(str(entity_id))
+        if bucket is not None:
+            bucket.append(dict(record))
+    return grouped
 
 
 class ChemblEntityFetcherBase:
@@ -147,7 +179,13 @@ class ChemblEntityFetcherBase:
     типами сущностей ChEMBL API.
     """
 
-    def __init__(self, chembl_client: ChemblClientProtocol, config: EntityConfig) -> None:
+    def __init__(
+        self,
+        chembl_client: ChemblClientProtocol,
+        config: EntityConfig,
+        *,
+        record_cache: RecordCache | None = None,
+    ) -> None:
         """Инициализировать fetcher для сущности.
 
         Parameters
@@ -156,9 +194,13 @@ class ChemblEntityFetcherBase:
             Экземпляр ChemblClient для выполнения запросов.
         config:
             Конфигурация сущности.
+        record_cache:
+            Опциональный кэш записей. Если не задан, используется
+            ``chembl_client.record_cache`` (при наличии).
         """
         self._chembl_client: ChemblClientProtocol = chembl_client
         self._config = config
+        self._record_cache = record_cache
         self._log = UnifiedLogger.get(__name__).bind(
             component="chembl_entity",
             entity=config.log_prefix,
@@ -169,6 +211,8 @@ class ChemblEntityFetcherBase:
         ids: Iterable[str],
         fields: Sequence[str],
         page_limit: int = 1000,
+        *,
+        max_workers: int = 1,
     ) -> dict[str, dict[str, Any]] | dict[str, list[dict[str, Any]]]:
         """Получить записи сущности по ID.
 
@@ -180,6 +224,9 @@ class ChemblEntityFetcherBase:
             Список полей для получения из API.
         page_limit:
             Размер страницы для пагинации.
+        max_workers:
+            Максимальное число чанков, запрашиваемых одновременно. Порядок
+            записей в результате не зависит от значения.
 
         Returns
         -------
@@ -213,34 +260,47 @@ class ChemblEntityFetcherBase:
                 return {}
             return {}
 
-        # Обработка чанками
+        # Попадания в кэш записей; в сеть уходят только отсутствующие ID
+        record_cache, release = self._resolve_record_cache()
+        cached: dict[str, Any] = {}
+        if record_cache is not None:
+            cached = record_cache.get_many(
+                self._config.cache_namespace, unique_ids, release=release, fields=fields
+            )
         all_records: list[dict[str, Any]] = []
-        ids_list = list(unique_ids)
-
-        for i in range(0, len(ids_list), self._config.chunk_size):
-            chunk = ids_list[i : i + self._config.chunk_size]
-            params: dict[str, Any] = {
-                self._config.filter_param: ",".join(chunk),
-                "limit": page_limit,
-            }
-            # Параметр only для выбора полей
-            if fields:
-                params["only"] = ",".join(sorted(fields))
-
-            try:
-                for record in self._chembl_client.paginate(
-                    self._config.endpoint,
-                    params=params,
-                    page_size=page_limit,
-                    items_key=self._config.items_key,
-                ):
-                    all_records.append(dict(record))
-            except Exception as exc:
-                self._log.warning(
-                    f"{self._config.log_prefix}.fetch_error",
-                    entity_count=len(chunk),
-                    error=str(exc),
-                    exc_info=True,
+        for cached_records in cached.values():
+            all_records.extend(dict(record) for record in cached_records)
+        ids_list = [entity_id for entity_id in unique_ids if entity_id not in cached]
+        if cached:
+            self._log.debug(
+                f"{self._config.log_prefix}.record_cache_hits",
+                cache_hits=len(cached),
+                ids_to_fetch=len(ids_list),
+            )
+
+        # Обработка чанками; независимые чанки могут выполняться параллельно
+        chunks = [
+            ids_list[i : i + self._config.chunk_size]
+            for i in range(0, len(ids_list), self._config.chunk_size)
+        ]
+        workers = resolve_worker_count(max_workers, len(chunks))
+        for chunk, (chunk_records, succeeded) in zip(
+            chunks,
+            bounded_ordered_map(
+                lambda batch: self._fetch_chunk(batch, fields, page_limit),
+                chunks,
+                max_workers=workers,
+                thread_name_prefix=f"bioetl-{self._config.log_prefix}",
+            ),
+            strict=True,
+        ):
+            all_records.extend(chunk_records)
+            if succeeded and record_cache is not None:
+                record_cache.put_many(
+                    self._config.cache_namespace,
+                    group_records_by_id(chunk_records, self._config.id_key, chunk),
+                    release=release,
+                    fields=fields,
                 )
 
         # Построение результата
@@ -248,6 +308,66 @@ class ChemblEntityFetcherBase:
             return self._build_list_result(all_records, unique_ids)
         return self._build_dict_result(all_records, unique_ids)
 
+    def _fetch_chunk(
+        self,
+        chunk: Sequence[str],
+        fields: Sequence[str],
+        page_limit: int,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Загрузить один чанк ID.
+
+        Returns
+        -------
+        tuple[list[dict[str, Any]], bool]:
+            Полученные записи и признак успешного завершения пагинации.
+            При ошибке возвращаются записи, полученные до её возникновения.
+        """
+        params: dict[str, Any] = {
+            self._config.filter_param: ",".join(chunk),
+            "limit": page_limit,
+        }
+        # Параметр only для выбора полей
+        if fields:
+            params["only"] = ",".join(sorted(fields))
+
+        chunk_records: list[dict[str, Any]] = []
+        try:
+            for record in self._chembl_client.paginate(
+                self._config.endpoint,
+                params=params,
+                page_size=page_limit,
+                items_key=self._config.items_key,
+            ):
+                chunk_records.append(dict(record))
+        except Exception as exc:
+            self._log.warning(
+                f"{self._config.log_prefix}.fetch_error",
+                entity_count=len(chunk),
+                error=str(exc),
+                exc_info=True,
+            )
+            return chunk_records, False
+        return chunk_records, True
+
+    def _resolve_record_cache(self) -> tuple[RecordCache | LookupStore | None, str | None]:
+        """Вернуть кэш записей и релиз ChEMBL, к которому привязаны записи.
+
+        Хранилище справочников релиза (``chembl_client.lookup_store``) имеет
+        приоритет перед кэшем записей: оно общее для всех пайплайнов и не
+        устаревает по TTL. Кэш не используется, пока релиз неизвестен: без
+        него записи разных релизов были бы неразличимы.
+        """
+        release = getattr(self._chembl_client, "chembl_release", None)
+        if not isinstance(release, str) or not release:
+            return None, None
+        lookup_store = getattr(self._chembl_client, "lookup_store", None)
+        if isinstance(lookup_store, LookupStore):
+            return lookup_store, release
+        record_cache = self._record_cache or getattr(self._chembl_client, "record_cache", None)
+        if not isinstance(record_cache, RecordCache):
+            return None, None
+        return record_cache, release
+
     def _build_dict_result(
         self,
         records: list[dict[str, Any]],
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import warnings
-from collections.abc import Iterable, Iterator, Mapping, Sequence
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
@@ -20,11 +20,15 @@ from bioetl.clients.entities.client_compound_record import ChemblCompoundRecordE
 from bioetl.clients.entities.client_data_validity import ChemblDataValidityEntityClient
 from bioetl.clients.entities.client_document_term import ChemblDocumentTermEntityClient
 from bioetl.clients.entities.client_molecule import ChemblMoleculeEntityClient
+from bioetl.clients.entities.client_target_component import ChemblTargetComponentEntityClient
 from bioetl.config.loader import _load_yaml
 from bioetl.core.api_client import UnifiedAPIClient
+from bioetl.core.async_api_client import AsyncUnifiedAPIClient
 from bioetl.core.load_meta_store import LoadMetaStore
 from bioetl.core.log_events import LogEvents
 from bioetl.core.logger import UnifiedLogger
+from bioetl.core.lookup_store import LookupStore
+from bioetl.core.record_cache import RecordCache
 
 __all__ = ["ChemblClient", "_resolve_status_endpoint"]
 
@@ -77,14 +81,21 @@ class ChemblClient:
         load_meta_store: LoadMetaStore | None = None,
         job_id: str | None = None,
         operator: str | None = None,
+        record_cache: RecordCache | None = None,
+        chembl_release: str | None = None,
+        async_client: AsyncUnifiedAPIClient | None = None,
+        lookup_store: LookupStore | None = None,
     ) -> None:
         self._client = client
+        self._async_client = async_client
+        self._record_cache = record_cache
+        self._lookup_store = lookup_store
         self._log = UnifiedLogger.get(__name__).bind(component="chembl_client")
         self._status_cache: dict[str, Mapping[str, Any]] = {}
         self._load_meta_store = load_meta_store
         self._job_id = job_id
         self._operator = operator
-        self._chembl_release: str | None = None
+        self._chembl_release: str | None = chembl_release
         self._api_version: str | None = None
         # Initialize specialized entity clients.
         self._assay_entity = ChemblAssayEntityClient(self)
@@ -95,6 +106,25 @@ class ChemblClient:
         self._assay_parameters_entity = ChemblAssayParametersEntityClient(self)
         self._assay_classification_entity = ChemblAssayClassificationEntityClient(self)
         self._compound_record_entity = ChemblCompoundRecordEntityClient(self)
+        self._target_component_entity = ChemblTargetComponentEntityClient(self)
+
+    @property
+    def record_cache(self) -> RecordCache | None:
+        """Return the per-record cache consulted by entity fetchers, if any."""
+
+        return self._record_cache
+
+    @property
+    def lookup_store(self) -> LookupStore | None:
+        """Return the release-scoped lookup store shared across pipelines, if any."""
+
+        return self._lookup_store
+
+    @property
+    def chembl_release(self) -> str | None:
+        """Return the ChEMBL release discovered during the handshake."""
+
+        return self._chembl_release
 
     # ------------------------------------------------------------------
     # Discovery / handshake
@@ -120,20 +150,40 @@ class ChemblClient:
                     error=str(exc),
                 )
                 raise
-            self._status_cache[resolved_endpoint] = payload
-            release = payload.get("chembl_db_version")
-            api_version = payload.get("api_version")
-            if isinstance(release, str):
-                self._chembl_release = release
-            if isinstance(api_version, str):
-                self._api_version = api_version
-            self._log.info(LogEvents.CHEMBL_HANDSHAKE,
-                endpoint=resolved_endpoint,
-                chembl_release=self._chembl_release,
-                api_version=self._api_version,
-            )
+            self._remember_status(resolved_endpoint, payload)
         return self._status_cache[resolved_endpoint]
 
+    async def ahandshake(self, endpoint: str | None = None) -> Mapping[str, Any]:
+        """Async variant of :meth:`handshake` sharing the same payload cache."""
+
+        resolved_endpoint = endpoint if endpoint is not None else _resolve_status_endpoint()
+        if resolved_endpoint not in self._status_cache:
+            try:
+                response = await self._require_async_client().get(resolved_endpoint)
+                payload = response.json()
+            except (ConnectionError, Timeout, HTTPError, RequestException) as exc:
+                self._log.error(LogEvents.HTTP_REQUEST_FAILED,
+                    endpoint=resolved_endpoint,
+                    error=str(exc),
+                )
+                raise
+            self._remember_status(resolved_endpoint, payload)
+        return self._status_cache[resolved_endpoint]
+
+    def _remember_status(self, endpoint: str, payload: Mapping[str, Any]) -> None:
+        self._status_cache[endpoint] = payload
+        release = payload.get("chembl_db_version")
+        api_version = payload.get("api_version")
+        if isinstance(release, str):
+            self._chembl_release = release
+        if isinstance(api_version, str):
+            self._api_version = api_version
+        self._log.info(LogEvents.CHEMBL_HANDSHAKE,
+            endpoint=endpoint,
+            chembl_release=self._chembl_release,
+            api_version=self._api_version,
+        )
+
     # ------------------------------------------------------------------
     # Pagination helpers
     # ------------------------------------------------------------------
@@ -150,24 +200,11 @@ class ChemblClient:
 
         self.handshake()
         next_url: str | None = endpoint
-        query: dict[str, Any] | None = dict(params) if params is not None else None
-        if page_size and query is not None:
-            query.setdefault("limit", page_size)
-        load_meta_id: str | None = None
-        store = self._load_meta_store
+        query = self._initial_query(params, page_size)
+        load_meta_id = self._begin_load_meta(endpoint, query)
         records_fetched = 0
         page_index = 0
         try:
-            if store is not None:
-                load_meta_id = store.begin_record(
-                    "chembl_rest",
-                    self._resolve_request_base_url(endpoint),
-                    query or {},
-                    source_release=self._chembl_release,
-                    source_api_version=self._api_version,
-                    job_id=self._job_id,
-                    operator=self._operator,
-                )
             while next_url:
                 normalized_url = self._normalize_endpoint(next_url)
                 try:
@@ -182,45 +219,158 @@ class ChemblClient:
                     )
                     raise
                 items = list(self._extract_items(payload, items_key))
-                if load_meta_id is not None and store is not None:
-                    pagination_snapshot: dict[str, Any] = {
-                        "page_index": page_index,
-                        "endpoint": normalized_url,
-                        "status_code": response.status_code,
-                        "result_count": len(items),
-                    }
-                    if query is not None and page_index == 0:
-                        pagination_snapshot["params"] = dict(query)
-                    store.update_pagination(
-                        load_meta_id,
-                        pagination_snapshot,
-                        records_fetched_delta=len(items),
-                    )
+                self._record_page(
+                    load_meta_id, page_index, normalized_url, response.status_code, items, query
+                )
                 for item_raw in items:
-                    item_dict = dict(item_raw)
-                    if load_meta_id is not None:
-                        item_dict["load_meta_id"] = load_meta_id
                     records_fetched += 1
-                    yield item_dict
+                    yield self._tag_item(item_raw, load_meta_id)
                 next_url = self._next_link(payload)
                 query = None
                 page_index += 1
-            if load_meta_id is not None and store is not None:
-                store.finish_record(
-                    load_meta_id,
-                    status="success",
-                    records_fetched=records_fetched,
-                )
+            self._finish_load_meta(load_meta_id, records_fetched)
         except Exception as exc:
-            if load_meta_id is not None and store is not None:
-                store.finish_record(
-                    load_meta_id,
-                    status="error",
-                    records_fetched=records_fetched,
-                    error_message=str(exc),
+            self._finish_load_meta(load_meta_id, records_fetched, error=exc)
+            raise
+
+    async def apaginate(
+        self,
+        endpoint: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int = 200,
+        items_key: str | None = None,
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        """Async variant of :meth:`paginate` running on the ``async_client``.
+
+        Pages of one listing are fetched sequentially (each page links to the
+        next); run several listings concurrently to overlap I/O.
+        """
+
+        await self.ahandshake()
+        client = self._require_async_client()
+        next_url: str | None = endpoint
+        query = self._initial_query(params, page_size)
+        load_meta_id = self._begin_load_meta(endpoint, query)
+        records_fetched = 0
+        page_index = 0
+        try:
+            while next_url:
+                normalized_url = self._normalize_endpoint(next_url)
+                try:
+                    response = await client.get(
+                        normalized_url, params=query if next_url == endpoint else None
+                    )
+                    payload: Mapping[str, Any] = response.json()
+                except (ConnectionError, Timeout, HTTPError, RequestException) as exc:
+                    self._log.error(LogEvents.HTTP_REQUEST_FAILED,
+                        endpoint=normalized_url,
+                        error=str(exc),
+                    )
+                    raise
+                items = list(self._extract_items(payload, items_key))
+                self._record_page(
+                    load_meta_id, page_index, normalized_url, response.status_code, items, query
                 )
+                for item_raw in items:
+                    records_fetched += 1
+                    yield self._tag_item(item_raw, load_meta_id)
+                next_url = self._next_link(payload)
+                query = None
+                page_index += 1
+            self._finish_load_meta(load_meta_id, records_fetched)
+        except Exception as exc:
+            self._finish_load_meta(load_meta_id, records_fetched, error=exc)
             raise
 
+    # ------------------------------------------------------------------
+    # Pagination bookkeeping
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _initial_query(params: Mapping[str, Any] | None, page_size: int) -> dict[str, Any] | None:
+        query: dict[str, Any] | None = dict(params) if params is not None else None
+        if page_size and query is not None:
+            query.setdefault("limit", page_size)
+        return query
+
+    def _require_async_client(self) -> AsyncUnifiedAPIClient:
+        if self._async_client is None:
+            msg = "ChemblClient was created without an async_client"
+            raise RuntimeError(msg)
+        return self._async_client
+
+    def _begin_load_meta(self, endpoint: str, query: Mapping[str, Any] | None) -> str | None:
+        store = self._load_meta_store
+        if store is None:
+            return None
+        return store.begin_record(
+            "chembl_rest",
+            self._resolve_request_base_url(endpoint),
+            query or {},
+            source_release=self._chembl_release,
+            source_api_version=self._api_version,
+            job_id=self._job_id,
+            operator=self._operator,
+        )
+
+    def _record_page(
+        self,
+        load_meta_id: str | None,
+        page_index: int,
+        endpoint: str,
+        status_code: int,
+        items: Sequence[Mapping[str, Any]],
+        query: Mapping[str, Any] | None,
+    ) -> None:
+        store = self._load_meta_store
+        if load_meta_id is None or store is None:
+            return
+        pagination_snapshot: dict[str, Any] = {
+            "page_index": page_index,
+            "endpoint": endpoint,
+            "status_code": status_code,
+            "result_count": len(items),
+        }
+        if query is not None and page_index == 0:
+            pagination_snapshot["params"] = dict(query)
+        store.update_pagination(
+            load_meta_id,
+            pagination_snapshot,
+            records_fetched_delta=len(items),
+        )
+
+    @staticmethod
+    def _tag_item(item_raw: Mapping[str, Any], load_meta_id: str | None) -> dict[str, Any]:
+        item_dict = dict(item_raw)
+        if load_meta_id is not None:
+            item_dict["load_meta_id"] = load_meta_id
+        return item_dict
+
+    def _finish_load_meta(
+        self,
+        load_meta_id: str | None,
+        records_fetched: int,
+        *,
+        error: Exception | None = None,
+    ) -> None:
+        store = self._load_meta_store
+        if load_meta_id is None or store is None:
+            return
+        if error is None:
+            store.finish_record(
+                load_meta_id,
+                status="success",
+                records_fetched=records_fetched,
+            )
+        else:
+            store.finish_record(
+                load_meta_id,
+                status="error",
+                records_fetched=records_fetched,
+                error_message=str(error),
+            )
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -542,3 +692,38 @@ class ChemblClient:
         """
         result = self._assay_classification_entity.fetch_by_ids(class_ids, fields, page_limit)
         return cast(dict[str, dict[str, Any]], result)
+
+    # ------------------------------------------------------------------
+    # Target component fetching
+    # ------------------------------------------------------------------
+
+    def fetch_target_components_by_target_ids(
+        self,
+        target_ids: Iterable[str],
+        fields: Sequence[str],
+        page_limit: int = 1000,
+        *,
+        max_workers: int = 1,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch target_component entries by target_chembl_id.
+
+        Parameters
+        ----------
+        target_ids:
+            Iterable of target_chembl_id values.
+        fields:
+            List of field names to fetch from target_component API.
+        page_limit:
+            Page size for pagination requests.
+        max_workers:
+            Maximum number of ``target_chembl_id__in`` chunks fetched concurrently.
+
+        Returns
+        -------
+        dict[str, list[dict[str, Any]]]:
+            Dictionary keyed by target_chembl_id -> list of component records.
+        """
+        result = self._target_component_entity.fetch_by_ids(
+            target_ids, fields, page_limit, max_workers=max_workers
+        )
+        return cast(dict[str, list[dict[str, Any]]], result)
@@ -8,7 +8,9 @@ from typing import Any, Callable, cast
 from urllib.parse import urlencode
 
 from bioetl.clients.chembl_base import ChemblClientProtocol, EntityConfig
+from bioetl.clients.client_chembl_base import group_records_by_id
 from bioetl.core.logger import UnifiedLogger
+from bioetl.core.record_cache import RecordCache
 from bioetl.pipelines.common.release_tracker import ChemblReleaseMixin
 
 # ChemblClient is dynamically loaded in __init__.py, so we use Any for type checking
@@ -32,6 +34,7 @@ class ChemblEntityIterator(ChemblReleaseMixin):
         *,
         batch_size: int,
         max_url_length: int | None = None,
+        record_cache: RecordCache | None = None,
     ) -> None:
         """Инициализировать итератор для сущности.
 
@@ -45,6 +48,9 @@ class ChemblEntityIterator(ChemblReleaseMixin):
             Размер батча для пагинации (максимум 25 для ChEMBL API).
         max_url_length:
             Максимальная длина URL для проверки. Если None, проверка отключена.
+        record_cache:
+            Опциональный кэш записей. Используется в :meth:`iterate_by_ids`
+            после handshake, когда известен релиз ChEMBL.
         """
         super().__init__()
         if batch_size <= 0:
@@ -60,6 +66,7 @@ class ChemblEntityIterator(ChemblReleaseMixin):
         self._config = config
         self._batch_size = min(batch_size, 25)
         self._max_url_length = max_url_length
+        self._record_cache = record_cache
         self._log = UnifiedLogger.get(__name__).bind(
             component="chembl_iterator",
             entity=config.log_prefix,
@@ -203,17 +210,57 @@ class ChemblEntityIterator(ChemblReleaseMixin):
         Mapping[str, object]:
             Записи сущности.
         """
+        release = self.chembl_release
+        record_cache = self._record_cache if release else None
+
         for chunk in self._chunk_identifiers(ids, select_fields=select_fields):
-            params: dict[str, object] = {self._config.filter_param: ",".join(chunk)}
-            if select_fields:
-                params["only"] = ",".join(select_fields)
-
-            yield from self._chembl_client.paginate(
-                self._config.endpoint,
-                params=params,
-                page_size=len(chunk),
-                items_key=self._config.items_key,
+            if record_cache is None:
+                yield from self._paginate_ids(chunk, select_fields=select_fields)
+                continue
+
+            # Записи чанка отдаются в порядке запрошенных ID, чтобы порядок не
+            # зависел от того, какие из них уже были в кэше.
+            grouped: dict[str, Sequence[Mapping[str, object]]] = dict(
+                record_cache.get_many(
+                    self._config.cache_namespace,
+                    chunk,
+                    release=release,
+                    fields=select_fields,
+                )
             )
+            missing = [identifier for identifier in chunk if identifier not in grouped]
+            if missing:
+                fetched = group_records_by_id(
+                    self._paginate_ids(missing, select_fields=select_fields),
+                    self._config.id_key,
+                    missing,
+                )
+                record_cache.put_many(
+                    self._config.cache_namespace,
+                    fetched,
+                    release=release,
+                    fields=select_fields,
+                )
+                grouped.update(fetched)
+            for identifier in chunk:
+                yield from grouped.get(identifier, ())
+
+    def _paginate_ids(
+        self,
+        ids: Sequence[str],
+        *,
+        select_fields: Sequence[str] | None,
+    ) -> Iterator[Mapping[str, object]]:
+        params: dict[str, object] = {self._config.filter_param: ",".join(ids)}
+        if select_fields:
+            params["only"] = ",".join(select_fields)
+
+        yield from self._chembl_client.paginate(
+            self._config.endpoint,
+            params=params,
+            page_size=len(ids),
+            items_key=self._config.items_key,
+        )
 
     def close(self) -> None:
         """Попытаться закрыть обёрнутый клиент, если он поддерживает close()."""
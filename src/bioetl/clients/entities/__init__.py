@@ -1,18 +1,13 @@
-"""Entity-specific clients for ChEMBL API (modularized package)."""
-
-from .client_activity import ChemblActivityClient
-from .client_assay import ChemblAssayClient
-from .client_assay_class_map import ChemblAssayClassMapEntityClient
-from .client_assay_classification import ChemblAssayClassificationEntityClient
-from .client_assay_entity import ChemblAssayEntityClient
-from .client_assay_parameters import ChemblAssayParametersEntityClient
-from .client_compound_record import ChemblCompoundRecordEntityClient
-from .client_data_validity import ChemblDataValidityEntityClient
-from .client_document import ChemblDocumentClient
-from .client_document_term import ChemblDocumentTermEntityClient
-from .client_molecule import ChemblMoleculeEntityClient
-from .client_target import ChemblTargetClient
-from .client_testitem import ChemblTestitemClient
+"""Entity-specific clients for ChEMBL API (modularized package).
+
+Clients are imported on first attribute access, so importing one entity
+module does not load the others.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 __all__: list[str] = [
     "ChemblActivityClient",
@@ -28,5 +23,56 @@ __all__: list[str] = [
     "ChemblAssayParametersEntityClient",
     "ChemblAssayClassificationEntityClient",
     "ChemblCompoundRecordEntityClient",
+    "ChemblTargetComponentEntityClient",
 ]
 
+_EXPORTS: dict[str, str] = {
+    "ChemblActivityClient": ".client_activity",
+    "ChemblAssayClient": ".client_assay",
+    "ChemblAssayClassMapEntityClient": ".client_assay_class_map",
+    "ChemblAssayClassificationEntityClient": ".client_assay_classification",
+    "ChemblAssayEntityClient": ".client_assay_entity",
+    "ChemblAssayParametersEntityClient": ".client_assay_parameters",
+    "ChemblCompoundRecordEntityClient": ".client_compound_record",
+    "ChemblDataValidityEntityClient": ".client_data_validity",
+    "ChemblDocumentClient": ".client_document",
+    "ChemblDocumentTermEntityClient": ".client_document_term",
+    "ChemblMoleculeEntityClient": ".client_molecule",
+    "ChemblTargetClient": ".client_target",
+    "ChemblTargetComponentEntityClient": ".client_target_component",
+    "ChemblTestitemClient": ".client_testitem",
+}
+
+if TYPE_CHECKING:
+    from .client_activity import ChemblActivityClient
+    from .client_assay import ChemblAssayClient
+    from .client_assay_class_map import ChemblAssayClassMapEntityClient
+    from .client_assay_classification import ChemblAssayClassificationEntityClient
+    from .client_assay_entity import ChemblAssayEntityClient
+    from .client_assay_parameters import ChemblAssayParametersEntityClient
+    from .client_compound_record import ChemblCompoundRecordEntityClient
+    from .client_data_validity import ChemblDataValidityEntityClient
+    from .client_document import ChemblDocumentClient
+    from .client_document_term import ChemblDocumentTermEntityClient
+    from .client_molecule import ChemblMoleculeEntityClient
+    from .client_target import ChemblTargetClient
+    from .client_target_component import ChemblTargetComponentEntityClient
+    from .client_testitem import ChemblTestitemClient
+
+
+def __getattr__(name: str) -> Any:
+    """Import the entity module exporting ``name`` on first access."""
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the lazily available public names."""
+
+    return sorted(set(__all__ + list(globals().keys())))
@@ -0,0 +1,24 @@
+"""Target component entity client for ChEMBL API."""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from bioetl.clients.client_chembl_base import EntityConfig, make_entity_config
+from bioetl.clients.client_chembl_entity import ChemblEntityClientBase
+
+__all__ = ["ChemblTargetComponentEntityClient"]
+
+
+class ChemblTargetComponentEntityClient(ChemblEntityClientBase):
+    """Клиент для получения target_component записей из ChEMBL API."""
+
+    CONFIG: ClassVar[EntityConfig] = make_entity_config(
+        endpoint="/target_component.json",
+        filter_param="target_chembl_id__in",
+        id_key="target_chembl_id",
+        items_key="target_components",
+        log_prefix="target_component",
+        chunk_size=50,
+        supports_list_result=True,  # Одна мишень может иметь несколько компонентов
+    )
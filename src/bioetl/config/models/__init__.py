@@ -14,6 +14,7 @@ from .models import (
     IOInputConfig,
     IOOutputConfig,
     LoggingConfig,
+    LogSamplingConfig,
     MaterializationConfig,
     PathsConfig,
     PipelineConfig,
@@ -27,6 +28,7 @@ from .models import (
     ValidationConfig,
 )
 from .policies import (
+    AdaptiveRateLimitConfig,
     CircuitBreakerConfig,
     DeterminismConfig,
     DeterminismEnvironmentConfig,
@@ -51,6 +53,7 @@ __all__ = [
     "HTTPConfig",
     "HTTPClientConfig",
     "RetryConfig",
+    "AdaptiveRateLimitConfig",
     "RateLimitConfig",
     "CircuitBreakerConfig",
     "StatusCode",
@@ -77,6 +80,7 @@ __all__ = [
     "SourceConfig",
     "CLIConfig",
     "LoggingConfig",
+    "LogSamplingConfig",
     "FallbacksConfig",
     "TelemetryConfig",
 ]
@@ -145,6 +149,7 @@ for _name, _symbols, _target in [
             "HTTPConfig",
             "HTTPClientConfig",
             "RetryConfig",
+            "AdaptiveRateLimitConfig",
             "RateLimitConfig",
             "CircuitBreakerConfig",
             "StatusCode",
@@ -152,7 +157,7 @@ for _name, _symbols, _target in [
         "policies",
     ),
     ("io", ("IOConfig", "IOInputConfig", "IOOutputConfig"), "models"),
-    ("logging", ("LoggingConfig",), "models"),
+    ("logging", ("LoggingConfig", "LogSamplingConfig"), "models"),
     ("paths", ("PathsConfig", "MaterializationConfig"), "models"),
     ("postprocess", ("PostprocessConfig", "PostprocessCorrelationConfig"), "models"),
     ("runtime", ("RuntimeConfig",), "models"),
@@ -41,6 +41,21 @@ class RuntimeConfig(BaseModel):
         default=100_000,
         description="Размер чанка строк для пакетной обработки источников.",
     )
+    streaming: bool = Field(
+        default=False,
+        description=(
+            "Потоковый режим run(): extract/transform/validate/write выполняются по чанкам "
+            "размером chunk_rows с ограниченным потреблением памяти."
+        ),
+    )
+    release_gated: bool = Field(
+        default=False,
+        description=(
+            "Режим ChEMBL-пайплайнов с привязкой к релизу: пока релиз ChEMBL совпадает с "
+            "предыдущим запуском, его строки переносятся и запрашиваются только новые ID; "
+            "после смены релиза выборка полная. Рядом с датасетом пишется журнал изменений."
+        ),
+    )
     dry_run: bool = Field(
         default=False,
         description="Режим проверки без записи артефактов во внешние системы.",
@@ -61,6 +76,13 @@ class CacheConfig(BaseModel):
     ttl: PositiveInt = Field(
         default=86_400, description="Time-to-live for cached entries in seconds."
     )
+    lookup_store: bool = Field(
+        default=False,
+        description=(
+            "Share ChEMBL lookup records between pipelines in a release-scoped store "
+            "under <paths.cache_root>/<release>/ (no TTL; fill with `bioetl cache warm`)."
+        ),
+    )
 
 
 class IOInputConfig(BaseModel):
@@ -82,10 +104,25 @@ class IOOutputConfig(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
-    format: str = Field(default="parquet", description="Формат итоговых данных (parquet, csv).")
+    format: Literal["csv", "parquet"] = Field(
+        default="csv",
+        description=(
+            "Формат итогового датасета (csv, parquet). Профиль base.yaml включает parquet."
+        ),
+    )
     partition_by: Sequence[str] = Field(
         default_factory=tuple,
-        description="Список колонок для партиционирования набора данных.",
+        description=(
+            "Список колонок для hive-партиционирования набора данных (только для parquet)."
+        ),
+    )
+    compression: str = Field(
+        default="zstd",
+        description="Кодек сжатия parquet (zstd, snappy, gzip, none).",
+    )
+    row_group_size: PositiveInt = Field(
+        default=131_072,
+        description="Число строк в row group parquet; фиксировано для детерминизма.",
     )
     overwrite: bool = Field(
         default=True,
@@ -169,6 +206,27 @@ class ValidationConfig(BaseModel):
     coerce: bool = Field(
         default=True, description="If true, Pandera coerces data types during validation."
     )
+    incremental: bool = Field(
+        default=False,
+        description=(
+            "If true, rows whose hash_row already passed the same schema version are not "
+            "re-checked row by row (cache under <paths.cache_root>/validation)."
+        ),
+    )
+    chunk_rows: PositiveInt | None = Field(
+        default=None,
+        description=(
+            "If set, frames larger than this are validated in row chunks; cross-row checks "
+            "(unique, groupby, frame-level) still run once over the whole frame."
+        ),
+    )
+    workers: PositiveInt | None = Field(
+        default=None,
+        description=(
+            "Worker processes for chunked validation; defaults to runtime.parallelism, "
+            "1 validates chunks sequentially."
+        ),
+    )
 
 
 class TransformConfig(BaseModel):
@@ -224,6 +282,23 @@ class PostprocessConfig(BaseModel):
     )
 
 
+class LogSamplingConfig(BaseModel):
+    """Политика сэмплирования и ограничения частоты для одного события."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Доля выводимых событий (0.1 — каждое десятое).",
+    )
+    max_per_second: PositiveFloat | None = Field(
+        default=None,
+        description="Максимум выводимых событий в секунду; None отключает ограничение.",
+    )
+
+
 class LoggingConfig(BaseModel):
     """Определяет параметры структурного логирования."""
 
@@ -242,6 +317,29 @@ class LoggingConfig(BaseModel):
         default_factory=lambda: ("pipeline", "run_id"),
         description="Обязательные поля контекста, которые должны присутствовать в каждом сообщении.",
     )
+    callsite_level: str = Field(
+        default="WARNING",
+        description="Минимальный уровень, с которого в событие добавляются pathname/lineno/func_name.",
+    )
+    sampling: dict[str, LogSamplingConfig] = Field(
+        default_factory=dict,
+        description=(
+            "Сэмплирование по имени события (допускаются fnmatch-шаблоны); "
+            "применяется только к событиям ниже WARNING."
+        ),
+    )
+    async_sink: bool = Field(
+        default=False,
+        description="Рендерить и записывать логи в фоновом потоке через очередь.",
+    )
+    queue_size: PositiveInt = Field(
+        default=10_000,
+        description="Ёмкость очереди асинхронного приёмника логов.",
+    )
+    batch_size: PositiveInt = Field(
+        default=256,
+        description="Максимум записей, выводимых фоновым потоком за одну запись в поток.",
+    )
 
 
 class TelemetryConfig(BaseModel):
@@ -252,15 +350,15 @@ class TelemetryConfig(BaseModel):
     enabled: bool = Field(default=False, description="Включить экспорт телеметрии.")
     exporter: str | None = Field(
         default=None,
-        description="Тип экспортера (jaeger, otlp, console).",
+        description="Тип экспортера (prometheus, otlp, console, jaeger).",
     )
     endpoint: str | None = Field(
         default=None,
-        description="URL или адрес экспортера, если требуется.",
+        description="URL или путь к файлу экспортера метрик, если требуется.",
     )
     sampling_ratio: PositiveFloat = Field(
         default=1.0,
-        description="Доля выборки трасс (1.0 = 100%).",
+        description="Доля выборки трасс (1.0 = 100%); на метрики не влияет.",
     )
 
 
@@ -300,6 +398,10 @@ class CLIConfig(BaseModel):
         default=False,
         description="If true, enable verbose (DEBUG-level) logging output.",
     )
+    profiling: bool = Field(
+        default=False,
+        description="If true, profile each stage (cProfile, sampled stacks, peak memory) and write profile artifacts.",
+    )
     fail_on_schema_drift: bool = Field(
         default=True,
         description="If true, schema drift raises an error; otherwise it is logged and execution continues.",
@@ -409,6 +511,7 @@ __all__ = [
     "TransformConfig",
     "PostprocessCorrelationConfig",
     "PostprocessConfig",
+    "LogSamplingConfig",
     "LoggingConfig",
     "TelemetryConfig",
     "CLIConfig",
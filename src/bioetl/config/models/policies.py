@@ -53,6 +53,56 @@ class RetryConfig(BaseModel):
     )
 
 
+class AdaptiveRateLimitConfig(BaseModel):
+    """AIMD tuning of the client-side rate limit (opt-in)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = Field(
+        default=False,
+        description="Adapt the rate to server feedback; clients of one host share the limiter.",
+    )
+    min_rate: PositiveFloat = Field(
+        default=0.5,
+        description="Lowest rate in calls per second the limiter backs off to.",
+    )
+    max_rate: PositiveFloat | None = Field(
+        default=None,
+        description="Highest rate in calls per second; defaults to max_calls / period.",
+    )
+    increase: PositiveFloat = Field(
+        default=1.0,
+        description="Calls per second added after a window within the latency and error targets.",
+    )
+    decrease_factor: float = Field(
+        default=0.5,
+        gt=0.0,
+        lt=1.0,
+        description="Factor applied to the rate on 429/503 responses or a Retry-After header.",
+    )
+    target_p95_latency_sec: PositiveFloat = Field(
+        default=2.0,
+        description="p95 response latency in seconds above which the rate stops increasing.",
+    )
+    target_error_rate: float = Field(
+        default=0.02,
+        ge=0.0,
+        le=1.0,
+        description="Share of failed requests (5xx or transport errors) above which the rate stops increasing.",
+    )
+    window: PositiveInt = Field(
+        default=20,
+        description="Number of responses evaluated per adjustment.",
+    )
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> AdaptiveRateLimitConfig:
+        if self.max_rate is not None and self.min_rate > self.max_rate:
+            msg = "rate_limit.adaptive.min_rate must not exceed rate_limit.adaptive.max_rate"
+            raise ValueError(msg)
+        return self
+
+
 class RateLimitConfig(BaseModel):
     """Leaky-bucket style client-side rate limiting."""
 
@@ -66,6 +116,7 @@ class RateLimitConfig(BaseModel):
         default=1.0,
         description="Time window in seconds for the rate limit.",
     )
+    adaptive: AdaptiveRateLimitConfig = Field(default_factory=AdaptiveRateLimitConfig)
 
 
 class CircuitBreakerConfig(BaseModel):
@@ -375,6 +426,7 @@ class DeterminismConfig(BaseModel):
 __all__ = [
     "StatusCode",
     "RetryConfig",
+    "AdaptiveRateLimitConfig",
     "RateLimitConfig",
     "CircuitBreakerConfig",
     "HTTPClientConfig",
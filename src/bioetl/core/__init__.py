@@ -1,25 +1,18 @@
-"""Core utilities for configuring the BioETL runtime."""
-
-from .api_client import TokenBucketLimiter, UnifiedAPIClient, merge_http_configs
-from .cli_base import CliCommandBase, CliEntrypoint
-from .client_factory import APIClientFactory
-from .errors import BioETLError
-from .logger import (
-    DEFAULT_LOG_LEVEL,
-    MANDATORY_FIELDS,
-    LogConfig,
-    LogFormat,
-    LoggerConfig,
-    UnifiedLogger,
-    bind_global_context,
-    configure_logging,
-    get_logger,
-    reset_global_context,
-)
-from .mapping_utils import stringify_mapping
+"""Core utilities for configuring the BioETL runtime.
+
+Public names are resolved lazily on first access so that importing a single
+``bioetl.core`` submodule (for example :mod:`bioetl.core.logger` from the CLI)
+does not pull in the HTTP client stack.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 __all__ = [
     "APIClientFactory",
+    "AdaptiveRateLimiter",
     "BioETLError",
     "DEFAULT_LOG_LEVEL",
     "LogConfig",
@@ -28,13 +21,82 @@ __all__ = [
     "LoggerConfig",
     "CliCommandBase",
     "CliEntrypoint",
+    "ClientRegistry",
     "TokenBucketLimiter",
     "UnifiedAPIClient",
     "UnifiedLogger",
     "bind_global_context",
     "configure_logging",
+    "get_client_registry",
     "get_logger",
     "merge_http_configs",
     "reset_global_context",
     "stringify_mapping",
 ]
+
+_EXPORTS: dict[str, str] = {
+    "AdaptiveRateLimiter": ".api_client",
+    "TokenBucketLimiter": ".api_client",
+    "UnifiedAPIClient": ".api_client",
+    "merge_http_configs": ".api_client",
+    "CliCommandBase": ".cli_base",
+    "CliEntrypoint": ".cli_base",
+    "APIClientFactory": ".client_factory",
+    "ClientRegistry": ".client_registry",
+    "get_client_registry": ".client_registry",
+    "BioETLError": ".errors",
+    "DEFAULT_LOG_LEVEL": ".logger",
+    "MANDATORY_FIELDS": ".logger",
+    "LogConfig": ".logger",
+    "LogFormat": ".logger",
+    "LoggerConfig": ".logger",
+    "UnifiedLogger": ".logger",
+    "bind_global_context": ".logger",
+    "configure_logging": ".logger",
+    "get_logger": ".logger",
+    "reset_global_context": ".logger",
+    "stringify_mapping": ".mapping_utils",
+}
+
+if TYPE_CHECKING:
+    from .api_client import (
+        AdaptiveRateLimiter,
+        TokenBucketLimiter,
+        UnifiedAPIClient,
+        merge_http_configs,
+    )
+    from .cli_base import CliCommandBase, CliEntrypoint
+    from .client_factory import APIClientFactory
+    from .client_registry import ClientRegistry, get_client_registry
+    from .errors import BioETLError
+    from .logger import (
+        DEFAULT_LOG_LEVEL,
+        MANDATORY_FIELDS,
+        LogConfig,
+        LogFormat,
+        LoggerConfig,
+        UnifiedLogger,
+        bind_global_context,
+        configure_logging,
+        get_logger,
+        reset_global_context,
+    )
+    from .mapping_utils import stringify_mapping
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule exporting ``name`` on first access."""
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the lazily available public names."""
+
+    return sorted(set(__all__ + list(globals().keys())))
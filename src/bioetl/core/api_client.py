@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import email.utils
+import math
 import random
 import threading
 import time
 from collections import deque
-from collections.abc import Callable, Mapping, MutableMapping
+from collections.abc import Awaitable, Callable, Mapping, MutableMapping
 from dataclasses import dataclass
-from typing import Any, Literal, cast
-from urllib.parse import urljoin
+from typing import Any, Literal, TypeVar, cast
+from urllib.parse import urljoin, urlsplit
 from uuid import uuid4
 
 import requests
@@ -19,16 +22,32 @@ from requests.exceptions import HTTPError, RequestException
 from bioetl.config.models.policies import CircuitBreakerConfig, HTTPClientConfig
 from bioetl.core.api import ApiProfile, get_api_client, profile_from_http_config
 from bioetl.core.logger import UnifiedLogger
+from bioetl.core.metrics import (
+    observe_http_request,
+    observe_rate_limiter_wait,
+    record_circuit_breaker_transition,
+    record_rate_limiter_rate,
+)
 
 __all__ = [
+    "AdaptiveRateLimiter",
     "TokenBucketLimiter",
     "CircuitBreaker",
     "CircuitBreakerOpenError",
     "UnifiedAPIClient",
+    "build_rate_limiter",
     "merge_http_configs",
+    "parse_retry_after",
+    "reset_adaptive_rate_limiters",
 ]
 
 
+_T = TypeVar("_T")
+
+_THROTTLE_STATUSES = frozenset({429, 503})
+_RETRY_AFTER_STATUSES = frozenset({413, 429, 503})
+
+
 class CircuitBreakerOpenError(RequestException):
     """Raised when the circuit breaker blocks outbound requests."""
 
@@ -57,14 +76,9 @@ class TokenBucketLimiter:
 
         waited = 0.0
         while True:
-            with self._lock:
-                now = time.monotonic()
-                while self._timestamps and now - self._timestamps[0] >= self.period:
-                    self._timestamps.popleft()
-                if len(self._timestamps) < self.max_calls:
-                    self._timestamps.append(now)
-                    return waited
-                sleep_for = self.period - (now - self._timestamps[0])
+            sleep_for = self._reserve()
+            if sleep_for is None:
+                return waited
             if self.jitter:
                 sleep_for += random.uniform(0.0, self._jitter_max)
             if sleep_for > 0:
@@ -73,6 +87,211 @@ class TokenBucketLimiter:
             else:  # pragma: no cover - defensive, should rarely happen
                 time.sleep(0)
 
+    async def acquire_async(self) -> float:
+        """Await a token without blocking the event loop and return wait seconds."""
+
+        waited = 0.0
+        while True:
+            sleep_for = self._reserve()
+            if sleep_for is None:
+                return waited
+            if self.jitter:
+                sleep_for += random.uniform(0.0, self._jitter_max)
+            await asyncio.sleep(max(sleep_for, 0.0))
+            waited += max(sleep_for, 0.0)
+
+    def _reserve(self) -> float | None:
+        """Take a token if one is free, otherwise return seconds until the next one."""
+
+        with self._lock:
+            now = time.monotonic()
+            while self._timestamps and now - self._timestamps[0] >= self.period:
+                self._timestamps.popleft()
+            if len(self._timestamps) < self.max_calls:
+                self._timestamps.append(now)
+                return None
+            return self.period - (now - self._timestamps[0])
+
+    def record(
+        self, status_code: int | None, latency_seconds: float, *, retry_after: float | None = None
+    ) -> None:
+        """Feed back the outcome of a request; the fixed limiter ignores it."""
+
+
+class AdaptiveRateLimiter(TokenBucketLimiter):
+    """Token bucket whose rate follows server feedback (AIMD).
+
+    The limiter admits ``burst`` calls per ``burst / rate`` seconds. Every
+    ``window`` responses the rate grows by ``increase`` calls per second while
+    the window's p95 latency and error rate (5xx and transport errors) stay
+    within the targets. A 429/503 response or a ``Retry-After`` header
+    multiplies the rate by ``decrease_factor`` once per congestion event:
+    responses to requests sent before the last back-off do not cut it again.
+    ``Retry-After`` also holds every caller until the server-given time.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        min_rate: float,
+        max_rate: float,
+        burst: int = 1,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        target_p95_latency: float = 2.0,
+        target_error_rate: float = 0.02,
+        window: int = 20,
+        jitter: bool = True,
+        host: str = "",
+    ) -> None:
+        if not 0 < min_rate <= max_rate:
+            msg = "min_rate must be > 0 and <= max_rate"
+            raise ValueError(msg)
+        if not 0 < decrease_factor < 1:
+            msg = "decrease_factor must be between 0 and 1"
+            raise ValueError(msg)
+        if window <= 0:
+            msg = "window must be > 0"
+            raise ValueError(msg)
+        rate = min(max(rate, min_rate), max_rate)
+        super().__init__(burst, burst / rate, jitter=jitter)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.target_p95_latency = target_p95_latency
+        self.target_error_rate = target_error_rate
+        self.host = host
+        self._window: deque[tuple[float, bool]] = deque(maxlen=window)
+        self._blocked_until = 0.0
+        self._last_decrease = -math.inf
+        record_rate_limiter_rate(host, rate)
+
+    @classmethod
+    def from_config(cls, config: HTTPClientConfig, *, host: str = "") -> AdaptiveRateLimiter:
+        """Build the limiter described by ``config.rate_limit``."""
+
+        rate_limit = config.rate_limit
+        adaptive = rate_limit.adaptive
+        configured = rate_limit.max_calls / rate_limit.period
+        max_rate = adaptive.max_rate if adaptive.max_rate is not None else configured
+        return cls(
+            configured,
+            min_rate=min(adaptive.min_rate, max_rate),
+            max_rate=max_rate,
+            burst=rate_limit.max_calls,
+            increase=adaptive.increase,
+            decrease_factor=adaptive.decrease_factor,
+            target_p95_latency=adaptive.target_p95_latency_sec,
+            target_error_rate=adaptive.target_error_rate,
+            window=adaptive.window,
+            jitter=config.rate_limit_jitter,
+            host=host,
+        )
+
+    @property
+    def rate(self) -> float:
+        """Current rate in calls per second."""
+
+        with self._lock:
+            return self.max_calls / self.period
+
+    def record(
+        self, status_code: int | None, latency_seconds: float, *, retry_after: float | None = None
+    ) -> None:
+        """Adjust the rate from one response (``status_code`` ``None``: transport error)."""
+
+        with self._lock:
+            now = time.monotonic()
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            if status_code in _THROTTLE_STATUSES or retry_after is not None:
+                if now - latency_seconds >= self._last_decrease:
+                    self._last_decrease = now
+                    self._window.clear()
+                    self._set_rate(self._current_rate() * self.decrease_factor)
+                return
+            failed = status_code is None or status_code >= 500
+            self._window.append((latency_seconds, failed))
+            if len(self._window) < (self._window.maxlen or 1):
+                return
+            latencies = sorted(latency for latency, _ in self._window)
+            p95 = latencies[math.ceil(0.95 * len(latencies)) - 1]
+            error_rate = sum(failed for _, failed in self._window) / len(self._window)
+            self._window.clear()
+            if p95 <= self.target_p95_latency and error_rate <= self.target_error_rate:
+                self._set_rate(self._current_rate() + self.increase)
+
+    def _current_rate(self) -> float:
+        return self.max_calls / self.period
+
+    def _set_rate(self, rate: float) -> None:
+        rate = min(max(rate, self.min_rate), self.max_rate)
+        self.period = self.max_calls / rate
+        self._jitter_max = 1.0 / rate
+        record_rate_limiter_rate(self.host, rate)
+
+    def _reserve(self) -> float | None:
+        with self._lock:
+            blocked = self._blocked_until - time.monotonic()
+        if blocked > 0:
+            return blocked
+        return super()._reserve()
+
+
+_adaptive_limiters: dict[str, AdaptiveRateLimiter] = {}
+_adaptive_lock = threading.Lock()
+
+
+def build_rate_limiter(
+    config: HTTPClientConfig, *, base_url: str | None = None
+) -> TokenBucketLimiter:
+    """Return the rate limiter for a client of ``base_url`` configured by ``config``.
+
+    Without ``rate_limit.adaptive.enabled`` this is a new fixed
+    :class:`TokenBucketLimiter`. Adaptive limiters are shared by every client
+    of the same host, so back-off applies to all of them; the first client of
+    a host determines the limiter settings.
+    """
+
+    if not config.rate_limit.adaptive.enabled:
+        return TokenBucketLimiter(
+            config.rate_limit.max_calls,
+            config.rate_limit.period,
+            jitter=config.rate_limit_jitter,
+        )
+    host = urlsplit(base_url or "").netloc.lower()
+    if not host:
+        return AdaptiveRateLimiter.from_config(config)
+    with _adaptive_lock:
+        limiter = _adaptive_limiters.get(host)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter.from_config(config, host=host)
+            _adaptive_limiters[host] = limiter
+        return limiter
+
+
+def reset_adaptive_rate_limiters() -> None:
+    """Forget the per-host adaptive limiters; new clients start from the configured rate."""
+
+    with _adaptive_lock:
+        _adaptive_limiters.clear()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds of a ``Retry-After`` header (seconds or HTTP date)."""
+
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    parsed = email.utils.parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(float(email.utils.mktime_tz(parsed)) - time.time(), 0.0)
+
 
 class CircuitBreaker:
     """Circuit breaker for protecting against cascading failures.
@@ -120,6 +339,31 @@ class CircuitBreaker:
         CircuitBreakerOpenError:
             If the circuit breaker is in open state and timeout hasn't elapsed.
         """
+        self._before_call()
+
+        # Execute the function
+        try:
+            result = func()
+            self._on_success()
+            return result
+        except Exception:
+            self._on_failure()
+            raise
+
+    async def call_async(self, func: Callable[[], Awaitable[_T]]) -> _T:
+        """Await ``func`` with the same protection as :meth:`call`."""
+
+        self._before_call()
+        try:
+            result = await func()
+        except Exception:
+            self._on_failure()
+            raise
+        self._on_success()
+        return result
+
+    def _before_call(self) -> None:
+        """Raise :class:`CircuitBreakerOpenError` while the circuit is open."""
         with self._lock:
             if self._state == "open":
                 if self._last_failure_time is None:
@@ -132,6 +376,7 @@ class CircuitBreaker:
                         # Transition to half-open
                         self._state = "half-open"
                         self._half_open_calls = 0
+                        record_circuit_breaker_transition(self.name, "half-open")
                         if self._logger:
                             self._logger.info(
                                 "circuit_breaker.transition",
@@ -154,15 +399,6 @@ class CircuitBreaker:
                             f"Elapsed: {elapsed:.2f}s, timeout: {self._timeout:.2f}s"
                         )
 
-        # Execute the function
-        try:
-            result = func()
-            self._on_success()
-            return result
-        except Exception:
-            self._on_failure()
-            raise
-
     def _on_success(self) -> None:
         """Handle successful request."""
         with self._lock:
@@ -172,6 +408,7 @@ class CircuitBreaker:
                 self._failure_count = 0
                 self._last_failure_time = None
                 self._half_open_calls = 0
+                record_circuit_breaker_transition(self.name, "closed")
                 if self._logger:
                     self._logger.info(
                         "circuit_breaker.transition",
@@ -193,6 +430,7 @@ class CircuitBreaker:
                 # Failure in half-open, transition back to open
                 self._state = "open"
                 self._half_open_calls = 0
+                record_circuit_breaker_transition(self.name, "open")
                 if self._logger:
                     self._logger.warning(
                         "circuit_breaker.transition",
@@ -205,6 +443,7 @@ class CircuitBreaker:
                 if self._failure_count >= self._failure_threshold:
                     # Too many failures, transition to open
                     self._state = "open"
+                    record_circuit_breaker_transition(self.name, "open")
                     if self._logger:
                         self._logger.warning(
                             "circuit_breaker.transition",
@@ -242,6 +481,10 @@ def _deep_merge(
     return base
 
 
+def _noop() -> None:
+    return None
+
+
 class UnifiedAPIClient:
     """HTTP client providing retries, timeouts, and rate limiting."""
 
@@ -252,7 +495,15 @@ class UnifiedAPIClient:
         base_url: str | None = None,
         name: str | None = None,
         session: requests.Session | None = None,
+        rate_limiter: TokenBucketLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        on_close: Callable[[], None] | None = None,
     ) -> None:
+        """Create a client; shared transports pass their own pool, limiter and breaker.
+
+        When ``on_close`` is given, :meth:`close` calls it instead of closing
+        ``session``, leaving a pooled session open for other clients.
+        """
         self.config = config
         self.base_url = base_url.rstrip("/") if base_url else ""
         self.name = name or "default"
@@ -265,20 +516,17 @@ class UnifiedAPIClient:
                 self._session.headers.setdefault(key, value)
         self._timeout = self._profile.timeouts.as_requests_timeout()
         self._max_url_length = int(config.max_url_length)
-        self._rate_limiter = TokenBucketLimiter(
-            config.rate_limit.max_calls,
-            config.rate_limit.period,
-            jitter=config.rate_limit_jitter,
-        )
+        self._rate_limiter = rate_limiter or build_rate_limiter(config, base_url=self.base_url)
         self._logger = UnifiedLogger.get(__name__).bind(
             component="http_client",
             http_client=self.name,
         )
-        self._circuit_breaker = CircuitBreaker(
+        self._circuit_breaker = circuit_breaker or CircuitBreaker(
             config.circuit_breaker,
             name=self.name,
             logger=self._logger,
         )
+        self._on_close = on_close
 
     @staticmethod
     def _derive_timeout(config: HTTPClientConfig) -> tuple[float, float]:
@@ -292,7 +540,11 @@ class UnifiedAPIClient:
         return (connect, read)
 
     def close(self) -> None:
-        self._session.close()
+        if self._on_close is None:
+            self._session.close()
+            return
+        on_close, self._on_close = self._on_close, _noop
+        on_close()
 
     # ------------------------------------------------------------------
     # Request execution
@@ -341,6 +593,7 @@ class UnifiedAPIClient:
         request_id = str(uuid4())
         def _execute() -> Response:
             wait_seconds = self._rate_limiter.acquire()
+            observe_rate_limiter_wait(self.name, wait_seconds)
             attempt = 1
             if wait_seconds:
                 self._logger.debug(
@@ -351,17 +604,25 @@ class UnifiedAPIClient:
                     request_id=request_id,
                 )
             start = time.perf_counter()
-            response = self._session.request(
-                method,
-                url,
-                params=params,
-                json=json,
-                data=data,
-                headers=self._apply_headers(headers),
-                timeout=self._timeout,
-            )
+            try:
+                response = self._session.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    data=data,
+                    headers=self._apply_headers(headers),
+                    timeout=self._timeout,
+                )
+            except RequestException:
+                elapsed = time.perf_counter() - start
+                observe_http_request(self.name, method, url, "error", elapsed)
+                self._rate_limiter.record(None, elapsed)
+                raise
             duration_ms = (time.perf_counter() - start) * 1000
             status_code = response.status_code
+            observe_http_request(self.name, method, url, status_code, duration_ms / 1000)
+            self._record_rate_feedback(response, duration_ms / 1000)
             if status_code >= 400:
                 self._logger.error(
                     "http.request.failed",
@@ -418,6 +679,23 @@ class UnifiedAPIClient:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _record_rate_feedback(self, response: Response, latency_seconds: float) -> None:
+        """Report ``response`` and the throttled attempts urllib3 retried to the limiter."""
+
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+        history = getattr(retries, "history", ())
+        if isinstance(history, tuple):
+            for entry in history:
+                if getattr(entry, "status", None) in _THROTTLE_STATUSES:
+                    self._rate_limiter.record(entry.status, latency_seconds)
+        retry_after: float | None = None
+        if (
+            response.status_code in _RETRY_AFTER_STATUSES
+            and self._profile.retries.respect_retry_after
+        ):
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        self._rate_limiter.record(response.status_code, latency_seconds, retry_after=retry_after)
+
     def _apply_headers(self, extra: Mapping[str, str] | None) -> Mapping[str, str]:
         # Convert headers to str-only dict, handling both str and bytes values
         session_headers: dict[str, str] = {}
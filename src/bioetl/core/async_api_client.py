@@ -0,0 +1,414 @@
+"""Asyncio HTTP client mirroring :class:`~bioetl.core.api_client.UnifiedAPIClient`."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Mapping
+from types import TracebackType
+from typing import Any
+from urllib.parse import urljoin
+from uuid import uuid4
+
+import httpx
+import requests
+from requests.exceptions import (
+    ConnectionError,
+    ConnectTimeout,
+    ReadTimeout,
+    RequestException,
+    Timeout,
+)
+
+from bioetl.config.models.policies import HTTPClientConfig
+from bioetl.core.api import ApiProfile, _default_user_agent, profile_from_http_config
+from bioetl.core.api_client import (
+    _RETRY_AFTER_STATUSES,
+    CircuitBreaker,
+    TokenBucketLimiter,
+    build_rate_limiter,
+    parse_retry_after,
+)
+from bioetl.core.logger import UnifiedLogger
+from bioetl.core.metrics import observe_http_request, observe_rate_limiter_wait
+
+__all__ = ["AsyncUnifiedAPIClient"]
+
+_CONNECT_ERRORS: tuple[type[httpx.TransportError], ...] = (httpx.ConnectError, httpx.ConnectTimeout)
+_READ_ERRORS: tuple[type[httpx.TransportError], ...] = (
+    httpx.ReadError,
+    httpx.ReadTimeout,
+    httpx.RemoteProtocolError,
+)
+
+
+class AsyncUnifiedAPIClient:
+    """Asyncio counterpart of :class:`UnifiedAPIClient` built on :mod:`httpx`.
+
+    Requests share the semantics of the blocking client: one token of the rate
+    limiter and one circuit breaker call per logical request, transport-level
+    retries driven by ``HTTPClientConfig.retries`` (backoff, ``Retry-After``,
+    retryable statuses and methods) and the same ``http.*`` log events.
+    Transport failures surface as :mod:`requests` exceptions so callers keep a
+    single set of ``except`` clauses.
+
+    The connection pool holds up to ``pool_maxsize`` connections; many
+    coroutines can therefore share one client from a single thread. The
+    underlying :class:`httpx.AsyncClient` is bound to the running event loop:
+    use the client as an async context manager within one loop.
+    """
+
+    def __init__(
+        self,
+        config: HTTPClientConfig,
+        *,
+        base_url: str | None = None,
+        name: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        rate_limiter: TokenBucketLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        on_close: Callable[[], None] | None = None,
+    ) -> None:
+        self.config = config
+        self.base_url = base_url.rstrip("/") if base_url else ""
+        self.name = name or "default"
+        self._profile: ApiProfile = profile_from_http_config(config, name=self.name)
+        self._max_url_length = int(config.max_url_length)
+        self._logger = UnifiedLogger.get(__name__).bind(
+            component="http_client",
+            http_client=self.name,
+        )
+        self._rate_limiter = rate_limiter or build_rate_limiter(config, base_url=self.base_url)
+        self._circuit_breaker = circuit_breaker or CircuitBreaker(
+            config.circuit_breaker,
+            name=self.name,
+            logger=self._logger,
+        )
+        self._on_close = on_close
+        self._client = self._build_client(transport)
+
+    def _build_client(self, transport: httpx.AsyncBaseTransport | None) -> httpx.AsyncClient:
+        profile = self._profile
+        headers: dict[str, str] = {"User-Agent": _default_user_agent()}
+        headers.update(profile.headers)
+        timeouts = profile.timeouts
+        limits = httpx.Limits(
+            max_connections=profile.limits.max_keepalive,
+            max_keepalive_connections=profile.limits.max_keepalive,
+        )
+        mounts: dict[str, httpx.AsyncBaseTransport | None] | None = None
+        if profile.proxies and transport is None:
+            mounts = {
+                f"{scheme}://": httpx.AsyncHTTPTransport(
+                    proxy=proxy, verify=profile.verify, cert=profile.cert, limits=limits
+                )
+                for scheme, proxy in profile.proxies.items()
+            }
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=httpx.Timeout(
+                connect=min(timeouts.connect, timeouts.total),
+                read=timeouts.read,
+                write=timeouts.write,
+                pool=timeouts.pool,
+            ),
+            limits=limits,
+            verify=profile.verify,
+            cert=profile.cert,
+            trust_env=profile.trust_env,
+            follow_redirects=True,
+            max_redirects=profile.max_redirects,
+            transport=transport,
+            mounts=mounts,
+        )
+
+    async def __aenter__(self) -> AsyncUnifiedAPIClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pool and release shared limiter/breaker leases."""
+
+        await self._client.aclose()
+        if self._on_close is not None:
+            on_close, self._on_close = self._on_close, None
+            on_close()
+
+    # ------------------------------------------------------------------
+    # Request execution
+    # ------------------------------------------------------------------
+
+    async def get(
+        self,
+        endpoint: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> httpx.Response:
+        params_dict: dict[str, Any] = dict(params or {})
+        if params_dict and (self.base_url or endpoint.startswith(("http://", "https://"))):
+            full_url = self._prepare_full_url(endpoint, params_dict)
+            if self._max_url_length and len(full_url) > self._max_url_length:
+                override_headers = dict(headers or {})
+                override_headers.setdefault("X-HTTP-Method-Override", "GET")
+                self._logger.info(
+                    "http.request.method_override",
+                    endpoint=full_url,
+                    url_length=len(full_url),
+                    max_length=self._max_url_length,
+                    client=self.name,
+                )
+                return await self.request(
+                    "POST",
+                    endpoint,
+                    data=params_dict,
+                    headers=override_headers,
+                )
+        return await self.request("GET", endpoint, params=params_dict or None, headers=headers)
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        data: Any | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> httpx.Response:
+        url = self._resolve_url(endpoint)
+        request_id = str(uuid4())
+
+        async def _execute() -> httpx.Response:
+            wait_seconds = await self._rate_limiter.acquire_async()
+            observe_rate_limiter_wait(self.name, wait_seconds)
+            if wait_seconds:
+                self._logger.debug(
+                    "http.rate_limiter.wait",
+                    wait_seconds=wait_seconds,
+                    endpoint=url,
+                    attempt=1,
+                    request_id=request_id,
+                )
+            start = time.perf_counter()
+            try:
+                response, attempt = await self._send_with_retries(
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    data=data,
+                    headers=headers,
+                )
+            except RequestException:
+                observe_http_request(self.name, method, url, "error", time.perf_counter() - start)
+                raise
+            duration_ms = (time.perf_counter() - start) * 1000
+            status_code = response.status_code
+            observe_http_request(self.name, method, url, status_code, duration_ms / 1000)
+            if status_code >= 400:
+                self._logger.error(
+                    "http.request.failed",
+                    endpoint=url,
+                    attempt=attempt,
+                    duration_ms=duration_ms,
+                    status_code=status_code,
+                    request_id=request_id,
+                )
+                message = f"{status_code} Error for url: {response.url}"
+                raise requests.HTTPError(message, response=response)  # type: ignore[arg-type]
+            self._logger.info(
+                "http.request.completed",
+                endpoint=url,
+                attempt=attempt,
+                duration_ms=duration_ms,
+                status_code=status_code,
+                request_id=request_id,
+            )
+            return response
+
+        try:
+            return await self._circuit_breaker.call_async(_execute)
+        except RequestException as exc:
+            self._logger.warning(
+                "http.request.exception",
+                endpoint=url,
+                request_id=request_id,
+                error=str(exc),
+            )
+            raise
+
+    async def request_json(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        data: Any | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> Any:
+        response = await self.request(
+            method,
+            endpoint,
+            params=params,
+            json=json,
+            data=data,
+            headers=headers,
+        )
+        return response.json()
+
+    # ------------------------------------------------------------------
+    # Retries
+    # ------------------------------------------------------------------
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None,
+        json: Any | None,
+        data: Any | None,
+        headers: Mapping[str, str] | None,
+    ) -> tuple[httpx.Response, int]:
+        """Send the request, retrying like the ``urllib3`` policy of the sync client."""
+
+        policy = self._profile.retries
+        budget = max(policy.total, 0)
+        status_budget = budget + 1 if budget else 0
+        method_retryable = method.upper() in policy.methods
+        consecutive_errors = 0
+        attempt = 1
+        while True:
+            sent = time.perf_counter()
+            try:
+                response = await self._client.request(
+                    method,
+                    url,
+                    params=dict(params) if params is not None else None,
+                    json=json,
+                    data=data,
+                    headers=dict(headers) if headers else None,
+                )
+            except httpx.TransportError as exc:
+                self._rate_limiter.record(None, time.perf_counter() - sent)
+                if isinstance(exc, _CONNECT_ERRORS):
+                    retryable = policy.retry_on_connection_errors
+                elif isinstance(exc, _READ_ERRORS):
+                    retryable = policy.retry_on_read_errors and method_retryable
+                else:
+                    retryable = policy.retry_on_other_errors
+                if not retryable or consecutive_errors >= budget:
+                    raise _as_requests_exception(exc) from exc
+                consecutive_errors += 1
+                wait_seconds = self._backoff(consecutive_errors)
+                self._log_retry(
+                    attempt, wait_seconds, method, url, None, exc, budget - consecutive_errors
+                )
+                await asyncio.sleep(wait_seconds)
+                attempt += 1
+                continue
+
+            status_code = response.status_code
+            retry_after = self._retry_after(response)
+            self._rate_limiter.record(
+                status_code,
+                time.perf_counter() - sent,
+                retry_after=retry_after if status_code in _RETRY_AFTER_STATUSES else None,
+            )
+            should_retry = method_retryable and (
+                status_code in policy.statuses
+                or (retry_after is not None and status_code in _RETRY_AFTER_STATUSES)
+            )
+            if not should_retry or consecutive_errors >= status_budget:
+                return response, attempt
+            consecutive_errors += 1
+            wait_seconds = (
+                retry_after if retry_after is not None else self._backoff(consecutive_errors)
+            )
+            self._log_retry(
+                attempt,
+                wait_seconds,
+                method,
+                url,
+                status_code,
+                None,
+                status_budget - consecutive_errors,
+            )
+            await response.aclose()
+            await asyncio.sleep(wait_seconds)
+            attempt += 1
+
+    def _backoff(self, consecutive_errors: int) -> float:
+        if consecutive_errors <= 1:
+            return 0.0
+        policy = self._profile.retries
+        backoff = policy.backoff_factor * (2 ** (consecutive_errors - 1))
+        return float(max(0.0, min(policy.backoff_max, backoff)))
+
+    def _retry_after(self, response: httpx.Response) -> float | None:
+        if not self._profile.retries.respect_retry_after:
+            return None
+        return parse_retry_after(response.headers.get("Retry-After"))
+
+    def _log_retry(
+        self,
+        attempt: int,
+        wait_seconds: float,
+        method: str,
+        url: str,
+        status_code: int | None,
+        error: Exception | None,
+        status_remaining: int,
+    ) -> None:
+        self._logger.debug(
+            "http.retry",
+            attempt=attempt + 1,
+            wait_seconds=wait_seconds,
+            method=method,
+            url=url,
+            status_code=status_code,
+            error=str(error) if error else None,
+            profile=self._profile.name,
+            status_remaining=status_remaining,
+            status_forcelist=list(self._profile.retries.statuses),
+        )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _resolve_url(self, endpoint: str) -> str:
+        if endpoint.startswith("http://") or endpoint.startswith("https://"):
+            return endpoint
+        if not self.base_url:
+            return endpoint
+        return urljoin(self.base_url + "/", endpoint.lstrip("/"))
+
+    def _prepare_full_url(self, endpoint: str, params: Mapping[str, Any]) -> str:
+        url = self._resolve_url(endpoint)
+        prepared = requests.Request("GET", url, params=params).prepare()
+        return prepared.url or url
+
+
+def _as_requests_exception(exc: httpx.TransportError) -> RequestException:
+    """Translate an :mod:`httpx` transport error into its :mod:`requests` peer."""
+
+    message = str(exc) or type(exc).__name__
+    if isinstance(exc, httpx.ConnectTimeout):
+        return ConnectTimeout(message)
+    if isinstance(exc, httpx.ReadTimeout):
+        return ReadTimeout(message)
+    if isinstance(exc, httpx.TimeoutException):
+        return Timeout(message)
+    if isinstance(exc, (httpx.ConnectError, httpx.ReadError, httpx.RemoteProtocolError)):
+        return ConnectionError(message)
+    return RequestException(message)
@@ -0,0 +1,215 @@
+"""Chunked, optionally process-parallel Pandera validation.
+
+The schema is split into a row-level part, evaluated independently on row
+chunks (in a process pool when more than one worker is requested), and a
+cross-row part (``unique`` columns, ``groupby`` checks and frame-level
+checks) evaluated once over the combined frame. Uniqueness is decided by the
+hash-based ``duplicated`` of the combined frame, so duplicates spanning chunks
+are still reported.
+
+Failures from different chunks are merged per check in chunk order, giving
+one ``SchemaError`` per failed check in the order of a single-pass validation.
+One difference remains: when a column fails dtype coercion, single-pass
+Pandera reports its checks as a ``CHECK_ERROR``, while chunks that coerced
+cleanly still report the concrete failing values.
+"""
+
+from __future__ import annotations
+
+import pickle
+from collections.abc import Hashable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import pandas as pd
+from pandera import Column, DataFrameSchema
+from pandera.errors import SchemaError, SchemaErrors
+
+from bioetl.core.concurrency import resolve_worker_count
+
+__all__ = ["cross_row_schema", "row_level_schema", "validate_in_chunks"]
+
+
+def row_level_schema(schema: DataFrameSchema) -> DataFrameSchema:
+    """Return ``schema`` without the checks that depend on more than one row."""
+
+    updates: dict[str, dict[str, Any]] = {}
+    for name, column in schema.columns.items():
+        row_checks = [check for check in column.checks if check.groupby is None]
+        if column.unique or len(row_checks) != len(column.checks):
+            updates[name] = {"checks": row_checks, "unique": False}
+    reduced = schema.update_columns(updates) if updates else schema.replace()
+    reduced.checks = []
+    reduced.unique = None
+    return reduced
+
+
+def cross_row_schema(schema: DataFrameSchema) -> DataFrameSchema | None:
+    """Return the checks of ``schema`` that depend on more than one row, if any."""
+
+    columns: dict[str, Column] = {}
+    for name, column in schema.columns.items():
+        grouped_checks = [check for check in column.checks if check.groupby is not None]
+        if column.unique or grouped_checks:
+            columns[name] = Column(
+                checks=grouped_checks,
+                nullable=True,
+                unique=column.unique,
+                report_duplicates=column.report_duplicates,
+                name=name,
+            )
+    if not columns and not schema.checks and not schema.unique:
+        return None
+    return DataFrameSchema(
+        columns,
+        checks=schema.checks,
+        unique=schema.unique,
+        report_duplicates=schema.report_duplicates,
+    )
+
+
+def validate_in_chunks(
+    schema: DataFrameSchema,
+    df: pd.DataFrame,
+    *,
+    chunk_rows: int,
+    max_workers: int | None = 1,
+) -> pd.DataFrame:
+    """Validate ``df`` against ``schema`` in row chunks of ``chunk_rows``.
+
+    Parameters
+    ----------
+    schema:
+        Pandera schema; validation is always lazy.
+    df:
+        Frame to validate. Chunks keep the original index labels, so
+        ``failure_cases["index"]`` refers to rows of ``df``.
+    chunk_rows:
+        Maximum number of rows per chunk. Frames that fit into one chunk are
+        validated in a single pass.
+    max_workers:
+        Number of worker processes (see :func:`resolve_worker_count`); ``1``
+        validates the chunks sequentially in the current process.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The validated (coerced) frame in the original row order.
+
+    Raises
+    ------
+    pandera.errors.SchemaErrors
+        With the failures of all chunks and of the cross-row checks.
+    """
+
+    if chunk_rows < 1:
+        msg = f"chunk_rows must be positive, got {chunk_rows}"
+        raise ValueError(msg)
+    if len(df) <= chunk_rows or schema.index is not None:
+        return schema.validate(df, lazy=True)
+
+    row_schema = row_level_schema(schema)
+    chunks = [df.iloc[start : start + chunk_rows] for start in range(0, len(df), chunk_rows)]
+    workers = resolve_worker_count(max_workers, len(chunks))
+    if workers > 1 and not _is_picklable(row_schema):
+        workers = 1
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_validate_chunk, [row_schema] * len(chunks), chunks))
+    else:
+        results = [_validate_chunk(row_schema, chunk) for chunk in chunks]
+
+    errors: list[SchemaError] = []
+    parts: list[pd.DataFrame] = []
+    for chunk, validated in zip(chunks, results, strict=True):
+        if validated is None:
+            # SchemaError теряет failure_cases при pickle: упавший чанк проверяется здесь.
+            try:
+                row_schema.validate(chunk, lazy=True)
+            except SchemaErrors as exc:
+                errors.extend(exc.schema_errors)
+            parts.append(chunk)
+        else:
+            parts.append(validated)
+    combined = pd.concat(parts)
+
+    cross_schema = cross_row_schema(schema)
+    if cross_schema is not None:
+        try:
+            cross_schema.validate(combined, lazy=True)
+        except SchemaErrors as exc:
+            errors.extend(exc.schema_errors)
+    if errors:
+        raise SchemaErrors(schema, _merge_schema_errors(schema, errors, df), df)
+    return combined
+
+
+def _is_picklable(schema: DataFrameSchema) -> bool:
+    """Return whether ``schema`` can be sent to a worker process (no lambdas/closures)."""
+
+    try:
+        pickle.dumps(schema)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _validate_chunk(schema: DataFrameSchema, chunk: pd.DataFrame) -> pd.DataFrame | None:
+    try:
+        return schema.validate(chunk, lazy=True)
+    except SchemaErrors:
+        return None
+
+
+def _merge_schema_errors(
+    schema: DataFrameSchema, errors: list[SchemaError], data: pd.DataFrame
+) -> list[SchemaError]:
+    """Merge per-chunk errors of the same check and order them like a single pass.
+
+    Pandera reports frame structure errors first, then columns in schema order
+    (uniqueness before checks), then frame-level checks.
+    """
+
+    grouped: dict[Hashable, list[SchemaError]] = {}
+    for error in errors:
+        key = (
+            error.reason_code,
+            error.column_name,
+            type(error.schema).__name__,
+            getattr(error.schema, "name", None),
+            error.check_index,
+            str(error.check),
+        )
+        grouped.setdefault(key, []).append(error)
+
+    merged: list[SchemaError] = []
+    for group in grouped.values():
+        first = group[0]
+        frames = [
+            error.failure_cases for error in group if isinstance(error.failure_cases, pd.DataFrame)
+        ]
+        if len(group) == 1 or len(frames) != len(group):
+            # Скалярные ошибки (нет колонки, неверный dtype) одинаковы во всех чанках.
+            merged.append(first)
+            continue
+        merged.append(
+            SchemaError(
+                first.schema,
+                data,
+                str(first),
+                failure_cases=pd.concat(frames, ignore_index=True),
+                check=first.check,
+                check_index=first.check_index,
+                reason_code=first.reason_code,
+                column_name=first.column_name,
+            )
+        )
+    positions = {name: position for position, name in enumerate(schema.columns)}
+
+    def _order(error: SchemaError) -> tuple[int, int, int]:
+        check_index = -1 if error.check_index is None else int(error.check_index)
+        if isinstance(error.schema, Column):
+            return (1, positions.get(str(error.column_name), len(positions)), check_index)
+        return (0, 0, 0) if error.check_index is None else (2, 0, check_index)
+
+    return sorted(merged, key=_order)
@@ -2,21 +2,33 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from bioetl.config.models.models import PipelineConfig
 from bioetl.config.models.policies import HTTPClientConfig
 from bioetl.config.models.models import SourceConfig
 
 from .api_client import UnifiedAPIClient, merge_http_configs
+from .client_registry import ClientKey, ClientRegistry, get_client_registry
 from .logger import UnifiedLogger
 
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from .async_api_client import AsyncUnifiedAPIClient
+
 __all__ = ["APIClientFactory"]
 
 
 class APIClientFactory:
-    """Create fully configured :class:`UnifiedAPIClient` instances."""
+    """Create fully configured :class:`UnifiedAPIClient` instances.
 
-    def __init__(self, config: PipelineConfig) -> None:
+    Clients for the same source, base URL and HTTP profile share one
+    connection pool, rate limiter and circuit breaker taken from ``registry``
+    (the process-wide :class:`ClientRegistry` by default).
+    """
+
+    def __init__(self, config: PipelineConfig, *, registry: ClientRegistry | None = None) -> None:
         self._config = config
+        self._registry = registry
         self._log = UnifiedLogger.get(__name__).bind(component="client_factory")
 
     @property
@@ -43,21 +55,65 @@ class APIClientFactory:
             profile=profile or "default",
             base_url=base_url,
         )
-        return UnifiedAPIClient(http_config, base_url=base_url, name=client_name)
+        registry = self._registry if self._registry is not None else get_client_registry()
+        key = ClientKey.for_config(
+            http_config, source=client_name, base_url=base_url, profile=profile
+        )
+        transport = registry.acquire(key, http_config)
+        return UnifiedAPIClient(
+            http_config,
+            base_url=base_url,
+            name=client_name,
+            session=transport.session,
+            rate_limiter=transport.rate_limiter,
+            circuit_breaker=transport.circuit_breaker,
+            on_close=lambda: registry.release(transport),
+        )
+
+    def build_async(
+        self,
+        *,
+        base_url: str,
+        source: str | None = None,
+        profile: str | None = None,
+        overrides: HTTPClientConfig | None = None,
+        name: str | None = None,
+    ) -> AsyncUnifiedAPIClient:
+        """Return an :class:`AsyncUnifiedAPIClient` for the given settings.
+
+        The async client owns its connection pool (it is bound to an event
+        loop) but shares the rate limiter and circuit breaker with blocking
+        clients of the same upstream.
+        """
+
+        from .async_api_client import AsyncUnifiedAPIClient  # Lazy: httpx is only needed here
+
+        http_config = self._resolve_http_config(profile=profile, overrides=overrides)
+        client_name = name or source or profile or "default"
+        self._log.debug(
+            "client_factory.build_async",
+            client=client_name,
+            profile=profile or "default",
+            base_url=base_url,
+        )
+        registry = self._registry if self._registry is not None else get_client_registry()
+        key = ClientKey.for_config(
+            http_config, source=client_name, base_url=base_url, profile=profile
+        )
+        transport = registry.acquire(key, http_config)
+        return AsyncUnifiedAPIClient(
+            http_config,
+            base_url=base_url,
+            name=client_name,
+            rate_limiter=transport.rate_limiter,
+            circuit_breaker=transport.circuit_breaker,
+            on_close=lambda: registry.release(transport),
+        )
 
     def for_source(self, source_name: str, *, base_url: str) -> UnifiedAPIClient:
         """Build a client using the configuration for ``source_name``."""
 
-        source_config = self._get_source(source_name)
-        profile = source_config.http_profile
-        overrides = source_config.http
-        parameters = source_config.parameters or {}
-        max_url_length = parameters.get("max_url_length")
-        if isinstance(max_url_length, int) and max_url_length > 0:
-            if overrides is not None:
-                overrides = overrides.model_copy(update={"max_url_length": max_url_length})
-            else:
-                overrides = HTTPClientConfig(max_url_length=max_url_length)
+        profile, overrides = self._source_http_settings(source_name)
         return self.build(
             base_url=base_url,
             source=source_name,
@@ -66,6 +122,18 @@ class APIClientFactory:
             name=source_name,
         )
 
+    def for_source_async(self, source_name: str, *, base_url: str) -> AsyncUnifiedAPIClient:
+        """Build an async client using the configuration for ``source_name``."""
+
+        profile, overrides = self._source_http_settings(source_name)
+        return self.build_async(
+            base_url=base_url,
+            source=source_name,
+            profile=profile,
+            overrides=overrides,
+            name=source_name,
+        )
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -86,6 +154,19 @@ class APIClientFactory:
                 raise KeyError(msg) from exc
         return merge_http_configs(default, profile_config, overrides)
 
+    def _source_http_settings(self, source_name: str) -> tuple[str | None, HTTPClientConfig | None]:
+        source_config = self._get_source(source_name)
+        profile = source_config.http_profile
+        overrides = source_config.http
+        parameters = source_config.parameters or {}
+        max_url_length = parameters.get("max_url_length")
+        if isinstance(max_url_length, int) and max_url_length > 0:
+            if overrides is not None:
+                overrides = overrides.model_copy(update={"max_url_length": max_url_length})
+            else:
+                overrides = HTTPClientConfig(max_url_length=max_url_length)
+        return profile, overrides
+
     def _get_source(self, name: str) -> SourceConfig:
         try:
             return self._config.sources[name]
@@ -0,0 +1,181 @@
+"""Process-wide registry of HTTP transports shared between API clients."""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import threading
+from dataclasses import dataclass, field
+
+import requests
+
+from bioetl.config.models.policies import HTTPClientConfig
+
+from .api import get_api_client, profile_from_http_config
+from .api_client import CircuitBreaker, TokenBucketLimiter, build_rate_limiter
+from .logger import UnifiedLogger
+
+__all__ = [
+    "ClientKey",
+    "ClientRegistry",
+    "SharedTransport",
+    "get_client_registry",
+    "reset_client_registry",
+]
+
+
+@dataclass(frozen=True)
+class ClientKey:
+    """Identity of an upstream: source, base URL and resolved HTTP profile.
+
+    ``settings_digest`` fingerprints the merged :class:`HTTPClientConfig`, so
+    clients with diverging overrides never share limits by accident.
+    """
+
+    source: str
+    base_url: str
+    profile: str
+    settings_digest: str
+
+    @classmethod
+    def for_config(
+        cls,
+        config: HTTPClientConfig,
+        *,
+        source: str,
+        base_url: str,
+        profile: str | None = None,
+    ) -> ClientKey:
+        """Build the key for ``config`` used against ``base_url``."""
+
+        digest = hashlib.sha256(config.model_dump_json().encode("utf-8")).hexdigest()[:16]
+        return cls(
+            source=source,
+            base_url=base_url.rstrip("/"),
+            profile=profile or "default",
+            settings_digest=digest,
+        )
+
+
+@dataclass
+class SharedTransport:
+    """Keep-alive session, rate limiter and circuit breaker of one upstream."""
+
+    key: ClientKey
+    session: requests.Session
+    rate_limiter: TokenBucketLimiter
+    circuit_breaker: CircuitBreaker
+    leases: int = field(default=0)
+
+
+class ClientRegistry:
+    """Thread-safe registry handing out one :class:`SharedTransport` per upstream.
+
+    Every :class:`~bioetl.core.api_client.UnifiedAPIClient` built for the same
+    :class:`ClientKey` reuses the same connection pool (sized by
+    ``HTTPClientConfig.pool_maxsize``), the same token bucket and the same
+    circuit breaker, so the configured rate limit holds across all pipeline
+    stages. Adaptive limiters (``rate_limit.adaptive``) are shared wider, by
+    every client of the same host (see
+    :func:`~bioetl.core.api_client.build_rate_limiter`). Transports stay open after the last lease is released and are
+    closed by :meth:`close` (registered with :mod:`atexit` for the default
+    registry).
+    """
+
+    def __init__(self) -> None:
+        self._transports: dict[ClientKey, SharedTransport] = {}
+        self._lock = threading.Lock()
+        self._log = UnifiedLogger.get(__name__).bind(component="client_registry")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._transports)
+
+    def acquire(self, key: ClientKey, config: HTTPClientConfig) -> SharedTransport:
+        """Return the transport for ``key``, creating it on first use."""
+
+        with self._lock:
+            transport = self._transports.get(key)
+            if transport is None:
+                transport = self._create(key, config)
+                self._transports[key] = transport
+            transport.leases += 1
+            return transport
+
+    def release(self, transport: SharedTransport) -> None:
+        """Return a lease taken by :meth:`acquire`; the session stays pooled."""
+
+        with self._lock:
+            transport.leases = max(transport.leases - 1, 0)
+
+    def close(self) -> None:
+        """Close every pooled session and forget all transports."""
+
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+        for transport in transports:
+            try:
+                transport.session.close()
+            except Exception as exc:  # pragma: no cover - defensive cleanup path
+                self._log.warning(
+                    "client_registry.close_failed",
+                    source=transport.key.source,
+                    base_url=transport.key.base_url,
+                    error=str(exc),
+                )
+
+    def _create(self, key: ClientKey, config: HTTPClientConfig) -> SharedTransport:
+        profile = profile_from_http_config(config, name=key.source)
+        session = get_api_client(profile)
+        for header, value in dict(config.headers).items():
+            session.headers.setdefault(header, value)
+        rate_limiter = build_rate_limiter(config, base_url=key.base_url)
+        breaker_logger = UnifiedLogger.get("bioetl.core.api_client").bind(
+            component="http_client",
+            http_client=key.source,
+        )
+        circuit_breaker = CircuitBreaker(
+            config.circuit_breaker,
+            name=key.source,
+            logger=breaker_logger,
+        )
+        self._log.debug(
+            "client_registry.transport_created",
+            source=key.source,
+            base_url=key.base_url,
+            profile=key.profile,
+            pool_maxsize=int(config.pool_maxsize),
+        )
+        return SharedTransport(
+            key=key,
+            session=session,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+        )
+
+
+_default_registry: ClientRegistry | None = None
+_default_lock = threading.Lock()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Return the process-wide :class:`ClientRegistry`."""
+
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = ClientRegistry()
+            atexit.register(_default_registry.close)
+        return _default_registry
+
+
+def reset_client_registry() -> None:
+    """Close the process-wide registry; the next lookup starts afresh."""
+
+    global _default_registry
+    with _default_lock:
+        registry, _default_registry = _default_registry, None
+    if registry is not None:
+        atexit.unregister(registry.close)
+        registry.close()
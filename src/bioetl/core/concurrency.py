@@ -0,0 +1,106 @@
+"""Bounded, order-preserving concurrency helpers for I/O-bound stages."""
+
+from __future__ import annotations
+
+import contextvars
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+__all__ = ["bounded_ordered_map", "resolve_worker_count"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def resolve_worker_count(parallelism: int | None, tasks: int) -> int:
+    """Return the effective worker count for ``tasks`` units of work.
+
+    Parameters
+    ----------
+    parallelism:
+        Requested number of workers (typically ``RuntimeConfig.parallelism``).
+        ``None`` or values below one fall back to sequential execution.
+    tasks:
+        Number of independent units that will be scheduled.
+
+    Returns
+    -------
+    int
+        A worker count in ``[1, tasks]`` (or ``1`` when there is no work).
+    """
+
+    if parallelism is None or parallelism < 1 or tasks <= 1:
+        return 1
+    return min(int(parallelism), int(tasks))
+
+
+def bounded_ordered_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_workers: int,
+    max_in_flight: int | None = None,
+    thread_name_prefix: str = "bioetl",
+) -> Iterator[R]:
+    """Apply ``func`` to ``items`` concurrently and yield results in input order.
+
+    At most ``max_in_flight`` calls are pending at any time, so the input is
+    consumed lazily and memory stays bounded regardless of its length. Every
+    task runs inside a copy of the caller's :mod:`contextvars` context so
+    structured logging context (``run_id``, ``stage`` and friends) is preserved
+    in worker threads.
+
+    Parameters
+    ----------
+    func:
+        Callable applied to each item. Exceptions propagate to the consumer
+        when the corresponding result is reached.
+    items:
+        Input items; consumed lazily.
+    max_workers:
+        Number of worker threads. ``1`` runs ``func`` inline without a pool.
+    max_in_flight:
+        Upper bound on submitted-but-unconsumed tasks. Defaults to
+        ``2 * max_workers``.
+    thread_name_prefix:
+        Prefix used for worker thread names.
+
+    Yields
+    ------
+    R
+        Results of ``func`` in the same order as ``items``.
+    """
+
+    if max_workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    window = max(max_in_flight or 2 * max_workers, max_workers)
+    pending: deque[Future[R]] = deque()
+    iterator = iter(items)
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix=thread_name_prefix
+    ) as executor:
+
+        def _submit(item: T) -> None:
+            context = contextvars.copy_context()
+            pending.append(executor.submit(context.run, func, item))
+
+        try:
+            for item in iterator:
+                _submit(item)
+                if len(pending) >= window:
+                    break
+            while pending:
+                result = pending.popleft().result()
+                for item in iterator:
+                    _submit(item)
+                    break
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
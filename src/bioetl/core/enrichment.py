@@ -0,0 +1,124 @@
+"""Dependency-ordered enrichment stages merged back in one pass.
+
+An :class:`EnrichmentStage` reads the frame it is given and returns a lookup
+table holding only the columns it owns, one row per input row in input order.
+:func:`enrichment_waves` groups stages whose dependencies are satisfied so
+that :meth:`~bioetl.pipelines.base.PipelineBase.execute_enrichment_stages`
+can fetch each wave concurrently, and :func:`merge_enrichment_lookups` writes
+all lookups of a wave into the frame with a single column-wise concatenation.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+import pandas as pd
+
+__all__ = ["EnrichmentStage", "enrichment_waves", "merge_enrichment_lookups"]
+
+
+@dataclass(frozen=True)
+class EnrichmentStage:
+    """One enrichment step of a pipeline.
+
+    Attributes
+    ----------
+    name:
+        Unique stage name, used in ``depends_on`` and in profiling output.
+    func:
+        Callable receiving the frame (base columns plus the columns of the
+        stages it depends on) and returning a frame with the same number of
+        rows, in the same order. The caller must not mutate the input.
+    columns:
+        Columns the stage owns. Only these are taken from the result; columns
+        missing from the result are filled with ``NA``.
+    depends_on:
+        Names of stages whose columns ``func`` reads.
+    """
+
+    name: str
+    func: Callable[[pd.DataFrame], pd.DataFrame]
+    columns: tuple[str, ...]
+    depends_on: tuple[str, ...] = ()
+
+
+def enrichment_waves(stages: Sequence[EnrichmentStage]) -> list[list[EnrichmentStage]]:
+    """Group ``stages`` into waves whose members depend only on earlier waves.
+
+    Stages keep their declaration order within a wave. Dependencies on stages
+    outside ``stages`` are treated as already satisfied.
+
+    Raises
+    ------
+    ValueError
+        On duplicate stage names, two stages owning the same column, or a
+        dependency cycle.
+    """
+
+    names = [stage.name for stage in stages]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        msg = f"Duplicate enrichment stage names: {duplicates}"
+        raise ValueError(msg)
+    owners: dict[str, str] = {}
+    for stage in stages:
+        for column in stage.columns:
+            if column in owners:
+                msg = (
+                    f"Column '{column}' is produced by both '{owners[column]}' "
+                    f"and '{stage.name}' enrichment stages"
+                )
+                raise ValueError(msg)
+            owners[column] = stage.name
+
+    known = set(names)
+    remaining = list(stages)
+    done: set[str] = set()
+    waves: list[list[EnrichmentStage]] = []
+    while remaining:
+        wave = [
+            stage
+            for stage in remaining
+            if all(dep in done or dep not in known for dep in stage.depends_on)
+        ]
+        if not wave:
+            msg = f"Enrichment stages form a dependency cycle: {[s.name for s in remaining]}"
+            raise ValueError(msg)
+        waves.append(wave)
+        done.update(stage.name for stage in wave)
+        remaining = [stage for stage in remaining if stage.name not in done]
+    return waves
+
+
+def merge_enrichment_lookups(
+    df: pd.DataFrame,
+    lookups: Sequence[tuple[EnrichmentStage, pd.DataFrame]],
+) -> pd.DataFrame:
+    """Return ``df`` with the owned columns of every lookup written in one pass.
+
+    Existing columns keep their position and are replaced in place; new
+    columns are appended in stage order. The lookups are aligned to ``df`` by
+    position, so stages may return any index.
+    """
+
+    if not lookups:
+        return df
+    owned: dict[str, pd.Series] = {}
+    for stage, lookup in lookups:
+        if len(lookup) != len(df):
+            msg = (
+                f"Enrichment stage '{stage.name}' returned {len(lookup)} rows "
+                f"for {len(df)} input rows"
+            )
+            raise ValueError(msg)
+        for column in stage.columns:
+            if column in lookup.columns:
+                owned[column] = lookup[column].set_axis(df.index)
+            else:
+                owned[column] = pd.Series(pd.NA, index=df.index, dtype="object")
+
+    kept = df.drop(columns=[column for column in owned if column in df.columns])
+    merged = pd.concat([kept, pd.DataFrame(owned, index=df.index)], axis=1)
+    order = list(df.columns) + [column for column in owned if column not in df.columns]
+    return merged[order]
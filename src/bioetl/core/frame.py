@@ -1,7 +1,37 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
+from typing import Any, Literal, TypeAlias
+
+import numpy as np
 import pandas as pd
 from pandas import Series
+from pandas.api.types import infer_dtype
+
+# Битовые метки типов значений для построчного вывода dtype (как у ``pd.Series(dict)``).
+_NONE, _NAN, _BOOL, _INT, _FLOAT, _STR, _OTHER = (1 << shift for shift in range(7))
+_VALUE_KINDS: dict[type, int] = {
+    type(None): _NONE,
+    bool: _BOOL,
+    np.bool_: _BOOL,
+    int: _INT,
+    np.int64: _INT,
+    np.int32: _INT,
+    float: _FLOAT,
+    np.float64: _FLOAT,
+    np.float32: _FLOAT,
+    str: _STR,
+}
+# Размер LRU для нехешируемых значений (list/dict) в ``map_unique`` по умолчанию.
+DEFAULT_UNHASHABLE_CACHE_SIZE = 1024
+_UNHASHABLE_TYPES: frozenset[type] = frozenset({list, dict, set, np.ndarray})
+# pandas>=3 выводит для строк с пропусками строковый dtype с NaN вместо None.
+_STRING_ROWS_USE_NAN = pd.Series(["", None]).iloc[1] is not None
+
+# Поле таблицы поиска: имя поля записи или функция от всей записи.
+LookupField: TypeAlias = str | Callable[[Any], Any]
+LookupHow: TypeAlias = Literal["fill", "update", "replace"]
 
 
 def ensure_columns(df: pd.DataFrame, columns: tuple[tuple[str, str], ...]) -> pd.DataFrame:
@@ -22,3 +52,378 @@ def ensure_columns(df: pd.DataFrame, columns: tuple[tuple[str, str], ...]) -> pd
 
     return out
 
+
+def dict_fields_to_columns(values: Iterable[Any], fields: Sequence[str]) -> dict[str, list[Any]]:
+    """Извлечь поля словарей за один проход в списки по колонкам.
+
+    Args:
+        values: Значения колонки; не-словари дают ``None`` во всех полях.
+        fields: Имена извлекаемых полей.
+
+    Returns:
+        Словарь ``поле -> список значений`` в порядке ``values``.
+    """
+    records = [value if isinstance(value, dict) else {} for value in values]
+    return {field: [record.get(field) for record in records] for field in fields}
+
+
+def flatten_dict_column(values: Series, fields: Sequence[str], *, prefix: str = "") -> pd.DataFrame:
+    """Развернуть колонку словарей в плоские колонки ``<prefix><field>``.
+
+    Колоночная замена ``values.map(...).apply(pd.Series)``: без Series на
+    строку, но с теми же колонками и dtype. Как и ``pd.Series(dict)``, значения
+    строки сначала приводятся к общему типу: целые в строке с пропусками или
+    float становятся float, ``None`` в числовых и строковых строках — NaN.
+
+    Args:
+        values: Колонка со словарями (прочие значения считаются пустыми).
+        fields: Имена извлекаемых полей.
+        prefix: Префикс имён результирующих колонок.
+
+    Returns:
+        DataFrame с индексом ``values`` и колонками в порядке ``fields``.
+    """
+    fields = list(dict.fromkeys(fields))
+    columns = dict_fields_to_columns(values.tolist(), fields)
+    arrays = [np.fromiter(column, dtype=object, count=len(values)) for column in columns.values()]
+    if arrays and len(values):
+        kinds = [_value_kinds(array) for array in arrays]
+        row_kinds = np.bitwise_or.reduce(np.vstack(kinds), axis=0)
+        float_rows = _only(row_kinds, _INT | _FLOAT | _NAN | _NONE) & (
+            _has(row_kinds, _FLOAT | _NAN) | (_has(row_kinds, _INT) & _has(row_kinds, _NONE))
+        )
+        none_rows = float_rows
+        if _STRING_ROWS_USE_NAN:
+            none_rows = none_rows | (_only(row_kinds, _STR | _NAN | _NONE) & _has(row_kinds, _STR))
+        for array, array_kinds in zip(arrays, kinds, strict=True):
+            array[(array_kinds == _NONE) & none_rows] = np.nan
+            ints = (array_kinds == _INT) & float_rows
+            if ints.any():
+                array[ints] = array[ints].astype(float)
+        bool_rows = row_kinds == _BOOL
+        if bool_rows.any() and not bool_rows.all():
+            # Только числовые строки: numpy повышает bool до int/float для всего фрейма.
+            numeric_rows = bool_rows | (row_kinds == _INT) | float_rows
+            if numeric_rows.all():
+                dtype = float if float_rows.any() else int
+                for array in arrays:
+                    array[:] = array.astype(dtype)
+    return pd.DataFrame(
+        {f"{prefix}{field}": array.tolist() for field, array in zip(fields, arrays, strict=True)},
+        index=values.index,
+        columns=[f"{prefix}{field}" for field in fields],
+    )
+
+
+def _value_kinds(array: np.ndarray) -> np.ndarray:
+    kinds = np.fromiter(
+        (_VALUE_KINDS.get(type(value), _OTHER) for value in array),
+        dtype=np.int64,
+        count=len(array),
+    )
+    floats = kinds == _FLOAT
+    if floats.any():
+        nan = np.isnan(array[floats].astype(float))
+        kinds[np.flatnonzero(floats)[nan]] = _NAN
+    return kinds
+
+
+def _has(row_kinds: np.ndarray, kinds: int) -> np.ndarray:
+    return (row_kinds & kinds) != 0
+
+
+def _only(row_kinds: np.ndarray, kinds: int) -> np.ndarray:
+    return (row_kinds & ~kinds) == 0
+
+
+def map_unique(
+    values: Series,
+    func: Callable[[Any], Any],
+    *,
+    na_action: Literal["ignore"] | None = None,
+    unhashable_cache_size: int | None = DEFAULT_UNHASHABLE_CACHE_SIZE,
+) -> Series:
+    """Аналог ``values.map(func)``, вызывающий ``func`` один раз на уникальное значение.
+
+    Колонка факторизуется, ``func`` применяется к уникальным значениям, а
+    результат раздаётся по кодам, поэтому стоимость зависит от кардинальности,
+    а не от числа строк. Значения считаются одинаковыми при равенстве типа и
+    ``==``; пропуски разных типов (``None``, ``NaN``, ``pd.NA``) передаются
+    ``func`` по отдельности. Нехешируемые значения (списки, словари, массивы)
+    сравниваются по точному ключу содержимого через LRU на ``unhashable_cache_size`` записей
+    (``None`` — без кэширования; без повторов кэш отключается). Строки с
+    одинаковыми значениями получают один и тот же объект результата.
+
+    Args:
+        values: Исходная колонка.
+        func: Функция от одного значения (должна быть чистой).
+        na_action: Как у :meth:`pandas.Series.map`: ``"ignore"`` оставляет пропуски.
+        unhashable_cache_size: Размер LRU для нехешируемых значений.
+
+    Returns:
+        Series с индексом и именем ``values`` и dtype, как у ``values.map(func)``.
+    """
+
+    if values.empty or not isinstance(values.dtype, (np.dtype, pd.StringDtype)):
+        # Categorical.map уже работает по категориям; у masked-массивов свои правила map.
+        return values.map(func, na_action=na_action)
+    codes, representatives = _unique_codes(values, unhashable_cache_size)
+    mapped = Series(representatives, dtype=object).map(func, na_action=na_action)
+    result = mapped.take(codes)
+    result.index = values.index
+    result.name = values.name
+    return result
+
+
+def lookup_keys(
+    values: Series,
+    *,
+    upper: bool = False,
+    normalize: Callable[[Any], Any] | None = None,
+) -> Series:
+    """Нормализовать ключи соединения с таблицей поиска.
+
+    Значения приводятся к строке и обрезаются (``normalize`` заменяет это
+    приведение и вызывается один раз на уникальное значение); пропуски и
+    пустые строки становятся NA.
+
+    Args:
+        values: Колонка с ключами.
+        upper: Дополнительно привести ключи к верхнему регистру.
+        normalize: Собственная нормализация значения в строку.
+
+    Returns:
+        Series строкового dtype с индексом ``values``.
+    """
+    if normalize is not None:
+        values = map_unique(values, normalize)
+    keys = values.astype("string").str.strip()
+    if upper:
+        keys = keys.str.upper()
+    return keys.mask(keys.eq("").fillna(False))
+
+
+def unique_keys(keys: Series | pd.DataFrame) -> list[Any]:
+    """Вернуть уникальные непустые ключи в порядке первого появления.
+
+    Args:
+        keys: Результат :func:`lookup_keys` или фрейм из таких колонок
+            (составной ключ, строки с пропуском в любой части отбрасываются).
+
+    Returns:
+        Список строк или, для составного ключа, кортежей.
+    """
+    present = keys.dropna().drop_duplicates()
+    if isinstance(present, pd.DataFrame):
+        return list(present.itertuples(index=False, name=None))
+    return present.tolist()
+
+
+def lookup_frame(
+    records: Mapping[Any, Any],
+    fields: Mapping[str, LookupField] | Sequence[str],
+) -> pd.DataFrame:
+    """Собрать таблицу поиска из ответа вида ``{ключ: запись}``.
+
+    Args:
+        records: Записи по ключу; кортежные ключи дают ``MultiIndex``.
+        fields: Выходная колонка → имя поля записи или функция от записи.
+            Последовательность имён означает одноимённые поля.
+
+    Returns:
+        DataFrame с уникальным индексом по ключам ``records``.
+    """
+    sources: Mapping[str, LookupField] = (
+        fields if isinstance(fields, Mapping) else {field: field for field in fields}
+    )
+    keys = list(records)
+    values = list(records.values())
+    columns: dict[str, list[Any]] = {}
+    for column, source in sources.items():
+        if callable(source):
+            columns[column] = [source(record) for record in values]
+        else:
+            columns[column] = [
+                record.get(source) if isinstance(record, Mapping) else None for record in values
+            ]
+    if keys and all(isinstance(key, tuple) for key in keys):
+        index: pd.Index = pd.MultiIndex.from_tuples(keys)
+    else:
+        index = pd.Index(keys, dtype=object)
+    return pd.DataFrame(columns, index=index, columns=list(sources))
+
+
+def merge_lookup(
+    df: pd.DataFrame,
+    keys: Series | pd.DataFrame,
+    lookup: pd.DataFrame,
+    *,
+    how: LookupHow = "fill",
+    blank_is_missing: bool = False,
+) -> pd.DataFrame:
+    """Присоединить таблицу поиска к ``df`` одним left join по ключам.
+
+    Строки ``lookup`` выбираются по индексу для каждой строки ``df``, после
+    чего колонки ``lookup`` переносятся в ``df``. Отсутствующие колонки
+    добавляются целиком, существующие объединяются по правилу ``how``:
+
+    - ``"fill"`` — непустое значение из ``lookup`` заполняет пропуск в ``df``;
+    - ``"update"`` — непустое значение из ``lookup`` заменяет значение ``df``;
+    - ``"replace"`` — строки с найденным ключом получают значения ``lookup``,
+      включая пропуски.
+
+    Индекс и порядок строк ``df`` сохраняются; при несовместимых типах
+    колонка приводится к ``object``.
+
+    Args:
+        df: Исходный DataFrame.
+        keys: Ключи строк ``df`` (см. :func:`lookup_keys`), для составного
+            ключа — фрейм с колонками в порядке уровней индекса ``lookup``.
+        lookup: Таблица поиска с уникальным индексом (см. :func:`lookup_frame`).
+        how: Правило объединения существующих колонок.
+        blank_is_missing: Для ``"fill"`` считать пропуском и пустые строки.
+
+    Returns:
+        Новый DataFrame с колонками ``lookup``.
+    """
+    if isinstance(keys, pd.DataFrame):
+        target: pd.Index = pd.MultiIndex.from_frame(keys)
+    else:
+        target = pd.Index(keys)
+    positions = lookup.index.get_indexer(target) if len(lookup) else np.full(len(df), -1)
+    matched = positions >= 0
+    aligned = lookup.reindex(target) if len(lookup) else lookup.reindex(range(len(df)))
+    aligned.index = df.index
+
+    result = df.copy()
+    for column in lookup.columns:
+        incoming = aligned[column]
+        if column not in result.columns:
+            result[column] = incoming
+            continue
+        current = result[column]
+        if how == "replace":
+            take = matched
+        elif how == "update":
+            take = incoming.notna().to_numpy()
+        else:
+            missing = current.isna().to_numpy()
+            if blank_is_missing:
+                missing = missing | _blank_mask(current)
+            take = missing & incoming.notna().to_numpy()
+        if take.any():
+            result[column] = _where(current, ~take, incoming)
+    return result
+
+
+def _blank_mask(values: Series) -> np.ndarray:
+    return values.astype("string").str.strip().eq("").fillna(False).to_numpy(dtype=bool)
+
+
+def _where(current: Series, keep: np.ndarray, incoming: Series) -> Series:
+    try:
+        return current.where(keep, incoming)
+    except (TypeError, ValueError):
+        # Расширенные dtype (string, Int64, boolean) не принимают чужие значения.
+        return current.astype(object).where(keep, incoming)
+
+
+def _unique_codes(
+    values: Series, unhashable_cache_size: int | None
+) -> tuple[np.ndarray, list[Any]]:
+    """Вернуть коды строк и представителей уникальных значений ``values``."""
+
+    if values.dtype != object or infer_dtype(values, skipna=True) in ("string", "empty"):
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        representatives = uniques.tolist()
+        missing = np.flatnonzero(codes < 0)
+        if len(missing):
+            # factorize сводит все пропуски к -1; различаем их по типу.
+            missing_codes: dict[type, int] = {}
+            for row, value in zip(missing, values.iloc[missing].tolist(), strict=True):
+                code = missing_codes.setdefault(type(value), len(representatives))
+                if code == len(representatives):
+                    representatives.append(value)
+                codes[row] = code
+        return codes, representatives
+
+    index: dict[Hashable, int] = {}
+    unhashable = _UnhashableLRU(unhashable_cache_size)
+    representatives = []
+    codes = np.empty(len(values), dtype=np.intp)
+    for position, value in enumerate(values.tolist()):
+        value_type = type(value)
+        if value_type in _UNHASHABLE_TYPES:
+            code = unhashable.code(value, len(representatives))
+        else:
+            if isinstance(value, float) and value != value:
+                key: Hashable = (value_type, None)
+            else:
+                key = (value_type, value)
+            try:
+                code = index.setdefault(key, len(representatives))
+            except TypeError:
+                code = unhashable.code(value, len(representatives))
+        if code == len(representatives):
+            representatives.append(value)
+        codes[position] = code
+    return codes, representatives
+
+
+def _content_key(value: Any) -> Hashable:
+    """Хешируемый ключ, равный только для значений одного типа с равным содержимым.
+
+    ``repr`` для этого не годится: numpy сокращает вывод длинных массивов, и
+    разные массивы получают одинаковый ``repr``. Массивы сравниваются по
+    ``(dtype, shape, байты)``, контейнеры — поэлементно с учётом типов.
+    Для значений без такого ключа поднимается ``TypeError``.
+    """
+
+    value_type = type(value)
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return (value_type, value.shape, tuple(_content_key(item) for item in value.flat))
+        return (value_type, value.dtype.str, value.shape, value.tobytes())
+    if value_type in (list, tuple):
+        return (value_type, tuple(_content_key(item) for item in value))
+    if value_type is dict:
+        return (value_type, tuple((_content_key(k), _content_key(v)) for k, v in value.items()))
+    if value_type in (set, frozenset):
+        return (value_type, frozenset(_content_key(item) for item in value))
+    hash(value)
+    return (value_type, value)
+
+
+class _UnhashableLRU:
+    """LRU кодов нехешируемых значений по ключу содержимого (:func:`_content_key`).
+
+    Если первые ``max(size, 256)`` значений не дали ни одного попадания,
+    payload'ы считаются уникальными и ключи больше не вычисляются. Значения
+    без ключа не дедуплицируются.
+    """
+
+    probe_size = 256
+
+    def __init__(self, size: int | None) -> None:
+        self.size = size or 0
+        self.hits = 0
+        self.misses = 0
+        self._codes: OrderedDict[Hashable, int] = OrderedDict()
+
+    def code(self, value: Any, next_code: int) -> int:
+        if not self.size or (self.hits == 0 and self.misses >= max(self.size, self.probe_size)):
+            return next_code
+        try:
+            key = _content_key(value)
+        except TypeError:
+            return next_code
+        code = self._codes.get(key)
+        if code is not None:
+            self.hits += 1
+            self._codes.move_to_end(key)
+            return code
+        self.misses += 1
+        self._codes[key] = next_code
+        if len(self._codes) > self.size:
+            self._codes.popitem(last=False)
+        return next_code
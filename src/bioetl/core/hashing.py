@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import hashlib
 import math
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
 from typing import Any
 
 _DEFAULT_SEPARATOR = "\u001f"
+_PARALLEL_MIN_ROWS = 200_000
+"""Minimum frame size for which :func:`hash_frame_rows` uses a process pool."""
 
 _pd: Any | None
 try:  # Optional dependency (avoids importing pandas when not installed)
@@ -116,7 +119,140 @@ def hash_from_mapping(
     return compute_hash(values, algorithm=algorithm, separator=separator)
 
 
+def _normalise_column(values: Any) -> list[str]:
+    """Normalise a single column with the same semantics as ``_normalise_component``.
+
+    Columns with native numpy dtypes take dedicated fast paths; other columns
+    are processed value-by-value with a cheap type dispatch, falling back to
+    :func:`_normalise_component` only for values that are not plain strings or
+    scalar missing markers.
+    """
+
+    dtype = values.dtype
+    kind = getattr(dtype, "kind", "O")
+    items = values.tolist()
+    if kind in "iu" and not hasattr(dtype, "na_value"):
+        return [str(item) for item in items]
+    if kind == "f" and not hasattr(dtype, "na_value"):
+        return ["" if item != item else str(item).lower() for item in items]
+    if kind == "b" and not hasattr(dtype, "na_value"):
+        return ["true" if item else "false" for item in items]
+    if kind == "M":
+        return ["" if item is _pd.NaT else item.isoformat() for item in items]  # type: ignore[union-attr]
+
+    na_value = getattr(_pd, "NA", None)
+    normalised: list[str] = []
+    append = normalised.append
+    for item in items:
+        if type(item) is str:
+            append(item.strip().lower())
+        elif item is None or item is na_value:
+            append("")
+        else:
+            append(_normalise_component(item))
+    return normalised
+
+
+def _hash_frame_chunk(
+    frame: Any,
+    fields: Sequence[str],
+    algorithm: str,
+    separator: str,
+) -> list[str]:
+    columns = [_normalise_column(frame[field]) for field in fields]
+    hasher: Callable[..., Any] = getattr(hashlib, algorithm, None) or (
+        lambda payload: hashlib.new(algorithm, payload)
+    )
+    if not columns:
+        empty_digest = hasher(b"").hexdigest()
+        return [empty_digest] * len(frame)
+    return [
+        hasher(separator.join(parts).encode("utf-8")).hexdigest()
+        for parts in zip(*columns, strict=True)
+    ]
+
+
+def hash_frame_rows(
+    frame: Any,
+    fields: Sequence[str],
+    *,
+    algorithm: str = "sha256",
+    separator: str = _DEFAULT_SEPARATOR,
+    max_workers: int = 1,
+) -> list[str]:
+    """Return one digest per row of ``frame`` computed over ``fields``.
+
+    The result is byte-for-byte identical to calling :func:`hash_from_mapping`
+    for every row, but columns are normalised in bulk and no per-row mapping
+    is materialised.
+
+    Parameters
+    ----------
+    frame:
+        ``pandas.DataFrame`` holding the values to hash.
+    fields:
+        Column names, in hashing order.
+    algorithm:
+        Name of a :mod:`hashlib` algorithm.
+    separator:
+        Separator placed between normalised components.
+    max_workers:
+        Number of worker processes. Frames with at least
+        ``_PARALLEL_MIN_ROWS`` rows are split into contiguous chunks and hashed
+        in a process pool when ``max_workers > 1``.
+
+    Returns
+    -------
+    list[str]
+        Hex digests in row order.
+
+    Raises
+    ------
+    KeyError
+        If any of ``fields`` is not a column of ``frame``.
+    ValueError
+        If ``algorithm`` is not supported by :mod:`hashlib`.
+    """
+
+    if _pd is None:  # pragma: no cover - pandas is always available in runtime env
+        msg = "pandas is required for hash_frame_rows"
+        raise RuntimeError(msg)
+
+    missing = [field for field in fields if field not in frame.columns]
+    if missing:
+        msg = f"Fields required for hashing are missing: {missing}"
+        raise KeyError(msg)
+
+    try:
+        hashlib.new(algorithm)
+    except ValueError as exc:
+        msg = f"Unsupported hash algorithm: {algorithm}"
+        raise ValueError(msg) from exc
+
+    fields = list(fields)
+    total = len(frame)
+    if max_workers <= 1 or total < _PARALLEL_MIN_ROWS:
+        return _hash_frame_chunk(frame, fields, algorithm, separator)
+
+    chunk_size = -(-total // max_workers)
+    chunks = [
+        frame.iloc[start : start + chunk_size][fields] for start in range(0, total, chunk_size)
+    ]
+    digests: list[str] = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for chunk_digests in executor.map(
+            _hash_frame_chunk,
+            chunks,
+            [fields] * len(chunks),
+            [algorithm] * len(chunks),
+            [separator] * len(chunks),
+        ):
+            digests.extend(chunk_digests)
+    return digests
+
+
 __all__ = [
     "compute_hash",
+    "hash_frame_rows",
     "hash_from_mapping",
 ]
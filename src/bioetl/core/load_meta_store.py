@@ -1,4 +1,16 @@
-"""Storage helper for persisting chembl_metadata_schema lineage events."""
+"""Storage helper for persisting chembl_metadata_schema lineage events.
+
+Without a ``run_id`` every finished record is written to its own
+``{load_meta_id}.parquet`` file. With a ``run_id`` the store is buffered:
+finished records are appended to a JSON-lines journal, validated in bulk and
+flushed as row groups into a single ``{run_id}.parquet`` file that is
+published on :meth:`LoadMetaStore.close`. Journals left behind by a crashed
+run are turned into Parquet files when the next store is opened.
+
+A run holds an exclusive ``flock`` on its journal while it is open, so
+recovery never touches the journal of a run that is still alive. Where file
+locks are unavailable (Windows) journals are left for manual recovery.
+"""
 
 from __future__ import annotations
 
@@ -6,13 +18,19 @@ import json
 import os
 import shutil
 import tempfile
+import threading
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import IO, TYPE_CHECKING, Any, cast
 from uuid import uuid4
 
+try:  # pragma: no cover - ``fcntl`` is unavailable on Windows
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
 import pandas as pd
 import pandera as pa
 
@@ -40,6 +58,53 @@ def _canonical_json(payload: Any) -> str:
     )
 
 
+def _journal_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _try_lock(handle: IO[str]) -> bool:
+    """Take an exclusive lock on ``handle``; ``False`` while another owner holds it."""
+
+    if fcntl is None:  # pragma: no cover - Windows
+        return False
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+_TIMESTAMP_COLUMNS = ("request_started_at", "request_finished_at", "ingested_at")
+_INTEGER_COLUMNS = ("records_fetched", "retry_count")
+
+
+def _frame_from_payloads(payloads: Iterable[Mapping[str, Any]]) -> pd.DataFrame:
+    """Return finished-record payloads as a frame with the schema dtypes."""
+
+    frame = pd.DataFrame(list(payloads), columns=COLUMN_ORDER)
+    for column in _TIMESTAMP_COLUMNS:
+        frame[column] = pd.to_datetime(frame[column], utc=True).astype("datetime64[ns, UTC]")
+    for column in _INTEGER_COLUMNS:
+        frame[column] = frame[column].astype("int64")
+    return cast(pd.DataFrame, frame)
+
+
+def _arrow_schema() -> Any:
+    import pyarrow as pa
+
+    fields: list[Any] = []
+    for column in COLUMN_ORDER:
+        if column in _TIMESTAMP_COLUMNS:
+            fields.append(pa.field(column, pa.timestamp("ns", tz="UTC")))
+        elif column in _INTEGER_COLUMNS:
+            fields.append(pa.field(column, pa.int64()))
+        else:
+            fields.append(pa.field(column, pa.string()))
+    return pa.schema(fields)
+
+
 def _normalize_base_url(value: Any) -> str:
     text = str(value)
     if text.startswith("http://") or text.startswith("https://"):
@@ -96,12 +161,40 @@ class _ActiveRecord:
 
 
 class LoadMetaStore:
-    """Manage lifecycle of chembl_metadata_schema entries with deterministic persistence."""
-
-    def __init__(self, base_path: str | Path, *, dataset_format: str = "parquet") -> None:
+    """Manage lifecycle of chembl_metadata_schema entries with deterministic persistence.
+
+    Parameters
+    ----------
+    base_path:
+        Root directory; records are stored under ``<base_path>/load_meta``.
+    dataset_format:
+        ``parquet`` or ``delta`` (the latter for Spark frames only).
+    run_id:
+        Enables buffered mode with one ``{run_id}.parquet`` file per run.
+    flush_rows:
+        Buffered records validated and written per Parquet row group.
+
+    A store may be shared by threads (e.g. parallel enrichment stages): record
+    bookkeeping, the journal and the Parquet writer are guarded by one lock.
+    """
+
+    journal_suffix = ".journal.jsonl"
+    partial_suffix = ".parquet.partial"
+
+    def __init__(
+        self,
+        base_path: str | Path,
+        *,
+        dataset_format: str = "parquet",
+        run_id: str | None = None,
+        flush_rows: int = 1_000,
+    ) -> None:
         if dataset_format not in {"parquet", "delta"}:
             msg = f"Unsupported dataset format: {dataset_format}"
             raise ValueError(msg)
+        if flush_rows < 1:
+            msg = f"flush_rows must be positive, got {flush_rows!r}"
+            raise ValueError(msg)
         self._base_path = Path(base_path).resolve()
         self._base_path.mkdir(parents=True, exist_ok=True)
         self._meta_dir = self._base_path / "load_meta"
@@ -109,6 +202,21 @@ class LoadMetaStore:
         self._dataset_format = dataset_format
         self._logger = UnifiedLogger.get(__name__).bind(component="load_meta_store")
         self._active: dict[str, _ActiveRecord] = {}
+        self._run_stem = run_id.replace(os.sep, "_") if run_id else None
+        self._flush_rows = flush_rows
+        self._buffer: list[dict[str, Any]] = []
+        self._journal: IO[str] | None = None
+        self._writer: Any = None
+        self._segment = 0
+        self._lock = threading.RLock()
+        if self._run_stem is not None:
+            self.recover_journals()
+
+    @property
+    def buffered(self) -> bool:
+        """Return whether records are collected into one file per run."""
+
+        return self._run_stem is not None
 
     # ------------------------------------------------------------------
     # Public API
@@ -149,7 +257,8 @@ class LoadMetaStore:
             operator=operator,
             notes=notes,
         )
-        self._active[load_meta_id] = record
+        with self._lock:
+            self._active[load_meta_id] = record
         self._logger.info(LogEvents.LOAD_META_BEGIN,
             load_meta_id=load_meta_id,
             source_system=source_system,
@@ -166,17 +275,18 @@ class LoadMetaStore:
     ) -> None:
         """Append pagination metadata for ``load_meta_id``."""
 
-        record = self._require_active(load_meta_id)
         events: list[dict[str, Any]]
         if isinstance(pagination_payload, Mapping):
             mapped = cast(Mapping[str, Any], pagination_payload)
             events = [dict(mapped.items())]
         else:
             events = [dict(payload.items()) for payload in pagination_payload]
-        record.pagination_events.extend(events)
-        if records_fetched_delta is not None:
-            record.records_fetched += records_fetched_delta
-        record.request_finished_at = _utcnow()
+        with self._lock:
+            record = self._require_active(load_meta_id)
+            record.pagination_events.extend(events)
+            if records_fetched_delta is not None:
+                record.records_fetched += records_fetched_delta
+            record.request_finished_at = _utcnow()
         self._logger.info(LogEvents.LOAD_META_PAGE,
             load_meta_id=load_meta_id,
             pages=len(events),
@@ -196,29 +306,116 @@ class LoadMetaStore:
     ) -> None:
         """Finalize ``load_meta_id`` and persist it to storage."""
 
-        record = self._require_active(load_meta_id)
-        record.status = status
-        record.records_fetched = records_fetched
-        record.error_message_opt = error_message
-        record.retry_count += max(retry_count_delta, 0)
-        record.request_finished_at = request_finished_at or _utcnow()
-        record.ingested_at = ingested_at or _utcnow()
-        if notes:
-            record.notes = notes if record.notes is None else f"{record.notes}; {notes}"
-
-        payload = record.to_payload()
-        payload["hash_business_key"] = hash_from_mapping(payload, BUSINESS_KEY_FIELDS)
-        payload["hash_row"] = hash_from_mapping(payload, ROW_HASH_FIELDS)
-
-        df = pd.DataFrame([payload], columns=COLUMN_ORDER)
-        LoadMetaSchema.validate(df, lazy=True)
-        self._write_dataframe(df, self._meta_dir / f"{load_meta_id}.parquet")
-        self._logger.info(LogEvents.LOAD_META_FINISH,
-            load_meta_id=load_meta_id,
-            status=status,
-            records_fetched=records_fetched,
-        )
-        del self._active[load_meta_id]
+        with self._lock:
+            record = self._require_active(load_meta_id)
+            record.status = status
+            record.records_fetched = records_fetched
+            record.error_message_opt = error_message
+            record.retry_count += max(retry_count_delta, 0)
+            record.request_finished_at = request_finished_at or _utcnow()
+            record.ingested_at = ingested_at or _utcnow()
+            if notes:
+                record.notes = notes if record.notes is None else f"{record.notes}; {notes}"
+
+            payload = record.to_payload()
+            payload["hash_business_key"] = hash_from_mapping(payload, BUSINESS_KEY_FIELDS)
+            payload["hash_row"] = hash_from_mapping(payload, ROW_HASH_FIELDS)
+
+            if self.buffered:
+                self._append_journal(payload)
+                self._buffer.append(payload)
+                if len(self._buffer) >= self._flush_rows:
+                    self.flush()
+            else:
+                df = _frame_from_payloads([payload])
+                LoadMetaSchema.validate(df, lazy=True)
+                self._write_dataframe(df, self._meta_dir / f"{load_meta_id}.parquet")
+            self._logger.info(LogEvents.LOAD_META_FINISH,
+                load_meta_id=load_meta_id,
+                status=status,
+                records_fetched=records_fetched,
+            )
+            del self._active[load_meta_id]
+
+    def flush(self) -> None:
+        """Validate buffered records and append them as one Parquet row group."""
+
+        with self._lock:
+            if not self._buffer:
+                return
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            frame = _frame_from_payloads(self._buffer)
+            LoadMetaSchema.validate(frame, lazy=True)
+            schema = _arrow_schema()
+            if self._writer is None:
+                partial_path = self._segment_path(self.partial_suffix)
+                self._writer = pq.ParquetWriter(str(partial_path), schema)
+            table = pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+            self._writer.write_table(table, row_group_size=len(frame))
+            self._logger.debug(LogEvents.LOAD_META_FLUSH, rows=len(frame))
+            self._buffer.clear()
+
+    def close(self) -> Path | None:
+        """Flush buffered records and publish the run file.
+
+        Returns the published ``{run_id}.parquet`` path, or ``None`` when the
+        store is not buffered or no record was finished. A later call starts a
+        new ``{run_id}.<n>.parquet`` segment.
+        """
+
+        if not self.buffered:
+            return None
+        with self._lock:
+            self.flush()
+            journal_path = self._segment_path(self.journal_suffix)
+            target: Path | None = None
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+                target = self._segment_path(".parquet")
+                os.replace(self._segment_path(self.partial_suffix), target)
+                self._segment += 1
+            # The journal stays open (and locked) until the run file is published.
+            journal_path.unlink(missing_ok=True)
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            return target
+
+    def recover_journals(self) -> list[Path]:
+        """Publish journals left behind by runs that did not reach :meth:`close`.
+
+        Only journals whose lock is free belong to a dead run; journals of runs
+        still writing (also in other processes) are skipped. Records are
+        re-validated and written to the Parquet file of the journal's run; a
+        truncated trailing line is ignored. Journals that fail validation are
+        kept for inspection.
+        """
+
+        recovered: list[Path] = []
+        own_journal = self._segment_path(self.journal_suffix) if self.buffered else None
+        for journal_path in sorted(self._meta_dir.glob(f"*{self.journal_suffix}")):
+            if journal_path == own_journal and self._journal is not None:
+                continue
+            try:
+                handle = journal_path.open(encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            with handle:
+                if not _try_lock(handle):
+                    self._logger.debug(
+                        LogEvents.LOAD_META_RECOVERY_SKIPPED, journal=str(journal_path)
+                    )
+                    continue
+                if os.fstat(handle.fileno()).st_nlink == 0:
+                    # Published and removed by its run between glob and lock.
+                    continue
+                target = self._recover_journal(journal_path, handle)
+            if target is not None:
+                recovered.append(target)
+        return recovered
 
     def write_dataframe(
         self,
@@ -240,6 +437,51 @@ class LoadMetaStore:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _segment_path(self, suffix: str) -> Path:
+        stem = self._run_stem if self._segment == 0 else f"{self._run_stem}.{self._segment}"
+        return self._meta_dir / f"{stem}{suffix}"
+
+    def _recover_journal(self, journal_path: Path, handle: IO[str]) -> Path | None:
+        stem = journal_path.name[: -len(self.journal_suffix)]
+        payloads: list[dict[str, Any]] = []
+        for line in handle:
+            try:
+                payloads.append(json.loads(line))
+            except json.JSONDecodeError:
+                # Only the last line can be incomplete after a crash.
+                break
+        partial_path = self._meta_dir / f"{stem}{self.partial_suffix}"
+        target = self._meta_dir / f"{stem}.parquet"
+        try:
+            if payloads:
+                frame = _frame_from_payloads(payloads)
+                LoadMetaSchema.validate(frame, lazy=True)
+                self._write_dataframe(frame, target)
+        except Exception as exc:
+            self._logger.warning(
+                LogEvents.LOAD_META_RECOVERY_FAILED,
+                journal=str(journal_path),
+                error=str(exc),
+            )
+            return None
+        partial_path.unlink(missing_ok=True)
+        journal_path.unlink()
+        self._logger.info(
+            LogEvents.LOAD_META_RECOVERED,
+            journal=str(journal_path),
+            records=len(payloads),
+        )
+        return target if payloads else None
+
+    def _append_journal(self, payload: Mapping[str, Any]) -> None:
+        if self._journal is None:
+            self._journal = self._segment_path(self.journal_suffix).open("a", encoding="utf-8")
+            _try_lock(self._journal)
+        line = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=_journal_default)
+        self._journal.write(line + "\n")
+        # Flushed per record so a crashed run loses at most the record being written.
+        self._journal.flush()
+
     def _require_active(self, load_meta_id: str) -> _ActiveRecord:
         try:
             return self._active[load_meta_id]
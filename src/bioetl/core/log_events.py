@@ -137,6 +137,8 @@ class LogEvents(str, Enum):
     ASSAY_PARAMETERS_RESET_NON_STRING = auto()
     AUDIT_FINISHED = auto()
     AUDIT_STARTED = auto()
+    BENCHMARK_BASELINE_SAVED = auto()
+    BENCHMARK_REGRESSION_DETECTED = auto()
     BOOL_CONVERSION_FAILED = auto()
     BUILDING_WRITE_ARTIFACTS = auto()
     CATALOG_EXTRACT_DONE = auto()
@@ -300,7 +302,11 @@ class LogEvents(str, Enum):
     LINK_CHECK_START = auto()
     LOAD_META_BEGIN = auto()
     LOAD_META_FINISH = auto()
+    LOAD_META_FLUSH = auto()
     LOAD_META_PAGE = auto()
+    LOAD_META_RECOVERED = auto()
+    LOAD_META_RECOVERY_FAILED = auto()
+    LOAD_META_RECOVERY_SKIPPED = auto()
     LYCHEE_FINISHED = auto()
     LYCHEE_NOT_AVAILABLE = auto()
     LYCHEE_NOT_FOUND = auto()
@@ -308,6 +314,8 @@ class LogEvents(str, Enum):
     MARKDOWN_READ_FAILED = auto()
     MEASUREMENTS_NORMALIZED = auto()
     METADATA_WRITTEN = auto()
+    METRICS_EXPORT_FAILED = auto()
+    METRICS_EXPORTER_SKIPPED = auto()
     MISSING_COLUMN_NOT_REQUESTED = auto()
     MISSING_COLUMNS_HANDLED = auto()
     MISSING_FIELD_IN_RESPONSE = auto()
@@ -335,6 +343,7 @@ class LogEvents(str, Enum):
     PIPELINE_RUN_FAILED = auto()
     PIPELINE_STARTED = auto()
     PREPARING_DIRECTORIES = auto()
+    PROFILE_ARTIFACTS_WRITTEN = auto()
     PROTEIN_CLASSIFICATION_FETCH_ERROR = auto()
     PROTEIN_FAMILY_CLASSIFICATION_FETCH_ERROR = auto()
     PYTEST_FINISHED = auto()
@@ -362,6 +371,10 @@ class LogEvents(str, Enum):
     SEMANTIC_DIFF_WRITTEN = auto()
     SOFT_ENUM_UNKNOWN_DATA_VALIDITY_COMMENT = auto()
     SPECIES_GROUP_FLAG_CONVERSION_FAILED = auto()
+    STREAMING_CHUNK_PROCESSED = auto()
+    STREAMING_MERGE_FINISH = auto()
+    STREAMING_MERGE_START = auto()
+    STREAMING_RUN_FALLBACK = auto()
     STRING_FIELDS_NORMALIZED = auto()
     TARGET_COMPONENT_FETCH_ERROR = auto()
     TARGET_DIRECTORY_EXISTS = auto()
@@ -383,6 +396,7 @@ class LogEvents(str, Enum):
     VALIDATE_STARTED = auto()
     VALIDATING_ASSAY_PARAMETERS_TRUV = auto()
     VALIDATING_CONFIG = auto()
+    VALIDATION_CACHE_APPLIED = auto()
     VALIDATION_COERCE_ONLY_PASSTHROUGH = auto()
     VALIDATION_COMPLETED = auto()
     VALIDATION_ERROR = auto()
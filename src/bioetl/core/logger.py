@@ -8,14 +8,22 @@ as by golden tests.
 """
 from __future__ import annotations
 
+import atexit
+import fnmatch
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-from collections.abc import Iterable, Iterator, MutableMapping, Sequence
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping, Sequence
 from contextlib import AbstractContextManager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from enum import Enum
 from functools import partial
-from typing import Any, cast
+from typing import Any, TextIO, cast
 
 import structlog
 from structlog.contextvars import (
@@ -29,9 +37,13 @@ from structlog.stdlib import BoundLogger
 __all__ = [
     "LogFormat",
     "LogConfig",
+    "LogSamplingRule",
+    "AsyncLogSink",
     "DEFAULT_LOG_LEVEL",
     "MANDATORY_FIELDS",
     "configure_logging",
+    "flush_logging",
+    "shutdown_logging",
     "bind_global_context",
     "reset_global_context",
     "get_logger",
@@ -75,13 +87,62 @@ _KEY_ORDER: Sequence[str] = (
 )
 
 
+_LEVEL_BY_METHOD: Mapping[str, int] = {
+    "critical": logging.CRITICAL,
+    "fatal": logging.CRITICAL,
+    "exception": logging.ERROR,
+    "error": logging.ERROR,
+    "warn": logging.WARNING,
+    "warning": logging.WARNING,
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+    "notset": logging.NOTSET,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class LogSamplingRule:
+    """Sampling and rate-limit policy for a single event name.
+
+    Attributes
+    ----------
+    rate:
+        Fraction of events that are emitted (``0.1`` keeps every tenth event).
+        Selection is deterministic, so repeated runs keep the same events.
+    max_per_second:
+        Upper bound of emitted events per second, ``None`` disables the limit.
+    """
+
+    rate: float = 1.0
+    max_per_second: float | None = None
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.rate <= 1.0:
+            raise ValueError(f"Sampling rate must be within [0, 1], got {self.rate}")
+        if self.max_per_second is not None and self.max_per_second <= 0:
+            raise ValueError(f"max_per_second must be positive, got {self.max_per_second}")
+
+
 @dataclass(frozen=True, slots=True)
 class LogConfig:
-    """User configurable logging parameters."""
+    """User configurable logging parameters.
+
+    ``sampling`` maps event names (``fnmatch`` patterns are allowed) to
+    :class:`LogSamplingRule`; only events below ``WARNING`` are sampled.
+    Call-site fields (``pathname``, ``lineno``, ``func_name``) are captured
+    for events at ``callsite_level`` and above. With ``async_sink`` enabled,
+    rendering and writing happen on a background thread in batches of up to
+    ``batch_size`` records.
+    """
 
     level: int | str = DEFAULT_LOG_LEVEL
     format: LogFormat = LogFormat.JSON
     redact_fields: Sequence[str] = ("api_key", "access_token", "password")
+    callsite_level: int | str = logging.WARNING
+    sampling: Mapping[str, LogSamplingRule] = field(default_factory=dict)
+    async_sink: bool = False
+    queue_size: int = 10_000
+    batch_size: int = 256
 
 
 def _coerce_log_level(level: int | str) -> int:
@@ -100,9 +161,9 @@ def _redact_sensitive_values(
     *,
     redact_fields: Iterable[str],
 ) -> MutableMapping[str, Any]:
-    for field in redact_fields:
-        if field in event_dict:
-            event_dict[field] = "***REDACTED***"
+    for key in redact_fields:
+        if key in event_dict:
+            event_dict[key] = "***REDACTED***"
     return event_dict
 
 
@@ -117,6 +178,157 @@ def _ensure_mandatory_fields(
     return event_dict
 
 
+def _method_level(method_name: str) -> int:
+    return _LEVEL_BY_METHOD.get(method_name, logging.INFO)
+
+
+class _CallsiteProcessor:
+    """Add call-site fields only to events at or above ``min_level``.
+
+    Stack inspection dominates the cost of a log call, so routine
+    ``INFO``/``DEBUG`` events skip it.
+    """
+
+    def __init__(self, min_level: int) -> None:
+        self._min_level = min_level
+        self._adder = structlog.processors.CallsiteParameterAdder(
+            parameters=(
+                structlog.processors.CallsiteParameter.PATHNAME,
+                structlog.processors.CallsiteParameter.LINENO,
+                structlog.processors.CallsiteParameter.FUNC_NAME,
+            ),
+            additional_ignores=["structlog", "logging", __name__],
+        )
+
+    def __call__(
+        self, logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+    ) -> MutableMapping[str, Any]:
+        if _method_level(method_name) < self._min_level:
+            return event_dict
+        return self._adder(logger, method_name, event_dict)
+
+
+@dataclass(slots=True)
+class _SamplingState:
+    credit: float = 0.0
+    tokens: float = 0.0
+    refilled_at: float | None = None
+    suppressed: int = 0
+
+
+class _EventSampler:
+    """Drop routine events according to per-event :class:`LogSamplingRule`.
+
+    The first event emitted after a suppressed stretch carries the number of
+    dropped events in ``sampled_out``.
+    """
+
+    def __init__(
+        self,
+        rules: Mapping[str, LogSamplingRule],
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rules = dict(rules)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._resolved: dict[str, LogSamplingRule | None] = {}
+        self._states: dict[str, _SamplingState] = {}
+
+    def _rule_for(self, name: str) -> LogSamplingRule | None:
+        try:
+            return self._resolved[name]
+        except KeyError:
+            rule = self._rules.get(name)
+            if rule is None:
+                rule = next(
+                    (
+                        candidate
+                        for pattern, candidate in self._rules.items()
+                        if fnmatch.fnmatchcase(name, pattern)
+                    ),
+                    None,
+                )
+            self._resolved[name] = rule
+            return rule
+
+    def __call__(
+        self, _: Any, method_name: str, event_dict: MutableMapping[str, Any]
+    ) -> MutableMapping[str, Any]:
+        if _method_level(method_name) >= logging.WARNING:
+            return event_dict
+        event = event_dict.get("event")
+        name = event.value if isinstance(event, Enum) else str(event)
+        rule = self._rule_for(name)
+        if rule is None:
+            return event_dict
+
+        with self._lock:
+            state = self._states.setdefault(name, _SamplingState())
+            state.credit += rule.rate
+            keep = state.credit >= 1.0
+            if keep:
+                state.credit -= 1.0
+            if keep and rule.max_per_second is not None:
+                now = self._clock()
+                if state.refilled_at is None:
+                    state.tokens = rule.max_per_second
+                else:
+                    state.tokens = min(
+                        rule.max_per_second,
+                        state.tokens + (now - state.refilled_at) * rule.max_per_second,
+                    )
+                state.refilled_at = now
+                keep = state.tokens >= 1.0
+                if keep:
+                    state.tokens -= 1.0
+            if not keep:
+                state.suppressed += 1
+                raise structlog.DropEvent
+            suppressed, state.suppressed = state.suppressed, 0
+
+        if suppressed:
+            event_dict["sampled_out"] = suppressed
+        return event_dict
+
+
+def _merge_record_context(
+    logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+) -> MutableMapping[str, Any]:
+    """Merge context captured by :class:`_QueueSinkHandler` for stdlib records.
+
+    Records from plain :mod:`logging` loggers are rendered on the sink thread,
+    where the caller's context variables are not visible.
+    """
+
+    context = getattr(event_dict.get("_record"), "bioetl_context", None)
+    if context is None:
+        return structlog.contextvars.merge_contextvars(logger, method_name, event_dict)
+    for key, value in context.items():
+        event_dict.setdefault(key, value)
+    return event_dict
+
+
+_TIMESTAMPER = structlog.processors.TimeStamper(fmt="iso", utc=True, key="timestamp")
+
+
+def _stamp_record_time(
+    logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+) -> MutableMapping[str, Any]:
+    """Stamp stdlib records with their creation time rather than render time.
+
+    With the asynchronous sink, records are rendered on the sink thread after
+    waiting in the queue; ``TimeStamper`` would report when they were written.
+    """
+
+    record = event_dict.get("_record")
+    if record is None:
+        return _TIMESTAMPER(logger, method_name, event_dict)
+    created = datetime.fromtimestamp(record.created, tz=timezone.utc)
+    event_dict["timestamp"] = created.isoformat().replace("+00:00", "Z")
+    return event_dict
+
+
 def _shared_processors(config: LogConfig) -> list[Any]:
     def _safe_exception_pretty_printer(
         logger: Any,
@@ -138,21 +350,14 @@ def _shared_processors(config: LogConfig) -> list[Any]:
     return [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso", utc=True, key="timestamp"),
+        _TIMESTAMPER,
         _ensure_mandatory_fields,
         structlog.processors.EventRenamer("message"),
         partial(
             _redact_sensitive_values,
             redact_fields=config.redact_fields,
         ),
-        structlog.processors.CallsiteParameterAdder(
-            parameters=(
-                structlog.processors.CallsiteParameter.PATHNAME,
-                structlog.processors.CallsiteParameter.LINENO,
-                structlog.processors.CallsiteParameter.FUNC_NAME,
-            ),
-            additional_ignores=["structlog", "logging"],
-        ),
+        _CallsiteProcessor(_coerce_log_level(config.callsite_level)),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
@@ -173,6 +378,162 @@ def _renderer_for(format: LogFormat) -> Any:
     return structlog.processors.JSONRenderer(sort_keys=True, ensure_ascii=False)
 
 
+class _QueueSinkHandler(logging.handlers.QueueHandler):
+    """Queue handler that defers all formatting to the sink thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if not isinstance(record.msg, dict):
+            record.bioetl_context = get_contextvars()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Ждём место в очереди вместо потери записи (put_nowait в базовом классе).
+        cast("queue.Queue[Any]", self.queue).put(record)
+
+
+_STOP = object()
+
+
+class AsyncLogSink:
+    """Render and write log records on a background thread.
+
+    Callers only enqueue records; the sink thread drains the queue in batches,
+    formats each record and writes the batch to ``stream`` with a single
+    ``write``/``flush``. When the bounded queue is full, callers wait for the
+    sink instead of dropping records.
+    """
+
+    def __init__(
+        self,
+        formatter: logging.Formatter,
+        stream: TextIO,
+        *,
+        queue_size: int = 10_000,
+        batch_size: int = 256,
+    ) -> None:
+        if queue_size <= 0 or batch_size <= 0:
+            raise ValueError("queue_size and batch_size must be positive")
+        self._formatter = formatter
+        self._stream = stream
+        self._batch_size = batch_size
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+        self.handler: logging.Handler = _QueueSinkHandler(self._queue)
+        self._thread = threading.Thread(target=self._run, name="bioetl-log-sink", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines: list[str] = []
+            stopping = False
+            for item in batch:
+                if item is _STOP:
+                    stopping = True
+                    continue
+                try:
+                    lines.append(self._formatter.format(item))
+                except Exception:
+                    self.handler.handleError(item)
+            if lines:
+                try:
+                    self._stream.write("\n".join(lines) + "\n")
+                    self._stream.flush()
+                except (OSError, ValueError):
+                    pass
+            for _ in batch:
+                self._queue.task_done()
+            if stopping:
+                return
+
+    def flush(self) -> None:
+        """Block until every enqueued record has been written."""
+
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def synchronous_handler(self) -> logging.Handler:
+        """Return a handler writing to the sink's stream on the calling thread."""
+
+        handler = logging.StreamHandler(self._stream)
+        handler.setFormatter(self._formatter)
+        handler.setLevel(self.handler.level)
+        return handler
+
+    def stop(self) -> None:
+        """Write the remaining records and stop the sink thread."""
+
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+
+_ACTIVE_SINK: AsyncLogSink | None = None
+_ACTIVE_SINK_LOCK = threading.Lock()
+
+
+def _detach_sink(sink: AsyncLogSink) -> None:
+    """Route the root logger to ``sink``'s stream synchronously.
+
+    A queue handler left installed after its sink thread is gone would fill the
+    queue and then block every caller in ``put``.
+    """
+
+    root = logging.getLogger()
+    if sink.handler in root.handlers:
+        root.removeHandler(sink.handler)
+        root.addHandler(sink.synchronous_handler())
+
+
+def _replace_sink(sink: AsyncLogSink | None) -> None:
+    global _ACTIVE_SINK
+    with _ACTIVE_SINK_LOCK:
+        previous, _ACTIVE_SINK = _ACTIVE_SINK, sink
+    if previous is not None:
+        _detach_sink(previous)
+        previous.stop()
+
+
+def flush_logging() -> None:
+    """Wait until the asynchronous sink, if any, has written queued records."""
+
+    sink = _ACTIVE_SINK
+    if sink is not None:
+        sink.flush()
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the asynchronous sink, if any."""
+
+    _replace_sink(None)
+
+
+atexit.register(shutdown_logging)
+
+
+def _reset_logging_after_fork() -> None:
+    """Write synchronously in forked children (e.g. process-pool workers).
+
+    Only the forking thread survives ``fork``: records queued by the child
+    would never be written, and once the queue is full ``put`` would block the
+    child forever. Children also exit without running :mod:`atexit` hooks.
+    """
+
+    global _ACTIVE_SINK, _ACTIVE_SINK_LOCK
+    _ACTIVE_SINK_LOCK = threading.Lock()
+    sink, _ACTIVE_SINK = _ACTIVE_SINK, None
+    if sink is not None:
+        _detach_sink(sink)
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch - absent on Windows
+    os.register_at_fork(after_in_child=_reset_logging_after_fork)
+
+
 def configure_logging(
     config: LogConfig | None = None,
     *,
@@ -185,24 +546,45 @@ def configure_logging(
     if additional_processors:
         shared_processors = [*shared_processors, *additional_processors]
     renderer = _renderer_for(cfg.format)
+    sampler = _EventSampler(cfg.sampling) if cfg.sampling else None
 
+    # Записи стандартного logging уже отфильтрованы по уровню самим logging;
+    # filter_by_level здесь получает logger=None и падает.
+    foreign_pre_chain = [
+        _stamp_record_time if processor is _TIMESTAMPER else processor
+        for processor in shared_processors
+    ]
+    if cfg.async_sink:
+        foreign_pre_chain[0] = _merge_record_context
     formatter = structlog.stdlib.ProcessorFormatter(
-        foreign_pre_chain=[*shared_processors, structlog.stdlib.filter_by_level],
+        foreign_pre_chain=foreign_pre_chain,
         processors=[
             structlog.stdlib.ProcessorFormatter.remove_processors_meta,
             renderer,
         ],
     )
 
-    handler = logging.StreamHandler()
-    handler.setFormatter(formatter)
+    handler: logging.Handler
+    if cfg.async_sink:
+        sink = AsyncLogSink(
+            formatter, sys.stderr, queue_size=cfg.queue_size, batch_size=cfg.batch_size
+        )
+        handler = sink.handler
+        _replace_sink(sink)
+    else:
+        _replace_sink(None)
+        handler = logging.StreamHandler()
+        handler.setFormatter(formatter)
 
     logging.basicConfig(handlers=[handler], level=_coerce_log_level(cfg.level), force=True)
 
+    # Фильтр уровня и сэмплирование стоят первыми: отброшенные события не
+    # проходят через остальную цепочку процессоров.
     structlog.configure(
         processors=[
-            *shared_processors,
             structlog.stdlib.filter_by_level,
+            *([sampler] if sampler is not None else []),
+            *shared_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         context_class=dict,
@@ -269,6 +651,12 @@ class UnifiedLogger:
 
         configure_logging(config, additional_processors=additional_processors)
 
+    @staticmethod
+    def flush() -> None:
+        """Wait until queued log records have been written."""
+
+        flush_logging()
+
     @staticmethod
     def get(name: str | None = None) -> BoundLogger:
         """Return a configured bound logger."""
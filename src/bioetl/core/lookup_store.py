@@ -0,0 +1,273 @@
+"""Release-scoped store of ChEMBL lookup records shared by all pipelines.
+
+Each ChEMBL release gets its own SQLite catalog at
+``<root>/<release>/lookups.sqlite``. Records of a release never change, so
+entries do not expire, and a record stored with a wider field selection serves
+any narrower selection: the activity, assay, document and testitem pipelines
+reuse each other's lookups even though they request different ``only=``
+fields. The store exposes the same ``get_many``/``put_many`` interface as
+:class:`~bioetl.core.record_cache.RecordCache`.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from bioetl.core.logger import UnifiedLogger
+from bioetl.core.metrics import record_cache_lookup
+
+__all__ = ["LookupStore", "release_directory"]
+
+_ALL_FIELDS = "*"
+_SQLITE_MAX_VARIABLES = 900
+_RELEASE_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lookups (
+    entity TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    fields TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (entity, record_id)
+) WITHOUT ROWID
+"""
+
+
+def release_directory(root: str | Path, release: str) -> Path:
+    """Return the directory holding release-scoped artifacts of ``release``.
+
+    Raises
+    ------
+    ValueError
+        If ``release`` is not usable as a directory name.
+    """
+
+    if not _RELEASE_PATTERN.match(release):
+        msg = f"Invalid ChEMBL release name for the lookup store: {release!r}"
+        raise ValueError(msg)
+    return Path(root) / release
+
+
+def _encode_fields(fields: Sequence[str] | None) -> str:
+    if not fields:
+        return _ALL_FIELDS
+    return ",".join(sorted({str(field) for field in fields}))
+
+
+def _covers(stored: str, requested: str) -> bool:
+    if stored == _ALL_FIELDS:
+        return True
+    if requested == _ALL_FIELDS:
+        return False
+    return set(requested.split(",")) <= set(stored.split(","))
+
+
+def _project(payload: Any, requested: str) -> Any:
+    """Restrict stored records to the requested fields, as ``only=`` would."""
+
+    if requested == _ALL_FIELDS:
+        return payload
+    keep = requested.split(",")
+    if isinstance(payload, list):
+        return [_project(item, requested) for item in payload]
+    if isinstance(payload, dict):
+        return {key: payload[key] for key in keep if key in payload}
+    return payload
+
+
+class LookupStore:
+    """SQLite catalogs of lookup records, one per ChEMBL release.
+
+    Parameters
+    ----------
+    root:
+        Directory holding one sub-directory per release.
+
+    Notes
+    -----
+    Catalogs are opened on first use of their release. The instance is safe to
+    share between threads; all failures are logged and treated as misses.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+        self._lock = threading.Lock()
+        self._connections: dict[str, sqlite3.Connection] = {}
+        self._log = UnifiedLogger.get(__name__).bind(component="lookup_store")
+
+    @property
+    def root(self) -> Path:
+        """Return the directory holding the per-release catalogs."""
+
+        return self._root
+
+    def path_for(self, release: str) -> Path:
+        """Return the catalog location of ``release``.
+
+        Raises
+        ------
+        ValueError
+            If ``release`` is not usable as a directory name.
+        """
+
+        return release_directory(self._root, release) / "lookups.sqlite"
+
+    def get_many(
+        self,
+        entity: str,
+        record_ids: Iterable[str],
+        *,
+        release: str | None,
+        fields: Sequence[str] | None = None,
+    ) -> dict[str, Any]:
+        """Return stored payloads whose field selection covers ``fields``.
+
+        Payloads stored with more fields are narrowed to ``fields``. Nothing is
+        returned while ``release`` is unknown.
+        """
+
+        identifiers = list(dict.fromkeys(str(record_id) for record_id in record_ids))
+        if not identifiers or not release:
+            return {}
+
+        requested = _encode_fields(fields)
+        hits: dict[str, Any] = {}
+        try:
+            with self._lock:
+                connection = self._connection(release)
+                for start in range(0, len(identifiers), _SQLITE_MAX_VARIABLES):
+                    chunk = identifiers[start : start + _SQLITE_MAX_VARIABLES]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = connection.execute(
+                        "SELECT record_id, fields, payload FROM lookups "
+                        f"WHERE entity = ? AND record_id IN ({placeholders})",
+                        (entity, *chunk),
+                    ).fetchall()
+                    for record_id, stored_fields, payload in rows:
+                        if _covers(stored_fields, requested):
+                            hits[record_id] = _project(json.loads(payload), requested)
+        except (sqlite3.Error, OSError, ValueError) as exc:
+            self._log.warning("lookup_store.read_failed", entity=entity, error=str(exc))
+            record_cache_lookup("lookup_store", entity, hits=0, misses=len(identifiers))
+            return {}
+        record_cache_lookup(
+            "lookup_store", entity, hits=len(hits), misses=len(identifiers) - len(hits)
+        )
+        return hits
+
+    def put_many(
+        self,
+        entity: str,
+        records: Mapping[str, Any],
+        *,
+        release: str | None,
+        fields: Sequence[str] | None = None,
+    ) -> int:
+        """Store ``records`` and return the number written.
+
+        An entry already stored with a field selection covering ``fields`` is
+        kept, so a narrow fetch never replaces a wider one.
+        """
+
+        if not records or not release:
+            return 0
+
+        encoded = _encode_fields(fields)
+        stored_at = time.time()
+        try:
+            rows = [
+                (
+                    entity,
+                    str(record_id),
+                    encoded,
+                    json.dumps(payload, sort_keys=True, default=str),
+                    stored_at,
+                )
+                for record_id, payload in records.items()
+            ]
+            with self._lock:
+                connection = self._connection(release)
+                existing = self._stored_fields(connection, entity, [row[1] for row in rows])
+                rows = [
+                    row
+                    for row in rows
+                    if row[1] not in existing or not _covers(existing[row[1]], encoded)
+                ]
+                if rows:
+                    connection.execute("BEGIN")
+                    try:
+                        connection.executemany(
+                            "INSERT OR REPLACE INTO lookups "
+                            "(entity, record_id, fields, payload, stored_at) "
+                            "VALUES (?, ?, ?, ?, ?)",
+                            rows,
+                        )
+                    except sqlite3.Error:
+                        connection.execute("ROLLBACK")
+                        raise
+                    connection.execute("COMMIT")
+        except (sqlite3.Error, OSError, TypeError, ValueError) as exc:
+            self._log.warning("lookup_store.write_failed", entity=entity, error=str(exc))
+            return 0
+        return len(rows)
+
+    def count(self, entity: str, *, release: str) -> int:
+        """Return the number of records stored for ``entity`` in ``release``."""
+
+        with self._lock:
+            row = self._connection(release).execute(
+                "SELECT COUNT(*) FROM lookups WHERE entity = ?", (entity,)
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def close(self) -> None:
+        """Close all open catalogs."""
+
+        with self._lock:
+            connections, self._connections = self._connections, {}
+            for connection in connections.values():
+                connection.close()
+
+    def __enter__(self) -> LookupStore:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _connection(self, release: str) -> sqlite3.Connection:
+        connection = self._connections.get(release)
+        if connection is None:
+            path = self.path_for(release)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(path), check_same_thread=False, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_SCHEMA)
+            self._connections[release] = connection
+        return connection
+
+    @staticmethod
+    def _stored_fields(
+        connection: sqlite3.Connection, entity: str, record_ids: Sequence[str]
+    ) -> dict[str, str]:
+        stored: dict[str, str] = {}
+        for start in range(0, len(record_ids), _SQLITE_MAX_VARIABLES):
+            chunk = record_ids[start : start + _SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            rows = connection.execute(
+                "SELECT record_id, fields FROM lookups "
+                f"WHERE entity = ? AND record_id IN ({placeholders})",
+                (entity, *chunk),
+            ).fetchall()
+            stored.update(dict(rows))
+        return stored
@@ -0,0 +1,436 @@
+"""Process-wide registry of performance metrics (counters, gauges, histograms).
+
+Instrumented code records into :func:`get_metrics_registry`; exporters from
+:mod:`bioetl.core.metrics_export` render a :meth:`MetricsRegistry.collect`
+snapshot as Prometheus text or OTLP JSON. Recording is in-memory only, so the
+instrumentation stays active whether or not ``telemetry.enabled`` is set.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Literal, TypeVar
+from urllib.parse import urlsplit
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricFamily",
+    "MetricPoint",
+    "MetricsRegistry",
+    "endpoint_label",
+    "get_metrics_registry",
+    "observe_http_request",
+    "observe_rate_limiter_wait",
+    "record_cache_lookup",
+    "record_circuit_breaker_transition",
+    "record_rate_limiter_rate",
+    "record_stage",
+    "reset_metrics_registry",
+]
+
+MetricKind = Literal["counter", "gauge", "histogram"]
+LabelSet = tuple[tuple[str, str], ...]
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+"""Upper bounds (seconds) of the HTTP latency and rate-limiter wait histograms."""
+
+_NAME_PATTERN = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+# Сегменты пути с цифрами (CHEMBL25, 2244) заменяются, чтобы метки не плодили серии.
+_ID_SEGMENT = re.compile(r"^(?!v\d+$)[^/]*\d[^/]*$")
+
+
+def _label_set(labels: Mapping[str, object]) -> LabelSet:
+    return tuple(sorted((str(key), str(value)) for key, value in labels.items()))
+
+
+@dataclass(frozen=True)
+class MetricPoint:
+    """One labelled series of a metric.
+
+    Counters and gauges carry ``value``. Histograms carry ``count``, ``sum``,
+    ``min``, ``max`` and the per-bucket (non-cumulative) ``bucket_counts``;
+    the last bucket counts observations above the largest bound.
+    """
+
+    labels: LabelSet
+    value: float = 0.0
+    count: int = 0
+    sum: float = 0.0
+    min: float | None = None
+    max: float | None = None
+    bucket_counts: tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class MetricFamily:
+    """Snapshot of a metric and all its series."""
+
+    name: str
+    kind: MetricKind
+    description: str
+    unit: str
+    points: tuple[MetricPoint, ...]
+    buckets: tuple[float, ...] = ()
+
+
+@dataclass
+class _HistogramState:
+    bucket_counts: list[int]
+    count: int = 0
+    sum: float = 0.0
+    min: float | None = None
+    max: float | None = None
+
+
+class _Instrument:
+    kind: MetricKind
+
+    def __init__(self, name: str, description: str, unit: str) -> None:
+        self.name = name
+        self.description = description
+        self.unit = unit
+        self._lock = threading.Lock()
+
+    def collect(self) -> MetricFamily:
+        raise NotImplementedError
+
+
+_InstrumentT = TypeVar("_InstrumentT", bound=_Instrument)
+
+
+class Counter(_Instrument):
+    """Monotonic sum per label set."""
+
+    kind: MetricKind = "counter"
+
+    def __init__(self, name: str, description: str, unit: str) -> None:
+        super().__init__(name, description, unit)
+        self._values: dict[LabelSet, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        """Add ``amount`` (non-negative) to the series of ``labels``."""
+
+        if amount < 0:
+            raise ValueError(f"Counter {self.name} cannot decrease (got {amount})")
+        key = _label_set(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        """Return the current value of the series of ``labels``."""
+
+        with self._lock:
+            return self._values.get(_label_set(labels), 0.0)
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            points = tuple(
+                MetricPoint(labels=key, value=value) for key, value in sorted(self._values.items())
+            )
+        return MetricFamily(self.name, self.kind, self.description, self.unit, points)
+
+
+class Gauge(_Instrument):
+    """Last (or highest, see :meth:`set_max`) value per label set."""
+
+    kind: MetricKind = "gauge"
+
+    def __init__(self, name: str, description: str, unit: str) -> None:
+        super().__init__(name, description, unit)
+        self._values: dict[LabelSet, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        """Replace the value of the series of ``labels``."""
+
+        key = _label_set(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def set_max(self, value: float, **labels: object) -> None:
+        """Keep the highest value seen for the series of ``labels``."""
+
+        key = _label_set(labels)
+        with self._lock:
+            current = self._values.get(key)
+            if current is None or value > current:
+                self._values[key] = float(value)
+
+    def value(self, **labels: object) -> float | None:
+        """Return the current value of the series of ``labels``, if set."""
+
+        with self._lock:
+            return self._values.get(_label_set(labels))
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            points = tuple(
+                MetricPoint(labels=key, value=value) for key, value in sorted(self._values.items())
+            )
+        return MetricFamily(self.name, self.kind, self.description, self.unit, points)
+
+
+class Histogram(_Instrument):
+    """Distribution of observations over fixed ``buckets`` per label set."""
+
+    kind: MetricKind = "histogram"
+
+    def __init__(
+        self, name: str, description: str, unit: str, buckets: Sequence[float]
+    ) -> None:
+        super().__init__(name, description, unit)
+        bounds = tuple(float(bound) for bound in buckets)
+        if not bounds or list(bounds) != sorted(set(bounds)):
+            raise ValueError(f"Histogram {name} needs strictly increasing buckets")
+        self.buckets = bounds
+        self._states: dict[LabelSet, _HistogramState] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        """Record one observation in the series of ``labels``."""
+
+        key = _label_set(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = _HistogramState(bucket_counts=[0] * (len(self.buckets) + 1))
+                self._states[key] = state
+            state.bucket_counts[index] += 1
+            state.count += 1
+            state.sum += value
+            state.min = value if state.min is None else min(state.min, value)
+            state.max = value if state.max is None else max(state.max, value)
+
+    def count(self, **labels: object) -> int:
+        """Return the number of observations in the series of ``labels``."""
+
+        with self._lock:
+            state = self._states.get(_label_set(labels))
+            return state.count if state is not None else 0
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            points = tuple(
+                MetricPoint(
+                    labels=key,
+                    count=state.count,
+                    sum=state.sum,
+                    min=state.min,
+                    max=state.max,
+                    bucket_counts=tuple(state.bucket_counts),
+                )
+                for key, state in sorted(self._states.items())
+            )
+        return MetricFamily(
+            self.name, self.kind, self.description, self.unit, points, self.buckets
+        )
+
+
+class MetricsRegistry:
+    """Thread-safe set of named instruments.
+
+    Asking for an existing name returns the registered instrument; asking for
+    it with a different kind raises :class:`ValueError`. ``start_time_ns`` is
+    the start of the cumulative series (creation or last :meth:`clear`).
+    """
+
+    def __init__(self) -> None:
+        self._instruments: dict[str, _Instrument] = {}
+        self._lock = threading.Lock()
+        self.start_time_ns = time.time_ns()
+
+    def counter(self, name: str, description: str = "", *, unit: str = "") -> Counter:
+        """Return the counter ``name``, creating it on first use."""
+
+        return self._get_or_create(name, Counter, lambda: Counter(name, description, unit))
+
+    def gauge(self, name: str, description: str = "", *, unit: str = "") -> Gauge:
+        """Return the gauge ``name``, creating it on first use."""
+
+        return self._get_or_create(name, Gauge, lambda: Gauge(name, description, unit))
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        *,
+        unit: str = "",
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram ``name``, creating it on first use."""
+
+        return self._get_or_create(
+            name, Histogram, lambda: Histogram(name, description, unit, buckets)
+        )
+
+    def collect(self) -> list[MetricFamily]:
+        """Return a snapshot of every instrument, ordered by name."""
+
+        with self._lock:
+            instruments = sorted(self._instruments.values(), key=lambda item: item.name)
+        return [instrument.collect() for instrument in instruments]
+
+    def clear(self) -> None:
+        """Drop all instruments and their series."""
+
+        with self._lock:
+            self._instruments.clear()
+            self.start_time_ns = time.time_ns()
+
+    def _get_or_create(
+        self, name: str, kind: type[_InstrumentT], factory: Callable[[], _InstrumentT]
+    ) -> _InstrumentT:
+        if not _NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid metric name: {name!r}")
+        with self._lock:
+            instrument = self._instruments.get(name)
+            if instrument is None:
+                instrument = factory()
+                self._instruments[name] = instrument
+        if not isinstance(instrument, kind):
+            msg = f"Metric {name!r} is already registered as a {instrument.kind}"
+            raise ValueError(msg)
+        return instrument
+
+
+_default_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide :class:`MetricsRegistry`."""
+
+    return _default_registry
+
+
+def reset_metrics_registry() -> None:
+    """Drop every metric recorded in the process-wide registry."""
+
+    _default_registry.clear()
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation helpers
+# ---------------------------------------------------------------------------
+
+
+def endpoint_label(url: str) -> str:
+    """Return the low-cardinality path of ``url`` used as the ``endpoint`` label.
+
+    Query strings are dropped and path segments containing digits (record
+    identifiers such as ``CHEMBL25`` or ``2244``) become ``{id}``.
+    """
+
+    path = urlsplit(url).path or "/"
+    return "/".join("{id}" if _ID_SEGMENT.match(part) else part for part in path.split("/"))
+
+
+def observe_http_request(
+    client: str, method: str, url: str, status: int | str, duration_seconds: float
+) -> None:
+    """Record the latency of one HTTP request (``status`` is ``error`` without response)."""
+
+    get_metrics_registry().histogram(
+        "bioetl_http_request_duration_seconds",
+        "HTTP request latency per endpoint.",
+        unit="s",
+    ).observe(
+        duration_seconds,
+        client=client,
+        method=method.upper(),
+        endpoint=endpoint_label(url),
+        status=status,
+    )
+
+
+def observe_rate_limiter_wait(client: str, wait_seconds: float) -> None:
+    """Record the time a request waited for a rate-limiter token."""
+
+    get_metrics_registry().histogram(
+        "bioetl_rate_limiter_wait_seconds",
+        "Time spent waiting for a rate-limiter token.",
+        unit="s",
+    ).observe(wait_seconds, client=client)
+
+
+def record_rate_limiter_rate(host: str, calls_per_second: float) -> None:
+    """Publish the current rate of the adaptive limiter shared by ``host``."""
+
+    get_metrics_registry().gauge(
+        "bioetl_rate_limiter_rate", "Current adaptive rate-limiter rate.", unit="1/s"
+    ).set(calls_per_second, host=host)
+
+
+def record_circuit_breaker_transition(name: str, state: str) -> None:
+    """Count a circuit-breaker transition into ``state``."""
+
+    get_metrics_registry().counter(
+        "bioetl_circuit_breaker_transitions_total",
+        "Circuit-breaker state transitions.",
+    ).inc(name=name, state=state)
+
+
+def record_cache_lookup(cache: str, entity: str, *, hits: int, misses: int) -> None:
+    """Count cache hits and misses and refresh the cumulative hit ratio."""
+
+    registry = get_metrics_registry()
+    lookups = registry.counter(
+        "bioetl_cache_lookups_total", "Cache lookups by result (hit or miss)."
+    )
+    lookups.inc(hits, cache=cache, entity=entity, result="hit")
+    lookups.inc(misses, cache=cache, entity=entity, result="miss")
+    total_hits = lookups.value(cache=cache, entity=entity, result="hit")
+    total = total_hits + lookups.value(cache=cache, entity=entity, result="miss")
+    if total:
+        registry.gauge(
+            "bioetl_cache_hit_ratio", "Cumulative cache hit ratio.", unit="1"
+        ).set(total_hits / total, cache=cache, entity=entity)
+
+
+def record_stage(
+    pipeline: str,
+    stage: str,
+    *,
+    duration_seconds: float,
+    rows: int | None = None,
+    peak_memory_bytes: int | None = None,
+) -> None:
+    """Record duration, throughput and peak memory of one pipeline stage."""
+
+    registry = get_metrics_registry()
+    registry.gauge(
+        "bioetl_stage_duration_seconds", "Wall-clock duration of a pipeline stage.", unit="s"
+    ).set(duration_seconds, pipeline=pipeline, stage=stage)
+    if rows is not None:
+        registry.counter("bioetl_stage_rows_total", "Rows produced by a pipeline stage.").inc(
+            rows, pipeline=pipeline, stage=stage
+        )
+        if duration_seconds > 0:
+            registry.gauge(
+                "bioetl_stage_rows_per_second", "Stage throughput.", unit="1/s"
+            ).set(rows / duration_seconds, pipeline=pipeline, stage=stage)
+    if peak_memory_bytes is not None:
+        registry.gauge(
+            "bioetl_stage_peak_memory_bytes",
+            "Peak resident memory while the stage ran.",
+            unit="By",
+        ).set_max(peak_memory_bytes, pipeline=pipeline, stage=stage)
@@ -0,0 +1,398 @@
+"""Exporters for :class:`~bioetl.core.metrics.MetricsRegistry` snapshots.
+
+Two wire formats are supported, both without a collector:
+
+* Prometheus text exposition format, written to a file or served over HTTP
+  (``GET /metrics``) for the duration of a run;
+* OTLP/JSON (``ExportMetricsServiceRequest``), written to a file or posted to
+  an OTLP/HTTP endpoint.
+
+:func:`create_metrics_exporter` maps ``TelemetryConfig`` onto an exporter.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Protocol
+from urllib.parse import urlsplit, urlunsplit
+
+from .log_events import LogEvents
+from .logger import UnifiedLogger
+from .metrics import MetricFamily, MetricPoint, MetricsRegistry
+
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from bioetl.config.models.models import TelemetryConfig
+
+__all__ = [
+    "ConsoleMetricsExporter",
+    "MetricsExporter",
+    "OTLPHttpMetricsExporter",
+    "OTLPJsonFileExporter",
+    "PROMETHEUS_CONTENT_TYPE",
+    "PrometheusFileExporter",
+    "PrometheusHTTPExporter",
+    "create_metrics_exporter",
+    "render_otlp_json",
+    "render_prometheus",
+]
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_DEFAULT_PROMETHEUS_PORT = 9464
+_OTLP_METRICS_PATH = "/v1/metrics"
+# AGGREGATION_TEMPORALITY_CUMULATIVE из спецификации OTLP.
+_CUMULATIVE = 2
+
+
+class MetricsExporter(Protocol):
+    """Destination of registry snapshots."""
+
+    def export(self, registry: MetricsRegistry) -> None:
+        """Publish the current contents of ``registry``."""
+
+    def close(self) -> None:
+        """Release resources held by the exporter."""
+
+
+# ---------------------------------------------------------------------------
+# Prometheus text format
+# ---------------------------------------------------------------------------
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _format_labels(labels: Iterable[tuple[str, str]]) -> str:
+    rendered = ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels)
+    return f"{{{rendered}}}" if rendered else ""
+
+
+def _prometheus_lines(family: MetricFamily) -> Iterable[str]:
+    if family.description:
+        yield f"# HELP {family.name} {_escape_help(family.description)}"
+    yield f"# TYPE {family.name} {family.kind}"
+    for point in family.points:
+        if family.kind != "histogram":
+            yield f"{family.name}{_format_labels(point.labels)} {_format_value(point.value)}"
+            continue
+        cumulative = 0
+        bounds = (*family.buckets, math.inf)
+        for bound, count in zip(bounds, point.bucket_counts, strict=True):
+            cumulative += count
+            labels = _format_labels((*point.labels, ("le", _format_value(bound))))
+            yield f"{family.name}_bucket{labels} {cumulative}"
+        labels = _format_labels(point.labels)
+        yield f"{family.name}_sum{labels} {_format_value(point.sum)}"
+        yield f"{family.name}_count{labels} {point.count}"
+
+
+def render_prometheus(families: Iterable[MetricFamily]) -> str:
+    """Render ``families`` in the Prometheus text exposition format (0.0.4)."""
+
+    lines = [line for family in families for line in _prometheus_lines(family)]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+# ---------------------------------------------------------------------------
+# OTLP/JSON
+# ---------------------------------------------------------------------------
+
+
+def _otlp_attributes(items: Iterable[tuple[str, str]]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": {"stringValue": value}} for key, value in items]
+
+
+def _otlp_point(
+    point: MetricPoint, kind: str, buckets: tuple[float, ...], start_ns: int, now_ns: int
+) -> dict[str, Any]:
+    data: dict[str, Any] = {
+        "attributes": _otlp_attributes(point.labels),
+        "startTimeUnixNano": str(start_ns),
+        "timeUnixNano": str(now_ns),
+    }
+    if kind != "histogram":
+        data["asDouble"] = point.value
+        return data
+    # Целые 64-битные поля OTLP/JSON кодируются строками.
+    data.update(
+        {
+            "count": str(point.count),
+            "sum": point.sum,
+            "bucketCounts": [str(count) for count in point.bucket_counts],
+            "explicitBounds": list(buckets),
+        }
+    )
+    if point.min is not None and point.max is not None:
+        data["min"] = point.min
+        data["max"] = point.max
+    return data
+
+
+def render_otlp_json(
+    families: Iterable[MetricFamily],
+    *,
+    resource: Mapping[str, str],
+    start_time_ns: int,
+    time_ns: int | None = None,
+) -> dict[str, Any]:
+    """Return ``families`` as an OTLP ``ExportMetricsServiceRequest`` JSON payload."""
+
+    now_ns = time.time_ns() if time_ns is None else time_ns
+    metrics: list[dict[str, Any]] = []
+    for family in families:
+        points = [
+            _otlp_point(point, family.kind, family.buckets, start_time_ns, now_ns)
+            for point in family.points
+        ]
+        metric: dict[str, Any] = {
+            "name": family.name,
+            "description": family.description,
+            "unit": family.unit,
+        }
+        if family.kind == "counter":
+            metric["sum"] = {
+                "dataPoints": points,
+                "aggregationTemporality": _CUMULATIVE,
+                "isMonotonic": True,
+            }
+        elif family.kind == "gauge":
+            metric["gauge"] = {"dataPoints": points}
+        else:
+            metric["histogram"] = {"dataPoints": points, "aggregationTemporality": _CUMULATIVE}
+        metrics.append(metric)
+    return {
+        "resourceMetrics": [
+            {
+                "resource": {"attributes": _otlp_attributes(sorted(resource.items()))},
+                "scopeMetrics": [{"scope": {"name": "bioetl"}, "metrics": metrics}],
+            }
+        ]
+    }
+
+
+# ---------------------------------------------------------------------------
+# Exporters
+# ---------------------------------------------------------------------------
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class PrometheusFileExporter:
+    """Write Prometheus text to ``path`` (e.g. for the node-exporter textfile collector)."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def export(self, registry: MetricsRegistry) -> None:
+        _write_text_atomic(self.path, render_prometheus(registry.collect()))
+
+    def close(self) -> None:
+        return None
+
+
+class ConsoleMetricsExporter:
+    """Write Prometheus text to ``stream`` (standard error by default)."""
+
+    def __init__(self, stream: IO[str] | None = None) -> None:
+        self._stream = stream
+
+    def export(self, registry: MetricsRegistry) -> None:
+        stream = self._stream or sys.stderr
+        stream.write(render_prometheus(registry.collect()))
+        stream.flush()
+
+    def close(self) -> None:
+        return None
+
+
+class PrometheusHTTPExporter:
+    """Serve live registry snapshots on ``http://<host>:<port>/metrics``.
+
+    The server runs on a daemon thread from construction until :meth:`close`;
+    ``port=0`` binds an ephemeral port (see :attr:`address`).
+    """
+
+    def __init__(
+        self, registry: MetricsRegistry, *, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        source = registry
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server API
+                if urlsplit(self.path).path not in {"/", "/metrics"}:
+                    self.send_error(404)
+                    return
+                body = render_prometheus(source.collect()).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return None
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="bioetl-metrics-http", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Return the bound ``(host, port)``."""
+
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def export(self, registry: MetricsRegistry) -> None:
+        return None
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+class OTLPJsonFileExporter:
+    """Write OTLP/JSON payloads to ``path``."""
+
+    def __init__(self, path: str | Path, *, resource: Mapping[str, str]) -> None:
+        self.path = Path(path)
+        self._resource = dict(resource)
+
+    def export(self, registry: MetricsRegistry) -> None:
+        payload = render_otlp_json(
+            registry.collect(), resource=self._resource, start_time_ns=registry.start_time_ns
+        )
+        _write_text_atomic(self.path, json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
+
+    def close(self) -> None:
+        return None
+
+
+class OTLPHttpMetricsExporter:
+    """POST OTLP/JSON payloads to an OTLP/HTTP collector endpoint."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        resource: Mapping[str, str],
+        timeout: float = 10.0,
+        session: Any | None = None,
+    ) -> None:
+        parts = urlsplit(endpoint)
+        if parts.path in {"", "/"}:
+            parts = parts._replace(path=_OTLP_METRICS_PATH)
+        self.endpoint = urlunsplit(parts)
+        self._resource = dict(resource)
+        self._timeout = timeout
+        self._session = session
+
+    def export(self, registry: MetricsRegistry) -> None:
+        import requests
+
+        payload = render_otlp_json(
+            registry.collect(), resource=self._resource, start_time_ns=registry.start_time_ns
+        )
+        session = self._session or requests
+        response = session.post(
+            self.endpoint,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            timeout=self._timeout,
+        )
+        response.raise_for_status()
+
+    def close(self) -> None:
+        return None
+
+
+def _is_http_url(value: str) -> bool:
+    return urlsplit(value).scheme in {"http", "https"}
+
+
+def create_metrics_exporter(
+    telemetry: TelemetryConfig | None,
+    *,
+    registry: MetricsRegistry,
+    default_directory: Path,
+    stem: str,
+    resource: Mapping[str, str],
+) -> MetricsExporter | None:
+    """Build the exporter selected by ``telemetry``.
+
+    ``exporter`` chooses the format: ``prometheus`` serves ``/metrics`` when
+    ``endpoint`` is an ``http://`` URL and otherwise writes a text file,
+    ``otlp`` posts to an ``http(s)://`` endpoint (``/v1/metrics`` by default)
+    and otherwise writes JSON, ``console`` prints Prometheus text to stderr.
+    Without ``endpoint`` files go to ``<default_directory>/<stem>_metrics.*``.
+    ``jaeger`` carries traces only and exports no metrics.
+
+    Raises
+    ------
+    ValueError
+        If ``exporter`` is not one of the supported names.
+    """
+
+    if telemetry is None or not telemetry.enabled:
+        return None
+    exporter = (telemetry.exporter or "").strip().lower()
+    endpoint = (telemetry.endpoint or "").strip()
+    if exporter in {"", "jaeger"}:
+        UnifiedLogger.get(__name__).debug(
+            LogEvents.METRICS_EXPORTER_SKIPPED, exporter=telemetry.exporter
+        )
+        return None
+    if exporter == "prometheus":
+        if endpoint and _is_http_url(endpoint):
+            parts = urlsplit(endpoint)
+            return PrometheusHTTPExporter(
+                registry,
+                host=parts.hostname or "127.0.0.1",
+                port=parts.port or _DEFAULT_PROMETHEUS_PORT,
+            )
+        return PrometheusFileExporter(
+            Path(endpoint) if endpoint else default_directory / f"{stem}_metrics.prom"
+        )
+    if exporter == "otlp":
+        if endpoint and _is_http_url(endpoint):
+            return OTLPHttpMetricsExporter(endpoint, resource=resource)
+        return OTLPJsonFileExporter(
+            Path(endpoint) if endpoint else default_directory / f"{stem}_metrics.otlp.json",
+            resource=resource,
+        )
+    if exporter == "console":
+        return ConsoleMetricsExporter()
+    msg = (
+        f"Unsupported telemetry exporter {telemetry.exporter!r}; "
+        "expected prometheus, otlp, console or jaeger"
+    )
+    raise ValueError(msg)
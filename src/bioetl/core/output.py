@@ -4,17 +4,20 @@ from __future__ import annotations
 
 import csv
 import os
-from collections.abc import Callable, Mapping
+import shutil
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, cast
+from urllib.parse import quote
 
 import pandas as pd
 import yaml
 
 from bioetl.config import PipelineConfig
-from bioetl.core.hashing import hash_from_mapping
+from bioetl.core.concurrency import resolve_worker_count
+from bioetl.core.hashing import hash_frame_rows
 from bioetl.core.log_events import LogEvents
 
 from .logger import UnifiedLogger
@@ -22,11 +25,21 @@ from .logger import UnifiedLogger
 # CSV quoting type for pandas to_csv
 # Values: 0=QUOTE_MINIMAL, 1=QUOTE_ALL, 2=QUOTE_NONNUMERIC, 3=QUOTE_NONE
 CSVQuotingLiteral = Literal[0, 1, 2, 3]
+OutputFormat = Literal["csv", "parquet"]
+
+_HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+_DICTIONARY_MAX_UNIQUE_RATIO = 0.5
+"""String columns at or below this distinct/non-null ratio are dictionary encoded."""
 
 __all__ = [
     "DeterministicWriteArtifacts",
     "prepare_dataframe",
     "ensure_hash_columns",
+    "resolve_output_format",
+    "StreamingDatasetWriter",
+    "arrow_schema",
+    "read_dataset",
+    "unify_arrow_schemas",
     "write_dataset_atomic",
     "write_yaml_atomic",
     "serialise_metadata",
@@ -67,6 +80,7 @@ def ensure_hash_columns(df: pd.DataFrame, *, config: PipelineConfig) -> pd.DataF
         raise KeyError(f"Field(s) {missing_str} is missing from dataframe")
 
     result = df.copy()
+    max_workers = resolve_worker_count(config.runtime.parallelism, len(result))
 
     def _needs_recompute(series: pd.Series) -> bool:
         if series.empty:
@@ -81,13 +95,9 @@ def ensure_hash_columns(df: pd.DataFrame, *, config: PipelineConfig) -> pd.DataF
 
     if row_needs_recompute:
         row_fields = list(row_fields)  # ensure deterministic ordering
-        row_records: list[dict[str, Any]] = []
-        for tuple_values in result[row_fields].itertuples(index=False, name=None):
-            record = dict(zip(row_fields, tuple_values, strict=True))
-            row_records.append(record)
-        row_hashes = [
-            hash_from_mapping(record, row_fields, algorithm=algorithm) for record in row_records
-        ]
+        row_hashes = hash_frame_rows(
+            result, row_fields, algorithm=algorithm, max_workers=max_workers
+        )
         result[row_column] = pd.Series(row_hashes, index=result.index, dtype="string")
 
     if business_fields:
@@ -96,14 +106,9 @@ def ensure_hash_columns(df: pd.DataFrame, *, config: PipelineConfig) -> pd.DataF
         else:
             business_needs_recompute = True
         if business_needs_recompute:
-            business_records: list[dict[str, Any]] = []
-            for tuple_values in result[business_fields].itertuples(index=False, name=None):
-                record = dict(zip(business_fields, tuple_values, strict=True))
-                business_records.append(record)
-            business_hashes = [
-                hash_from_mapping(record, business_fields, algorithm=algorithm)
-                for record in business_records
-            ]
+            business_hashes = hash_frame_rows(
+                result, business_fields, algorithm=algorithm, max_workers=max_workers
+            )
             result[business_column] = pd.Series(
                 business_hashes, index=result.index, dtype="string"
             )
@@ -188,16 +193,26 @@ def _csv_quoting(config: PipelineConfig) -> CSVQuotingLiteral:
         raise ValueError(msg) from exc
 
 
-def write_dataset_atomic(df: pd.DataFrame, path: Path, *, config: PipelineConfig) -> None:
-    """Write ``df`` deterministically to ``path`` using an atomic replace."""
+def resolve_output_format(config: PipelineConfig) -> OutputFormat:
+    """Return the dataset format configured in ``io.output.format``."""
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    return "parquet" if config.io.output.format == "parquet" else "csv"
+
+
+def _write_csv(
+    df: pd.DataFrame,
+    path: Path,
+    *,
+    config: PipelineConfig,
+    append: bool = False,
+) -> None:
     csv_config = config.determinism.serialization.csv
     float_format = f"%.{config.determinism.float_precision}f"
     quoting_value = _csv_quoting(config)
     df.to_csv(
-        path_or_buf=str(tmp_path),
+        path_or_buf=str(path),
+        mode="a" if append else "w",
+        header=not append,
         index=False,
         sep=csv_config.separator,
         na_rep=csv_config.na_rep,
@@ -206,7 +221,428 @@ def write_dataset_atomic(df: pd.DataFrame, path: Path, *, config: PipelineConfig
         lineterminator="\n",
         float_format=float_format,
     )
+
+
+def _import_pyarrow() -> tuple[Any, Any]:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - pyarrow is a runtime dependency
+        msg = "Parquet output requires the 'pyarrow' package"
+        raise RuntimeError(msg) from exc
+    return pa, pq
+
+
+def _arrow_table(df: pd.DataFrame) -> Any:
+    """Convert ``df`` to an Arrow table, stringifying object columns Arrow cannot type."""
+
+    pa, _ = _import_pyarrow()
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        pass
+
+    coerced = df.copy()
+    for column in coerced.columns:
+        series = coerced[column]
+        if series.dtype != object:
+            continue
+        try:
+            pa.array(series, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            coerced[column] = series.map(
+                lambda value: value if value is None or value is pd.NA else str(value)
+            ).astype("string")
+    return pa.Table.from_pandas(coerced, preserve_index=False)
+
+
+def _dictionary_columns(table: Any) -> list[str]:
+    """Return string columns whose cardinality makes dictionary encoding worthwhile."""
+
+    pa, _ = _import_pyarrow()
+    columns: list[str] = []
+    for name, column in zip(table.column_names, table.columns, strict=True):
+        if not (pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+            continue
+        non_null = len(column) - column.null_count
+        if non_null == 0:
+            continue
+        if len(column.unique()) / non_null <= _DICTIONARY_MAX_UNIQUE_RATIO:
+            columns.append(name)
+    return columns
+
+
+def _parquet_compression(config: PipelineConfig) -> str | None:
+    compression = config.io.output.compression
+    return None if compression.lower() == "none" else compression
+
+
+def _write_parquet_file(table: Any, path: Path, *, config: PipelineConfig) -> None:
+    _, pq = _import_pyarrow()
+    pq.write_table(
+        table,
+        str(path),
+        compression=_parquet_compression(config),
+        row_group_size=config.io.output.row_group_size,
+        use_dictionary=_dictionary_columns(table),
+        write_statistics=True,
+    )
+
+
+def _partition_segment(column: str, value: Any) -> str:
+    if value is None or value is pd.NA or (isinstance(value, float) and value != value):
+        rendered = _HIVE_DEFAULT_PARTITION
+    else:
+        rendered = quote(str(value), safe="")
+    return f"{column}={rendered}"
+
+
+def _write_parquet_partitioned(
+    df: pd.DataFrame,
+    directory: Path,
+    partition_by: Sequence[str],
+    *,
+    config: PipelineConfig,
+) -> None:
+    """Write a hive-style partitioned dataset into ``directory``.
+
+    Partitions are visited in sorted key order and each partition keeps the
+    input row order, so the layout and file contents are deterministic.
+    """
+
+    missing = [column for column in partition_by if column not in df.columns]
+    if missing:
+        msg = f"Partition columns missing from dataframe: {missing}"
+        raise KeyError(msg)
+
+    directory.mkdir(parents=True, exist_ok=True)
+    keys = list(partition_by)
+    grouped = df.groupby(keys, dropna=False, sort=True, observed=True)
+    for key, partition in grouped:
+        values = key if isinstance(key, tuple) else (key,)
+        target = directory.joinpath(
+            *(_partition_segment(column, value) for column, value in zip(keys, values, strict=True))
+        )
+        target.mkdir(parents=True, exist_ok=True)
+        table = _arrow_table(partition.drop(columns=keys).reset_index(drop=True))
+        _write_parquet_file(table, target / "part-00000.parquet", config=config)
+
+
+def _remove_path(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        path.unlink()
+
+
+def _replace_path(tmp_path: Path, path: Path) -> None:
+    """Move ``tmp_path`` over ``path``, replacing files or partition directories.
+
+    ``os.replace`` cannot overwrite a non-empty directory, so an existing
+    directory is first moved aside and removed once the new one is in place.
+    """
+
+    if not path.exists() or (tmp_path.is_file() and path.is_file()):
+        os.replace(tmp_path, path)
+        return
+    backup = path.with_name(path.name + ".old")
+    _remove_path(backup)
+    os.replace(path, backup)
     os.replace(tmp_path, path)
+    _remove_path(backup)
+
+
+def write_dataset_atomic(df: pd.DataFrame, path: Path, *, config: PipelineConfig) -> None:
+    """Write ``df`` deterministically to ``path`` using an atomic replace.
+
+    The format follows the file suffix: ``.parquet`` targets are written with
+    pyarrow (fixed row groups, ``io.output.compression``, dictionary encoding
+    for low-cardinality strings) and become a hive-style directory when
+    ``io.output.partition_by`` is set; any other suffix produces CSV using the
+    determinism serialisation settings.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    if tmp_path.is_dir():
+        shutil.rmtree(tmp_path)
+
+    if path.suffix == ".parquet":
+        partition_by = list(config.io.output.partition_by)
+        if partition_by:
+            _write_parquet_partitioned(df, tmp_path, partition_by, config=config)
+        else:
+            _write_parquet_file(_arrow_table(df), tmp_path, config=config)
+    else:
+        _write_csv(df, tmp_path, config=config)
+    _replace_path(tmp_path, path)
+
+
+def read_dataset(
+    path: Path,
+    *,
+    config: PipelineConfig,
+    dtypes: Mapping[str, Any] | None = None,
+) -> pd.DataFrame:
+    """Read a dataset previously written by :func:`write_dataset_atomic`.
+
+    CSV files are parsed with the configured separator and ``na_rep``. Columns
+    listed in ``dtypes`` (typically the output schema's) are parsed as those
+    dtypes instead of being inferred, so nullable integers with gaps do not turn
+    into floats and numeric-looking strings stay strings. For hive-partitioned
+    Parquet directories the partition columns are restored from the directory
+    names, with the default partition mapped to missing, and cast to their
+    ``dtypes`` entry (strings otherwise).
+    """
+
+    if path.suffix != ".parquet":
+        csv_config = config.determinism.serialization.csv
+        na_values = [csv_config.na_rep] if csv_config.na_rep else None
+        parse_dtypes = {
+            column: "string" if _is_datetime_dtype(dtype) else dtype
+            for column, dtype in (dtypes or {}).items()
+        }
+        frame = pd.read_csv(
+            path,
+            sep=csv_config.separator,
+            encoding="utf-8",
+            na_values=na_values,
+            low_memory=False,
+            dtype=parse_dtypes or None,
+        )
+        # read_csv cannot parse into datetime dtypes directly.
+        for column, dtype in (dtypes or {}).items():
+            if column in frame.columns and _is_datetime_dtype(dtype):
+                frame[column] = frame[column].astype(dtype)
+        return frame
+    pa, pq = _import_pyarrow()
+    if not path.is_dir():
+        return cast(pd.DataFrame, pq.read_table(str(path)).to_pandas())
+    import pyarrow.dataset as ds
+
+    partitioning = ds.HivePartitioning(
+        pa.schema([(column, pa.string()) for column in config.io.output.partition_by]),
+        null_fallback=_HIVE_DEFAULT_PARTITION,
+    )
+    table = pq.read_table(str(path), partitioning=partitioning)
+    frame = cast(pd.DataFrame, table.to_pandas())
+    for column in config.io.output.partition_by:
+        if dtypes and column in dtypes:
+            frame[column] = frame[column].astype(dtypes[column])
+    return frame
+
+
+def _is_datetime_dtype(dtype: Any) -> bool:
+    return bool(pd.api.types.is_datetime64_any_dtype(dtype))
+
+
+def arrow_schema(df: pd.DataFrame) -> Any:
+    """Return the Arrow schema ``df`` is written with in Parquet datasets."""
+
+    pa, _ = _import_pyarrow()
+    try:
+        return pa.Schema.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return _arrow_table(df).schema
+
+
+def unify_arrow_schemas(schemas: Sequence[Any]) -> Any:
+    """Merge per-chunk Arrow schemas into one dataset schema.
+
+    Types are promoted permissively, so a column that is entirely null in one
+    chunk takes the type observed in the others.
+    """
+
+    pa, _ = _import_pyarrow()
+    if not schemas:
+        msg = "At least one schema is required"
+        raise ValueError(msg)
+    return pa.unify_schemas(
+        [schema.remove_metadata() for schema in schemas], promote_options="permissive"
+    )
+
+
+class StreamingDatasetWriter:
+    """Append-only counterpart of :func:`write_dataset_atomic` for chunked runs.
+
+    Chunks are written to a temporary path and moved over ``path`` by
+    :meth:`close`; an exception inside the ``with`` block discards them. CSV
+    output is appended chunk by chunk with a single header. Parquet output is
+    re-sliced into ``io.output.row_group_size`` row groups so the file layout
+    does not depend on chunk boundaries; with ``io.output.partition_by`` every
+    row group contributes one ``part-NNNNN.parquet`` file per partition.
+
+    Parameters
+    ----------
+    path:
+        Final dataset location; the suffix selects the format.
+    config:
+        Pipeline configuration providing serialisation settings.
+    schema:
+        Arrow schema for Parquet output, typically
+        :func:`unify_arrow_schemas` over :func:`arrow_schema` of every chunk.
+        Defaults to the schema of the first row group.
+    """
+
+    def __init__(self, path: Path, *, config: PipelineConfig, schema: Any | None = None) -> None:
+        self._path = path
+        self._config = config
+        self._schema = schema
+        self._format: OutputFormat = "parquet" if path.suffix == ".parquet" else "csv"
+        self._partition_by = (
+            list(config.io.output.partition_by) if self._format == "parquet" else []
+        )
+        self._tmp_path = path.with_suffix(path.suffix + ".tmp")
+        self._parquet_writer: Any | None = None
+        self._pending: list[pd.DataFrame] = []
+        self._pending_rows = 0
+        self._partition_parts: dict[Path, int] = {}
+        self._csv_columns: list[str] | None = None
+        self._rows_written = 0
+        self._closed = False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _remove_path(self._tmp_path)
+
+    @property
+    def rows_written(self) -> int:
+        """Return the number of rows written so far."""
+
+        return self._rows_written
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append ``df`` to the dataset."""
+
+        if self._closed:
+            msg = "StreamingDatasetWriter is closed"
+            raise RuntimeError(msg)
+        if self._format == "csv":
+            if self._csv_columns is None:
+                self._csv_columns = list(df.columns)
+                _write_csv(df, self._tmp_path, config=self._config)
+            elif list(df.columns) != self._csv_columns:
+                msg = (
+                    "Streaming chunk columns differ from the dataset columns: "
+                    f"{list(df.columns)} != {self._csv_columns}"
+                )
+                raise ValueError(msg)
+            else:
+                _write_csv(df, self._tmp_path, config=self._config, append=True)
+            self._rows_written += len(df)
+            return
+        if df.empty:
+            return
+        self._pending.append(df)
+        self._pending_rows += len(df)
+        row_group_size = self._config.io.output.row_group_size
+        if self._pending_rows < row_group_size:
+            return
+        buffer = pd.concat(self._pending, ignore_index=True)
+        start = 0
+        while len(buffer) - start >= row_group_size:
+            self._write_row_group(buffer.iloc[start : start + row_group_size])
+            start += row_group_size
+        remainder = buffer.iloc[start:].reset_index(drop=True)
+        self._pending = [remainder] if not remainder.empty else []
+        self._pending_rows = len(remainder)
+
+    def close(self) -> None:
+        """Flush buffered rows and atomically publish the dataset."""
+
+        if self._closed:
+            return
+        if self._pending:
+            self._write_row_group(pd.concat(self._pending, ignore_index=True))
+            self._pending = []
+            self._pending_rows = 0
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        elif self._partition_by:
+            self._tmp_path.mkdir(parents=True, exist_ok=True)
+        elif self._format == "parquet":
+            table = (
+                self._schema.empty_table()
+                if self._schema is not None
+                else _arrow_table(pd.DataFrame())
+            )
+            _write_parquet_file(table, self._tmp_path, config=self._config)
+        elif self._csv_columns is None:
+            _write_csv(pd.DataFrame(), self._tmp_path, config=self._config)
+        self._closed = True
+        _replace_path(self._tmp_path, self._path)
+
+    def abort(self) -> None:
+        """Discard everything written so far."""
+
+        if self._closed:
+            return
+        self._closed = True
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        _remove_path(self._tmp_path)
+
+    def __enter__(self) -> StreamingDatasetWriter:
+        return self
+
+    def __exit__(self, exc_type: object, *_: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _conform(self, frame: pd.DataFrame, schema: Any | None) -> Any:
+        table = _arrow_table(frame.reset_index(drop=True))
+        if schema is None:
+            return table
+        if table.schema.names != schema.names:
+            msg = (
+                "Streaming chunk columns differ from the dataset schema: "
+                f"{table.schema.names} != {schema.names}"
+            )
+            raise ValueError(msg)
+        return table.cast(schema)
+
+    def _write_row_group(self, frame: pd.DataFrame) -> None:
+        self._rows_written += len(frame)
+        if self._partition_by:
+            self._write_partitioned(frame)
+            return
+        _, pq = _import_pyarrow()
+        table = self._conform(frame, self._schema)
+        if self._parquet_writer is None:
+            self._schema = table.schema
+            self._parquet_writer = pq.ParquetWriter(
+                str(self._tmp_path),
+                table.schema,
+                compression=_parquet_compression(self._config),
+                use_dictionary=_dictionary_columns(table),
+                write_statistics=True,
+            )
+        self._parquet_writer.write_table(table, row_group_size=len(frame))
+
+    def _write_partitioned(self, frame: pd.DataFrame) -> None:
+        missing = [column for column in self._partition_by if column not in frame.columns]
+        if missing:
+            msg = f"Partition columns missing from dataframe: {missing}"
+            raise KeyError(msg)
+        pa, _ = _import_pyarrow()
+        keys = self._partition_by
+        schema = self._schema
+        if schema is not None:
+            schema = pa.schema([field for field in schema if field.name not in keys])
+        grouped = frame.groupby(keys, dropna=False, sort=True, observed=True)
+        for key, partition in grouped:
+            values = key if isinstance(key, tuple) else (key,)
+            target = self._tmp_path.joinpath(
+                *(
+                    _partition_segment(column, value)
+                    for column, value in zip(keys, values, strict=True)
+                )
+            )
+            target.mkdir(parents=True, exist_ok=True)
+            part = self._partition_parts.get(target, 0)
+            self._partition_parts[target] = part + 1
+            table = self._conform(partition.drop(columns=keys), schema)
+            _write_parquet_file(table, target / f"part-{part:05d}.parquet", config=self._config)
 
 
 def write_yaml_atomic(payload: Mapping[str, Any], path: Path) -> None:
@@ -0,0 +1,289 @@
+"""Per-stage CPU and memory profiling for pipeline runs (``--profile``)."""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from .output import write_yaml_atomic
+
+try:  # pragma: no cover - ``resource`` is unavailable on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+__all__ = [
+    "PROFILE_ARTIFACT_SUFFIXES",
+    "StageProfile",
+    "StageProfiler",
+    "peak_rss_bytes",
+    "profile_artifact_paths",
+    "reset_peak_rss",
+]
+
+PROFILE_ARTIFACT_SUFFIXES: Mapping[str, str] = {
+    "profile_stats": "_profile.pstats",
+    "profile_stacks": "_profile.collapsed",
+    "profile_summary": "_profile.yaml",
+}
+"""Artifact key → file suffix appended to the run stem."""
+
+_STAGE_SEPARATOR = "/"
+_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+def profile_artifact_paths(run_directory: Path, stem: str) -> dict[str, Path]:
+    """Return the profile artifact paths written next to ``<stem>_meta.yaml``."""
+
+    return {
+        key: run_directory / f"{stem}{suffix}" for key, suffix in PROFILE_ARTIFACT_SUFFIXES.items()
+    }
+
+
+def peak_rss_bytes() -> int | None:
+    """Return the process peak resident set size in bytes, if the OS reports it."""
+
+    if resource is None:  # pragma: no cover - Windows
+        return None
+    peak = int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def reset_peak_rss() -> bool:
+    """Reset the process peak RSS so that :func:`peak_rss_bytes` covers what follows.
+
+    Only Linux supports this (``/proc/self/clear_refs``); elsewhere, or when
+    the file is not writable, the peak keeps covering the whole process and
+    ``False`` is returned.
+    """
+
+    try:
+        _CLEAR_REFS.write_text("5", encoding="ascii")
+    except OSError:
+        return False
+    return True
+
+
+@dataclass
+class StageProfile:
+    """Accumulated measurements of one (possibly nested) stage.
+
+    ``peak_traced_bytes`` is the highest amount of memory allocated through
+    Python while the stage ran (``tracemalloc``); ``peak_rss_bytes`` is the
+    process high-water mark observed when the stage last finished.
+    """
+
+    name: str
+    calls: int = 0
+    duration_ms: float = 0.0
+    peak_traced_bytes: int = 0
+    peak_rss_bytes: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "duration_ms": round(self.duration_ms, 3),
+            "peak_traced_bytes": self.peak_traced_bytes,
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+
+
+class StageProfiler:
+    """Profile pipeline stages with cProfile, tracemalloc and a stack sampler.
+
+    :meth:`stage` may be nested (``transform/enrich_assay``); every stage owns
+    a :class:`cProfile.Profile` that is paused while a nested stage runs, so the
+    merged statistics count each call once. A daemon thread samples the stack
+    of the profiled thread every ``sample_interval`` seconds and aggregates it
+    into collapsed stacks (``stage;file:function;... count``) for flamegraph
+    tools.
+    """
+
+    def __init__(self, *, sample_interval: float = 0.005) -> None:
+        self.sample_interval = sample_interval
+        self._stages: dict[str, StageProfile] = {}
+        self._profilers: dict[str, cProfile.Profile] = {}
+        self._active: list[tuple[str, cProfile.Profile | None]] = []
+        self._active_path: tuple[str, ...] = ()
+        self._samples: Counter[str] = Counter()
+        self._samples_lock = threading.Lock()
+        self._thread_id: int | None = None
+        self._sampler: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._owns_tracemalloc = False
+
+    @property
+    def stages(self) -> Mapping[str, StageProfile]:
+        return dict(self._stages)
+
+    @property
+    def running(self) -> bool:
+        return self._thread_id is not None
+
+    def start(self) -> None:
+        """Start tracemalloc and the sampler for the calling thread."""
+
+        if self.running:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self._thread_id = threading.get_ident()
+        self._stop_event.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_loop, name="bioetl-stage-profiler", daemon=True
+        )
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Stop sampling and release tracemalloc if this profiler started it."""
+
+        if not self.running:
+            return
+        self._stop_event.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        self._sampler = None
+        self._thread_id = None
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageProfile]:
+        """Profile the enclosed block as stage ``name`` nested in the active stage."""
+
+        path = (*self._active_path, name)
+        key = _STAGE_SEPARATOR.join(path)
+        record = self._stages.setdefault(key, StageProfile(name=key))
+        if self._active:
+            self._pause(self._active[-1])
+        profiler = self._profilers.setdefault(key, cProfile.Profile())
+        if not _enable(profiler):
+            profiler = None
+        self._active.append((key, profiler))
+        self._active_path = path
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.calls += 1
+            record.duration_ms += (time.perf_counter() - started) * 1000.0
+            frame = self._active.pop()
+            self._pause(frame)
+            self._active_path = path[:-1]
+            record.peak_rss_bytes = peak_rss_bytes()
+            if self._active:
+                parent_key, parent_profiler = self._active[-1]
+                parent = self._stages[parent_key]
+                parent.peak_traced_bytes = max(parent.peak_traced_bytes, record.peak_traced_bytes)
+                if parent_profiler is not None and not _enable(parent_profiler):
+                    self._active[-1] = (parent_key, None)
+
+    def _pause(self, frame: tuple[str, cProfile.Profile | None]) -> None:
+        key, profiler = frame
+        if profiler is not None:
+            profiler.disable()
+        if tracemalloc.is_tracing():
+            record = self._stages[key]
+            record.peak_traced_bytes = max(
+                record.peak_traced_bytes, tracemalloc.get_traced_memory()[1]
+            )
+            tracemalloc.reset_peak()
+
+    def _sample_loop(self) -> None:
+        while not self._stop_event.wait(self.sample_interval):
+            path = self._active_path
+            thread_id = self._thread_id
+            if not path or thread_id is None:
+                continue
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                continue
+            stack = ";".join((*path, *_frame_names(frame)))
+            with self._samples_lock:
+                self._samples[stack] += 1
+
+    def collapsed_stacks(self) -> list[str]:
+        """Return ``stack count`` lines sorted by stack for deterministic output."""
+
+        with self._samples_lock:
+            return [f"{stack} {count}" for stack, count in sorted(self._samples.items())]
+
+    def summary(self) -> dict[str, Any]:
+        with self._samples_lock:
+            samples = sum(self._samples.values())
+        return {
+            "sample_interval_ms": round(self.sample_interval * 1000.0, 3),
+            "samples": samples,
+            "stages": {key: stage.to_dict() for key, stage in self._stages.items()},
+        }
+
+    def write(self, paths: Mapping[str, Path]) -> dict[str, Path]:
+        """Write the artifacts named by :func:`profile_artifact_paths`.
+
+        Returns the subset of ``paths`` that was written; statistics are
+        skipped when no stage recorded any call.
+        """
+
+        written: dict[str, Path] = {}
+        stats_path = paths.get("profile_stats")
+        if stats_path is not None:
+            stats = self._merged_stats()
+            if stats is not None:
+                stats_path.parent.mkdir(parents=True, exist_ok=True)
+                stats.dump_stats(str(stats_path))
+                written["profile_stats"] = stats_path
+        stacks_path = paths.get("profile_stacks")
+        if stacks_path is not None:
+            stacks_path.parent.mkdir(parents=True, exist_ok=True)
+            lines = self.collapsed_stacks()
+            stacks_path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+            written["profile_stacks"] = stacks_path
+        summary_path = paths.get("profile_summary")
+        if summary_path is not None:
+            write_yaml_atomic(self.summary(), summary_path)
+            written["profile_summary"] = summary_path
+        return written
+
+    def _merged_stats(self) -> pstats.Stats | None:
+        merged: pstats.Stats | None = None
+        for profiler in self._profilers.values():
+            profiler.create_stats()
+            if not getattr(profiler, "stats", None):
+                continue
+            if merged is None:
+                merged = pstats.Stats(profiler)
+            else:
+                merged.add(profiler)
+        return merged
+
+
+def _enable(profiler: cProfile.Profile) -> bool:
+    try:
+        profiler.enable()
+    except ValueError:  # another profiler (e.g. a debugger) owns the hook
+        return False
+    return True
+
+
+def _frame_names(frame: FrameType | None) -> list[str]:
+    names: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{Path(code.co_filename).name}:{code.co_name}")
+        frame = frame.f_back
+    names.reverse()
+    return names
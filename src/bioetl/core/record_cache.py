@@ -0,0 +1,207 @@
+"""Per-record, content-addressed cache for entity payloads fetched from APIs.
+
+Records are stored in a single SQLite file and addressed by
+``(entity, record_id, release, fields_signature)``. Unlike batch-level caches,
+lookups do not depend on batch composition, ordering or size: a batch can be
+partially served from the cache and only missing identifiers go to the network.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from bioetl.core.logger import UnifiedLogger
+from bioetl.core.metrics import record_cache_lookup
+
+__all__ = ["RecordCache", "fields_signature"]
+
+_UNKNOWN_RELEASE = "unknown"
+_SQLITE_MAX_VARIABLES = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    entity TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    release TEXT NOT NULL,
+    fields TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (entity, release, fields, record_id)
+) WITHOUT ROWID
+"""
+
+
+def fields_signature(fields: Sequence[str] | None) -> str:
+    """Return a stable signature for a ``only=`` field selection.
+
+    The signature does not depend on the order of ``fields``; ``None`` and an
+    empty selection (all fields) share the ``"*"`` signature.
+    """
+
+    if not fields:
+        return "*"
+    canonical = ",".join(sorted({str(field) for field in fields}))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+class RecordCache:
+    """SQLite-backed cache of individual entity payloads.
+
+    Parameters
+    ----------
+    path:
+        Location of the SQLite database. Parent directories are created.
+    ttl_seconds:
+        Maximum age of an entry. ``0`` disables expiry.
+
+    Notes
+    -----
+    The instance is safe to share between threads: a single connection is
+    guarded by a lock and WAL journaling keeps concurrent processes readable.
+    All failures are logged and treated as cache misses.
+    """
+
+    def __init__(self, path: str | Path, *, ttl_seconds: int = 0) -> None:
+        self._path = Path(path)
+        self._ttl_seconds = max(int(ttl_seconds), 0)
+        self._lock = threading.Lock()
+        self._log = UnifiedLogger.get(__name__).bind(component="record_cache")
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(self._path), check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        """Return the location of the SQLite database."""
+
+        return self._path
+
+    def get_many(
+        self,
+        entity: str,
+        record_ids: Iterable[str],
+        *,
+        release: str | None,
+        fields: Sequence[str] | None = None,
+    ) -> dict[str, Any]:
+        """Return cached payloads for ``record_ids`` that are present and fresh.
+
+        Parameters
+        ----------
+        entity:
+            Logical entity name, e.g. ``"activity"`` or ``"molecule"``.
+        record_ids:
+            Identifiers to look up.
+        release:
+            Source release the payloads belong to.
+        fields:
+            Field selection used when the payloads were fetched.
+
+        Returns
+        -------
+        dict[str, Any]
+            Mapping of identifier to decoded payload for cache hits only.
+        """
+
+        identifiers = list(dict.fromkeys(str(record_id) for record_id in record_ids))
+        if not identifiers:
+            return {}
+
+        release_key = release or _UNKNOWN_RELEASE
+        signature = fields_signature(fields)
+        min_stored_at = time.time() - self._ttl_seconds if self._ttl_seconds else None
+        hits: dict[str, Any] = {}
+        try:
+            with self._lock:
+                for start in range(0, len(identifiers), _SQLITE_MAX_VARIABLES):
+                    chunk = identifiers[start : start + _SQLITE_MAX_VARIABLES]
+                    placeholders = ",".join("?" * len(chunk))
+                    query = (
+                        "SELECT record_id, payload, stored_at FROM records "
+                        "WHERE entity = ? AND release = ? AND fields = ? "
+                        f"AND record_id IN ({placeholders})"
+                    )
+                    rows = self._connection.execute(
+                        query, (entity, release_key, signature, *chunk)
+                    ).fetchall()
+                    for record_id, payload, stored_at in rows:
+                        if min_stored_at is not None and stored_at < min_stored_at:
+                            continue
+                        hits[record_id] = json.loads(payload)
+        except (sqlite3.Error, json.JSONDecodeError) as exc:
+            self._log.warning("record_cache.read_failed", entity=entity, error=str(exc))
+            record_cache_lookup("record_cache", entity, hits=0, misses=len(identifiers))
+            return {}
+        record_cache_lookup(
+            "record_cache", entity, hits=len(hits), misses=len(identifiers) - len(hits)
+        )
+        return hits
+
+    def put_many(
+        self,
+        entity: str,
+        records: Mapping[str, Any],
+        *,
+        release: str | None,
+        fields: Sequence[str] | None = None,
+    ) -> int:
+        """Store ``records`` keyed by identifier and return the number written."""
+
+        if not records:
+            return 0
+
+        release_key = release or _UNKNOWN_RELEASE
+        signature = fields_signature(fields)
+        stored_at = time.time()
+        try:
+            rows = [
+                (
+                    entity,
+                    str(record_id),
+                    release_key,
+                    signature,
+                    json.dumps(payload, sort_keys=True, default=str),
+                    stored_at,
+                )
+                for record_id, payload in records.items()
+            ]
+            with self._lock:
+                self._connection.execute("BEGIN")
+                try:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO records "
+                        "(entity, record_id, release, fields, payload, stored_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                except sqlite3.Error:
+                    self._connection.execute("ROLLBACK")
+                    raise
+                self._connection.execute("COMMIT")
+        except (sqlite3.Error, TypeError, ValueError) as exc:
+            self._log.warning("record_cache.write_failed", entity=entity, error=str(exc))
+            return 0
+        return len(rows)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> RecordCache:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
@@ -9,6 +9,8 @@ from typing import Any, TypeAlias, cast
 import pandas as pd
 from pandas.api.types import is_scalar
 
+from .frame import map_unique
+
 __all__ = [
     "escape_delims",
     "header_rows_serialize",
@@ -105,7 +107,7 @@ def serialize_array_fields(df: pd.DataFrame, columns: Sequence[str]) -> pd.DataF
     for column in columns:
         if column in df_result.columns:
             original_series = df_result[column]
-            serialized = original_series.map(header_rows_serialize).astype("string")
+            serialized = map_unique(original_series, header_rows_serialize).astype("string")
             df_result[column] = serialized
 
             def _should_preserve_na(value: Any) -> bool:
@@ -0,0 +1,344 @@
+"""Bounded-memory building blocks for chunked (streaming) pipeline runs.
+
+The helpers here let :class:`~bioetl.pipelines.base.PipelineBase` process a
+dataset chunk by chunk while still producing the same deterministic output as
+the in-memory path: :class:`ExternalSorter` spills sorted runs to disk and
+merges them back in global order, and :class:`ExternalDistinctCounter` counts
+distinct values exactly by hash-partitioning them into on-disk buckets.
+"""
+
+from __future__ import annotations
+
+import pickle
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, Literal, TypeVar
+
+import pandas as pd
+
+__all__ = [
+    "ExternalDistinctCounter",
+    "ExternalSorter",
+    "batch_records",
+    "iter_frame_chunks",
+    "rebatch_frames",
+]
+
+_RUN_COLUMN = "__bioetl_run__"
+_POSITION_COLUMN = "__bioetl_position__"
+
+_T = TypeVar("_T")
+
+
+def iter_frame_chunks(df: pd.DataFrame, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """Yield consecutive slices of ``df`` with at most ``chunk_rows`` rows.
+
+    An empty ``df`` is yielded once as is, so that its columns reach the
+    downstream stages.
+    """
+
+    if chunk_rows < 1:
+        msg = f"chunk_rows must be positive, got {chunk_rows!r}"
+        raise ValueError(msg)
+    if df.empty:
+        yield df
+        return
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start : start + chunk_rows].reset_index(drop=True)
+
+
+def rebatch_frames(frames: Iterable[pd.DataFrame], rows: int) -> Iterator[pd.DataFrame]:
+    """Re-slice a stream of frames into batches of exactly ``rows`` rows.
+
+    Only the last batch may be shorter. At most ``rows`` buffered rows plus the
+    incoming frame are held in memory.
+    """
+
+    if rows < 1:
+        msg = f"rows must be positive, got {rows!r}"
+        raise ValueError(msg)
+    pending: list[pd.DataFrame] = []
+    pending_rows = 0
+    for frame in frames:
+        if frame.empty:
+            continue
+        pending.append(frame)
+        pending_rows += len(frame)
+        if pending_rows < rows:
+            continue
+        buffer = pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0]
+        start = 0
+        while len(buffer) - start >= rows:
+            yield buffer.iloc[start : start + rows].reset_index(drop=True)
+            start += rows
+        remainder = buffer.iloc[start:].reset_index(drop=True)
+        pending = [remainder] if not remainder.empty else []
+        pending_rows = len(remainder)
+    if pending_rows:
+        yield pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0]
+
+
+def batch_records(records: Iterable[_T], rows: int) -> Iterator[list[_T]]:
+    """Group a stream of records into lists of exactly ``rows`` records.
+
+    Only the last batch may be shorter and an empty stream yields nothing. Just
+    the current batch is held in memory, so a paginated listing is consumed
+    page by page as the batches are taken.
+    """
+
+    if rows < 1:
+        msg = f"rows must be positive, got {rows!r}"
+        raise ValueError(msg)
+    batch: list[_T] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == rows:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class ExternalSorter:
+    """Stable external merge sort over a stream of DataFrame chunks.
+
+    Each chunk passed to :meth:`add` is sorted in memory and spilled to
+    ``directory`` as a run of pickled batches. :meth:`iter_sorted` then merges
+    the runs with a batched k-way merge, so at most one batch per run is held in
+    memory. Ties are broken by input order, which makes the result identical to
+    a stable ``sort_values`` over the concatenated chunks. Without sort keys the
+    runs are replayed in input order.
+
+    Parameters
+    ----------
+    directory:
+        Spill directory owned by the caller (e.g. a temporary directory).
+    by:
+        Sort columns; empty to keep input order.
+    ascending:
+        Per-column sort direction. Defaults to ascending for all columns.
+    na_position:
+        Placement of missing values, as in :meth:`pandas.DataFrame.sort_values`.
+    batch_rows:
+        Rows per spilled batch and therefore per run held in memory while merging.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        by: Sequence[str] = (),
+        ascending: Sequence[bool] | None = None,
+        na_position: Literal["first", "last"] = "last",
+        batch_rows: int = 8_192,
+    ) -> None:
+        if batch_rows < 1:
+            msg = f"batch_rows must be positive, got {batch_rows!r}"
+            raise ValueError(msg)
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._by = list(by)
+        self._ascending = list(ascending) if ascending else [True] * len(self._by)
+        if len(self._ascending) != len(self._by):
+            msg = "ascending must have the same length as by"
+            raise ValueError(msg)
+        self._na_position: Literal["first", "last"] = na_position
+        self._batch_rows = batch_rows
+        self._runs: list[list[Path]] = []
+        self._row_count = 0
+
+    @property
+    def row_count(self) -> int:
+        """Return the number of rows added so far."""
+
+        return self._row_count
+
+    @property
+    def run_count(self) -> int:
+        """Return the number of spilled runs."""
+
+        return len(self._runs)
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        """Sort ``chunk`` and spill it as a new run."""
+
+        if chunk.empty:
+            return
+        missing = [column for column in self._by if column not in chunk.columns]
+        if missing:
+            msg = f"Sort columns missing from dataframe: {missing}"
+            raise KeyError(msg)
+        ordered = chunk
+        if self._by:
+            ordered = chunk.sort_values(
+                by=self._by,
+                ascending=self._ascending,
+                na_position=self._na_position,
+                kind="stable",
+            )
+        ordered = ordered.reset_index(drop=True)
+        run_index = len(self._runs)
+        batches: list[Path] = []
+        for start in range(0, len(ordered), self._batch_rows):
+            path = self._directory / f"run-{run_index:05d}-{len(batches):05d}.pkl"
+            ordered.iloc[start : start + self._batch_rows].to_pickle(path)
+            batches.append(path)
+        self._runs.append(batches)
+        self._row_count += len(ordered)
+
+    def iter_sorted(self) -> Iterator[pd.DataFrame]:
+        """Yield the added rows in global sort order as a stream of frames."""
+
+        if not self._by or len(self._runs) == 1:
+            for batches in self._runs:
+                for path in batches:
+                    yield pd.read_pickle(path).reset_index(drop=True)
+            return
+        yield from self._merge()
+
+    def _load(self, run_index: int, batch_index: int, offset: int) -> pd.DataFrame:
+        frame = pd.read_pickle(self._runs[run_index][batch_index]).reset_index(drop=True)
+        frame[_RUN_COLUMN] = run_index
+        frame[_POSITION_COLUMN] = range(offset, offset + len(frame))
+        return frame
+
+    def _merge(self) -> Iterator[pd.DataFrame]:
+        # A run's buffered rows are always a sorted prefix of what is left in it,
+        # so every row ordered at or before the smallest "last buffered row" over
+        # all active runs (the frontier) can be emitted: nothing still on disk
+        # precedes it. Runs whose first buffered row lies past the frontier are
+        # left untouched, which keeps already-ordered inputs linear.
+        next_batch = [1] * len(self._runs)
+        offsets = [0] * len(self._runs)
+        buffers: dict[int, pd.DataFrame] = {}
+        for run_index in range(len(self._runs)):
+            buffers[run_index] = self._load(run_index, 0, 0)
+            offsets[run_index] = len(buffers[run_index])
+
+        while buffers:
+            if len(buffers) == 1:
+                ((run_index, frame),) = buffers.items()
+                yield frame.drop(columns=[_RUN_COLUMN, _POSITION_COLUMN])
+                for batch_index in range(next_batch[run_index], len(self._runs[run_index])):
+                    yield pd.read_pickle(self._runs[run_index][batch_index]).reset_index(drop=True)
+                return
+
+            edges = self._sort(
+                pd.concat(
+                    [buffers[run_index].iloc[[0, -1]] for run_index in sorted(buffers)],
+                    ignore_index=True,
+                )
+            )
+            is_last = (
+                edges[_POSITION_COLUMN].to_numpy()
+                == edges[_RUN_COLUMN]
+                .map({run_index: offsets[run_index] - 1 for run_index in buffers})
+                .to_numpy()
+            )
+            frontier_edge = int(is_last.nonzero()[0][0])
+            frontier = (
+                int(edges[_RUN_COLUMN].iloc[frontier_edge]),
+                int(edges[_POSITION_COLUMN].iloc[frontier_edge]),
+            )
+            participating = sorted(
+                {int(run_index) for run_index in edges[_RUN_COLUMN].iloc[: frontier_edge + 1]}
+            )
+
+            combined = self._sort(
+                pd.concat([buffers[run_index] for run_index in participating], ignore_index=True)
+            )
+            is_frontier = (combined[_RUN_COLUMN].to_numpy() == frontier[0]) & (
+                combined[_POSITION_COLUMN].to_numpy() == frontier[1]
+            )
+            cut = int(is_frontier.nonzero()[0][0]) + 1
+            yield combined.iloc[:cut].drop(columns=[_RUN_COLUMN, _POSITION_COLUMN])
+
+            remainder = combined.iloc[cut:]
+            for run_index in participating:
+                rest = remainder[remainder[_RUN_COLUMN] == run_index]
+                if not rest.empty:
+                    buffers[run_index] = rest.reset_index(drop=True)
+                    continue
+                batch_index = next_batch[run_index]
+                if batch_index >= len(self._runs[run_index]):
+                    del buffers[run_index]
+                    continue
+                buffers[run_index] = self._load(run_index, batch_index, offsets[run_index])
+                offsets[run_index] += len(buffers[run_index])
+                next_batch[run_index] = batch_index + 1
+
+    def _sort(self, frame: pd.DataFrame) -> pd.DataFrame:
+        return frame.sort_values(
+            by=[*self._by, _RUN_COLUMN, _POSITION_COLUMN],
+            ascending=[*self._ascending, True, True],
+            na_position=self._na_position,
+            kind="stable",
+        ).reset_index(drop=True)
+
+
+class ExternalDistinctCounter:
+    """Exact distinct-value counter with memory bounded by one hash bucket.
+
+    Values are hash-partitioned into ``buckets`` spill files; :meth:`count`
+    loads one bucket at a time. Missing values count as a single distinct
+    value, matching ``Series.nunique(dropna=False)``.
+    """
+
+    def __init__(self, directory: Path, *, buckets: int = 16) -> None:
+        if buckets < 1:
+            msg = f"buckets must be positive, got {buckets!r}"
+            raise ValueError(msg)
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._buckets = buckets
+        self._has_missing = False
+        self._total = 0
+
+    @property
+    def total(self) -> int:
+        """Return the number of values added, including duplicates and missing values."""
+
+        return self._total
+
+    @property
+    def has_missing(self) -> bool:
+        """Return whether a missing value was added."""
+
+        return self._has_missing
+
+    def add(self, values: pd.Series[Any]) -> None:
+        """Add ``values`` to the counter."""
+
+        self._total += len(values)
+        missing = values.isna()
+        if bool(missing.any()):
+            self._has_missing = True
+            values = values[~missing]
+        if values.empty:
+            return
+        bucket_ids = pd.util.hash_pandas_object(values, index=False).to_numpy() % self._buckets
+        for bucket in pd.unique(bucket_ids):
+            selected = values[bucket_ids == bucket].tolist()
+            with self._bucket_path(int(bucket)).open("ab") as handle:
+                pickle.dump(selected, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def count(self) -> int:
+        """Return the exact number of distinct values added."""
+
+        distinct = 1 if self._has_missing else 0
+        for bucket in range(self._buckets):
+            path = self._bucket_path(bucket)
+            if not path.exists():
+                continue
+            seen: set[Any] = set()
+            with path.open("rb") as handle:
+                while True:
+                    try:
+                        seen.update(pickle.load(handle))
+                    except EOFError:
+                        break
+            distinct += len(seen)
+        return distinct
+
+    def _bucket_path(self, bucket: int) -> Path:
+        return self._directory / f"bucket-{bucket:03d}.pkl"
@@ -12,6 +12,7 @@ import pandas as pd
 from bioetl.clients.activity.chembl_activity import ChemblActivityClient
 from bioetl.clients.chembl import ChemblClient
 from bioetl.clients.types import EntityClient
+from bioetl.core.frame import lookup_frame, lookup_keys, merge_lookup, unique_keys
 from bioetl.core.logger import UnifiedLogger
 
 __all__ = ["join_activity_with_molecule"]
@@ -100,18 +101,10 @@ def join_activity_with_molecule(
             return _create_empty_result()
 
     # 2) Cобираем уникальные ключи с нормализацией
-    record_ids: set[str] = set()
-    molecule_ids: set[str] = set()
-
-    for _, row in df_act.iterrows():
-        rec = row.get("record_id")
-        rec_s = _canonical_record_id(rec)
-        if rec_s:
-            record_ids.add(rec_s)
-
-        mol = _normalize_chembl_id(row.get("molecule_chembl_id"))
-        if mol:
-            molecule_ids.add(mol)
+    record_keys = lookup_keys(df_act["record_id"], normalize=_canonical_record_id)
+    molecule_keys = lookup_keys(df_act["molecule_chembl_id"], normalize=_normalize_chembl_id)
+    record_ids: list[str] = unique_keys(record_keys)
+    molecule_ids: list[str] = unique_keys(molecule_keys)
 
     # 3) Ранние возвраты/пустые кейсы
     if not record_ids and not molecule_ids:
@@ -126,15 +119,17 @@ def join_activity_with_molecule(
         ]
 
     # 4) compound_record по record_id (обязательное only= и корректный items_key "compound_records")
-    compound_records_dict = _fetch_compound_records_by_ids(list(record_ids), client, cfg, log)
+    compound_records_dict = _fetch_compound_records_by_ids(record_ids, client, cfg, log)
 
     # 5) molecule по molecule_chembl_id (обязательное only= на
     #    molecule_chembl_id, pref_name, molecule_synonyms — это ровно те поля,
     #    которые нам нужны для имени; пагинация через page_meta)
-    molecules_dict = _fetch_molecules_for_join(list(molecule_ids), client, cfg, log)
+    molecules_dict = _fetch_molecules_for_join(molecule_ids, client, cfg, log)
 
     # 6) Джоины
-    df_result = _perform_joins(df_act, compound_records_dict, molecules_dict, log)
+    df_result = _perform_joins(
+        df_act, record_keys, molecule_keys, compound_records_dict, molecules_dict
+    )
 
     # 7) Детерминизм: стабильно сортируем
     if "activity_id" in df_result.columns:
@@ -331,98 +326,32 @@ def _fetch_molecules_for_join(
 
 def _perform_joins(
     df_act: pd.DataFrame,
+    record_keys: pd.Series,
+    molecule_keys: pd.Series,
     compound_records_dict: dict[str, dict[str, Any]],
     molecules_dict: dict[str, dict[str, Any]],
-    log: Any,
 ) -> pd.DataFrame:
     """Выполнить два left-join и сформировать выходные поля."""
-    # Создать DataFrame для compound_record
-    compound_data: list[dict[str, Any]] = []
-    for record_id, record in compound_records_dict.items():
-        compound_data.append(
-            {
-                "record_id": record_id,
-                "compound_key": record.get("compound_key"),
-                "compound_name": record.get("compound_name"),
-            }
-        )
+    # Таблица compound_record по каноническому record_id
+    compound_lookup = lookup_frame(compound_records_dict, ("compound_key", "compound_name"))
 
-    df_compound = (
-        pd.DataFrame(compound_data)
-        if compound_data
-        else pd.DataFrame(columns=["record_id", "compound_key", "compound_name"])
-    )
-
-    # Создать DataFrame для molecule с вычислением molecule_name
-    molecule_data: list[dict[str, Any]] = []
-    for mol_id, record in molecules_dict.items():
-        molecule_name = _extract_molecule_name(record, mol_id)
-        molecule_data.append(
-            {
-                "molecule_chembl_id": mol_id,
+    # Таблица molecule с вычислением molecule_name
+    molecule_lookup = lookup_frame(
+        {
+            mol_id: {
                 "molecule_key": mol_id,
-                "molecule_name": molecule_name,
+                "molecule_name": _extract_molecule_name(record, mol_id),
             }
-        )
-
-    df_molecule = (
-        pd.DataFrame(molecule_data)
-        if molecule_data
-        else pd.DataFrame(columns=["molecule_chembl_id", "molecule_key", "molecule_name"])
+            for mol_id, record in molecules_dict.items()
+        },
+        ("molecule_key", "molecule_name"),
     )
 
-    # Сохранить исходный порядок
-    original_index = df_act.index.copy()
-
-    # Нормализовать типы данных перед merge
-    df_act_normalized = df_act.copy()
-
-    # Нормализовать record_id: преобразовать в строку для совместимости с df_compound
-    if "record_id" in df_act_normalized.columns:
-        df_act_normalized["record_id"] = df_act_normalized["record_id"].map(_canonical_record_id)
-        df_act_normalized.loc[df_act_normalized["record_id"] == "", "record_id"] = pd.NA
-        if "record_id" in df_compound.columns and not df_compound.empty:
-            df_compound["record_id"] = df_compound["record_id"].map(_canonical_record_id)
-            df_compound.loc[df_compound["record_id"] == "", "record_id"] = pd.NA
-
-    # Нормализовать molecule_chembl_id: преобразовать в строку для совместимости с df_molecule
-    if "molecule_chembl_id" in df_act_normalized.columns:
-        # Сохранить NaN значения, преобразовать остальные в строку
-        mask_na = df_act_normalized["molecule_chembl_id"].isna()
-        # Преобразовать в строку, но заменить "nan" на pd.NA
-        df_act_normalized["molecule_chembl_id"] = df_act_normalized["molecule_chembl_id"].astype(
-            str
-        )
-        df_act_normalized.loc[
-            df_act_normalized["molecule_chembl_id"] == "nan", "molecule_chembl_id"
-        ] = pd.NA
-        df_act_normalized.loc[mask_na, "molecule_chembl_id"] = pd.NA
-        # Убедиться, что df_molecule.molecule_chembl_id тоже строка
-        if "molecule_chembl_id" in df_molecule.columns and not df_molecule.empty:
-            df_molecule["molecule_chembl_id"] = df_molecule["molecule_chembl_id"].astype(str)
-            # Заменить "nan" на pd.NA
-            df_molecule.loc[
-                df_molecule["molecule_chembl_id"] == "nan", "molecule_chembl_id"
-            ] = pd.NA
-
     # Первый join: activity.record_id → compound_record.record_id
-    df_result = df_act_normalized.merge(
-        df_compound,
-        on=["record_id"],
-        how="left",
-        suffixes=("", "_compound"),
-    )
+    df_result = merge_lookup(df_act, record_keys, compound_lookup, how="fill")
 
     # Второй join: activity.molecule_chembl_id → molecule.molecule_chembl_id
-    df_result = df_result.merge(
-        df_molecule,
-        on=["molecule_chembl_id"],
-        how="left",
-        suffixes=("", "_molecule"),
-    )
-
-    # Восстановить исходный порядок
-    df_result = df_result.reindex(original_index)
+    df_result = merge_lookup(df_result, molecule_keys, molecule_lookup, how="fill")
 
     # Убедиться, что все выходные колонки присутствуют
     output_columns = [
@@ -0,0 +1,143 @@
+"""Cache of row hashes that already passed Pandera validation.
+
+Rows are addressed by ``(schema_key, row_hash)`` where ``schema_key`` combines
+the schema identifier, its version and the validation options. A row whose
+``hash_row`` was validated against the same schema key in a previous run does
+not need to go through the row-level Pandera checks again.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import numpy as np
+
+from bioetl.core.logger import UnifiedLogger
+
+__all__ = ["ValidationCache", "validation_cache_key"]
+
+_SQLITE_MAX_VARIABLES = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS validated_rows (
+    schema_key TEXT NOT NULL,
+    row_hash TEXT NOT NULL,
+    validated_at REAL NOT NULL,
+    PRIMARY KEY (schema_key, row_hash)
+) WITHOUT ROWID
+"""
+
+
+def validation_cache_key(
+    identifier: str,
+    version: str,
+    *,
+    strict: bool,
+    coerce: bool,
+) -> str:
+    """Return the cache scope for a schema version and validation options."""
+
+    return f"{identifier}@{version}:strict={int(strict)}:coerce={int(coerce)}"
+
+
+class ValidationCache:
+    """SQLite-backed set of row hashes validated per schema key.
+
+    Parameters
+    ----------
+    path:
+        Location of the SQLite database. Parent directories are created.
+
+    Notes
+    -----
+    Failures are logged and treated as cache misses, so a broken cache only
+    costs a full validation.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._log = UnifiedLogger.get(__name__).bind(component="validation_cache")
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(self._path), check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        """Return the location of the SQLite database."""
+
+        return self._path
+
+    def contains(self, schema_key: str, row_hashes: Sequence[str | None]) -> np.ndarray:
+        """Return a boolean mask of ``row_hashes`` already validated for ``schema_key``.
+
+        Missing hashes (``None``/NA) are never reported as validated.
+        """
+
+        mask = np.zeros(len(row_hashes), dtype=bool)
+        candidates = list(dict.fromkeys(value for value in row_hashes if isinstance(value, str)))
+        if not candidates:
+            return mask
+        known: set[str] = set()
+        try:
+            with self._lock:
+                for start in range(0, len(candidates), _SQLITE_MAX_VARIABLES):
+                    chunk = candidates[start : start + _SQLITE_MAX_VARIABLES]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._connection.execute(
+                        "SELECT row_hash FROM validated_rows "
+                        f"WHERE schema_key = ? AND row_hash IN ({placeholders})",
+                        (schema_key, *chunk),
+                    ).fetchall()
+                    known.update(row_hash for (row_hash,) in rows)
+        except sqlite3.Error as exc:
+            self._log.warning("validation_cache.read_failed", error=str(exc))
+            return mask
+        if known:
+            mask[:] = [isinstance(value, str) and value in known for value in row_hashes]
+        return mask
+
+    def add(self, schema_key: str, row_hashes: Iterable[str | None]) -> int:
+        """Record ``row_hashes`` as validated for ``schema_key``; return the count stored."""
+
+        unique_hashes = list(dict.fromkeys(value for value in row_hashes if isinstance(value, str)))
+        if not unique_hashes:
+            return 0
+        validated_at = time.time()
+        try:
+            with self._lock:
+                self._connection.execute("BEGIN")
+                try:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO validated_rows "
+                        "(schema_key, row_hash, validated_at) VALUES (?, ?, ?)",
+                        [(schema_key, row_hash, validated_at) for row_hash in unique_hashes],
+                    )
+                except sqlite3.Error:
+                    self._connection.execute("ROLLBACK")
+                    raise
+                self._connection.execute("COMMIT")
+        except sqlite3.Error as exc:
+            self._log.warning("validation_cache.write_failed", error=str(exc))
+            return 0
+        return len(unique_hashes)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> ValidationCache:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
@@ -1,6 +1,14 @@
-"""Pipeline orchestration primitives."""
+"""Pipeline orchestration primitives.
 
-from .base import PipelineBase, RunArtifacts, RunResult, WriteArtifacts, WriteResult
+:mod:`bioetl.pipelines.base` (pandas, pandera, the HTTP clients) is imported
+on first attribute access, so importing a lightweight submodule such as
+:mod:`bioetl.pipelines.errors` stays cheap.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 __all__ = [
     "PipelineBase",
@@ -9,3 +17,23 @@ __all__ = [
     "WriteArtifacts",
     "WriteResult",
 ]
+
+if TYPE_CHECKING:
+    from .base import PipelineBase, RunArtifacts, RunResult, WriteArtifacts, WriteResult
+
+
+def __getattr__(name: str) -> Any:
+    """Expose :mod:`bioetl.pipelines.base` names through lazy loading."""
+
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(".base", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the lazily available public names."""
+
+    return sorted(set(__all__ + list(globals().keys())))
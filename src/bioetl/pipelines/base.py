@@ -8,18 +8,22 @@ rules with executable references.
 from __future__ import annotations
 
 import hashlib
+import shutil
+import tempfile
 import time
 import uuid
 from abc import ABC, abstractmethod
 from builtins import ConnectionError as BuiltinConnectionError
 from builtins import TimeoutError as BuiltinTimeoutError
-from collections.abc import Callable, Iterable, Mapping, Sequence, Sized
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence, Sized
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Literal, cast
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 import pandera.errors
 from pandas import Series
@@ -30,24 +34,106 @@ from bioetl.clients import client_exceptions
 from bioetl.config import PipelineConfig
 from bioetl.core import APIClientFactory
 from bioetl.core.api_client import CircuitBreakerOpenError, UnifiedAPIClient
+from bioetl.core.chunked_validation import cross_row_schema, validate_in_chunks
+from bioetl.core.concurrency import bounded_ordered_map, resolve_worker_count
+from bioetl.core.enrichment import EnrichmentStage, enrichment_waves, merge_enrichment_lookups
 from bioetl.core.load_meta_store import LoadMetaStore
 from bioetl.core.log_events import LogEvents
 from bioetl.core.logger import UnifiedLogger
+from bioetl.core.metrics import get_metrics_registry, record_stage
+from bioetl.core.metrics_export import MetricsExporter, create_metrics_exporter
 from bioetl.core.output import (
     DeterministicWriteArtifacts,
+    StreamingDatasetWriter,
+    arrow_schema,
     build_write_artifacts,
     emit_qc_artifact,
     ensure_hash_columns,
+    prepare_dataframe,
+    resolve_output_format,
+    serialise_metadata,
+    unify_arrow_schemas,
     write_dataset_atomic,
     write_yaml_atomic,
 )
+from bioetl.core.profiling import (
+    PROFILE_ARTIFACT_SUFFIXES,
+    StageProfiler,
+    peak_rss_bytes,
+    profile_artifact_paths,
+    reset_peak_rss,
+)
+from bioetl.core.streaming import ExternalDistinctCounter, ExternalSorter, iter_frame_chunks
 from bioetl.core.utils.validation import format_failure_cases, summarize_schema_errors
+from bioetl.core.validation_cache import ValidationCache, validation_cache_key
 from bioetl.pipelines.errors import PipelineError, map_client_exc
+from bioetl.qc.incremental import IncrementalQCAccumulator
 from bioetl.qc.report import build_correlation_report as build_default_correlation_report
 from bioetl.qc.report import build_qc_metrics_payload
 from bioetl.qc.report import build_quality_report as build_default_quality_report
 from bioetl.schemas import SchemaRegistryEntry, get_schema
 
+_STREAMING_INCOMPATIBLE_HOOKS = (
+    "write",
+    "build_quality_report",
+    "build_correlation_report",
+    "build_qc_metrics",
+)
+# QC hooks whose streaming counterpart is ``build_qc_accumulator``.
+_STREAMING_QC_HOOKS = frozenset(
+    {"build_quality_report", "build_correlation_report", "build_qc_metrics"}
+)
+
+
+def _merge_validation_summaries(
+    aggregate: dict[str, Any] | None,
+    chunk: Mapping[str, Any] | None,
+) -> dict[str, Any] | None:
+    """Fold the validation summary of one streaming chunk into ``aggregate``."""
+
+    if chunk is None:
+        return aggregate
+    if aggregate is None:
+        return dict(chunk)
+    merged = dict(aggregate)
+    merged["row_count"] = int(aggregate.get("row_count", 0)) + int(chunk.get("row_count", 0))
+    merged["schema_valid"] = bool(aggregate.get("schema_valid", True)) and bool(
+        chunk.get("schema_valid", True)
+    )
+    if "failure_count" in chunk:
+        merged["failure_count"] = int(aggregate.get("failure_count", 0)) + int(
+            chunk["failure_count"] or 0
+        )
+    if "error" in chunk and "error" not in merged:
+        merged["error"] = chunk["error"]
+    if "cached_rows" in chunk:
+        merged["cached_rows"] = int(aggregate.get("cached_rows", 0)) + int(chunk["cached_rows"])
+    return merged
+
+
+def _cached_rows_schema(
+    schema: DataFrameSchema, volatile_columns: Iterable[str]
+) -> DataFrameSchema:
+    """Return ``schema`` reduced to what previously validated rows still need.
+
+    Columns covered by ``hash_row`` keep only dtype coercion; columns outside
+    the hash (``volatile_columns``) are checked in full. Cross-row checks are
+    left to :func:`cross_row_schema`.
+    """
+
+    volatile = set(volatile_columns)
+    reduced = schema.update_columns(
+        {
+            name: {"checks": [], "nullable": True, "unique": False}
+            for name in schema.columns
+            if name not in volatile
+        }
+    )
+    reduced.checks = []
+    reduced.unique = None
+    return reduced
+
+
 _NETWORK_ERROR_TYPES = (
     client_exceptions.Timeout,
     client_exceptions.HTTPError,
@@ -146,7 +232,7 @@ class RunResult:
 
     @property
     def dataframe(self) -> pd.DataFrame:
-        """Return a copy of the dataframe produced by the run when available."""
+        """Return the dataframe produced by the run when available."""
 
         if self._dataframe is not None:
             return self._dataframe
@@ -166,19 +252,32 @@ class PipelineBase(ABC):
         self.config = config
         self.run_id = run_id
         self.pipeline_code = config.pipeline.name
+        self.dataset_extension = resolve_output_format(config)
         self.output_root = Path(config.materialization.root)
         self.logs_root = self.output_root.parent / "logs"
         self.retention_runs = 5
         self.pipeline_directory = self._ensure_pipeline_directory()
         self.logs_directory = self._ensure_logs_directory()
         self._stage_durations_ms: dict[str, float] = {}
+        self._stage_rows: dict[str, int] = {}
+        # Dataset position of the first row passed to transform(); advanced per streaming chunk.
+        self._chunk_row_offset = 0
+        self._stage_peak_memory: dict[str, int] = {}
+        self._memory_stage: str | None = None
+        self._metrics_exporter: MetricsExporter | None = None
         self._registered_clients: dict[str, Callable[[], None]] = {}
         self._trace_id, self._root_span_id = self._derive_trace_and_span()
         self._validation_schema: SchemaRegistryEntry | None = None
         self._validation_summary: dict[str, Any] | None = None
         self._extract_metadata: dict[str, Any] = {}
+        self._run_output_path: Path | None = None
+        self._profiler: StageProfiler | None = None
+        self._profile_artifacts: dict[str, Path] = {}
+        self._validation_cache: ValidationCache | None = None
         load_meta_root = self.output_root.parent / "load_meta" / self.pipeline_code
-        self.load_meta_store = LoadMetaStore(load_meta_root, dataset_format="parquet")
+        self.load_meta_store = LoadMetaStore(
+            load_meta_root, dataset_format="parquet", run_id=self.run_id
+        )
 
     def _ensure_pipeline_directory(self) -> Path:
         """Return the deterministic output folder path for the pipeline.
@@ -313,21 +412,27 @@ class PipelineBase(ABC):
             extras=extras or {},
         )
 
-    def list_run_stems(self) -> Sequence[str]:
-        """Return deterministic run stems discovered via dataset files."""
+    def list_run_stems(self, directory: Path | None = None) -> Sequence[str]:
+        """Return deterministic run stems discovered via dataset files.
+
+        Stems are ordered from the most recent run; ``directory`` defaults to
+        :attr:`pipeline_directory`.
+        """
 
-        if not self.pipeline_directory.exists():
+        search_directory = directory if directory is not None else self.pipeline_directory
+        if not search_directory.exists():
             return []
 
         suffix = f".{self.dataset_extension}"
         dataset_files = sorted(
             (
                 path
-                for path in self.pipeline_directory.glob(f"{self.pipeline_code}_*{suffix}")
+                for path in search_directory.glob(f"{self.pipeline_code}_*{suffix}")
                 if path.name.endswith(suffix)
                 and not path.stem.endswith("_quality_report")
                 and not path.stem.endswith("_correlation_report")
                 and not path.stem.endswith("_qc")
+                and not path.stem.endswith("_changes")
             ),
             key=lambda path: path.stat().st_mtime,
             reverse=True,
@@ -343,7 +448,9 @@ class PipelineBase(ABC):
         stems = self.list_run_stems()
         for outdated_stem in stems[self.retention_runs :]:
             for candidate in self._artifact_candidates(outdated_stem):
-                if candidate.exists():
+                if candidate.is_dir():
+                    shutil.rmtree(candidate)
+                elif candidate.exists():
                     candidate.unlink()
             log_candidate = self.logs_directory / f"{outdated_stem}.{self.log_extension}"
             if log_candidate.exists():
@@ -356,8 +463,11 @@ class PipelineBase(ABC):
         yield self.pipeline_directory / f"{stem}_quality_report.{self.qc_extension}"
         yield self.pipeline_directory / f"{stem}_correlation_report.{self.qc_extension}"
         yield self.pipeline_directory / f"{stem}_qc.{self.qc_extension}"
+        yield self.pipeline_directory / f"{stem}_changes.{self.qc_extension}"
         yield self.pipeline_directory / f"{stem}_meta.yaml"
         yield self.pipeline_directory / f"{stem}_run_manifest.{self.manifest_extension}"
+        for suffix in PROFILE_ARTIFACT_SUFFIXES.values():
+            yield self.pipeline_directory / f"{stem}{suffix}"
 
     @abstractmethod
     def extract(self, *args: object, **kwargs: object) -> pd.DataFrame:
@@ -400,6 +510,17 @@ class PipelineBase(ABC):
     # Optional hooks overridable by subclasses
     # ------------------------------------------------------------------
 
+    def extract_chunks(self, *args: object, **kwargs: object) -> Iterator[pd.DataFrame]:
+        """Yield extracted records in chunks of at most ``runtime.chunk_rows`` rows.
+
+        Used by the streaming mode of :meth:`run`. The default slices the result
+        of :meth:`extract`; pipelines that can page through their source
+        override it so that only one chunk is materialised at a time.
+        """
+
+        extracted = self.extract(*args, **kwargs)
+        yield from iter_frame_chunks(extracted, self.config.runtime.chunk_rows)
+
     def build_quality_report(self, df: pd.DataFrame) -> pd.DataFrame | dict[str, object] | None:
         """Return a QC dataframe for the quality report artefact."""
 
@@ -419,6 +540,41 @@ class PipelineBase(ABC):
         # Convert Mapping[str, Any] to dict[str, object]
         return dict(payload)
 
+    def build_qc_accumulator(
+        self, spill_directory: Path, *, track_correlation: bool
+    ) -> IncrementalQCAccumulator:
+        """Return the accumulator computing QC artefacts in streaming runs.
+
+        Streaming counterpart of :meth:`build_quality_report`,
+        :meth:`build_correlation_report` and :meth:`build_qc_metrics`. Pipelines
+        overriding those hooks override this one as well, otherwise streaming
+        falls back to the in-memory path.
+        """
+
+        return IncrementalQCAccumulator(
+            spill_directory,
+            business_key_fields=self.config.determinism.hashing.business_key_fields,
+            track_correlation=track_correlation,
+        )
+
+    def merge_previous_output(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Combine transformed records with rows reused from a previous run.
+
+        Called by :meth:`run` between transform and validation. The default
+        returns ``df`` unchanged; release-gated pipelines add carried-over rows.
+        """
+
+        return df
+
+    def build_change_log(self, df: pd.DataFrame) -> pd.DataFrame | None:
+        """Return the change log of ``df`` against the previous run, if any.
+
+        ``df`` is the dataset as it will be written. A returned frame is stored
+        as ``<stem>_changes.<qc_extension>`` next to the dataset.
+        """
+
+        return None
+
     def augment_metadata(
         self,
         metadata: Mapping[str, object],
@@ -722,16 +878,59 @@ class PipelineBase(ABC):
 
         return f"{pipeline_name}_id"
 
+    @contextmanager
+    def profile_stage(self, name: str) -> Iterator[None]:
+        """Profile the enclosed block as stage ``name`` when ``--profile`` is set.
+
+        Calls nested inside a running stage are recorded under the parent, e.g.
+        enrichment steps show up as ``transform/enrich_assay``. While metrics
+        are exported (``telemetry.enabled``) the peak RSS of top-level stages
+        is tracked for ``bioetl_stage_peak_memory_bytes``. Without an active
+        profiler or exporter this is a no-op.
+        """
+
+        track_memory = self._metrics_exporter is not None and self._memory_stage is None
+        if track_memory:
+            self._memory_stage = name
+            reset_peak_rss()
+        try:
+            profiler = self._profiler
+            if profiler is None:
+                yield
+            else:
+                with profiler.stage(name):
+                    yield
+        finally:
+            if track_memory:
+                self._memory_stage = None
+                peak = peak_rss_bytes()
+                if peak is not None:
+                    self._stage_peak_memory[name] = max(
+                        self._stage_peak_memory.get(name, 0), peak
+                    )
+
+    def enrichment_stages(self) -> list[EnrichmentStage]:
+        """Return the enrichment stages of this pipeline.
+
+        The default implementation has none. Subclasses return the stages that
+        are enabled by their configuration, see :class:`EnrichmentStage`.
+        """
+
+        return []
+
     def execute_enrichment_stages(
         self,
         df: pd.DataFrame,
         *,
         stages: Sequence[str] | None = None,
+        graph: Sequence[EnrichmentStage] | None = None,
     ) -> pd.DataFrame:
-        """Execute registered enrichment hooks.
+        """Execute enrichment stages and merge their lookup tables into ``df``.
 
-        This method runs registered enrichment stages in sequence. Subclasses
-        can override this to add custom enrichment logic.
+        Stages are grouped into dependency waves. Stages of a wave read the
+        same frame and run concurrently on up to ``runtime.parallelism``
+        threads; their lookup tables are then written into the frame in one
+        pass before the next wave starts.
 
         Parameters
         ----------
@@ -739,7 +938,9 @@ class PipelineBase(ABC):
             The DataFrame to enrich.
         stages:
             Optional sequence of stage names to execute. If None, all
-            registered stages are executed.
+            stages of ``graph`` are executed.
+        graph:
+            Stages to run; defaults to :meth:`enrichment_stages`.
 
         Returns
         -------
@@ -750,10 +951,41 @@ class PipelineBase(ABC):
         if df.empty:
             return df
 
-        # Default implementation: no enrichment stages
-        # Subclasses can override to add custom enrichment logic
-        log.debug(LogEvents.ENRICHMENT_STAGES_COMPLETED, stages=stages or [])
-        return df
+        selected = list(self.enrichment_stages() if graph is None else graph)
+        if stages is not None:
+            wanted = set(stages)
+            selected = [stage for stage in selected if stage.name in wanted]
+
+        enriched = df
+        for wave in enrichment_waves(selected):
+            workers = resolve_worker_count(self.config.runtime.parallelism, len(wave))
+            frame = enriched
+
+            def _run_stage(stage: EnrichmentStage, frame: pd.DataFrame = frame) -> pd.DataFrame:
+                return stage.func(frame)
+
+            if workers > 1:
+                # StageProfiler привязан к одному потоку: параллельная волна профилируется целиком.
+                with self.profile_stage("enrich_" + "+".join(stage.name for stage in wave)):
+                    lookups = list(
+                        bounded_ordered_map(
+                            _run_stage,
+                            wave,
+                            max_workers=workers,
+                            thread_name_prefix=f"{self.pipeline_code}-enrich",
+                        )
+                    )
+            else:
+                lookups = []
+                for stage in wave:
+                    with self.profile_stage(f"enrich_{stage.name}"):
+                        lookups.append(_run_stage(stage))
+            enriched = merge_enrichment_lookups(enriched, list(zip(wave, lookups, strict=True)))
+
+        log.debug(
+            LogEvents.ENRICHMENT_STAGES_COMPLETED, stages=[stage.name for stage in selected]
+        )
+        return enriched
 
     def run_schema_validation(
         self,
@@ -797,7 +1029,7 @@ class PipelineBase(ABC):
                     ),
                 )
 
-            validated_candidate: Any = schema.validate(df, lazy=True)
+            validated_candidate: Any = self._validate_frame(schema, df)
             if not isinstance(validated_candidate, pd.DataFrame):
                 msg = "Schema validation did not return a DataFrame"
                 raise TypeError(msg)
@@ -1026,11 +1258,27 @@ class PipelineBase(ABC):
                 return None
         return None
 
+    def _count_stage_rows(self, stage: str, payload: object) -> None:
+        """Add the rows of ``payload`` to the ``stage`` row count used for metrics."""
+
+        rows = self._safe_len(payload)
+        if rows is not None:
+            self._stage_rows[stage] = self._stage_rows.get(stage, 0) + rows
+
+    def _row_positions(self, count: int) -> range:
+        """Return dataset positions of ``count`` rows passed to :meth:`transform`.
+
+        Positions start at 0 in-memory and continue from the previous chunk in
+        streaming runs, so ``row_index`` values match between the two.
+        """
+
+        return range(self._chunk_row_offset, self._chunk_row_offset + count)
+
     def _schema_column_specs(self) -> Mapping[str, Mapping[str, Any]]:
         """Default column factories and dtypes for schema-required columns."""
 
         def _row_index_factory(count: int) -> pd.Series[Any]:
-            return pd.Series(range(count), dtype="Int64")
+            return pd.Series(self._row_positions(count), dtype="Int64")
 
         return {
             "row_subtype": {
@@ -1273,43 +1521,11 @@ class PipelineBase(ABC):
                 f"received {type(df).__name__!s}"
             )
             raise TypeError(msg)
-        run_tag = self._normalise_run_tag(None)
-        effective_extended = bool(extended or getattr(self.config.cli, "extended", False))
-        mode = "extended" if effective_extended else None
-
-        postprocess_config = getattr(self.config, "postprocess", None)
-        correlation_config = getattr(postprocess_config, "correlation", None)
-        correlation_default = bool(getattr(correlation_config, "enabled", False))
-
-        include_correlation_flag = (
-            bool(include_correlation)
-            if include_correlation is not None
-            else (effective_extended or correlation_default)
-        )
-        include_qc_metrics_flag = (
-            bool(include_qc_metrics)
-            if include_qc_metrics is not None
-            else effective_extended
-        )
-        include_metadata = bool(self.config.validation.schema_out)
-        if effective_extended:
-            include_metadata = True
-        elif self._extract_metadata:
-            include_metadata = True
-        include_manifest = effective_extended
-
-        run_dir = output_path if output_path.is_dir() else output_path.parent
-        run_dir.mkdir(parents=True, exist_ok=True)
-
-        artifacts = self.plan_run_artifacts(
-            run_tag=run_tag,
-            mode=mode,
-            include_correlation=include_correlation_flag,
-            include_qc_metrics=include_qc_metrics_flag,
-            include_metadata=include_metadata,
-            include_manifest=include_manifest,
-            extras=None,
-            run_directory=run_dir,
+        artifacts = self._plan_write_artifacts(
+            output_path,
+            extended=extended,
+            include_correlation=include_correlation,
+            include_qc_metrics=include_qc_metrics,
         )
 
         # Build write artifacts
@@ -1322,6 +1538,7 @@ class PipelineBase(ABC):
             stage_durations_ms=self._stage_durations_ms,
         )
 
+        change_log = self.build_change_log(prepared.dataframe)
         metadata_payload = self.augment_metadata(prepared.metadata, prepared.dataframe)
         metadata = dict(metadata_payload)
 
@@ -1356,7 +1573,6 @@ class PipelineBase(ABC):
         )
 
         record_count = int(prepared.dataframe.shape[0])
-        dataframe_copy = prepared.dataframe.copy(deep=True)
 
         write_dataset_atomic(prepared.dataframe, artifacts.write.dataset, config=self.config)
         log.debug(LogEvents.DATASET_WRITTEN, path=str(artifacts.write.dataset))
@@ -1392,6 +1608,18 @@ class PipelineBase(ABC):
             artifact_name="qc_metrics",
         )
 
+        extras = dict(artifacts.extras)
+        change_log_path = emit_qc_artifact(
+            change_log,
+            artifacts.run_directory
+            / f"{artifacts.write.dataset.stem}_changes.{self.qc_extension}",
+            config=self.config,
+            log=log,
+            artifact_name="change_log",
+        )
+        if change_log_path is not None:
+            extras["change_log"] = change_log_path
+
         # Create WriteResult for RunResult
         write_result = WriteResult(
             dataset=artifacts.write.dataset,
@@ -1399,7 +1627,7 @@ class PipelineBase(ABC):
             quality_report=quality_path,
             correlation_report=correlation_path,
             qc_metrics=metrics_path,
-            extras=dict(artifacts.extras),
+            extras=dict(extras),
         )
 
         # Return RunResult according to documentation
@@ -1407,7 +1635,7 @@ class PipelineBase(ABC):
             write_result=write_result,
             run_directory=artifacts.run_directory,
             manifest=artifacts.manifest,
-            additional_datasets=dict(artifacts.extras),
+            additional_datasets=dict(extras),
             qc_summary=metrics_path,
             debug_dataset=None,  # Not implemented yet
             run_id=self.run_id,
@@ -1415,7 +1643,62 @@ class PipelineBase(ABC):
             stage_durations_ms=self._stage_durations_ms,
             _dataset_path=artifacts.write.dataset,
             _records=record_count,
-            _dataframe=dataframe_copy,
+            _dataframe=prepared.dataframe,
+        )
+
+    def _plan_write_artifacts(
+        self,
+        output_path: Path,
+        *,
+        extended: bool,
+        include_correlation: bool | None,
+        include_qc_metrics: bool | None,
+    ) -> RunArtifacts:
+        """Resolve which artefacts the write stage emits and where."""
+
+        run_tag = self._normalise_run_tag(None)
+        effective_extended = bool(extended or getattr(self.config.cli, "extended", False))
+        mode = "extended" if effective_extended else None
+
+        postprocess_config = getattr(self.config, "postprocess", None)
+        correlation_config = getattr(postprocess_config, "correlation", None)
+        correlation_default = bool(getattr(correlation_config, "enabled", False))
+
+        include_correlation_flag = (
+            bool(include_correlation)
+            if include_correlation is not None
+            else (effective_extended or correlation_default)
+        )
+        include_qc_metrics_flag = (
+            bool(include_qc_metrics)
+            if include_qc_metrics is not None
+            else effective_extended
+        )
+        include_metadata = bool(self.config.validation.schema_out)
+        if effective_extended:
+            include_metadata = True
+        elif self._extract_metadata:
+            include_metadata = True
+        include_manifest = effective_extended
+
+        run_dir = output_path if output_path.is_dir() else output_path.parent
+        run_dir.mkdir(parents=True, exist_ok=True)
+
+        extras: dict[str, Path] | None = None
+        if self._profiler is not None:
+            stem = self.build_run_stem(run_tag=run_tag, mode=mode)
+            self._profile_artifacts = profile_artifact_paths(run_dir, stem)
+            extras = dict(self._profile_artifacts)
+
+        return self.plan_run_artifacts(
+            run_tag=run_tag,
+            mode=mode,
+            include_correlation=include_correlation_flag,
+            include_qc_metrics=include_qc_metrics_flag,
+            include_metadata=include_metadata,
+            include_manifest=include_manifest,
+            extras=extras,
+            run_directory=run_dir,
         )
 
     def run(
@@ -1460,7 +1743,11 @@ class PipelineBase(ABC):
 
         stage_durations_ms: dict[str, float] = {}
         self._stage_durations_ms = stage_durations_ms
+        self._stage_rows = {}
+        self._chunk_row_offset = 0
+        self._stage_peak_memory = {}
         self._extract_metadata = {}
+        self._run_output_path = output_path
 
         effective_extended = bool(extended or getattr(self.config.cli, "extended", False))
         configured_mode = "extended" if effective_extended else None
@@ -1482,38 +1769,73 @@ class PipelineBase(ABC):
         UnifiedLogger.bind(stage="bootstrap")
         log.info(LogEvents.STAGE_RUN_START, mode=configured_mode, output_path=str(output_path))
 
+        self._profile_artifacts = {}
+        self._profiler = StageProfiler() if getattr(self.config.cli, "profiling", False) else None
+        self._metrics_exporter = self._create_metrics_exporter(log)
+
         try:
-            with UnifiedLogger.stage("extract", component=self._component_for_stage("extract")):
+            if self._profiler is not None:
+                self._profiler.start()
+            if self._streaming_enabled(log):
+                result = self._run_streaming(
+                    output_path,
+                    args,
+                    kwargs,
+                    extended=effective_extended,
+                    include_correlation=include_correlation_flag,
+                    include_qc_metrics=include_qc_metrics_flag,
+                )
+                self._write_profile_artifacts(log)
+                self.apply_retention_policy()
+                log.info(LogEvents.STAGE_RUN_FINISH, stage_durations_ms=stage_durations_ms)
+                return result
+
+            with (
+                UnifiedLogger.stage("extract", component=self._component_for_stage("extract")),
+                self.profile_stage("extract"),
+            ):
                 log.info(LogEvents.STAGE_EXTRACT_START)
                 extract_start = time.perf_counter()
                 extracted = self.extract(*args, **kwargs)
                 duration = (time.perf_counter() - extract_start) * 1000.0
                 stage_durations_ms["extract"] = duration
                 rows = self._safe_len(extracted)
+                self._count_stage_rows("extract", extracted)
                 log.info(LogEvents.STAGE_EXTRACT_FINISH, duration_ms=duration, rows=rows)
 
-            with UnifiedLogger.stage("transform", component=self._component_for_stage("transform")):
+            with (
+                UnifiedLogger.stage("transform", component=self._component_for_stage("transform")),
+                self.profile_stage("transform"),
+            ):
                 log.info(LogEvents.STAGE_TRANSFORM_START)
                 transform_start = time.perf_counter()
-                transformed = self.transform(extracted)
+                transformed = self.merge_previous_output(self.transform(extracted))
                 duration = (time.perf_counter() - transform_start) * 1000.0
                 stage_durations_ms["transform"] = duration
                 rows = self._safe_len(transformed)
+                self._count_stage_rows("transform", transformed)
                 log.info(LogEvents.STAGE_TRANSFORM_FINISH, duration_ms=duration, rows=rows)
 
             # transformed is always pd.DataFrame according to transform signature
             prepared_for_validation = self._apply_cli_sample(transformed)
 
-            with UnifiedLogger.stage("validate", component=self._component_for_stage("validate")):
+            with (
+                UnifiedLogger.stage("validate", component=self._component_for_stage("validate")),
+                self.profile_stage("validate"),
+            ):
                 log.info(LogEvents.STAGE_VALIDATE_START)
                 validate_start = time.perf_counter()
                 validated = self.validate(prepared_for_validation)
                 duration = (time.perf_counter() - validate_start) * 1000.0
                 stage_durations_ms["validate"] = duration
                 rows = self._safe_len(validated)
+                self._count_stage_rows("validate", validated)
                 log.info(LogEvents.STAGE_VALIDATE_FINISH, duration_ms=duration, rows=rows)
 
-            with UnifiedLogger.stage("write", component=self._component_for_stage("write")):
+            with (
+                UnifiedLogger.stage("write", component=self._component_for_stage("write")),
+                self.profile_stage("write"),
+            ):
                 log.info(LogEvents.STAGE_WRITE_START, output_path=str(output_path))
                 write_start = time.perf_counter()
                 result = self.write(
@@ -1525,11 +1847,13 @@ class PipelineBase(ABC):
                 )
                 duration = (time.perf_counter() - write_start) * 1000.0
                 stage_durations_ms["write"] = duration
+                self._count_stage_rows("write", validated)
                 log.info(LogEvents.STAGE_WRITE_FINISH,
                     duration_ms=duration,
                     dataset=str(result.write_result.dataset),
                 )
 
+            self._write_profile_artifacts(log)
             self.apply_retention_policy()
             log.info(LogEvents.STAGE_RUN_FINISH, stage_durations_ms=stage_durations_ms)
 
@@ -1559,6 +1883,9 @@ class PipelineBase(ABC):
             raise
 
         finally:
+            if self._profiler is not None:
+                self._profiler.stop()
+                self._profiler = None
             with UnifiedLogger.stage("cleanup", component=self._component_for_stage("cleanup")):
                 log.info(LogEvents.STAGE_CLEANUP_START)
                 self._cleanup_registered_clients()
@@ -1566,8 +1893,365 @@ class PipelineBase(ABC):
                     self.close_resources()
                 except Exception as cleanup_error:  # pragma: no cover - defensive cleanup path
                     log.warning(LogEvents.STAGE_CLEANUP_ERROR, error=str(cleanup_error))
+                try:
+                    self.load_meta_store.close()
+                except Exception as cleanup_error:  # pragma: no cover - journal is recovered later
+                    log.warning(LogEvents.STAGE_CLEANUP_ERROR, error=str(cleanup_error))
+                self._export_stage_metrics(log)
                 log.info(LogEvents.STAGE_CLEANUP_FINISH)
 
+    def _create_metrics_exporter(self, log: BoundLogger) -> MetricsExporter | None:
+        """Return the metrics exporter configured by ``telemetry``, if any."""
+
+        run_dir = self._run_output_path
+        if run_dir is not None and not run_dir.is_dir():
+            run_dir = run_dir.parent
+        try:
+            return create_metrics_exporter(
+                getattr(self.config, "telemetry", None),
+                registry=get_metrics_registry(),
+                default_directory=run_dir if run_dir is not None else self.pipeline_directory,
+                stem=self.build_run_stem(run_tag=self._normalise_run_tag(None), mode=None),
+                resource={
+                    "service.name": "bioetl",
+                    "bioetl.pipeline": self.pipeline_code,
+                    "bioetl.run_id": self.run_id,
+                },
+            )
+        except (OSError, ValueError) as exc:
+            log.warning(LogEvents.METRICS_EXPORT_FAILED, error=str(exc))
+            return None
+
+    def _export_stage_metrics(self, log: BoundLogger) -> None:
+        """Record per-stage metrics of the run and hand the registry to the exporter."""
+
+        registry = get_metrics_registry()
+        for stage, duration_ms in self._stage_durations_ms.items():
+            record_stage(
+                self.pipeline_code,
+                stage,
+                duration_seconds=duration_ms / 1000.0,
+                rows=self._stage_rows.get(stage),
+                peak_memory_bytes=self._stage_peak_memory.get(stage),
+            )
+        exporter, self._metrics_exporter = self._metrics_exporter, None
+        if exporter is None:
+            return
+        try:
+            exporter.export(registry)
+        except Exception as exc:  # pragma: no cover - exporting must not fail the run
+            log.warning(LogEvents.METRICS_EXPORT_FAILED, error=str(exc))
+        finally:
+            exporter.close()
+
+    def _write_profile_artifacts(self, log: BoundLogger) -> None:
+        """Persist the ``--profile`` measurements next to ``meta.yaml``."""
+
+        if self._profiler is None:
+            return
+        if not self._profile_artifacts:
+            run_dir = self._run_output_path
+            if run_dir is not None and not run_dir.is_dir():
+                run_dir = run_dir.parent
+            stem = self.build_run_stem(run_tag=self._normalise_run_tag(None), mode=None)
+            self._profile_artifacts = profile_artifact_paths(
+                run_dir if run_dir is not None else self.pipeline_directory, stem
+            )
+        written = self._profiler.write(self._profile_artifacts)
+        log.info(
+            LogEvents.PROFILE_ARTIFACTS_WRITTEN,
+            artifacts={key: str(path) for key, path in written.items()},
+            stages={key: stage.to_dict() for key, stage in self._profiler.stages.items()},
+        )
+
+    def _streaming_enabled(self, log: BoundLogger) -> bool:
+        """Return whether :meth:`run` should process the dataset chunk by chunk."""
+
+        if not self.config.runtime.streaming:
+            return False
+        reason: str | None = None
+        if getattr(self.config.cli, "sample", None):
+            reason = "cli_sample"
+        elif self.config.runtime.release_gated:
+            reason = "release_gated"
+        else:
+            # Overridden write/QC hooks expect the whole dataframe at once.
+            accumulator_overridden = (
+                type(self).build_qc_accumulator is not PipelineBase.build_qc_accumulator
+            )
+            for hook in _STREAMING_INCOMPATIBLE_HOOKS:
+                if accumulator_overridden and hook in _STREAMING_QC_HOOKS:
+                    continue
+                if getattr(type(self), hook) is not getattr(PipelineBase, hook):
+                    reason = f"{hook}_overridden"
+                    break
+        if reason is not None:
+            log.warning(LogEvents.STREAMING_RUN_FALLBACK, reason=reason)
+            return False
+        return True
+
+    def _run_streaming(
+        self,
+        output_path: Path,
+        args: Sequence[object],
+        kwargs: Mapping[str, object],
+        *,
+        extended: bool,
+        include_correlation: bool,
+        include_qc_metrics: bool,
+    ) -> RunResult:
+        """Run extract → transform → validate → write with bounded memory.
+
+        Every chunk from :meth:`extract_chunks` is transformed and validated on
+        its own, hashed and spilled to disk as a sorted run. The runs are then
+        merged in ``determinism.sort`` order straight into the dataset, so the
+        output matches the in-memory path for row-local transforms. Metadata
+        and QC artefacts are computed incrementally by
+        :meth:`build_qc_accumulator`; schema checks
+        spanning several rows only see one chunk at a time.
+        """
+
+        log = UnifiedLogger.get(__name__)
+        stage_durations_ms = self._stage_durations_ms
+        for stage in ("extract", "transform", "validate"):
+            stage_durations_ms[stage] = 0.0
+        hashing = self.config.determinism.hashing
+        sort_config = self.config.determinism.sort
+        na_position: Literal["first", "last"] = (
+            "first" if sort_config.na_position == "first" else "last"
+        )
+        collect_schemas = resolve_output_format(self.config) == "parquet"
+
+        with tempfile.TemporaryDirectory(prefix=f"{self.pipeline_code}-streaming-") as spill_root:
+            spill_directory = Path(spill_root)
+            sorter = ExternalSorter(
+                spill_directory / "sort",
+                by=sort_config.by,
+                ascending=sort_config.ascending or None,
+                na_position=na_position,
+                batch_rows=self.config.runtime.chunk_rows,
+            )
+            qc = self.build_qc_accumulator(
+                spill_directory / "qc", track_correlation=include_correlation
+            )
+            hash_counters = {
+                column: ExternalDistinctCounter(spill_directory / column)
+                for column in (hashing.row_hash_column, hashing.business_key_column)
+            }
+            schemas: list[Any] = []
+            validation_summary: dict[str, Any] | None = None
+            template = pd.DataFrame()
+
+            chunks = iter(self.extract_chunks(*args, **kwargs))
+            chunk_index = 0
+            while True:
+                with (
+                    UnifiedLogger.stage("extract", component=self._component_for_stage("extract")),
+                    self.profile_stage("extract"),
+                ):
+                    stage_start = time.perf_counter()
+                    chunk = next(chunks, None)
+                    stage_durations_ms["extract"] += (time.perf_counter() - stage_start) * 1000.0
+                if chunk is None:
+                    break
+
+                with (
+                    UnifiedLogger.stage(
+                        "transform", component=self._component_for_stage("transform")
+                    ),
+                    self.profile_stage("transform"),
+                ):
+                    stage_start = time.perf_counter()
+                    # Row positions assigned in transform continue from the previous chunk.
+                    self._chunk_row_offset = self._stage_rows.get("transform", 0)
+                    transformed = self.transform(chunk)
+                    stage_durations_ms["transform"] += (time.perf_counter() - stage_start) * 1000.0
+                self._count_stage_rows("extract", chunk)
+                self._count_stage_rows("transform", transformed)
+
+                with (
+                    UnifiedLogger.stage(
+                        "validate", component=self._component_for_stage("validate")
+                    ),
+                    self.profile_stage("validate"),
+                ):
+                    stage_start = time.perf_counter()
+                    validated = self.validate(transformed)
+                    validation_summary = _merge_validation_summaries(
+                        validation_summary, self._validation_summary
+                    )
+                    stage_durations_ms["validate"] += (time.perf_counter() - stage_start) * 1000.0
+                self._count_stage_rows("validate", validated)
+
+                prepared = ensure_hash_columns(
+                    prepare_dataframe(validated, config=self.config), config=self.config
+                )
+                template = prepared.iloc[0:0]
+                if not prepared.empty:
+                    sorter.add(prepared)
+                    qc.update(prepared)
+                    for column, counter in hash_counters.items():
+                        if column in prepared.columns:
+                            counter.add(prepared[column])
+                    if collect_schemas:
+                        schemas.append(arrow_schema(prepared))
+                log.debug(
+                    LogEvents.STREAMING_CHUNK_PROCESSED,
+                    chunk=chunk_index,
+                    rows_in=len(chunk),
+                    rows_out=len(prepared),
+                )
+                chunk_index += 1
+
+            self._validation_summary = validation_summary
+            log.info(
+                LogEvents.STAGE_VALIDATE_FINISH,
+                duration_ms=stage_durations_ms["validate"],
+                rows=sorter.row_count,
+                chunks=chunk_index,
+            )
+
+            if sorter.row_count == 0:
+                # Nothing to merge: the in-memory writer handles empty datasets.
+                with self.profile_stage("write"):
+                    return self.write(
+                        template,
+                        output_path,
+                        extended=extended,
+                        include_correlation=include_correlation,
+                        include_qc_metrics=include_qc_metrics,
+                    )
+
+            with (
+                UnifiedLogger.stage("write", component=self._component_for_stage("write")),
+                self.profile_stage("write"),
+            ):
+                log.info(LogEvents.STAGE_WRITE_START, output_path=str(output_path))
+                write_start = time.perf_counter()
+                artifacts = self._plan_write_artifacts(
+                    output_path,
+                    extended=extended,
+                    include_correlation=include_correlation,
+                    include_qc_metrics=include_qc_metrics,
+                )
+                dataset_path = artifacts.write.dataset
+
+                log.debug(
+                    LogEvents.STREAMING_MERGE_START,
+                    runs=sorter.run_count,
+                    rows=sorter.row_count,
+                )
+                first_batch: pd.DataFrame | None = None
+                with StreamingDatasetWriter(
+                    dataset_path,
+                    config=self.config,
+                    schema=unify_arrow_schemas(schemas) if schemas else None,
+                ) as writer:
+                    for batch in sorter.iter_sorted():
+                        if first_batch is None:
+                            first_batch = batch
+                        writer.write(batch)
+                record_count = writer.rows_written
+                self._stage_rows["write"] = record_count
+                log.debug(LogEvents.STREAMING_MERGE_FINISH, rows=record_count)
+                log.debug(LogEvents.DATASET_WRITTEN, path=str(dataset_path))
+
+                base_metadata = dict(
+                    serialise_metadata(
+                        cast(pd.DataFrame, first_batch),
+                        config=self.config,
+                        run_id=self.run_id,
+                        pipeline_code=self.pipeline_code,
+                        dataset_path=dataset_path,
+                        stage_durations_ms=stage_durations_ms,
+                    )
+                )
+                base_metadata["row_count"] = record_count
+                hashing_metadata = cast(dict[str, Any], base_metadata["hashing"])
+                for column, counter in hash_counters.items():
+                    if column in hashing_metadata:
+                        hashing_metadata[column] = {
+                            "unique": counter.count(),
+                            "nullable": counter.has_missing,
+                        }
+                metadata = dict(
+                    self.augment_metadata(base_metadata, cast(pd.DataFrame, first_batch))
+                )
+
+                metrics_summary = dict(qc.qc_metrics_payload())
+                if validation_summary:
+                    validation_default: dict[str, Any] = {}
+                    validation_dict = cast(
+                        dict[str, Any], metadata.setdefault("validation", validation_default)
+                    )
+                    validation_dict.update(validation_summary)
+                quality_default: dict[str, Any] = {}
+                quality_dict = cast(dict[str, Any], metadata.setdefault("quality", quality_default))
+                metrics_default: dict[str, Any] = {}
+                metrics_dict = cast(
+                    dict[str, Any], quality_dict.setdefault("metrics", metrics_default)
+                )
+                metrics_dict.update(metrics_summary)
+
+                metadata_path: Path | None = None
+                if artifacts.write.metadata is not None:
+                    write_yaml_atomic(metadata, artifacts.write.metadata)
+                    log.debug(LogEvents.METADATA_WRITTEN, path=str(artifacts.write.metadata))
+                    metadata_path = artifacts.write.metadata
+
+                quality_path = emit_qc_artifact(
+                    qc.quality_report(),
+                    artifacts.write.quality_report,
+                    config=self.config,
+                    log=log,
+                    artifact_name="quality_report",
+                )
+                correlation_path = emit_qc_artifact(
+                    qc.correlation_report() if include_correlation else None,
+                    artifacts.write.correlation_report,
+                    config=self.config,
+                    log=log,
+                    artifact_name="correlation_report",
+                )
+                metrics_path = emit_qc_artifact(
+                    metrics_summary,
+                    artifacts.write.qc_metrics,
+                    config=self.config,
+                    log=log,
+                    artifact_name="qc_metrics",
+                )
+
+                duration = (time.perf_counter() - write_start) * 1000.0
+                stage_durations_ms["write"] = duration
+                log.info(
+                    LogEvents.STAGE_WRITE_FINISH,
+                    duration_ms=duration,
+                    dataset=str(dataset_path),
+                )
+
+        write_result = WriteResult(
+            dataset=dataset_path,
+            metadata=metadata_path,
+            quality_report=quality_path,
+            correlation_report=correlation_path,
+            qc_metrics=metrics_path,
+            extras=dict(artifacts.extras),
+        )
+        return RunResult(
+            write_result=write_result,
+            run_directory=artifacts.run_directory,
+            manifest=artifacts.manifest,
+            additional_datasets=dict(artifacts.extras),
+            qc_summary=metrics_path,
+            debug_dataset=None,
+            run_id=self.run_id,
+            log_file=artifacts.log_file,
+            stage_durations_ms=stage_durations_ms,
+            _dataset_path=dataset_path,
+            _records=record_count,
+            _dataframe=None,
+        )
+
     def validate(self, df: pd.DataFrame) -> pd.DataFrame:
         """Validate ``df`` against the configured Pandera schema.
 
@@ -1622,6 +2306,25 @@ class PipelineBase(ABC):
         )
         df_for_validation = self._ensure_load_meta_ids(df_for_validation)
 
+        validation_cache = self._get_validation_cache()
+        cache_key = validation_cache_key(
+            schema_entry.identifier,
+            schema_entry.version,
+            strict=bool(self.config.validation.strict),
+            coerce=bool(self.config.validation.coerce),
+        )
+        row_hash_column = self.config.determinism.hashing.row_hash_column
+        row_hashes: list[Any] = []
+        cached_mask: np.ndarray | None = None
+        if (
+            validation_cache is not None
+            and isinstance(schema, DataFrameSchema)
+            and row_hash_column in df_for_validation.columns
+        ):
+            row_hashes = df_for_validation[row_hash_column].astype("string").tolist()
+            cached_mask = validation_cache.contains(cache_key, row_hashes)
+        validated_cleanly = False
+
         def _coerce_failures_only(error: pandera.errors.SchemaErrors) -> tuple[bool, list[str]]:
             failure_cases_df = getattr(error, "failure_cases", None)
             if not isinstance(failure_cases_df, pd.DataFrame) or failure_cases_df.empty:
@@ -1645,8 +2348,14 @@ class PipelineBase(ABC):
             return True, columns_list
 
         try:
-            validated_candidate: Any = schema.validate(df_for_validation, lazy=True)
+            validated_candidate: Any = self._validate_skipping_cached_rows(
+                schema,
+                df_for_validation,
+                cached_mask,
+                volatile_columns=self._columns_outside_row_hash(df, df_for_validation),
+            )
             validated = self._reorder_columns(validated_candidate, schema_entry.column_order)
+            validated_cleanly = True
         except pandera.errors.SchemaErrors as exc:
             fallback_validated: pd.DataFrame | None = None
             coerce_only = False
@@ -1663,8 +2372,8 @@ class PipelineBase(ABC):
                     ),
                 )
                 try:
-                    retried_candidate: Any = fallback_schema.validate(
-                        df_for_validation, lazy=True
+                    retried_candidate: Any = self._validate_frame(
+                        fallback_schema, df_for_validation
                     )
                 except pandera.errors.SchemaErrors:
                     fallback_validated = None
@@ -1724,6 +2433,24 @@ class PipelineBase(ABC):
             self._validation_summary["error"] = error_summary
         if failure_count is not None:
             self._validation_summary["failure_count"] = failure_count
+        if validation_cache is not None and cached_mask is not None:
+            cached_rows = int(cached_mask.sum())
+            stored = 0
+            if validated_cleanly:
+                fresh_hashes = [
+                    row_hash
+                    for row_hash, cached in zip(row_hashes, cached_mask, strict=True)
+                    if not cached
+                ]
+                stored = validation_cache.add(cache_key, fresh_hashes)
+            self._validation_summary["cached_rows"] = cached_rows
+            log.debug(LogEvents.VALIDATION_CACHE_APPLIED,
+                schema=schema_entry.identifier,
+                version=schema_entry.version,
+                cached_rows=cached_rows,
+                validated_rows=int(len(cached_mask) - cached_rows),
+                stored=stored,
+            )
 
         if schema_valid:
             log.debug(LogEvents.VALIDATION_COMPLETED,
@@ -1734,6 +2461,89 @@ class PipelineBase(ABC):
 
         return validated
 
+    def _get_validation_cache(self) -> ValidationCache | None:
+        """Return the row validation cache, opening it on first use.
+
+        The cache lives at ``<paths.cache_root>/validation/<pipeline>.sqlite`` and
+        is only used when ``validation.incremental`` is enabled.
+        """
+
+        if not self.config.validation.incremental:
+            return None
+        if self._validation_cache is None:
+            path = (
+                Path(self.config.paths.cache_root) / "validation" / f"{self.pipeline_code}.sqlite"
+            )
+            self._validation_cache = ValidationCache(path)
+            self.register_client("validation_cache", self._close_validation_cache)
+        return self._validation_cache
+
+    def _close_validation_cache(self) -> None:
+        validation_cache, self._validation_cache = self._validation_cache, None
+        if validation_cache is not None:
+            validation_cache.close()
+
+    def _columns_outside_row_hash(self, source: pd.DataFrame, prepared: pd.DataFrame) -> list[str]:
+        """Return columns of ``prepared`` whose values ``hash_row`` does not cover."""
+
+        hashing = self.config.determinism.hashing
+        if hashing.row_fields:
+            hashed = set(hashing.row_fields)
+        else:
+            hashed = {column for column in source.columns if column not in hashing.exclude_fields}
+        hashed -= {hashing.row_hash_column, hashing.business_key_column}
+        return [column for column in prepared.columns if column not in hashed]
+
+    def _validate_frame(self, schema: Any, df: pd.DataFrame) -> pd.DataFrame:
+        """Validate ``df`` lazily, in row chunks when ``validation.chunk_rows`` is set.
+
+        Chunks are validated in ``validation.workers`` processes (falling back
+        to ``runtime.parallelism``); see :func:`validate_in_chunks`.
+        """
+
+        chunk_rows = self.config.validation.chunk_rows
+        if chunk_rows is None or not isinstance(schema, DataFrameSchema):
+            return schema.validate(df, lazy=True)
+        workers = self.config.validation.workers or self.config.runtime.parallelism
+        return validate_in_chunks(schema, df, chunk_rows=chunk_rows, max_workers=workers)
+
+    def _validate_skipping_cached_rows(
+        self,
+        schema: DataFrameSchema,
+        df: pd.DataFrame,
+        cached_mask: np.ndarray | None,
+        *,
+        volatile_columns: Sequence[str],
+    ) -> pd.DataFrame:
+        """Validate ``df``, running row-level checks only for rows not in ``cached_mask``.
+
+        Rows flagged in ``cached_mask`` are only coerced and checked on
+        ``volatile_columns``; cross-row checks always see the whole frame. On
+        any failure the full frame is re-validated so failure cases match a
+        run without the cache.
+        """
+
+        if cached_mask is None or not cached_mask.any():
+            return self._validate_frame(schema, df)
+        fresh_mask = ~cached_mask
+        try:
+            parts: list[pd.DataFrame] = []
+            positions: list[np.ndarray] = []
+            if fresh_mask.any():
+                parts.append(self._validate_frame(schema, df.loc[fresh_mask]))
+                positions.append(np.flatnonzero(fresh_mask))
+            cached_schema = _cached_rows_schema(schema, volatile_columns)
+            parts.append(cached_schema.validate(df.loc[cached_mask], lazy=True))
+            positions.append(np.flatnonzero(cached_mask))
+            combined = pd.concat(parts) if len(parts) > 1 else parts[0]
+            combined = combined.iloc[np.argsort(np.concatenate(positions), kind="stable")]
+            cross_schema = cross_row_schema(schema)
+            if cross_schema is not None:
+                cross_schema.validate(combined, lazy=True)
+        except pandera.errors.SchemaErrors:
+            return self._validate_frame(schema, df)
+        return combined
+
     def _ensure_load_meta_ids(self, df: pd.DataFrame) -> pd.DataFrame:
         """Populate ``load_meta_id`` column with deterministic UUIDs when missing."""
 
@@ -1762,7 +2572,9 @@ class PipelineBase(ABC):
         namespace_uuid = uuid.uuid5(uuid.NAMESPACE_URL, namespace_seed)
 
         synthetic_values: dict[int, str] = {}
-        for position, index in enumerate(df.index[missing_mask]):
+        # Dataset positions, so that streaming chunks derive the IDs of an in-memory run.
+        positions = np.asarray(self._row_positions(len(df)))[missing_mask.to_numpy(dtype=bool)]
+        for position, index in zip(positions.tolist(), df.index[missing_mask], strict=True):
             row_hash_value = str(df.at[index, row_hash_column])
             synthetic_uuid = uuid.uuid5(
                 namespace_uuid,
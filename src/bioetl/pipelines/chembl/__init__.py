@@ -1,12 +1,14 @@
-"""ChEMBL pipeline helpers and run entry points."""
+"""ChEMBL pipeline helpers and run entry points.
+
+Run modules are imported on first attribute access, so importing a helper
+module such as :mod:`bioetl.pipelines.chembl.activity.normalize` does not load
+every pipeline.
+"""
 
 from __future__ import annotations
 
-from bioetl.pipelines.chembl.activity import run as activity_run
-from bioetl.pipelines.chembl.assay import run as assay_run
-from bioetl.pipelines.chembl.document import run as document_run
-from bioetl.pipelines.chembl.target import run as target_run
-from bioetl.pipelines.chembl.testitem import run as testitem_run
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 __all__ = [
     "activity_run",
@@ -16,4 +18,26 @@ __all__ = [
     "testitem_run",
 ]
 
+if TYPE_CHECKING:
+    from bioetl.pipelines.chembl.activity import run as activity_run
+    from bioetl.pipelines.chembl.assay import run as assay_run
+    from bioetl.pipelines.chembl.document import run as document_run
+    from bioetl.pipelines.chembl.target import run as target_run
+    from bioetl.pipelines.chembl.testitem import run as testitem_run
+
+
+def __getattr__(name: str) -> Any:
+    """Import the ``<entity>.run`` module for ``<entity>_run`` on first access."""
+
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = import_module(f".{name.removesuffix('_run')}.run", __name__)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the lazily available public names."""
 
+    return sorted(set(__all__ + list(globals().keys())))
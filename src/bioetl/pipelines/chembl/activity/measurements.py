@@ -0,0 +1,190 @@
+"""Нормализация измерений активности: значения, отношения и единицы.
+
+Каждая колонка факторизуется в уникальные значения, которые нормализуются
+один раз (точным поиском по таблице или разбором числа), после чего
+результат раздаётся обратно по кодам. Стоимость определяется числом
+уникальных значений, а не числом строк.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import pandas as pd
+
+from bioetl.core.frame import map_unique
+
+__all__ = [
+    "CANONICAL_UNIT_OVERRIDES",
+    "LEGACY_UNIT_SYNONYMS",
+    "RELATION_SYMBOLS",
+    "UNIT_DICTIONARIES",
+    "UnitLookup",
+    "default_unit_lookup",
+    "normalize_measurement_values",
+    "normalize_relations",
+    "normalize_units",
+    "strip_values",
+]
+
+UNIT_DICTIONARIES: tuple[str, ...] = ("activity_units", "standard_units")
+"""Словари vocab store, из которых строится таблица синонимов единиц."""
+
+CANONICAL_UNIT_OVERRIDES: Mapping[str, str] = {"uM": "μM"}
+"""Идентификатор словаря → форма, которую исторически выдаёт пайплайн."""
+
+LEGACY_UNIT_SYNONYMS: Mapping[str, str] = {
+    "nanomolar": "nM",
+    "nmol": "nM",
+    "nm": "nM",
+    "NM": "nM",
+    "µM": "μM",
+    "uM": "μM",
+    "UM": "μM",
+    "micromolar": "μM",
+    "microM": "μM",
+    "umol": "μM",
+    "millimolar": "mM",
+    "milliM": "mM",
+    "mmol": "mM",
+    "MM": "mM",
+    "percent": "%",
+    "pct": "%",
+    "ratios": "ratio",
+}
+"""Синонимы, поддерживаемые пайплайном помимо словарей."""
+
+RELATION_SYMBOLS: Mapping[str, str] = {"≤": "<=", "≥": ">=", "≠": "~"}
+
+_NUMBER_PATTERN = r"([+-]?\d*\.?\d+)"
+
+
+@dataclass(frozen=True)
+class UnitLookup:
+    """Точное сопоставление написаний единиц с каноническими формами.
+
+    Значение сначала ищется как есть (после ``strip``), затем без учёта
+    регистра; неизвестные единицы возвращаются без изменений. Подстроки не
+    заменяются, поэтому ``nm`` внутри ``nmol/kg`` не трогается.
+    """
+
+    exact: Mapping[str, str]
+    folded: Mapping[str, str]
+
+    @classmethod
+    def from_synonyms(cls, synonyms: Mapping[str, str]) -> UnitLookup:
+        exact = {key.strip(): value for key, value in synonyms.items() if key.strip()}
+        folded: dict[str, str] = {}
+        ambiguous: set[str] = set()
+        for key, value in exact.items():
+            folded_key = key.casefold()
+            if folded.setdefault(folded_key, value) != value:
+                ambiguous.add(folded_key)
+        for folded_key in ambiguous:
+            del folded[folded_key]
+        return cls(exact=exact, folded=folded)
+
+    @classmethod
+    def from_vocab_store(
+        cls,
+        store: Mapping[str, Any],
+        *,
+        dictionaries: Iterable[str] = UNIT_DICTIONARIES,
+        overrides: Mapping[str, str] = CANONICAL_UNIT_OVERRIDES,
+        extra_synonyms: Mapping[str, str] = LEGACY_UNIT_SYNONYMS,
+    ) -> UnitLookup:
+        """Собрать таблицу из ``id``/``aliases`` словарей и дополнительных синонимов.
+
+        Записи учитываются независимо от ``status``: устаревшие написания тоже
+        должны приводиться к канонической форме. Первое определение синонима
+        имеет приоритет.
+        """
+
+        synonyms: dict[str, str] = {}
+        for name in dictionaries:
+            block = store.get(name)
+            if not isinstance(block, Mapping):
+                continue
+            for entry in block.get("values") or ():
+                if not isinstance(entry, Mapping) or not isinstance(entry.get("id"), str):
+                    continue
+                entry_id = entry["id"].strip()
+                canonical = overrides.get(entry_id, entry_id)
+                synonyms.setdefault(entry_id, canonical)
+                for alias in entry.get("aliases") or ():
+                    if isinstance(alias, str):
+                        synonyms.setdefault(alias.strip(), canonical)
+        for key, value in extra_synonyms.items():
+            synonyms.setdefault(key, value)
+        return cls.from_synonyms(synonyms)
+
+    def resolve(self, value: str) -> str:
+        stripped = value.strip()
+        found = self.exact.get(stripped)
+        if found is None:
+            found = self.folded.get(stripped.casefold(), stripped)
+        return found
+
+
+@lru_cache(maxsize=1)
+def default_unit_lookup() -> UnitLookup:
+    """Вернуть таблицу единиц из vocab store (``VOCAB_STORE`` или ``configs/dictionaries``)."""
+
+    from bioetl.schemas.schema_vocabulary_helper import vocab_store
+
+    return UnitLookup.from_vocab_store(vocab_store())
+
+
+def _map_uniques(
+    values: pd.Series, normalize: Callable[[pd.Series], Any], *, dtype: Any = object
+) -> pd.Series:
+    """Векторно обработать уникальные значения и раздать результат по строкам.
+
+    В отличие от :func:`bioetl.core.frame.map_unique` ``normalize`` получает
+    сразу все уникальные значения (без пропусков) одним Series.
+    """
+
+    codes, uniques = pd.factorize(values)
+    normalized = pd.Series(normalize(pd.Series(uniques, dtype=object)), dtype=dtype)
+    # Код -1 (пропуск) отсутствует в индексе уникальных значений и даёт NA.
+    result = normalized.reindex(codes)
+    result.index = values.index
+    result.name = values.name
+    return result
+
+
+def _parse_numbers(uniques: pd.Series) -> pd.Series:
+    text = uniques.astype(str).str.strip().str.replace(r"[,\s]", "", regex=True)
+    return pd.to_numeric(text.str.extract(_NUMBER_PATTERN, expand=False), errors="coerce")
+
+
+def normalize_measurement_values(values: pd.Series) -> pd.Series:
+    """Разобрать числа: убрать пробелы/запятые и взять первое число (``10-20`` → 10)."""
+
+    return _map_uniques(values, _parse_numbers, dtype=float)
+
+
+def strip_values(values: pd.Series) -> pd.Series:
+    """Привести значения к строкам без обрамляющих пробелов."""
+
+    return map_unique(values, lambda value: str(value).strip(), na_action="ignore")
+
+
+def normalize_relations(values: pd.Series) -> pd.Series:
+    """Перевести Unicode-отношения (``≤``, ``≥``, ``≠``) в ASCII-форму."""
+
+    def _normalize(value: Any) -> str:
+        stripped = str(value).strip()
+        return RELATION_SYMBOLS.get(stripped, stripped)
+
+    return map_unique(values, _normalize, na_action="ignore")
+
+
+def normalize_units(values: pd.Series, lookup: UnitLookup | None = None) -> pd.Series:
+    """Привести написания единиц к каноническим формам по :class:`UnitLookup`."""
+
+    table = lookup if lookup is not None else default_unit_lookup()
+    return map_unique(values, lambda value: table.resolve(str(value)), na_action="ignore")
@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 
 import numpy as np
 import pandas as pd
 
-from bioetl.clients.client_chembl_common import ChemblClient
-from bioetl.core.frame import ensure_columns
+from bioetl.core.frame import ensure_columns, lookup_frame, lookup_keys, merge_lookup, unique_keys
 from bioetl.core.log_events import LogEvents
 from bioetl.core.logger import UnifiedLogger
 from bioetl.schemas.chembl_activity_enrichment import (
@@ -18,6 +17,9 @@ from bioetl.schemas.chembl_activity_enrichment import (
     DATA_VALIDITY_ENRICHMENT_SCHEMA,
 )
 
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from bioetl.clients.client_chembl_common import ChemblClient
+
 __all__ = ["enrich_with_assay", "enrich_with_compound_record", "enrich_with_data_validity"]
 
 
@@ -49,6 +51,15 @@ _COMPOUND_COLUMNS: tuple[tuple[str, str], ...] = (
 _DATA_VALIDITY_COLUMNS: tuple[tuple[str, str], ...] = (("data_validity_description", "string"),)
 
 
+def _clean_text(value: Any) -> str | None:
+    """Вернуть обрезанную строку или ``None`` для пустого значения."""
+
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
 def _extract_first_present(record: Mapping[str, Any], keys: Iterable[str]) -> Any:
     """Возвратить значение по первому доступному алиасу."""
 
@@ -64,6 +75,14 @@ def _extract_first_present(record: Mapping[str, Any], keys: Iterable[str]) -> An
     return None
 
 
+def _row_id_lookup(df_enrich: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
+    """Таблица поиска по ``_row_id`` из промежуточного обогащения (последняя запись побеждает)."""
+
+    present = [column for column in columns if column in df_enrich.columns]
+    df_enrich = df_enrich.dropna(subset=["_row_id"]).drop_duplicates("_row_id", keep="last")
+    return cast(pd.DataFrame, df_enrich.set_index(df_enrich["_row_id"].astype("int64"))[present])
+
+
 def enrich_with_assay(
     df_act: pd.DataFrame,
     client: ChemblClient,
@@ -90,8 +109,8 @@ def enrich_with_assay(
         return ASSAY_ENRICHMENT_SCHEMA.validate(df_act, lazy=True)
 
     # 2) Собрать уникальные валидные идентификаторы (без iterrows: быстрее и чище)
-    assay_ids = df_act["assay_chembl_id"].dropna().astype(str).str.strip()
-    assay_ids = assay_ids[assay_ids.ne("")].unique().tolist()
+    assay_keys = lookup_keys(df_act["assay_chembl_id"])
+    assay_ids = unique_keys(assay_keys)
 
     # Гарантируем наличие выходных колонок даже при пустом наборе ID
     if not assay_ids:
@@ -130,40 +149,13 @@ def enrich_with_assay(
         log.debug(LogEvents.ENRICHMENT_NO_RECORDS_FOUND)
         return ASSAY_ENRICHMENT_SCHEMA.validate(df_act, lazy=True)
 
-    enrichment_rows: list[dict[str, Any]] = []
-    for assay_id, rec in records_by_id.items():
-        enrichment_rows.append(
-            {
-                "assay_chembl_id": assay_id,
-                "assay_organism": rec.get("assay_organism"),
-                "assay_tax_id": rec.get("assay_tax_id"),
-            }
-        )
-
-    df_enrich = pd.DataFrame(enrichment_rows)
+    lookup = lookup_frame(records_by_id, ("assay_organism", "assay_tax_id"))
 
-    # 6) Левый джойн по ключу, порядок строк — как во входном df_act
-    original_index = df_act.index
-    df_merged = df_act.merge(
-        df_enrich,
-        on="assay_chembl_id",
-        how="left",
-        sort=False,
-        suffixes=("", "_enrich"),
-    ).reindex(original_index)
+    # 6) Левый джойн по ключу, порядок строк — как во входном df_act;
+    #    значения из /assay имеют приоритет над уже заполненными
+    df_merged = merge_lookup(df_act, assay_keys, lookup, how="update")
 
     # 7) Приведение типов (софт)
-    if "assay_organism_enrich" in df_merged.columns:
-        df_merged["assay_organism"] = df_merged["assay_organism_enrich"].combine_first(
-            df_merged["assay_organism"]
-        )
-        df_merged = df_merged.drop(columns=["assay_organism_enrich"])
-    if "assay_tax_id_enrich" in df_merged.columns:
-        df_merged["assay_tax_id"] = df_merged["assay_tax_id_enrich"].combine_first(
-            df_merged["assay_tax_id"]
-        )
-        df_merged = df_merged.drop(columns=["assay_tax_id_enrich"])
-
     if "assay_organism" not in df_merged.columns:
         df_merged["assay_organism"] = pd.NA
     if "assay_tax_id" not in df_merged.columns:
@@ -276,117 +268,29 @@ def enrich_with_compound_record(
         enrichment_by_record_id = _enrich_by_record_id(df_need_fallback, client, cfg, log)
 
     # 6) Объединить результаты с приоритетом: данные из пар > данные из fallback
-    # Начинаем с исходного DataFrame и применяем обогащения последовательно
+    # Начинаем с исходного DataFrame и применяем обогащения по _row_id
     df_result = df_act.copy()
 
-    # Применить обогащение через пары для строк с document_chembl_id
+    # Непустые значения из обогащения через пары заменяют исходные
     if enrichment_by_pairs is not None and not enrichment_by_pairs.empty:
-        # Создать словарь данных из обогащения через пары по _row_id
-        pairs_dict: dict[int, dict[str, Any]] = {}
-        for _, row in enrichment_by_pairs.iterrows():
-            row_id_raw = row.get("_row_id")
-            if not pd.isna(row_id_raw):
-                try:
-                    # Безопасное преобразование в int
-                    if isinstance(row_id_raw, (int, float)):
-                        row_id = int(row_id_raw)
-                    else:
-                        row_id = int(str(row_id_raw))
-                    pairs_dict[row_id] = {
-                        "compound_name": row.get("compound_name"),
-                        "compound_key": row.get("compound_key"),
-                        "curated": row.get("curated"),
-                    }
-                except (ValueError, TypeError):
-                    continue
-
-        # Применить данные из обогащения через пары
-        if "_row_id" in df_result.columns:
-            for idx in df_result.index:
-                row_id_raw = df_result.loc[idx, "_row_id"]
-                if not pd.isna(row_id_raw):
-                    try:
-                        # Безопасное преобразование в int
-                        if isinstance(row_id_raw, (int, float)):
-                            row_id = int(row_id_raw)
-                        else:
-                            row_id = int(str(row_id_raw))
-                        if row_id in pairs_dict:
-                            pairs_data = pairs_dict[row_id]
-                            if pairs_data.get("compound_name") is not None:
-                                df_result.loc[idx, "compound_name"] = pairs_data["compound_name"]
-                            if pairs_data.get("compound_key") is not None:
-                                df_result.loc[idx, "compound_key"] = pairs_data["compound_key"]
-                            if pairs_data.get("curated") is not None:
-                                df_result.loc[idx, "curated"] = pairs_data["curated"]
-                    except (ValueError, TypeError):
-                        continue
+        pairs_lookup = _row_id_lookup(
+            enrichment_by_pairs, ("compound_name", "compound_key", "curated")
+        )
+        df_result = merge_lookup(df_result, df_result["_row_id"], pairs_lookup, how="update")
 
     # Восстановить исходный порядок по _row_id
-    if "_row_id" in df_result.columns:
-        df_result = df_result.sort_values("_row_id").reset_index(drop=True)
+    df_result = df_result.sort_values("_row_id").reset_index(drop=True)
 
     # Применить fallback данные только для строк, где compound_name/compound_key пустые
     if enrichment_by_record_id is not None and not enrichment_by_record_id.empty:
-        # Создать словарь fallback данных по _row_id
-        fallback_dict: dict[int, dict[str, Any]] = {}
-        for _, row in enrichment_by_record_id.iterrows():
-            row_id_raw = row.get("_row_id")
-            if not pd.isna(row_id_raw):
-                try:
-                    # Безопасное преобразование в int
-                    if isinstance(row_id_raw, (int, float)):
-                        row_id = int(row_id_raw)
-                    else:
-                        row_id = int(str(row_id_raw))
-                    fallback_dict[row_id] = {
-                        "compound_name": row.get("compound_name"),
-                        "compound_key": row.get("compound_key"),
-                    }
-                except (ValueError, TypeError):
-                    continue
-
-        # Применить fallback данные только для строк, где compound_name/compound_key пустые
-        if "_row_id" in df_result.columns:
-            for idx in df_result.index:
-                row_id_raw = df_result.loc[idx, "_row_id"]
-                if not pd.isna(row_id_raw):
-                    try:
-                        # Безопасное преобразование в int
-                        if isinstance(row_id_raw, (int, float)):
-                            row_id = int(row_id_raw)
-                        else:
-                            row_id = int(str(row_id_raw))
-                        if row_id in fallback_dict:
-                            # Проверить, нужно ли применять fallback (если compound_name/compound_key пустые)
-                            compound_name = (
-                                df_result.loc[idx, "compound_name"]
-                                if "compound_name" in df_result.columns
-                                else pd.NA
-                            )
-                            compound_key = (
-                                df_result.loc[idx, "compound_key"]
-                                if "compound_key" in df_result.columns
-                                else pd.NA
-                            )
-
-                            name_empty = pd.isna(compound_name) or (
-                                str(compound_name).strip() == ""
-                            )
-                            key_empty = pd.isna(compound_key) or (str(compound_key).strip() == "")
-
-                            if name_empty or key_empty:
-                                fallback_data = fallback_dict[row_id]
-                                if name_empty and fallback_data.get("compound_name") is not None:
-                                    df_result.loc[idx, "compound_name"] = fallback_data[
-                                        "compound_name"
-                                    ]
-                                if key_empty and fallback_data.get("compound_key") is not None:
-                                    df_result.loc[idx, "compound_key"] = fallback_data[
-                                        "compound_key"
-                                    ]
-                    except (ValueError, TypeError):
-                        continue
+        fallback_lookup = _row_id_lookup(enrichment_by_record_id, ("compound_name", "compound_key"))
+        df_result = merge_lookup(
+            df_result,
+            df_result["_row_id"],
+            fallback_lookup,
+            how="fill",
+            blank_is_missing=True,
+        )
 
     # 6) Убедиться, что все новые колонки присутствуют (заполнить NA для отсутствующих)
     for col in ["compound_name", "compound_key", "curated", "removed"]:
@@ -441,12 +345,14 @@ def _enrich_by_pairs(
 ) -> pd.DataFrame:
     """Обогатить DataFrame activity через пары (molecule_chembl_id, document_chembl_id)."""
     # Нормализация ключей до сборки пар: upper, strip
-    pairs_df = df_act[["molecule_chembl_id", "document_chembl_id"]].astype("string").copy()
-    for column in pairs_df.columns:
-        pairs_df[column] = pairs_df[column].str.strip().str.upper()
-    pairs_df = pairs_df.dropna()  # pyright: ignore[reportUnknownMemberType]
-    pairs_df = pairs_df.drop_duplicates()
-    pairs: set[tuple[str, str]] = set(map(tuple, pairs_df.to_numpy()))
+    pair_keys = pd.DataFrame(
+        {
+            column: lookup_keys(df_act[column], upper=True)
+            for column in ("molecule_chembl_id", "document_chembl_id")
+        },
+        index=df_act.index,
+    )
+    pairs: set[tuple[str, str]] = set(unique_keys(pair_keys))
 
     if not pairs:
         log.debug(LogEvents.ENRICHMENT_BY_PAIRS_SKIPPED_NO_VALID_PAIRS)
@@ -485,63 +391,12 @@ def _enrich_by_pairs(
         )
         return df_act
 
-    # Маппинг результата клиента
-    enrichment_data: list[dict[str, Any]] = []
-    pairs_found = 0
-    pairs_not_found = 0
-    for pair in pairs:
-        compound_record: dict[str, Any] | None = compound_records_dict.get(pair)
-        if compound_record:
-            record_mapping: Mapping[str, Any] = compound_record
-
-            compound_name_raw = _extract_first_present(
-                record_mapping,
-                _COMPOUND_FIELD_ALIASES.get("compound_name", ("compound_name",)),
-            )
-            compound_key_raw = _extract_first_present(
-                record_mapping,
-                _COMPOUND_FIELD_ALIASES.get("compound_key", ("compound_key",)),
-            )
-            curated_raw = _extract_first_present(
-                record_mapping,
-                _COMPOUND_FIELD_ALIASES.get("curated", ("curated",)),
-            )
-
-            compound_name = None
-            if compound_name_raw is not None:
-                name_str = str(compound_name_raw).strip()
-                compound_name = name_str if name_str else None
-
-            compound_key = None
-            if compound_key_raw is not None:
-                key_str = str(compound_key_raw).strip()
-                compound_key = key_str if key_str else None
-
-            curated = curated_raw if curated_raw is not None else None
-
-            pairs_found += 1
-            enrichment_data.append(
-                {
-                    "molecule_chembl_id": pair[0],
-                    "document_chembl_id": pair[1],
-                    "compound_name": compound_name,
-                    "compound_key": compound_key,
-                    "curated": curated,
-                    "removed": None,
-                }
-            )
-        else:
-            pairs_not_found += 1
-            enrichment_data.append(
-                {
-                    "molecule_chembl_id": pair[0],
-                    "document_chembl_id": pair[1],
-                    "compound_name": None,
-                    "compound_key": None,
-                    "curated": None,
-                    "removed": None,
-                }
-            )
+    # Маппинг результата клиента: только запрошенные пары с непустой записью
+    found_records = {
+        pair: record for pair in pairs if (record := compound_records_dict.get(pair))
+    }
+    pairs_found = len(found_records)
+    pairs_not_found = len(pairs) - pairs_found
 
     # Логирование результатов
     log.info(LogEvents.ENRICHMENT_BY_PAIRS_COMPLETE,
@@ -558,55 +413,23 @@ def _enrich_by_pairs(
             hint="Проверьте, что пары (molecule_chembl_id, document_chembl_id) существуют в ChEMBL API",
         )
 
-    if not enrichment_data:
-        log.debug(LogEvents.ENRICHMENT_BY_PAIRS_NO_RECORDS_FOUND)
-        return df_act
-
-    df_enrich = pd.DataFrame(enrichment_data)
-
-    # Нормализовать ключи в df_enrich для join (upper, strip)
-    df_enrich["molecule_chembl_id"] = (
-        df_enrich["molecule_chembl_id"].astype("string").str.strip().str.upper()
-    )
-    df_enrich["document_chembl_id"] = (
-        df_enrich["document_chembl_id"].astype("string").str.strip().str.upper()
+    lookup = lookup_frame(
+        found_records,
+        {
+            "compound_name": lambda record: _clean_text(
+                _extract_first_present(record, _COMPOUND_FIELD_ALIASES["compound_name"])
+            ),
+            "compound_key": lambda record: _clean_text(
+                _extract_first_present(record, _COMPOUND_FIELD_ALIASES["compound_key"])
+            ),
+            "curated": lambda record: _extract_first_present(
+                record, _COMPOUND_FIELD_ALIASES["curated"]
+            ),
+        },
     )
 
-    # Нормализовать ключи в df_act для join (upper, strip)
-    df_act["molecule_chembl_id_normalized"] = (
-        df_act["molecule_chembl_id"].astype("string").str.strip().str.upper()
-    )
-    df_act["document_chembl_id_normalized"] = (
-        df_act["document_chembl_id"].astype("string").str.strip().str.upper()
-    )
-
-    # Left-join обратно к df_act на нормализованные ключи
-    df_result = df_act.merge(
-        df_enrich,
-        left_on=["molecule_chembl_id_normalized", "document_chembl_id_normalized"],
-        right_on=["molecule_chembl_id", "document_chembl_id"],
-        how="left",
-        suffixes=("", "_enrich"),
-    )
-
-    # Удалить временные нормализованные колонки
-    df_result = df_result.drop(
-        columns=["molecule_chembl_id_normalized", "document_chembl_id_normalized"]
-    )
-
-    # Коалесценс после merge: *_enrich → базовые колонки
-    for col in ["compound_name", "compound_key", "curated"]:
-        if f"{col}_enrich" in df_result.columns:
-            if col not in df_result.columns:
-                df_result[col] = df_result[f"{col}_enrich"]
-            else:
-                df_result[col] = df_result[col].where(
-                    df_result[col].notna(),
-                    df_result[f"{col}_enrich"],
-                )
-            df_result = df_result.drop(columns=[f"{col}_enrich"])
-
-    return df_result
+    # Left-join обратно к df_act на нормализованные ключи; заполняются только пропуски
+    return merge_lookup(df_act, pair_keys, lookup, how="fill")
 
 
 def _enrich_by_record_id(
@@ -617,15 +440,10 @@ def _enrich_by_record_id(
 ) -> pd.DataFrame:
     """Обогатить DataFrame activity через record_id (fallback для строк без document_chembl_id)."""
     # Собрать уникальные record_id
-    record_ids: set[str] = set()
-    for _, row in df_act.iterrows():
-        rec = row.get("record_id")
-        if rec is not None and not pd.isna(rec):
-            rec_s = str(rec).strip()
-            if rec_s:
-                record_ids.add(rec_s)
-
-    if not record_ids:
+    record_keys = lookup_keys(df_act["record_id"])
+    unique_ids: list[str] = unique_keys(record_keys)
+
+    if not unique_ids:
         log.debug(LogEvents.ENRICHMENT_BY_RECORD_ID_SKIPPED_NO_VALID_IDS)
         return df_act
 
@@ -636,11 +454,10 @@ def _enrich_by_record_id(
 
     # Получить compound_record по record_id
     log.info(LogEvents.ENRICHMENT_FETCHING_COMPOUND_RECORDS_BY_RECORD_ID,
-        record_ids_count=len(record_ids),
+        record_ids_count=len(unique_ids),
     )
     compound_records_dict: dict[str, dict[str, Any]] = {}
     try:
-        unique_ids = list(record_ids)
         all_records: list[dict[str, Any]] = []
 
         # Обработка батчами по фильтру record_id__in
@@ -668,21 +485,17 @@ def _enrich_by_record_id(
                     exc_info=True,
                 )
 
-        # Построить словарь по record_id
+        # Построить словарь по record_id (первая запись при дубликатах)
         for record in all_records:
             rid_raw = record.get("record_id")
             if rid_raw is None:
                 continue
             rid_str = str(rid_raw).strip()
             if rid_str and rid_str not in compound_records_dict:
-                compound_records_dict[rid_str] = {
-                    "record_id": rid_str,
-                    "compound_key": record.get("compound_key"),
-                    "compound_name": record.get("compound_name"),
-                }
+                compound_records_dict[rid_str] = record
     except Exception as exc:
         log.warning(LogEvents.ENRICHMENT_FETCH_ERROR_BY_RECORD_ID,
-            record_ids_count=len(record_ids),
+            record_ids_count=len(unique_ids),
             error=str(exc),
             exc_info=True,
         )
@@ -692,53 +505,9 @@ def _enrich_by_record_id(
         log.debug(LogEvents.ENRICHMENT_BY_RECORD_ID_NO_RECORDS_FOUND)
         return df_act
 
-    # Создать DataFrame для join
-    compound_data: list[dict[str, Any]] = []
-    for record_id, record in compound_records_dict.items():
-        compound_data.append(
-            {
-                "record_id": record_id,
-                "compound_key": record.get("compound_key"),
-                "compound_name": record.get("compound_name"),
-            }
-        )
-
-    df_compound = (
-        pd.DataFrame(compound_data)
-        if compound_data
-        else pd.DataFrame(columns=["record_id", "compound_key", "compound_name"])
-    )
-
-    # Нормализовать record_id в df_act для join
-    df_act_normalized = df_act.copy()
-    if "record_id" in df_act_normalized.columns:
-        mask_na = df_act_normalized["record_id"].isna()
-        df_act_normalized["record_id"] = df_act_normalized["record_id"].astype(str)
-        df_act_normalized.loc[df_act_normalized["record_id"] == "nan", "record_id"] = pd.NA
-        df_act_normalized.loc[mask_na, "record_id"] = pd.NA
-        if "record_id" in df_compound.columns and not df_compound.empty:
-            df_compound["record_id"] = df_compound["record_id"].astype(str)
-            df_compound.loc[df_compound["record_id"] == "nan", "record_id"] = pd.NA
-
-    # Left-join по record_id
-    df_result = df_act_normalized.merge(
-        df_compound,
-        on=["record_id"],
-        how="left",
-        suffixes=("", "_compound"),
-    )
-
-    # Коалесценс после merge: *_compound → базовые колонки
-    for col in ["compound_name", "compound_key"]:
-        if f"{col}_compound" in df_result.columns:
-            if col not in df_result.columns:
-                df_result[col] = df_result[f"{col}_compound"]
-            else:
-                df_result[col] = df_result[col].where(
-                    df_result[col].notna(),
-                    df_result[f"{col}_compound"],
-                )
-            df_result = df_result.drop(columns=[f"{col}_compound"])
+    # Left-join по нормализованному record_id; заполняются только пропуски
+    lookup = lookup_frame(compound_records_dict, ("compound_name", "compound_key"))
+    df_result = merge_lookup(df_act, record_keys, lookup, how="fill")
 
     # Добавить curated и removed (всегда None для этого пути)
     if "curated" not in df_result.columns:
@@ -789,19 +558,8 @@ def enrich_with_data_validity(
         return DATA_VALIDITY_ENRICHMENT_SCHEMA.validate(df_act, lazy=True)
 
     # Собрать уникальные data_validity_comment, dropna
-    validity_comments: list[str] = []
-    for _, row in df_act.iterrows():
-        comment = row.get("data_validity_comment")
-
-        # Пропускаем NaN/None значения
-        if pd.isna(comment) or comment is None:
-            continue
-
-        # Преобразуем в строку
-        comment_str = str(comment).strip()
-
-        if comment_str:
-            validity_comments.append(comment_str)
+    comment_keys = lookup_keys(df_act["data_validity_comment"])
+    validity_comments: list[str] = unique_keys(comment_keys)
 
     if not validity_comments:
         log.debug(LogEvents.ENRICHMENT_SKIPPED_NO_VALID_COMMENTS)
@@ -812,55 +570,16 @@ def enrich_with_data_validity(
     page_limit = cfg.get("page_limit", 1000)
 
     # Вызвать client.fetch_data_validity_lookup
-    log.info(LogEvents.ENRICHMENT_FETCHING_DATA_VALIDITY, comments_count=len(set(validity_comments)))
+    log.info(LogEvents.ENRICHMENT_FETCHING_DATA_VALIDITY, comments_count=len(validity_comments))
     records_dict = client.fetch_data_validity_lookup(
         comments=validity_comments,
         fields=list(fields),
         page_limit=page_limit,
     )
 
-    # Создать DataFrame для join
-    enrichment_data: list[dict[str, Any]] = []
-    for comment in set(validity_comments):
-        record = records_dict.get(comment)
-        if record:
-            enrichment_data.append(
-                {
-                    "data_validity_comment": comment,
-                    "data_validity_description": record.get("description"),
-                }
-            )
-        else:
-            # Если запись не найдена, оставляем description как NULL
-            enrichment_data.append(
-                {
-                    "data_validity_comment": comment,
-                    "data_validity_description": None,
-                }
-            )
-
-    if not enrichment_data:
-        log.debug(LogEvents.ENRICHMENT_NO_RECORDS_FOUND)
-        return DATA_VALIDITY_ENRICHMENT_SCHEMA.validate(df_act, lazy=True)
-
-    df_enrich = pd.DataFrame(enrichment_data)
-
-    # Left-join обратно к df_act на data_validity_comment
-    # Сохраняем исходный порядок строк через индекс
-    original_index = df_act.index.copy()
-    df_result = df_act.merge(
-        df_enrich,
-        on=["data_validity_comment"],
-        how="left",
-        suffixes=("", "_enrich"),
-    )
-
-    # Убедиться, что колонка присутствует (заполнить NA для отсутствующих)
-    if "data_validity_description" not in df_result.columns:
-        df_result["data_validity_description"] = pd.NA
-
-    # Восстановить исходный порядок
-    df_result = df_result.reindex(original_index)
+    # Left-join обратно к df_act на data_validity_comment (порядок строк сохраняется)
+    lookup = lookup_frame(records_dict, {"data_validity_description": "description"})
+    df_result = merge_lookup(df_act, comment_keys, lookup, how="fill")
 
     # Если комментарий присутствует, но описание отсутствует, используем комментарий как описание
     comment_series = df_result["data_validity_comment"].astype("string")
@@ -0,0 +1,183 @@
+"""Activity-specific QC rows for the quality report.
+
+Foreign-key integrity and ``standard_type``/``standard_units`` distributions
+are additive counts, so the same rows are produced from a whole dataframe and
+from a stream of chunks.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from bioetl.core.hashing import hash_frame_rows
+from bioetl.core.streaming import ExternalDistinctCounter
+from bioetl.qc.incremental import IncrementalQCAccumulator
+from bioetl.qc.metrics import duplicate_stats_from_counts
+from bioetl.qc.report import quality_report_from_stats
+
+__all__ = [
+    "ACTIVITY_REPORT_KEY",
+    "DISTRIBUTION_METRICS",
+    "FOREIGN_KEY_FIELDS",
+    "ActivityQCAccumulator",
+    "ActivityQCCounts",
+    "append_activity_rows",
+]
+
+ACTIVITY_REPORT_KEY: tuple[str, ...] = ("activity_id",)
+"""Business key of the duplicate summary in the activity quality report."""
+
+FOREIGN_KEY_FIELDS: tuple[str, ...] = (
+    "assay_chembl_id",
+    "molecule_chembl_id",
+    "target_chembl_id",
+    "document_chembl_id",
+)
+"""Columns whose values must be ChEMBL identifiers."""
+
+DISTRIBUTION_METRICS: Mapping[str, str] = {
+    "standard_type": "standard_type_count",
+    "standard_units": "standard_units_count",
+}
+"""Column → metric name of the value distributions in the report."""
+
+_CHEMBL_ID_PATTERN = r"^CHEMBL\d+$"
+
+
+class ActivityQCCounts:
+    """Additive counts behind the activity-specific quality report rows."""
+
+    def __init__(self) -> None:
+        self._foreign_keys: dict[str, list[int]] = {}
+        self._distributions: dict[str, dict[str, int]] = {}
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Fold ``df`` into the accumulated counts."""
+
+        for field in FOREIGN_KEY_FIELDS:
+            if field not in df.columns:
+                continue
+            mask = df[field].notna()
+            total_count = int(mask.sum())
+            if total_count == 0:
+                continue
+            matches = df[field].astype(str).str.match(_CHEMBL_ID_PATTERN, na=False)
+            counts = self._foreign_keys.setdefault(field, [0, 0])
+            counts[0] += int((mask & matches).sum())
+            counts[1] += total_count
+
+        for column in DISTRIBUTION_METRICS:
+            if column not in df.columns:
+                continue
+            counts_by_value = self._distributions.setdefault(column, defaultdict(int))
+            for value, count in df[column].value_counts(sort=False).items():
+                counts_by_value[str(value)] += int(count)
+
+    def rows(self) -> list[dict[str, Any]]:
+        """Return the foreign-key and distribution rows of the quality report.
+
+        Distribution rows are ordered by descending count, ties by value.
+        """
+
+        rows: list[dict[str, Any]] = []
+        for field in FOREIGN_KEY_FIELDS:
+            if field not in self._foreign_keys:
+                continue
+            valid_count, total_count = self._foreign_keys[field]
+            rows.append(
+                {
+                    "section": "foreign_key",
+                    "metric": "integrity_ratio",
+                    "column": field,
+                    "value": float(valid_count / total_count),
+                    "valid_count": valid_count,
+                    "invalid_count": total_count - valid_count,
+                    "total_count": total_count,
+                }
+            )
+
+        for column, metric in DISTRIBUTION_METRICS.items():
+            counts_by_value = self._distributions.get(column, {})
+            for value, count in sorted(
+                counts_by_value.items(), key=lambda item: (-item[1], item[0])
+            ):
+                rows.append(
+                    {
+                        "section": "distribution",
+                        "metric": metric,
+                        "column": column,
+                        "value": value,
+                        "count": count,
+                    }
+                )
+        return rows
+
+
+def append_activity_rows(base_report: pd.DataFrame, counts: ActivityQCCounts) -> pd.DataFrame:
+    """Return ``base_report`` followed by the activity-specific rows of ``counts``."""
+
+    records: Iterable[Mapping[Any, Any]] = (
+        base_report.to_dict("records")  # pyright: ignore[reportUnknownMemberType]
+        if not base_report.empty
+        else []
+    )
+    rows = [{str(key): value for key, value in record.items()} for record in records]
+    return pd.DataFrame([*rows, *counts.rows()])
+
+
+class ActivityQCAccumulator(IncrementalQCAccumulator):
+    """Streaming counterpart of the activity pipeline's quality report.
+
+    Duplicates in the quality report are counted by ``activity_id`` (the whole
+    row when the column is absent), while the QC metrics payload keeps the
+    configured business key, as in the in-memory run.
+    """
+
+    def __init__(
+        self,
+        spill_directory: Path,
+        *,
+        business_key_fields: Sequence[str] | None = None,
+        track_correlation: bool = True,
+    ) -> None:
+        super().__init__(
+            spill_directory,
+            business_key_fields=business_key_fields,
+            track_correlation=track_correlation,
+        )
+        self._report_identities = ExternalDistinctCounter(
+            Path(spill_directory) / "report_identities"
+        )
+        self._activity_counts = ActivityQCCounts()
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Fold ``df`` into the accumulated statistics."""
+
+        if df.empty:
+            return
+        if all(column in df.columns for column in ACTIVITY_REPORT_KEY):
+            fields = list(ACTIVITY_REPORT_KEY)
+        else:
+            fields = sorted(str(column) for column in df.columns)
+        self._report_identities.add(pd.Series(hash_frame_rows(df, fields), dtype="object"))
+        self._activity_counts.update(df)
+        super().update(df)
+
+    def quality_report(self) -> pd.DataFrame:
+        """Return the activity quality report for all accumulated rows."""
+
+        base_report = quality_report_from_stats(
+            duplicates=duplicate_stats_from_counts(
+                row_count=self.row_count, deduplicated_count=self._report_identities.count()
+            ),
+            missing=self.missingness(),
+            units_distribution=self.units_distribution(),
+            relation_distribution=self.relation_distribution(),
+            outliers={},
+        )
+        return append_activity_rows(base_report, self._activity_counts)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 import re
 import time
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from dataclasses import field as dataclass_field
 from datetime import datetime, timezone
+from functools import partial
+from itertools import chain
 from pathlib import Path
 from typing import Any, cast
 from urllib.parse import urlparse
@@ -17,9 +20,13 @@ import pandera.errors
 from requests.exceptions import RequestException
 
 from bioetl.clients.chembl import ChemblClient
+from bioetl.clients.client_chembl_base import group_records_by_id
 from bioetl.config import ActivitySourceConfig, PipelineConfig
 from bioetl.core import UnifiedLogger
 from bioetl.core.api_client import CircuitBreakerOpenError, UnifiedAPIClient
+from bioetl.core.concurrency import bounded_ordered_map, resolve_worker_count
+from bioetl.core.enrichment import EnrichmentStage
+from bioetl.core.frame import lookup_frame, lookup_keys, merge_lookup, unique_keys
 from bioetl.core.normalizers import (
     IdentifierRule,
     StringNormalizationConfig,
@@ -27,7 +34,10 @@ from bioetl.core.normalizers import (
     normalize_identifier_columns,
     normalize_string_columns_with_config,
 )
+from bioetl.core.record_cache import RecordCache
+from bioetl.core.streaming import batch_records
 from bioetl.pipelines.common.validation import format_failure_cases, summarize_schema_errors
+from bioetl.qc.incremental import IncrementalQCAccumulator
 from bioetl.qc.report import build_quality_report as build_default_quality_report
 from bioetl.schemas.activity import (
     ACTIVITY_PROPERTY_KEYS,
@@ -38,7 +48,6 @@ from bioetl.schemas.activity import (
 )
 from bioetl.schemas.vocab import required_vocab_ids
 
-from ..base import RunResult
 from ..chembl_base import CHEMBL_PIPELINE_EXTRACT_DOCSTRING, ChemblPipelineBase
 from .activity_enrichment import (
     enrich_with_assay,
@@ -46,6 +55,18 @@ from .activity_enrichment import (
     enrich_with_data_validity,
 )
 from .join_molecule import join_activity_with_molecule
+from .measurements import (
+    normalize_measurement_values,
+    normalize_relations,
+    normalize_units,
+    strip_values,
+)
+from .quality import (
+    ACTIVITY_REPORT_KEY,
+    ActivityQCAccumulator,
+    ActivityQCCounts,
+    append_activity_rows,
+)
 
 API_ACTIVITY_FIELDS: tuple[str, ...] = (
     "activity_id",
@@ -96,6 +117,68 @@ API_ACTIVITY_FIELDS: tuple[str, ...] = (
     "curated_by",  # Для вычисления curated: (curated_by IS NOT NULL) -> bool
 )
 
+_ACTIVITY_CACHE_NAMESPACE = "/activity.json#activity_id__in"
+
+_MEASUREMENT_VALUE_COLUMNS: tuple[str, ...] = (
+    "standard_value",
+    "standard_upper_value",
+    "upper_value",
+    "lower_value",
+)
+_MEASUREMENT_RELATION_COLUMNS: tuple[str, ...] = ("standard_relation", "relation")
+
+
+@dataclass(slots=True)
+class _ActivityBatchOutcome:
+    """Records and counters produced by a single ``activity_id__in`` batch."""
+
+    records: list[dict[str, Any]] = dataclass_field(default_factory=list)
+    success: int = 0
+    fallback: int = 0
+    errors: int = 0
+    api_calls: int = 0
+    cache_hits: int = 0
+
+
+# Колонки, которые читает (input) и заполняет (output) каждая стадия обогащения.
+# Стадии получают только свои входные колонки, а не копию всего фрейма.
+_ENRICHMENT_STAGE_COLUMNS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "compound_record": (
+        (
+            "molecule_chembl_id",
+            "document_chembl_id",
+            "record_id",
+            "compound_name",
+            "compound_key",
+            "curated",
+            "removed",
+        ),
+        ("compound_name", "compound_key", "curated", "removed"),
+    ),
+    "assay": (
+        ("assay_chembl_id", "assay_organism", "assay_tax_id"),
+        ("assay_organism", "assay_tax_id"),
+    ),
+    "molecule": (
+        ("activity_id", "record_id", "molecule_chembl_id", "molecule_pref_name"),
+        ("molecule_pref_name",),
+    ),
+    "data_validity": (
+        ("data_validity_comment", "data_validity_description"),
+        ("data_validity_description",),
+    ),
+}
+
+
+def _enrich_column_subset(
+    enrich: Callable[[pd.DataFrame], pd.DataFrame],
+    columns: Sequence[str],
+    df: pd.DataFrame,
+) -> pd.DataFrame:
+    """Run ``enrich`` on the ``columns`` of ``df`` that are present."""
+
+    return enrich(df[[column for column in columns if column in df.columns]])
+
 
 class ChemblActivityPipeline(ChemblPipelineBase):
     """ETL pipeline extracting activity records from the ChEMBL API."""
@@ -105,6 +188,7 @@ class ChemblActivityPipeline(ChemblPipelineBase):
     def __init__(self, config: PipelineConfig, run_id: str) -> None:
         super().__init__(config, run_id)
         self._last_batch_extract_stats: dict[str, Any] | None = None
+        self._enrichment_api_client: UnifiedAPIClient | None = None
         self._required_vocab_ids: Callable[[str], Iterable[str]] = required_vocab_ids
 
     def extract(self, *args: object, **kwargs: object) -> pd.DataFrame:
@@ -139,6 +223,43 @@ class ChemblActivityPipeline(ChemblPipelineBase):
         log = UnifiedLogger.get(__name__).bind(component=f"{self.pipeline_code}.extract")
         stage_start = time.perf_counter()
 
+        records: list[dict[str, Any]] = []
+        pages = 0
+        for page_items in self._iter_activity_pages(log):
+            records.extend(page_items)
+            pages += 1
+
+        dataframe = self._finish_activity_listing(records, self._lookup_chembl_client(), log)
+
+        duration_ms = (time.perf_counter() - stage_start) * 1000.0
+        log.info(
+            "chembl_activity.extract_summary",
+            rows=int(dataframe.shape[0]),
+            duration_ms=duration_ms,
+            chembl_release=self.chembl_release,
+            pages=pages,
+        )
+        return dataframe
+
+    def extract_all_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yield all activity records page batch by page batch.
+
+        Pages are requested as the batches of ``runtime.chunk_rows`` records are
+        consumed, so the full listing is never held in memory.
+        """
+
+        log = UnifiedLogger.get(__name__).bind(component=f"{self.pipeline_code}.extract")
+        lookup_client: ChemblClient | None = None
+        records = chain.from_iterable(self._iter_activity_pages(log))
+        for batch in batch_records(records, self.config.runtime.chunk_rows):
+            if lookup_client is None:
+                # The listing has fetched the release by the time a batch arrives.
+                lookup_client = self._lookup_chembl_client()
+            yield self._finish_activity_listing(batch, lookup_client, log)
+
+    def _iter_activity_pages(self, log: Any) -> Iterator[list[dict[str, Any]]]:
+        """Yield the processed items of the ``/activity.json`` listing page by page."""
+
         source_raw = self._resolve_source_config("chembl")
         source_config = ActivitySourceConfig.from_source(source_raw)
         client, base_url = self.prepare_chembl_client(
@@ -158,12 +279,6 @@ class ChemblActivityPipeline(ChemblPipelineBase):
             select_fields = list(select_fields_tuple)
         else:
             select_fields = list(API_ACTIVITY_FIELDS)
-        records: list[dict[str, Any]] = []
-        next_endpoint: str | None = "/activity.json"
-        params: Mapping[str, Any] | None = {
-            "limit": page_size,
-            "only": ",".join(select_fields),
-        }
         parameters_dict = dict(sorted(parameters.items()))
         filters_payload: dict[str, Any] = {
             "mode": "all",
@@ -181,49 +296,43 @@ class ChemblActivityPipeline(ChemblPipelineBase):
             filters=compact_filters,
             requested_at_utc=datetime.now(timezone.utc),
         )
-        pages = 0
 
-        while next_endpoint:
-            page_start = time.perf_counter()
-            response = client.get(next_endpoint, params=params)
-            payload = self._coerce_mapping(response.json())
-            page_items = self._extract_page_items(payload)
-
-            # Process nested fields for each item
-            processed_items: list[dict[str, Any]] = []
-            for item in page_items:
-                processed_item = self._extract_nested_fields(dict(item))
-                processed_item = self._extract_activity_properties_fields(processed_item)
-                processed_items.append(processed_item)
-
-            if limit is not None:
-                remaining = max(limit - len(records), 0)
-                if remaining == 0:
-                    break
-                processed_items = processed_items[:remaining]
-
-            records.extend(processed_items)
-            pages += 1
-            page_duration_ms = (time.perf_counter() - page_start) * 1000.0
-            log.debug(
-                "chembl_activity.page_fetched",
-                endpoint=next_endpoint,
-                batch_size=len(processed_items),
-                total_records=len(records),
-                duration_ms=page_duration_ms,
-            )
+        yield from self.iter_listing_pages(
+            client,
+            "/activity.json",
+            base_url=base_url,
+            params={"limit": page_size, "only": ",".join(select_fields)},
+            limit=limit,
+            process_item=self._process_listing_item,
+        )
 
-            next_link = self._next_link(payload, base_url=base_url)
-            if not next_link or (limit is not None and len(records) >= limit):
-                break
-            # Log the next_link before using it for debugging
-            log.info(
-                "chembl_activity.next_link_resolved",
-                next_link=next_link,
-                base_url=base_url,
-            )
-            next_endpoint = next_link
-            params = None
+    def _process_listing_item(self, item: dict[str, Any]) -> dict[str, Any]:
+        """Flatten nested fields and activity properties of a listing item."""
+
+        processed_item = self._extract_nested_fields(item)
+        return self._extract_activity_properties_fields(processed_item)
+
+    def _lookup_chembl_client(self) -> ChemblClient:
+        """Return a ChEMBL client for the lookups completing listed records."""
+
+        client, _ = self.prepare_chembl_client("chembl", client_name="chembl_activity_client")
+        return ChemblClient(
+            client,
+            load_meta_store=self.load_meta_store,
+            job_id=self.run_id,
+            operator=self.pipeline_code,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
+        )
+
+    def _finish_activity_listing(
+        self,
+        records: Sequence[Mapping[str, Any]],
+        chembl_client: ChemblClient,
+        log: Any,
+    ) -> pd.DataFrame:
+        """Build the frame of listed ``records`` and complete their comment fields."""
 
         dataframe: pd.DataFrame = pd.DataFrame.from_records(records)  # pyright: ignore[reportUnknownMemberType]; type: ignore
         if dataframe.empty:
@@ -235,25 +344,10 @@ class ChemblActivityPipeline(ChemblPipelineBase):
         dataframe = self._ensure_comment_fields(dataframe, log)
 
         # Извлечение data_validity_description из DATA_VALIDITY_LOOKUP
-        chembl_client = ChemblClient(
-            client,
-            load_meta_store=self.load_meta_store,
-            job_id=self.run_id,
-            operator=self.pipeline_code,
-        )
         dataframe = self._extract_data_validity_descriptions(dataframe, chembl_client, log)
 
         # Логирование метрик заполненности
         self._log_validity_comments_metrics(dataframe, log)
-
-        duration_ms = (time.perf_counter() - stage_start) * 1000.0
-        log.info(
-            "chembl_activity.extract_summary",
-            rows=int(dataframe.shape[0]),
-            duration_ms=duration_ms,
-            chembl_release=self.chembl_release,
-            pages=pages,
-        )
         return dataframe
 
     def extract_by_ids(self, ids: Sequence[str]) -> pd.DataFrame:
@@ -325,6 +419,8 @@ class ChemblActivityPipeline(ChemblPipelineBase):
         """Transform raw activity data by normalizing measurements, identifiers, and data types."""
 
         log = UnifiedLogger.get(__name__).bind(component=f"{self.pipeline_code}.transform")
+        # Bind actor to logs of this and the following stages, including write
+        UnifiedLogger.bind(actor=self.actor)
 
         # According to documentation, transform should accept df: pd.DataFrame
         # df is already a pd.DataFrame, so we can use it directly
@@ -358,21 +454,8 @@ class ChemblActivityPipeline(ChemblPipelineBase):
         df = self._validate_foreign_keys(df, log)
         df = self._ensure_schema_columns(df, COLUMN_ORDER, log)
 
-        # Enrichment: compound_record fields
-        if self._should_enrich_compound_record():
-            df = self._enrich_compound_record(df)
-
-        # Enrichment: assay fields
-        if self._should_enrich_assay():
-            df = self._enrich_assay(df)
-
-        # Enrichment: molecule fields
-        if self._should_enrich_molecule():
-            df = self._enrich_molecule(df)
-
-        # Enrichment: data_validity fields
-        if self._should_enrich_data_validity():
-            df = self._enrich_data_validity(df)
+        # Enrichment: compound_record, assay, molecule и data_validity параллельно
+        df = self.execute_enrichment_stages(df)
 
         # Finalize identifier columns BEFORE ordering to ensure all required columns exist
         df = self._finalize_identifier_columns(df, log)
@@ -481,6 +564,66 @@ class ChemblActivityPipeline(ChemblPipelineBase):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def enrichment_stages(self) -> list[EnrichmentStage]:
+        """Return the enabled ChEMBL enrichment stages.
+
+        Each stage reads only columns of the base extract, so all of them run
+        in one concurrent wave and are merged into the frame in a single pass.
+        """
+
+        candidates: tuple[
+            tuple[str, Callable[[], bool], Callable[[pd.DataFrame], pd.DataFrame]], ...
+        ] = (
+            ("compound_record", self._should_enrich_compound_record, self._enrich_compound_record),
+            ("assay", self._should_enrich_assay, self._enrich_assay),
+            ("molecule", self._should_enrich_molecule, self._enrich_molecule),
+            ("data_validity", self._should_enrich_data_validity, self._enrich_data_validity),
+        )
+        stages: list[EnrichmentStage] = []
+        for name, enabled, enrich in candidates:
+            if not enabled():
+                continue
+            inputs, outputs = _ENRICHMENT_STAGE_COLUMNS[name]
+            stages.append(
+                EnrichmentStage(
+                    name=name,
+                    func=partial(_enrich_column_subset, enrich, inputs),
+                    columns=outputs,
+                )
+            )
+        if stages:
+            # Клиент создаётся и регистрируется до запуска стадий в потоках.
+            self._get_enrichment_api_client()
+        return stages
+
+    def _get_enrichment_api_client(self) -> UnifiedAPIClient:
+        """Return the ChEMBL API client shared by the enrichment stages."""
+
+        if self._enrichment_api_client is None:
+            source_raw = self._resolve_source_config("chembl")
+            source_config = ActivitySourceConfig.from_source(source_raw)
+            parameters = self._normalize_parameters(source_config.parameters)
+            base_url = self._resolve_base_url(parameters)
+            api_client = self._client_factory.for_source("chembl", base_url=base_url)
+            # Регистрируем клиент только если он еще не зарегистрирован
+            if "chembl_enrichment_client" not in self._registered_clients:
+                self.register_client("chembl_enrichment_client", api_client)
+            self._enrichment_api_client = api_client
+        return self._enrichment_api_client
+
+    def _enrichment_chembl_client(self) -> ChemblClient:
+        """Return a ChemblClient over the shared enrichment API client."""
+
+        return ChemblClient(
+            self._get_enrichment_api_client(),
+            load_meta_store=self.load_meta_store,
+            job_id=self.run_id,
+            operator=self.pipeline_code,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
+        )
+
     def _should_enrich_compound_record(self) -> bool:
         """Проверить, включено ли обогащение compound_record в конфиге."""
         if not self.config.chembl:
@@ -533,20 +676,7 @@ class ChemblActivityPipeline(ChemblPipelineBase):
             )
 
         # Создать или переиспользовать клиент ChEMBL
-        source_raw = self._resolve_source_config("chembl")
-        source_config = ActivitySourceConfig.from_source(source_raw)
-        parameters = self._normalize_parameters(source_config.parameters)
-        base_url = self._resolve_base_url(parameters)
-        api_client = self._client_factory.for_source("chembl", base_url=base_url)
-        # Регистрируем клиент только если он еще не зарегистрирован
-        if "chembl_enrichment_client" not in self._registered_clients:
-            self.register_client("chembl_enrichment_client", api_client)
-        chembl_client = ChemblClient(
-            api_client,
-            load_meta_store=self.load_meta_store,
-            job_id=self.run_id,
-            operator=self.pipeline_code,
-        )
+        chembl_client = self._enrichment_chembl_client()
 
         # Вызвать функцию обогащения
         return enrich_with_compound_record(df, chembl_client, enrich_cfg)
@@ -601,20 +731,7 @@ class ChemblActivityPipeline(ChemblPipelineBase):
             )
 
         # Создать или переиспользовать клиент ChEMBL
-        source_raw = self._resolve_source_config("chembl")
-        source_config = ActivitySourceConfig.from_source(source_raw)
-        parameters = self._normalize_parameters(source_config.parameters)
-        base_url = self._resolve_base_url(parameters)
-        api_client = self._client_factory.for_source("chembl", base_url=base_url)
-        # Регистрируем клиент только если он еще не зарегистрирован
-        if "chembl_enrichment_client" not in self._registered_clients:
-            self.register_client("chembl_enrichment_client", api_client)
-        chembl_client = ChemblClient(
-            api_client,
-            load_meta_store=self.load_meta_store,
-            job_id=self.run_id,
-            operator=self.pipeline_code,
-        )
+        chembl_client = self._enrichment_chembl_client()
 
         # Вызвать функцию обогащения
         return enrich_with_assay(df, chembl_client, enrich_cfg)
@@ -680,20 +797,7 @@ class ChemblActivityPipeline(ChemblPipelineBase):
                 )
 
         # Создать или переиспользовать клиент ChEMBL
-        source_raw = self._resolve_source_config("chembl")
-        source_config = ActivitySourceConfig.from_source(source_raw)
-        parameters = self._normalize_parameters(source_config.parameters)
-        base_url = self._resolve_base_url(parameters)
-        api_client = self._client_factory.for_source("chembl", base_url=base_url)
-        # Регистрируем клиент только если он еще не зарегистрирован
-        if "chembl_enrichment_client" not in self._registered_clients:
-            self.register_client("chembl_enrichment_client", api_client)
-        chembl_client = ChemblClient(
-            api_client,
-            load_meta_store=self.load_meta_store,
-            job_id=self.run_id,
-            operator=self.pipeline_code,
-        )
+        chembl_client = self._enrichment_chembl_client()
 
         # Вызвать функцию обогащения (может обновить/перезаписать данные из extract)
         return enrich_with_data_validity(df, chembl_client, enrich_cfg)
@@ -748,49 +852,31 @@ class ChemblActivityPipeline(ChemblPipelineBase):
             )
 
         # Создать или переиспользовать клиент ChEMBL
-        source_raw = self._resolve_source_config("chembl")
-        source_config = ActivitySourceConfig.from_source(source_raw)
-        parameters = self._normalize_parameters(source_config.parameters)
-        base_url = self._resolve_base_url(parameters)
-        api_client = self._client_factory.for_source("chembl", base_url=base_url)
-        # Регистрируем клиент только если он еще не зарегистрирован
-        if "chembl_enrichment_client" not in self._registered_clients:
-            self.register_client("chembl_enrichment_client", api_client)
-        chembl_client = ChemblClient(
-            api_client,
-            load_meta_store=self.load_meta_store,
-            job_id=self.run_id,
-            operator=self.pipeline_code,
-        )
+        chembl_client = self._enrichment_chembl_client()
 
         # Вызвать функцию join для получения molecule_name
         df_join = join_activity_with_molecule(df, chembl_client, enrich_cfg)
 
         # Коалесцировать molecule_name из join в molecule_pref_name если оно пусто
-        if "molecule_name" in df_join.columns:
-            if "molecule_pref_name" not in df.columns:
-                df["molecule_pref_name"] = pd.NA
-            # Заполнить molecule_pref_name из molecule_name где оно пусто
-            mask = df["molecule_pref_name"].isna() | (
-                df["molecule_pref_name"].astype("string").str.strip() == ""
-            )
+        if "molecule_pref_name" in df.columns:
+            pref_name = df["molecule_pref_name"]
+        else:
+            pref_name = pd.Series(pd.NA, index=df.index, dtype="object")
+        if "molecule_name" in df_join.columns and "activity_id" in df_join.columns:
+            mask = pref_name.isna() | (pref_name.astype("string").str.strip() == "")
             if mask.any():
-                # Merge по activity_id для получения molecule_name
-                df_merged = df.merge(
-                    df_join[["activity_id", "molecule_name"]],
-                    on="activity_id",
-                    how="left",
-                    suffixes=("", "_join"),
-                )
-                # Заполнить molecule_pref_name из molecule_name где оно пусто
-                df.loc[mask, "molecule_pref_name"] = df_merged.loc[mask, "molecule_name"]
+                # Lookup activity_id -> molecule_name вместо merge по всему фрейму
+                names_by_activity = df_join.drop_duplicates("activity_id").set_index(
+                    "activity_id"
+                )["molecule_name"]
+                pref_name = pref_name.mask(mask, df["activity_id"].map(names_by_activity))
                 log.info(
                     "molecule_pref_name_enriched",
                     rows_enriched=int(mask.sum()),
                     total_rows=len(df),
                 )
 
-        return df
+        return df.assign(molecule_pref_name=pref_name)
 
     def _extract_from_chembl(
         self,
@@ -880,6 +966,22 @@ class ChemblActivityPipeline(ChemblPipelineBase):
         effective_batch_size = batch_size or activity_source_config.batch_size
         effective_batch_size = max(min(int(effective_batch_size), 25), 1)
 
+        configured_fields = activity_source_config.parameters.select_fields
+        select_fields = list(configured_fields) if configured_fields else list(API_ACTIVITY_FIELDS)
+        batches = [
+            normalized_ids[index : index + effective_batch_size]
+            for index in range(0, len(normalized_ids), effective_batch_size)
+        ]
+        workers = resolve_worker_count(self.config.runtime.parallelism, len(batches))
+        log.debug(
+            "chembl_activity.batch_plan",
+            batches=len(batches),
+            batch_size=effective_batch_size,
+            workers=workers,
+        )
+
+        record_cache = self.get_record_cache() if self.chembl_release else None
+
         records: list[dict[str, Any]] = []
         success_count = 0
         fallback_count = 0
@@ -888,96 +990,23 @@ class ChemblActivityPipeline(ChemblPipelineBase):
         api_calls = 0
         total_batches = 0
 
-        for index in range(0, len(normalized_ids), effective_batch_size):
-            batch = normalized_ids[index : index + effective_batch_size]
-            batch_keys: list[str] = [key for _, key in batch]
-            batch_start = time.perf_counter()
-            try:
-                cached_records = self._check_cache(batch_keys, self.chembl_release)
-                from_cache = cached_records is not None
-                batch_records: dict[str, dict[str, Any]] = {}
-                if cached_records is not None:
-                    batch_records = cached_records
-                    cache_hits += len(batch_keys)
-                else:
-                    configured_fields = activity_source_config.parameters.select_fields
-                    select_fields = (
-                        list(configured_fields) if configured_fields else list(API_ACTIVITY_FIELDS)
-                    )
-                    params = {
-                        "activity_id__in": ",".join(batch_keys),
-                        "only": ",".join(select_fields),
-                    }
-                    response = client.get("/activity.json", params=params)
-                    api_calls += 1
-                    payload = self._coerce_mapping(response.json())
-                    for item in self._extract_page_items(payload):
-                        activity_value = item.get("activity_id")
-                        if activity_value is None:
-                            continue
-                        batch_records[str(activity_value)] = item
-                    self._store_cache(batch_keys, batch_records, self.chembl_release)
-
-                success_in_batch = 0
-                for numeric_id, key in batch:
-                    record = batch_records.get(key)
-                    if record and not record.get("error"):
-                        materialised = dict(record)
-                        materialised = self._extract_nested_fields(materialised)
-                        materialised = self._extract_activity_properties_fields(materialised)
-                        materialised.setdefault("activity_id", numeric_id)
-                        records.append(materialised)
-                        success_count += 1
-                        success_in_batch += 1
-                    else:
-                        fallback_record = self._create_fallback_record(numeric_id)
-                        records.append(fallback_record)
-                        fallback_count += 1
-                        error_count += 1
-                total_batches += 1
-                batch_duration_ms = (time.perf_counter() - batch_start) * 1000.0
-                log.debug(
-                    "chembl_activity.batch_processed",
-                    batch_size=len(batch_keys),
-                    from_cache=from_cache,
-                    success_in_batch=success_in_batch,
-                    fallback_in_batch=len(batch_keys) - success_in_batch,
-                    duration_ms=batch_duration_ms,
-                )
-            except CircuitBreakerOpenError as exc:
-                total_batches += 1
-                log.warning(
-                    "chembl_activity.batch_circuit_breaker",
-                    batch_size=len(batch_keys),
-                    error=str(exc),
-                )
-                for numeric_id, _ in batch:
-                    records.append(self._create_fallback_record(numeric_id, exc))
-                    fallback_count += 1
-                    error_count += 1
-            except RequestException as exc:
-                total_batches += 1
-                log.error(
-                    "chembl_activity.batch_request_error",
-                    batch_size=len(batch_keys),
-                    error=str(exc),
-                )
-                for numeric_id, _ in batch:
-                    records.append(self._create_fallback_record(numeric_id, exc))
-                    fallback_count += 1
-                    error_count += 1
-            except Exception as exc:  # pragma: no cover - defensive path
-                total_batches += 1
-                log.error(
-                    "chembl_activity.batch_unhandled_error",
-                    batch_size=len(batch_keys),
-                    error=str(exc),
-                    exc_info=True,
-                )
-                for numeric_id, _ in batch:
-                    records.append(self._create_fallback_record(numeric_id, exc))
-                    fallback_count += 1
-                    error_count += 1
+        # Batches are fetched concurrently but consumed in submission order so the
+        # assembled records (and therefore output hashes) do not depend on timing.
+        for outcome in bounded_ordered_map(
+            lambda batch: self._fetch_activity_batch(
+                batch, client, select_fields, log, record_cache=record_cache
+            ),
+            batches,
+            max_workers=workers,
+            thread_name_prefix="chembl_activity",
+        ):
+            records.extend(outcome.records)
+            success_count += outcome.success
+            fallback_count += outcome.fallback
+            error_count += outcome.errors
+            cache_hits += outcome.cache_hits
+            api_calls += outcome.api_calls
+            total_batches += 1
 
         duration_ms = (time.perf_counter() - method_start) * 1000.0
         total_records = len(normalized_ids)
@@ -1017,6 +1046,9 @@ class ChemblActivityPipeline(ChemblPipelineBase):
             load_meta_store=self.load_meta_store,
             job_id=self.run_id,
             operator=self.pipeline_code,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
         )
         dataframe = self._extract_data_validity_descriptions(dataframe, chembl_client, log)
 
@@ -1028,113 +1060,120 @@ class ChemblActivityPipeline(ChemblPipelineBase):
 
         return dataframe
 
-    def _check_cache(
+    def _fetch_activity_batch(
         self,
-        batch_ids: Sequence[str],
-        release: str | None,
-    ) -> dict[str, dict[str, Any]] | None:
-        cache_config = self.config.cache
-        if not cache_config.enabled:
-            return None
-
-        normalized_ids = [str(identifier) for identifier in batch_ids]
-        cache_file = self._cache_file_path(normalized_ids, release)
-        if not cache_file.exists():
-            return None
-
-        try:
-            stat = cache_file.stat()
-        except OSError:
-            return None
-
-        ttl_seconds = int(cache_config.ttl)
-        if ttl_seconds > 0 and (time.time() - stat.st_mtime) > ttl_seconds:
-            try:
-                cache_file.unlink(missing_ok=True)
-            except OSError:
-                pass
-            return None
+        batch: Sequence[tuple[int, str]],
+        client: UnifiedAPIClient,
+        select_fields: Sequence[str],
+        log: Any,
+        *,
+        record_cache: RecordCache | None = None,
+    ) -> _ActivityBatchOutcome:
+        """Fetch a single ``activity_id__in`` batch, falling back per record on errors.
+
+        IDs already present in ``record_cache`` are served locally and only the
+        remaining IDs are requested. The method is safe to call from worker
+        threads: rate limiting and the circuit breaker are enforced by the
+        shared ``client``.
+        """
 
+        outcome = _ActivityBatchOutcome()
+        batch_keys: list[str] = [key for _, key in batch]
+        batch_start = time.perf_counter()
         try:
-            payload = json.loads(cache_file.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            try:
-                cache_file.unlink(missing_ok=True)
-            except OSError:
-                pass
-            return None
-
-        if not isinstance(payload, dict):
-            return None
-
-        missing = [identifier for identifier in normalized_ids if identifier not in payload]
-        if missing:
-            return None
-
-        return {
-            identifier: cast(dict[str, Any], payload[identifier]) for identifier in normalized_ids
-        }
-
-    def _store_cache(
-        self,
-        batch_ids: Sequence[str],
-        batch_data: Mapping[str, Mapping[str, Any]],
-        release: str | None,
-    ) -> None:
-        cache_config = self.config.cache
-        if not cache_config.enabled or not batch_ids or not batch_data:
-            return
-
-        normalized_ids = [str(identifier) for identifier in batch_ids]
-        cache_file = self._cache_file_path(normalized_ids, release)
-        normalized_set = set(normalized_ids)
-        data_to_store = {key: batch_data[key] for key in normalized_set if key in batch_data}
-        if not data_to_store:
-            return
+            batch_records: dict[str, dict[str, Any]] = {}
+            missing_keys: list[str] = batch_keys
+            if record_cache is not None:
+                cached = record_cache.get_many(
+                    _ACTIVITY_CACHE_NAMESPACE,
+                    batch_keys,
+                    release=self.chembl_release,
+                    fields=select_fields,
+                )
+                for key, cached_records in cached.items():
+                    if cached_records:
+                        batch_records[key] = cast(dict[str, Any], cached_records[0])
+                outcome.cache_hits += len(cached)
+                missing_keys = [key for key in batch_keys if key not in cached]
+
+            if missing_keys:
+                params = {
+                    "activity_id__in": ",".join(missing_keys),
+                    "only": ",".join(select_fields),
+                }
+                response = client.get("/activity.json", params=params)
+                outcome.api_calls += 1
+                payload = self._coerce_mapping(response.json())
+                fetched: list[dict[str, Any]] = []
+                for item in self._extract_page_items(payload):
+                    activity_value = item.get("activity_id")
+                    if activity_value is None:
+                        continue
+                    batch_records[str(activity_value)] = item
+                    fetched.append(item)
+                if record_cache is not None:
+                    record_cache.put_many(
+                        _ACTIVITY_CACHE_NAMESPACE,
+                        group_records_by_id(fetched, "activity_id", missing_keys),
+                        release=self.chembl_release,
+                        fields=select_fields,
+                    )
 
-        try:
-            cache_file.parent.mkdir(parents=True, exist_ok=True)
-            tmp_path = cache_file.with_suffix(cache_file.suffix + ".tmp")
-            tmp_path.write_text(
-                json.dumps(data_to_store, sort_keys=True, default=str),
-                encoding="utf-8",
+            success_in_batch = 0
+            for numeric_id, key in batch:
+                record = batch_records.get(key)
+                if record and not record.get("error"):
+                    materialised = dict(record)
+                    materialised = self._extract_nested_fields(materialised)
+                    materialised = self._extract_activity_properties_fields(materialised)
+                    materialised.setdefault("activity_id", numeric_id)
+                    outcome.records.append(materialised)
+                    outcome.success += 1
+                    success_in_batch += 1
+                else:
+                    outcome.records.append(self._create_fallback_record(numeric_id))
+                    outcome.fallback += 1
+                    outcome.errors += 1
+            batch_duration_ms = (time.perf_counter() - batch_start) * 1000.0
+            log.debug(
+                "chembl_activity.batch_processed",
+                batch_size=len(batch_keys),
+                cache_hits=len(batch_keys) - len(missing_keys),
+                success_in_batch=success_in_batch,
+                fallback_in_batch=len(batch_keys) - success_in_batch,
+                duration_ms=batch_duration_ms,
             )
-            tmp_path.replace(cache_file)
-        except Exception as exc:  # pragma: no cover - cache best-effort
-            log = UnifiedLogger.get(__name__).bind(component=f"{self.pipeline_code}.extract")
-            log.debug("chembl_activity.cache_store_failed", error=str(exc))
-
-    def _cache_file_path(self, batch_ids: Sequence[str], release: str | None) -> Path:
-        directory = self._cache_directory(release)
-        cache_key = self._cache_key(batch_ids, release)
-        return directory / f"{cache_key}.json"
-
-    def _cache_directory(self, release: str | None) -> Path:
-        cache_root = Path(self.config.paths.cache_root)
-        directory_name = (self.config.cache.directory or "http_cache").strip() or "http_cache"
-        release_component = self._sanitize_cache_component(release or "unknown")
-        pipeline_component = self._sanitize_cache_component(self.pipeline_code)
-        version_component = self._sanitize_cache_component(
-            self.config.pipeline.version or "unknown"
-        )
-        return (
-            cache_root / directory_name / pipeline_component / release_component / version_component
-        )
-
-    def _cache_key(self, batch_ids: Sequence[str], release: str | None) -> str:
-        payload = {
-            "ids": list(batch_ids),
-            "release": release or "unknown",
-            "pipeline": self.pipeline_code,
-            "pipeline_version": self.config.pipeline.version or "unknown",
-        }
-        raw = json.dumps(payload, sort_keys=True)
-        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+            return outcome
+        except CircuitBreakerOpenError as exc:
+            log.warning(
+                "chembl_activity.batch_circuit_breaker",
+                batch_size=len(batch_keys),
+                error=str(exc),
+            )
+            failure: Exception = exc
+        except RequestException as exc:
+            log.error(
+                "chembl_activity.batch_request_error",
+                batch_size=len(batch_keys),
+                error=str(exc),
+            )
+            failure = exc
+        except Exception as exc:  # pragma: no cover - defensive path
+            log.error(
+                "chembl_activity.batch_unhandled_error",
+                batch_size=len(batch_keys),
+                error=str(exc),
+                exc_info=True,
+            )
+            failure = exc
 
-    @staticmethod
-    def _sanitize_cache_component(value: str) -> str:
-        sanitized = re.sub(r"[^0-9A-Za-z_.-]", "_", value)
-        return sanitized or "default"
+        # Discard partial progress so a failed batch is reported uniformly.
+        outcome = _ActivityBatchOutcome(api_calls=outcome.api_calls)
+        for numeric_id, _ in batch:
+            outcome.records.append(self._create_fallback_record(numeric_id, failure))
+            outcome.fallback += 1
+            outcome.errors += 1
+        return outcome
 
     def _create_fallback_record(
         self, activity_id: int, error: Exception | None = None
@@ -1245,21 +1284,10 @@ class ChemblActivityPipeline(ChemblPipelineBase):
             return df
 
         # Собрать уникальные непустые значения data_validity_comment
-        validity_comments: list[str] = []
-        for _, row in df.iterrows():
-            comment = row.get("data_validity_comment")
-
-            # Пропускаем NaN/None значения
-            if pd.isna(comment) or comment is None:
-                continue
-
-            # Преобразуем в строку
-            comment_str = str(comment).strip()
-
-            if comment_str:
-                validity_comments.append(comment_str)
+        comment_keys = lookup_keys(df["data_validity_comment"])
+        unique_comments: list[str] = unique_keys(comment_keys)
 
-        if not validity_comments:
+        if not unique_comments:
             log.debug("extract_data_validity_descriptions_skipped", reason="no_valid_comments")
             # Гарантируем наличие колонки с pd.NA
             if "data_validity_description" not in df.columns:
@@ -1267,7 +1295,6 @@ class ChemblActivityPipeline(ChemblPipelineBase):
             return df
 
         # Вызвать fetch_data_validity_lookup для получения descriptions
-        unique_comments = list(set(validity_comments))
         log.info("extract_data_validity_descriptions_fetching", comments_count=len(unique_comments))
 
         try:
@@ -1287,64 +1314,18 @@ class ChemblActivityPipeline(ChemblPipelineBase):
                 df["data_validity_description"] = pd.Series([pd.NA] * len(df), dtype="string")
             return df
 
-        # Создать DataFrame для join
-        enrichment_data: list[dict[str, Any]] = []
-        for comment in unique_comments:
-            record = records_dict.get(comment)
-            if record:
-                enrichment_data.append(
-                    {
-                        "data_validity_comment": comment,
-                        "data_validity_description": record.get("description"),
-                    }
-                )
-            else:
-                # Если запись не найдена, оставляем description как NULL
-                enrichment_data.append(
-                    {
-                        "data_validity_comment": comment,
-                        "data_validity_description": None,
-                    }
-                )
-
-        if not enrichment_data:
-            log.debug("extract_data_validity_descriptions_no_records")
-            # Гарантируем наличие колонки с pd.NA
-            if "data_validity_description" not in df.columns:
-                df["data_validity_description"] = pd.Series([pd.NA] * len(df), dtype="string")
-            return df
-
-        df_enrich = pd.DataFrame(enrichment_data)
-
-        # Сохранить исходный порядок строк через индекс
-        original_index = df.index.copy()
-
-        # LEFT JOIN обратно к df на data_validity_comment
-        df_result = df.merge(
-            df_enrich,
-            on=["data_validity_comment"],
-            how="left",
-            suffixes=("", "_enrich"),
+        # LEFT JOIN обратно к df на data_validity_comment (порядок строк сохраняется);
+        # описание из справочника заполняет только пропуски
+        lookup = lookup_frame(records_dict or {}, {"data_validity_description": "description"})
+        df_result = merge_lookup(df, comment_keys, lookup, how="fill")
+        df_result["data_validity_description"] = df_result["data_validity_description"].astype(
+            "string"
         )
 
-        # Убедиться, что колонка присутствует (заполнить NA для отсутствующих)
-        if "data_validity_description" not in df_result.columns:
-            df_result["data_validity_description"] = pd.Series(
-                [pd.NA] * len(df_result), dtype="string"
-            )
-        else:
-            # Если колонка уже была, нормализовать типы
-            df_result["data_validity_description"] = df_result["data_validity_description"].astype(
-                "string"
-            )
-
-        # Восстановить исходный порядок
-        df_result = df_result.reindex(original_index)
-
         log.info(
             "extract_data_validity_descriptions_complete",
             comments_requested=len(unique_comments),
-            records_fetched=len(enrichment_data),
+            records_fetched=len(lookup),
             rows_enriched=len(df_result),
         )
 
@@ -1383,22 +1364,11 @@ class ChemblActivityPipeline(ChemblPipelineBase):
                     df[col] = pd.Series([pd.NA] * len(df), dtype=dtype)
             return df
 
-        # Собрать уникальные непустые значения assay_chembl_id
-        assay_ids: list[str] = []
-        for _, row in df.iterrows():
-            assay_id = row.get("assay_chembl_id")
-
-            # Пропускаем NaN/None значения
-            if pd.isna(assay_id) or assay_id is None:
-                continue
-
-            # Преобразуем в строку и нормализуем
-            assay_id_str = str(assay_id).strip().upper()
-
-            if assay_id_str:
-                assay_ids.append(assay_id_str)
+        # Собрать уникальные непустые значения assay_chembl_id (strip, upper)
+        assay_keys = lookup_keys(df["assay_chembl_id"], upper=True)
+        unique_assay_ids: list[str] = unique_keys(assay_keys)
 
-        if not assay_ids:
+        if not unique_assay_ids:
             log.debug("extract_assay_fields_skipped", reason="no_valid_assay_ids")
             # Гарантируем наличие колонок с pd.NA
             for col, dtype in (("assay_organism", "string"), ("assay_tax_id", "Int64")):
@@ -1407,7 +1377,6 @@ class ChemblActivityPipeline(ChemblPipelineBase):
             return df
 
         # Вызвать fetch_assays_by_ids для получения assay данных
-        unique_assay_ids = list(set(assay_ids))
         log.info("extract_assay_fields_fetching", assay_ids_count=len(unique_assay_ids))
 
         try:
@@ -1428,82 +1397,10 @@ class ChemblActivityPipeline(ChemblPipelineBase):
                     df[col] = pd.Series([pd.NA] * len(df), dtype=dtype)
             return df
 
-        # Создать DataFrame для join
-        enrichment_data: list[dict[str, Any]] = []
-        for assay_id in unique_assay_ids:
-            record = records_dict.get(assay_id) if records_dict else None
-            if record:
-                enrichment_data.append(
-                    {
-                        "assay_chembl_id": assay_id,
-                        "assay_organism": record.get("assay_organism"),
-                        "assay_tax_id": record.get("assay_tax_id"),
-                    }
-                )
-            else:
-                # Если запись не найдена, оставляем значения как NULL
-                enrichment_data.append(
-                    {
-                        "assay_chembl_id": assay_id,
-                        "assay_organism": None,
-                        "assay_tax_id": None,
-                    }
-                )
-
-        if not enrichment_data:
-            log.debug("extract_assay_fields_no_records")
-            # Гарантируем наличие колонок с pd.NA
-            for col, dtype in (("assay_organism", "string"), ("assay_tax_id", "Int64")):
-                if col not in df.columns:
-                    df[col] = pd.Series([pd.NA] * len(df), dtype=dtype)
-            return df
-
-        df_enrich = pd.DataFrame(enrichment_data)
-
-        # Нормализовать assay_chembl_id в df_enrich для join (upper, strip)
-        df_enrich["assay_chembl_id"] = (
-            df_enrich["assay_chembl_id"].astype("string").str.strip().str.upper()
-        )
-
-        # Нормализовать assay_chembl_id в df для join (upper, strip)
-        original_index = df.index.copy()
-        df_normalized = df.copy()
-        df_normalized["assay_chembl_id_normalized"] = (
-            df_normalized["assay_chembl_id"].astype("string").str.strip().str.upper()
-        )
-
-        # LEFT JOIN обратно к df на assay_chembl_id
-        df_result = df_normalized.merge(
-            df_enrich,
-            left_on="assay_chembl_id_normalized",
-            right_on="assay_chembl_id",
-            how="left",
-            suffixes=("", "_enrich"),
-        )
-
-        # Удалить временную нормализованную колонку
-        df_result = df_result.drop(columns=["assay_chembl_id_normalized"])
-
-        # Коалесценс после merge: *_enrich → базовые колонки
-        for col in ["assay_organism", "assay_tax_id"]:
-            if f"{col}_enrich" in df_result.columns:
-                # Коалесценс: использовать значение из обогащения, если базовое значение NA
-                if col not in df_result.columns:
-                    df_result[col] = df_result[f"{col}_enrich"]
-                else:
-                    # Заменить NA значения значениями из _enrich
-                    base_series: pd.Series[Any] = df_result[col]
-                    enrich_series: pd.Series[Any] = df_result[f"{col}_enrich"]
-                    missing_mask = base_series.isna()
-                    if bool(missing_mask.any()):
-                        df_result.loc[missing_mask, col] = enrich_series.loc[missing_mask]
-                # Удалить колонку _enrich
-                df_result = df_result.drop(columns=[f"{col}_enrich"])
-
-        # Убедиться, что все новые колонки присутствуют (заполнить NA для отсутствующих)
-        for col, dtype in (("assay_organism", "string"), ("assay_tax_id", "Int64")):
-            if col not in df_result.columns:
-                df_result[col] = pd.Series([pd.NA] * len(df_result), dtype=dtype)
+        # LEFT JOIN обратно к df на нормализованный assay_chembl_id (порядок строк
+        # сохраняется); значения из ASSAYS заполняют только пропуски
+        lookup = lookup_frame(records_dict or {}, ("assay_organism", "assay_tax_id"))
+        df_result = merge_lookup(df, assay_keys, lookup, how="fill")
 
         # Приведение типов
         df_result["assay_organism"] = df_result["assay_organism"].astype("string")
@@ -1524,13 +1421,10 @@ class ChemblActivityPipeline(ChemblPipelineBase):
                 )
                 df_result.loc[invalid_mask, "assay_tax_id"] = pd.NA
 
-        # Восстановить исходный порядок
-        df_result = df_result.reindex(original_index)
-
         log.info(
             "extract_assay_fields_complete",
             assay_ids_requested=len(unique_assay_ids),
-            records_fetched=len(enrichment_data),
+            records_fetched=len(lookup),
             rows_enriched=len(df_result),
         )
 
@@ -2231,63 +2125,46 @@ class ChemblActivityPipeline(ChemblPipelineBase):
         return df
 
     def _normalize_measurements(self, df: pd.DataFrame, log: Any) -> pd.DataFrame:
-        """Normalize standard_value, standard_units, standard_relation, and standard_type."""
+        """Normalize standard_value, standard_units, standard_relation, and standard_type.
+
+        Each column is factorised and only its unique values are normalised
+        (see :mod:`.measurements`), so the cost scales with cardinality.
+        """
 
         df = df.copy()
         normalized_count = 0
 
-        if "standard_value" in df.columns:
-            mask = df["standard_value"].notna()
-            if mask.any():
-                # Remove non-numeric characters and handle ranges
-                # Convert to string first to handle non-numeric values
-                series = df.loc[mask, "standard_value"].astype(str).str.strip()
-
-                # Remove common non-numeric characters (spaces, commas, etc.)
-                series = series.str.replace(r"[,\s]", "", regex=True)
-
-                # Handle ranges (e.g., "10-20" -> take first value, "10±5" -> take first value)
-                # Extract first numeric value from ranges
-                series = series.str.extract(r"([+-]?\d*\.?\d+)", expand=False)
-
-                # Convert to numeric (NaN for empty/invalid values)
-                numeric_series_std: pd.Series[Any] = pd.to_numeric(  # pyright: ignore[reportUnknownMemberType]
-                    series, errors="coerce"
-                )
-                df.loc[mask, "standard_value"] = numeric_series_std
-
-                # Check for negative values (should be >= 0)
-                negative_mask = mask & (df["standard_value"] < 0)
-                if negative_mask.any():
-                    log.warning("negative_standard_value", count=int(negative_mask.sum()))
-                    df.loc[negative_mask, "standard_value"] = None
-
-                normalized_count += int(mask.sum())
-
-        if "standard_relation" in df.columns:
-            unicode_to_ascii = {
-                "≤": "<=",
-                "≥": ">=",
-                "≠": "~",
-            }
-            mask = df["standard_relation"].notna()
-            if mask.any():
-                series = df.loc[mask, "standard_relation"].astype(str).str.strip()
-                for unicode_char, ascii_repl in unicode_to_ascii.items():
-                    series = series.str.replace(unicode_char, ascii_repl, regex=False)
-                df.loc[mask, "standard_relation"] = series
-                invalid_mask = mask & ~df["standard_relation"].isin(RELATIONS)  # pyright: ignore[reportUnknownMemberType]
-                if invalid_mask.any():
-                    log.warning("invalid_standard_relation", count=int(invalid_mask.sum()))
-                    df.loc[invalid_mask, "standard_relation"] = None
-                normalized_count += int(mask.sum())
+        for column in _MEASUREMENT_VALUE_COLUMNS:
+            if column not in df.columns:
+                continue
+            mask = df[column].notna()
+            if not mask.any():
+                continue
+            # "10-20" -> 10, "1,000" -> 1000, нечисловые значения -> NaN
+            df.loc[mask, column] = normalize_measurement_values(df.loc[mask, column])
+            negative_mask = mask & (df[column] < 0)
+            if negative_mask.any():
+                log.warning(f"negative_{column}", count=int(negative_mask.sum()))
+                df.loc[negative_mask, column] = None
+            normalized_count += int(mask.sum())
+
+        for column in _MEASUREMENT_RELATION_COLUMNS:
+            if column not in df.columns:
+                continue
+            mask = df[column].notna()
+            if not mask.any():
+                continue
+            df.loc[mask, column] = normalize_relations(df.loc[mask, column])
+            invalid_mask = mask & ~df[column].isin(RELATIONS)  # pyright: ignore[reportUnknownMemberType]
+            if invalid_mask.any():
+                log.warning(f"invalid_{column}", count=int(invalid_mask.sum()))
+                df.loc[invalid_mask, column] = None
+            normalized_count += int(mask.sum())
 
         if "standard_type" in df.columns:
             mask = df["standard_type"].notna()
             if mask.any():
-                df.loc[mask, "standard_type"] = (
-                    df.loc[mask, "standard_type"].astype(str).str.strip()
-                )
+                df.loc[mask, "standard_type"] = strip_values(df.loc[mask, "standard_type"])
                 standard_types_set: set[str] = STANDARD_TYPES
                 invalid_mask = mask & ~df["standard_type"].isin(standard_types_set)  # pyright: ignore[reportUnknownMemberType]
                 if invalid_mask.any():
@@ -2296,104 +2173,10 @@ class ChemblActivityPipeline(ChemblPipelineBase):
                 normalized_count += int(mask.sum())
 
         if "standard_units" in df.columns:
-            # Normalize unit synonyms: nM, µM/μM, mM, %, ratio
-            # Map various representations to canonical forms while preserving unit types
-            unit_mapping = {
-                # nanomolar variants -> nM
-                "nanomolar": "nM",
-                "nmol": "nM",
-                "nm": "nM",
-                "NM": "nM",
-                # micromolar variants -> μM
-                "µM": "μM",
-                "uM": "μM",
-                "UM": "μM",
-                "micromolar": "μM",
-                "microM": "μM",
-                "umol": "μM",
-                # millimolar variants -> mM
-                "millimolar": "mM",
-                "milliM": "mM",
-                "mmol": "mM",
-                "MM": "mM",
-                # percentage variants -> %
-                "percent": "%",
-                "pct": "%",
-                # ratio variants -> ratio
-                "ratios": "ratio",
-            }
+            # Синонимы единиц (nM, μM, mM, %, ratio) из словарей activity_units/standard_units
             mask = df["standard_units"].notna()
             if mask.any():
-                series = df.loc[mask, "standard_units"].astype(str).str.strip()
-                for old_unit, new_unit in unit_mapping.items():
-                    series = series.str.replace(old_unit, new_unit, regex=False, case=False)
-                df.loc[mask, "standard_units"] = series
-                normalized_count += int(mask.sum())
-
-        if "relation" in df.columns:
-            unicode_to_ascii = {
-                "≤": "<=",
-                "≥": ">=",
-                "≠": "~",
-            }
-            mask = df["relation"].notna()
-            if mask.any():
-                series = df.loc[mask, "relation"].astype(str).str.strip()
-                for unicode_char, ascii_repl in unicode_to_ascii.items():
-                    series = series.str.replace(unicode_char, ascii_repl, regex=False)
-                df.loc[mask, "relation"] = series
-                invalid_mask = mask & ~df["relation"].isin(RELATIONS)  # pyright: ignore[reportUnknownMemberType]
-                if invalid_mask.any():
-                    log.warning("invalid_relation", count=int(invalid_mask.sum()))
-                    df.loc[invalid_mask, "relation"] = None
-                normalized_count += int(mask.sum())
-
-        if "standard_upper_value" in df.columns:
-            mask = df["standard_upper_value"].notna()
-            if mask.any():
-                series = df.loc[mask, "standard_upper_value"].astype(str).str.strip()
-                series = series.str.replace(r"[,\s]", "", regex=True)
-                series = series.str.extract(r"([+-]?\d*\.?\d+)", expand=False)
-                numeric_series_std_upper: pd.Series[Any] = pd.to_numeric(  # pyright: ignore[reportUnknownMemberType]
-                    series, errors="coerce"
-                )
-                df.loc[mask, "standard_upper_value"] = numeric_series_std_upper
-                negative_mask = mask & (df["standard_upper_value"] < 0)
-                if negative_mask.any():
-                    log.warning("negative_standard_upper_value", count=int(negative_mask.sum()))
-                    df.loc[negative_mask, "standard_upper_value"] = None
-                normalized_count += int(mask.sum())
-
-        if "upper_value" in df.columns:
-            mask = df["upper_value"].notna()
-            if mask.any():
-                series = df.loc[mask, "upper_value"].astype(str).str.strip()
-                series = series.str.replace(r"[,\s]", "", regex=True)
-                series = series.str.extract(r"([+-]?\d*\.?\d+)", expand=False)
-                numeric_series_upper: pd.Series[Any] = pd.to_numeric(  # pyright: ignore[reportUnknownMemberType]
-                    series, errors="coerce"
-                )
-                df.loc[mask, "upper_value"] = numeric_series_upper
-                negative_mask = mask & (df["upper_value"] < 0)
-                if negative_mask.any():
-                    log.warning("negative_upper_value", count=int(negative_mask.sum()))
-                    df.loc[negative_mask, "upper_value"] = None
-                normalized_count += int(mask.sum())
-
-        if "lower_value" in df.columns:
-            mask = df["lower_value"].notna()
-            if mask.any():
-                series = df.loc[mask, "lower_value"].astype(str).str.strip()
-                series = series.str.replace(r"[,\s]", "", regex=True)
-                series = series.str.extract(r"([+-]?\d*\.?\d+)", expand=False)
-                numeric_series_lower: pd.Series[Any] = pd.to_numeric(  # pyright: ignore[reportUnknownMemberType]
-                    series, errors="coerce"
-                )
-                df.loc[mask, "lower_value"] = numeric_series_lower
-                negative_mask = mask & (df["lower_value"] < 0)
-                if negative_mask.any():
-                    log.warning("negative_lower_value", count=int(negative_mask.sum()))
-                    df.loc[negative_mask, "lower_value"] = None
+                df.loc[mask, "standard_units"] = normalize_units(df.loc[mask, "standard_units"])
                 normalized_count += int(mask.sum())
 
         if normalized_count > 0:
@@ -2743,12 +2526,12 @@ class ChemblActivityPipeline(ChemblPipelineBase):
             df["row_subtype"] = "activity"
             log.debug("row_subtype_filled", value="activity")
 
-        # Add row_index: sequential index starting from 0
+        # Add row_index: sequential dataset position, continued across streaming chunks
         if "row_index" not in df.columns:
-            df["row_index"] = range(len(df))
+            df["row_index"] = self._row_positions(len(df))
             log.debug("row_index_added", count=len(df))
         elif df["row_index"].isna().all():
-            df["row_index"] = range(len(df))
+            df["row_index"] = self._row_positions(len(df))
             log.debug("row_index_filled", count=len(df))
 
         return df
@@ -2814,7 +2597,7 @@ class ChemblActivityPipeline(ChemblPipelineBase):
                     df[field] = numeric_series_row.astype("Int64")
                     # Fill any NA values with sequential index
                     if df[field].isna().any():
-                        df[field] = range(len(df))
+                        df[field] = self._row_positions(len(df))
                 else:
                     # Convert to numeric, preserving NA values
                     nullable_numeric_series: pd.Series[Any] = pd.to_numeric(  # pyright: ignore[reportUnknownMemberType]
@@ -3131,172 +2914,21 @@ class ChemblActivityPipeline(ChemblPipelineBase):
         """Return QC report with activity-specific metrics including distributions."""
 
         # Build base quality report with activity_id as business key for duplicate checking
-        business_key = ["activity_id"] if "activity_id" in df.columns else None
-
+        business_key = list(ACTIVITY_REPORT_KEY) if "activity_id" in df.columns else None
         base_report = build_default_quality_report(df, business_key_fields=business_key)
-        # build_default_quality_report always returns pd.DataFrame by contract
 
-        rows: list[dict[str, Any]] = []
-        if not base_report.empty:
-            records_raw = base_report.to_dict("records")  # pyright: ignore[reportUnknownMemberType]
-            records: list[dict[str, Any]] = cast(list[dict[str, Any]], records_raw)
-            for record in records:
-                rows.append({str(k): v for k, v in record.items()})
+        # Foreign key integrity and measurement type/unit distributions
+        counts = ActivityQCCounts()
+        counts.update(df)
+        return append_activity_rows(base_report, counts)
 
-        # Add foreign key integrity metrics
-        chembl_id_pattern = re.compile(r"^CHEMBL\d+$")
-        foreign_key_fields = [
-            "assay_chembl_id",
-            "molecule_chembl_id",
-            "target_chembl_id",
-            "document_chembl_id",
-        ]
-        for field in foreign_key_fields:
-            if field in df.columns:
-                mask = df[field].notna()
-                if mask.any():
-                    string_series = df[field].astype(str)
-                    valid_mask = mask & string_series.str.match(chembl_id_pattern.pattern, na=False)
-                    invalid_count = int((mask & ~valid_mask).astype(int).sum())
-                    valid_count = int(valid_mask.astype(int).sum())
-                    total_count = int(mask.astype(int).sum())
-                    integrity_ratio = float(valid_count / total_count) if total_count > 0 else 0.0
-                    rows.append(
-                        {
-                            "section": "foreign_key",
-                            "metric": "integrity_ratio",
-                            "column": field,
-                            "value": float(integrity_ratio),
-                            "valid_count": int(valid_count),
-                            "invalid_count": int(invalid_count),
-                            "total_count": int(total_count),
-                        }
-                    )
+    def build_qc_accumulator(
+        self, spill_directory: Path, *, track_correlation: bool
+    ) -> IncrementalQCAccumulator:
+        """Return the accumulator mirroring :meth:`build_quality_report` in streaming runs."""
 
-        # Add measurement type distribution
-        if "standard_type" in df.columns:
-            type_counts_series: pd.Series[Any] = df["standard_type"].value_counts()
-            type_dist_raw = type_counts_series.to_dict()  # pyright: ignore[reportUnknownMemberType]
-            type_dist: dict[Any, int] = cast(dict[Any, int], type_dist_raw)
-            for type_value, count in type_dist.items():
-                rows.append(
-                    {
-                        "section": "distribution",
-                        "metric": "standard_type_count",
-                        "column": "standard_type",
-                        "value": str(type_value) if type_value is not None else "null",
-                        "count": int(count),
-                    }
-                )
-
-        # Add unit distribution
-        if "standard_units" in df.columns:
-            unit_counts_series: pd.Series[Any] = df["standard_units"].value_counts()
-            unit_dist_raw = unit_counts_series.to_dict()  # pyright: ignore[reportUnknownMemberType]
-            unit_dist: dict[Any, int] = cast(dict[Any, int], unit_dist_raw)
-            for unit_value, count in unit_dist.items():
-                rows.append(
-                    {
-                        "section": "distribution",
-                        "metric": "standard_units_count",
-                        "column": "standard_units",
-                        "value": str(unit_value) if unit_value is not None else "null",
-                        "count": int(count),
-                    }
-                )
-
-        return pd.DataFrame(rows)
-
-    def write(
-        self,
-        df: pd.DataFrame,
-        output_path: Path,
-        *,
-        extended: bool = False,
-        include_correlation: bool | None = None,
-        include_qc_metrics: bool | None = None,
-    ) -> RunResult:
-        """Override write() to bind actor and ensure deterministic sorting.
-
-        Parameters
-        ----------
-        df:
-            The DataFrame to write.
-        output_path:
-            The base output path for all artifacts.
-        extended:
-            Whether to include extended QC artifacts.
-
-        Returns
-        -------
-        RunResult:
-            All artifacts generated by the write operation.
-        """
-        log = UnifiedLogger.get(__name__).bind(component=f"{self.pipeline_code}.write")
-
-        # Bind actor to logs for all write operations
-        UnifiedLogger.bind(actor=self.actor)
-
-        # Ensure sort configuration is set for activity pipeline
-        # Use canonical identifier columns from schema: assay_chembl_id, testitem_chembl_id, activity_id
-        sort_keys = ["assay_chembl_id", "testitem_chembl_id", "activity_id"]
-
-        # Check if all sort keys exist in the DataFrame
-        # If DataFrame is empty or missing columns, fall back to original sort config
-        if df.empty or not all(key in df.columns for key in sort_keys):
-            # Use original sort config if DataFrame is empty or missing required columns
-            return super().write(
-                df,
-                output_path,
-                extended=extended,
-                include_correlation=include_correlation,
-                include_qc_metrics=include_qc_metrics,
-            )
-
-        # Temporarily override sort config if not already set
-        original_sort_by = self.config.determinism.sort.by
-        if not original_sort_by or original_sort_by != sort_keys:
-            # Create a modified config with the correct sort keys
-            from copy import deepcopy
-
-            from bioetl.config.models.policies import DeterminismSortingConfig
-
-            modified_config = deepcopy(self.config)
-            modified_config.determinism.sort = DeterminismSortingConfig(
-                by=sort_keys,
-                ascending=[True, True, True],
-                na_position="last",
-            )
-
-            log.debug(
-                "write_sort_config_set",
-                sort_keys=sort_keys,
-                original_sort_keys=list(original_sort_by) if original_sort_by else [],
-            )
-
-            # Temporarily replace config
-            original_config = self.config
-            self.config = modified_config
-
-            try:
-                result = super().write(
-                    df,
-                    output_path,
-                    extended=extended,
-                    include_correlation=include_correlation,
-                    include_qc_metrics=include_qc_metrics,
-                )
-            finally:
-                # Restore original config
-                self.config = original_config
-
-            return result
-
-        # If sort config already matches, proceed normally
-        return super().write(
-            df,
-            output_path,
-            extended=extended,
-            include_correlation=include_correlation,
-            include_qc_metrics=include_qc_metrics,
+        return ActivityQCAccumulator(
+            spill_directory,
+            business_key_fields=self.config.determinism.hashing.business_key_fields,
+            track_correlation=track_correlation,
         )
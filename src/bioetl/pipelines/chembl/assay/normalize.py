@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
-from bioetl.clients.client_chembl_common import ChemblClient
-from bioetl.core.frame import ensure_columns
+from bioetl.core.frame import ensure_columns, lookup_frame, lookup_keys, merge_lookup, unique_keys
 from bioetl.core.log_events import LogEvents
 from bioetl.core.logger import UnifiedLogger
 from bioetl.schemas.chembl_assay_enrichment import (
@@ -17,6 +16,9 @@ from bioetl.schemas.chembl_assay_enrichment import (
     ASSAY_PARAMETERS_ENRICHMENT_SCHEMA,
 )
 
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from bioetl.clients.client_chembl_common import ChemblClient
+
 __all__ = [
     "enrich_with_assay_classifications",
     "enrich_with_assay_parameters",
@@ -45,6 +47,37 @@ def _should_nullify_string_value(value: Any) -> bool:
     return not isinstance(value, str)
 
 
+def _collect_classifications(
+    mappings: list[dict[str, Any]],
+    classification_dict: Mapping[str, Mapping[str, Any]],
+    classification_fields: Sequence[str],
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Объединить mappings assay с данными ASSAY_CLASSIFICATION."""
+    classifications: list[dict[str, Any]] = []
+    class_ids: list[str] = []
+
+    for mapping in mappings:
+        class_id = mapping.get("assay_class_id")
+        if not class_id or (isinstance(class_id, float) and pd.isna(class_id)):
+            continue
+
+        class_id_str = str(class_id).strip()
+        if not class_id_str:
+            continue
+
+        # Создать объединенную структуру; без данных классификации — минимальная запись
+        class_record: dict[str, Any] = {"assay_class_id": class_id_str}
+        classification_data = classification_dict.get(class_id_str)
+        if classification_data:
+            for field in classification_fields:
+                if field != "assay_class_id":
+                    class_record[field] = classification_data.get(field)
+        classifications.append(class_record)
+        class_ids.append(class_id_str)
+
+    return classifications, class_ids
+
+
 def enrich_with_assay_classifications(
     df_assay: pd.DataFrame,
     client: ChemblClient,
@@ -94,19 +127,8 @@ def enrich_with_assay_classifications(
         return ASSAY_CLASSIFICATION_ENRICHMENT_SCHEMA.validate(df_assay, lazy=True)
 
     # Собрать уникальные assay_chembl_id, dropna
-    assay_ids: list[str] = []
-    for _, row in df_assay.iterrows():
-        assay_id = row.get("assay_chembl_id")
-
-        # Пропускаем NaN/None значения
-        if pd.isna(assay_id) or assay_id is None:
-            continue
-
-        # Преобразуем в строку
-        assay_id_str = str(assay_id).strip()
-
-        if assay_id_str:
-            assay_ids.append(assay_id_str)
+    assay_keys = lookup_keys(df_assay["assay_chembl_id"])
+    assay_ids: list[str] = unique_keys(assay_keys)
 
     if not assay_ids:
         log.debug(LogEvents.ENRICHMENT_SKIPPED_NO_VALID_IDS)
@@ -121,7 +143,7 @@ def enrich_with_assay_classifications(
     page_limit = cfg.get("page_limit", 1000)
 
     # Шаг 1: Получить ASSAY_CLASS_MAP по assay_chembl_id
-    log.info(LogEvents.ENRICHMENT_FETCHING_ASSAY_CLASS_MAP, ids_count=len(set(assay_ids)))
+    log.info(LogEvents.ENRICHMENT_FETCHING_ASSAY_CLASS_MAP, ids_count=len(assay_ids))
     class_map_dict = client.fetch_assay_class_map_by_assay_ids(
         assay_ids,
         list(class_map_fields),
@@ -146,70 +168,28 @@ def enrich_with_assay_classifications(
             page_limit,
         )
 
-    # Шаг 3: Объединить данные и создать структуры для каждого assay
-    df_assay = df_assay.copy()
-
-    # Инициализируем колонки если их нет
-    if "assay_classifications" not in df_assay.columns:
-        df_assay["assay_classifications"] = pd.NA
-    if "assay_class_id" not in df_assay.columns:
-        df_assay["assay_class_id"] = pd.NA
-
-    # Обработать каждую запись assay
-    for idx, row in df_assay.iterrows():
-        row_key: Any = idx
-        assay_id = row.get("assay_chembl_id")
-        if pd.isna(assay_id) or assay_id is None:
-            continue
-        assay_id_str = str(assay_id).strip()
-
-        # Получить mappings для этого assay
-        mappings = class_map_dict.get(assay_id_str, [])
-
+    # Шаг 3: Собрать структуры классификаций для каждого уникального assay.
+    # Assay без mappings получает NULL; assay, для которого не нашлось ни одного
+    # валидного assay_class_id, сохраняет исходные значения.
+    serialized: dict[str, dict[str, Any]] = {}
+    for assay_id in assay_ids:
+        mappings = class_map_dict.get(assay_id, [])
         if not mappings:
-            # Нет классификаций - оставляем NULL
-            df_assay.at[row_key, "assay_classifications"] = pd.NA
-            df_assay.at[row_key, "assay_class_id"] = pd.NA
+            serialized[assay_id] = {"assay_classifications": pd.NA, "assay_class_id": pd.NA}
             continue
 
-        # Собрать данные классификаций
-        classifications: list[dict[str, Any]] = []
-        class_ids: list[str] = []
-
-        for mapping in mappings:
-            class_id = mapping.get("assay_class_id")
-            if not class_id or (isinstance(class_id, float) and pd.isna(class_id)):
-                continue
-
-            class_id_str = str(class_id).strip()
-            if not class_id_str:
-                continue
-
-            # Получить данные классификации
-            classification_data = classification_dict.get(class_id_str)
-            if classification_data:
-                # Создать объединенную структуру
-                class_record: dict[str, Any] = {
-                    "assay_class_id": class_id_str,
-                }
-                # Добавить поля из classification_data
-                for field in classification_fields:
-                    if field != "assay_class_id":
-                        class_record[field] = classification_data.get(field)
-                classifications.append(class_record)
-            else:
-                # Если нет данных классификации, создаем минимальную запись
-                class_record = {"assay_class_id": class_id_str}
-                classifications.append(class_record)
-
-            class_ids.append(class_id_str)
-
-        # Сохранить результаты
+        classifications, class_ids = _collect_classifications(
+            mappings, classification_dict, classification_fields
+        )
         if classifications:
-            serialized = json.dumps(classifications, ensure_ascii=False)
-            class_id_joined = ";".join(class_ids)
-            df_assay.at[row_key, "assay_classifications"] = serialized
-            df_assay.at[row_key, "assay_class_id"] = class_id_joined
+            serialized[assay_id] = {
+                "assay_classifications": json.dumps(classifications, ensure_ascii=False),
+                "assay_class_id": ";".join(class_ids),
+            }
+
+    # Шаг 4: Один left join по assay_chembl_id
+    lookup = lookup_frame(serialized, ("assay_classifications", "assay_class_id"))
+    df_assay = merge_lookup(df_assay, assay_keys, lookup, how="replace")
 
     log.info(LogEvents.ENRICHMENT_CLASSIFICATIONS_COMPLETE,
         assays_with_classifications=len(df_assay[df_assay["assay_classifications"].notna()]),
@@ -282,19 +262,8 @@ def enrich_with_assay_parameters(
         return ASSAY_PARAMETERS_ENRICHMENT_SCHEMA.validate(df_assay, lazy=True)
 
     # Собрать уникальные assay_chembl_id, dropna
-    assay_ids: list[str] = []
-    for _, row in df_assay.iterrows():
-        assay_id = row.get("assay_chembl_id")
-
-        # Пропускаем NaN/None значения
-        if pd.isna(assay_id) or assay_id is None:
-            continue
-
-        # Преобразуем в строку
-        assay_id_str = str(assay_id).strip()
-
-        if assay_id_str:
-            assay_ids.append(assay_id_str)
+    assay_keys = lookup_keys(df_assay["assay_chembl_id"])
+    assay_ids: list[str] = unique_keys(assay_keys)
 
     if not assay_ids:
         log.debug(LogEvents.ENRICHMENT_SKIPPED_NO_VALID_IDS)
@@ -323,7 +292,7 @@ def enrich_with_assay_parameters(
     active_only = cfg.get("active_only", True)
 
     # Получить ASSAY_PARAMETERS по assay_chembl_id
-    log.info(LogEvents.ENRICHMENT_FETCHING_ASSAY_PARAMETERS, ids_count=len(set(assay_ids)))
+    log.info(LogEvents.ENRICHMENT_FETCHING_ASSAY_PARAMETERS, ids_count=len(assay_ids))
     parameters_dict = client.fetch_assay_parameters_by_assay_ids(
         assay_ids,
         list(fields),
@@ -331,43 +300,23 @@ def enrich_with_assay_parameters(
         active_only,
     )
 
-    # Обработать каждую запись assay
-    df_assay = df_assay.copy()
-
-    # Инициализируем колонку если её нет
-    if "assay_parameters" not in df_assay.columns:
-        df_assay["assay_parameters"] = pd.NA
-
-    # Обработать каждую запись assay
-    for row_position, (_, row) in enumerate(df_assay.iterrows()):
-        assay_id = row.get("assay_chembl_id")
-        if pd.isna(assay_id) or assay_id is None:
-            continue
-        assay_id_str = str(assay_id).strip()
-
-        # Получить параметры для этого assay
-        parameters = parameters_dict.get(assay_id_str, [])
-
-        if not parameters:
-            # Нет параметров - оставляем NULL
-            continue
-
-        # Создать список параметров с нужными полями
-        params_list: list[dict[str, Any]] = []
-        for param in parameters:
-            param_record: dict[str, Any] = {}
-            for field in fields:
-                if field != "assay_chembl_id":
-                    param_record[field] = param.get(field)
-            params_list.append(param_record)
-
-        # Сериализовать массив в JSON-строку
+    # Сериализовать параметры каждого уникального assay в JSON-массив
+    # (assay без параметров сохраняет исходное значение)
+    serialized: dict[str, dict[str, str]] = {}
+    for assay_id in assay_ids:
+        parameters = parameters_dict.get(assay_id, [])
+        params_list = [
+            {field: param.get(field) for field in fields if field != "assay_chembl_id"}
+            for param in parameters
+        ]
         if params_list:
-            index_label = df_assay.index[row_position]
-            df_assay.loc[index_label, "assay_parameters"] = json.dumps(
-                params_list,
-                ensure_ascii=False,
-            )
+            serialized[assay_id] = {
+                "assay_parameters": json.dumps(params_list, ensure_ascii=False)
+            }
+
+    # Один left join по assay_chembl_id
+    lookup = lookup_frame(serialized, ("assay_parameters",))
+    df_assay = merge_lookup(df_assay, assay_keys, lookup, how="update")
 
     log.info(LogEvents.ENRICHMENT_PARAMETERS_COMPLETE,
         assays_with_parameters=len(df_assay[df_assay["assay_parameters"].notna()]),
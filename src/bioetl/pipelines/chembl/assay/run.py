@@ -14,8 +14,10 @@ from pandas import Series
 from bioetl.clients.assay.chembl_assay import ChemblAssayClient
 from bioetl.clients.chembl import ChemblClient
 from bioetl.clients.types import EntityClient
-from bioetl.config import AssaySourceConfig, PipelineConfig
+from bioetl.config import AssaySourceConfig, AssaySourceParameters, PipelineConfig
+from bioetl.config.pipeline_source import ChemblPipelineSourceConfig
 from bioetl.core import UnifiedLogger
+from bioetl.core.frame import map_unique
 from bioetl.core.normalizers import (
     IdentifierRule,
     StringNormalizationConfig,
@@ -23,6 +25,7 @@ from bioetl.core.normalizers import (
     normalize_identifier_columns,
     normalize_string_columns_with_config,
 )
+from bioetl.core.streaming import batch_records
 from bioetl.pipelines.assay.assay_enrichment import (
     enrich_with_assay_classifications,
     enrich_with_assay_parameters,
@@ -89,6 +92,17 @@ def _iter_classification_mappings(node: Any) -> Iterator[Mapping[str, Any]]:
             yield from _iter_classification_mappings(item)
 
 
+def _is_nested_classification(value: Any) -> bool:
+    """Return whether ``value`` still holds raw (not yet serialised) classifications."""
+
+    if value is None or value is pd.NA:
+        return False
+    if isinstance(value, float) and pd.isna(value):
+        return False
+    # Уже сериализовано, обогащение выполняется позже.
+    return not isinstance(value, str)
+
+
 def _extract_bao_ids_from_classifications(node: Any) -> list[str]:
     identifiers: list[str] = []
     seen: set[str] = set()
@@ -108,6 +122,12 @@ def _extract_bao_ids_from_classifications(node: Any) -> list[str]:
 
     return identifiers
 
+
+def _joined_bao_ids_from_classifications(value: Any) -> str:
+    if not _is_nested_classification(value):
+        return ""
+    return ";".join(_extract_bao_ids_from_classifications(value))
+
 # Обязательные поля, которые всегда должны быть в запросе к API
 MUST_HAVE_FIELDS = {
     "assay_chembl_id",
@@ -145,8 +165,40 @@ class ChemblAssayPipeline(ChemblPipelineBase):
         log = UnifiedLogger.get(__name__).bind(component=self._component_for_stage("extract"))
         stage_start = time.perf_counter()
 
-        source_raw = self._resolve_source_config("chembl")
-        source_config = AssaySourceConfig.from_source(source_raw)
+        source_config = AssaySourceConfig.from_source(self._resolve_source_config("chembl"))
+        records = list(self._iter_assay_records(source_config, log))
+        if self.config.cli.dry_run:
+            return pd.DataFrame()
+        dataframe = self._assay_listing_frame(records, source_config, log)
+
+        duration_ms = (time.perf_counter() - stage_start) * 1000.0
+        log.info(
+            "chembl_assay.extract_summary",
+            rows=int(dataframe.shape[0]),
+            duration_ms=duration_ms,
+            chembl_release=self.chembl_release,
+            handshake_endpoint=source_config.handshake_endpoint,
+            limit=self.config.cli.limit,
+        )
+        return dataframe
+
+    def extract_all_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yield all assay records ``runtime.chunk_rows`` at a time as they are paged."""
+
+        log = UnifiedLogger.get(__name__).bind(component=self._component_for_stage("extract"))
+        source_config = AssaySourceConfig.from_source(self._resolve_source_config("chembl"))
+        records = self._iter_assay_records(source_config, log)
+        for batch in batch_records(records, self.config.runtime.chunk_rows):
+            yield self._assay_listing_frame(batch, source_config, log)
+
+    def _iter_assay_records(
+        self,
+        source_config: ChemblPipelineSourceConfig[AssaySourceParameters],
+        log: Any,
+    ) -> Iterator[Mapping[str, Any]]:
+        """Yield the records of the ``/assay.json`` listing as its pages arrive."""
+
+        stage_start = time.perf_counter()
         http_client, _ = self.prepare_chembl_client(
             "chembl",
             client_name="chembl_assay_http",
@@ -157,6 +209,9 @@ class ChemblAssayPipeline(ChemblPipelineBase):
             load_meta_store=self.load_meta_store,
             job_id=self.run_id,
             operator=self.pipeline_code,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
         )
         assay_client: EntityClient[Mapping[str, object]] = ChemblAssayClient(
             chembl_client,
@@ -179,16 +234,11 @@ class ChemblAssayPipeline(ChemblPipelineBase):
                 duration_ms=duration_ms,
                 chembl_release=self.chembl_release,
             )
-            return pd.DataFrame()
+            return
 
-        records: list[Mapping[str, Any]] = []
         limit = self.config.cli.limit
         page_size = source_config.batch_size
-        select_fields_tuple = source_config.parameters.select_fields
-        if select_fields_tuple:
-            select_fields = list(dict.fromkeys([*select_fields_tuple, *MUST_HAVE_FIELDS]))
-        else:
-            select_fields = list(MUST_HAVE_FIELDS)
+        select_fields = self._assay_select_fields(source_config)
 
         log.debug(
             "chembl_assay.select_fields",
@@ -215,11 +265,28 @@ class ChemblAssayPipeline(ChemblPipelineBase):
             requested_at_utc=datetime.now(timezone.utc),
         )
 
-        for item in assay_client.iter(
-            limit=limit, page_size=page_size, select_fields=select_fields
-        ):
-            records.append(item)
+        yield from assay_client.iter(limit=limit, page_size=page_size, select_fields=select_fields)
+
+    @staticmethod
+    def _assay_select_fields(
+        source_config: ChemblPipelineSourceConfig[AssaySourceParameters],
+    ) -> list[str]:
+        """Return the requested assay fields, always including ``MUST_HAVE_FIELDS``."""
 
+        select_fields_tuple = source_config.parameters.select_fields
+        if select_fields_tuple:
+            return list(dict.fromkeys([*select_fields_tuple, *MUST_HAVE_FIELDS]))
+        return list(MUST_HAVE_FIELDS)
+
+    def _assay_listing_frame(
+        self,
+        records: Sequence[Mapping[str, Any]],
+        source_config: ChemblPipelineSourceConfig[AssaySourceParameters],
+        log: Any,
+    ) -> pd.DataFrame:
+        """Build the frame of listed assay ``records`` and check the returned fields."""
+
+        select_fields = self._assay_select_fields(source_config)
         dataframe = pd.DataFrame.from_records(records)  # pyright: ignore[reportUnknownMemberType]
         if not dataframe.empty and "assay_chembl_id" in dataframe.columns:
             dataframe = dataframe.sort_values("assay_chembl_id").reset_index(drop=True)
@@ -252,15 +319,6 @@ class ChemblAssayPipeline(ChemblPipelineBase):
         # Проверка отсутствующих колонок для версионности ChEMBL (v34/v35)
         dataframe = self._check_missing_columns(dataframe, log, select_fields=select_fields)
 
-        duration_ms = (time.perf_counter() - stage_start) * 1000.0
-        log.info(
-            "chembl_assay.extract_summary",
-            rows=int(dataframe.shape[0]),
-            duration_ms=duration_ms,
-            chembl_release=self.chembl_release,
-            handshake_endpoint=source_config.handshake_endpoint,
-            limit=limit,
-        )
         return dataframe
 
     def extract_by_ids(self, ids: Sequence[str]) -> pd.DataFrame:
@@ -291,6 +349,9 @@ class ChemblAssayPipeline(ChemblPipelineBase):
             load_meta_store=self.load_meta_store,
             job_id=self.run_id,
             operator=self.pipeline_code,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
         )
         assay_client: EntityClient[Mapping[str, object]] = ChemblAssayClient(
             chembl_client,
@@ -409,7 +470,8 @@ class ChemblAssayPipeline(ChemblPipelineBase):
 
         df = self._normalize_identifiers(df, log)
         df = self._normalize_string_fields(df, log)
-        df = self._enrich_with_related_data(df, log)
+        with self.profile_stage("enrich_related_data"):
+            df = self._enrich_with_related_data(df, log)
         df = self._normalize_nested_structures(df, log)
         df = self._serialize_array_fields(df, log)
         df = self._add_row_metadata(df, log)
@@ -569,29 +631,23 @@ class ChemblAssayPipeline(ChemblPipelineBase):
             if "assay_class_id" not in df.columns:
                 df["assay_class_id"] = pd.NA
 
-            updated_rows = 0
-            classifications_series = df["assay_classifications"]
-
-            for row_index, value in classifications_series.items():
-                if value is None or value is pd.NA:
-                    continue
-                if isinstance(value, float) and pd.isna(value):
-                    continue
-                if isinstance(value, str):
-                    # Уже сериализовано, обогащение выполняется позже.
-                    continue
-
-                extracted_ids = _extract_bao_ids_from_classifications(value)
-                if not extracted_ids:
-                    continue
-
-                joined_ids = ";".join(extracted_ids)
-                row_label = cast(Any, row_index)
-                current_value = df.at[row_label, "assay_class_id"]
-
-                if pd.isna(current_value) or current_value != joined_ids:
-                    df.at[row_label, "assay_class_id"] = joined_ids
-                    updated_rows += 1
+            # Один проход по уникальным классификациям вместо построчных df.at.
+            joined_ids = map_unique(
+                df["assay_classifications"], _joined_bao_ids_from_classifications
+            ).tolist()
+            current_values = df["assay_class_id"].tolist()
+            positions = [
+                position
+                for position, (joined, current) in enumerate(
+                    zip(joined_ids, current_values, strict=True)
+                )
+                if joined and (pd.isna(current) or current != joined)
+            ]
+            updated_rows = len(positions)
+            if positions:
+                df.iloc[positions, df.columns.get_loc("assay_class_id")] = [
+                    joined_ids[position] for position in positions
+                ]
 
             if updated_rows > 0:
                 log.debug(
@@ -619,12 +675,12 @@ class ChemblAssayPipeline(ChemblPipelineBase):
             df["row_subtype"] = "assay"
             log.debug("row_subtype_filled", value="assay")
 
-        # Add row_index: sequential index starting from 0
+        # Add row_index: sequential dataset position, continued across streaming chunks
         if "row_index" not in df.columns:
-            df["row_index"] = range(len(df))
+            df["row_index"] = self._row_positions(len(df))
             log.debug("row_index_added", count=len(df))
         elif df["row_index"].isna().all():
-            df["row_index"] = range(len(df))
+            df["row_index"] = self._row_positions(len(df))
             log.debug("row_index_filled", count=len(df))
 
         return df
@@ -638,7 +694,7 @@ class ChemblAssayPipeline(ChemblPipelineBase):
 
         # Handle row_index specially - fill NA values with sequential index
         if "row_index" in df.columns and df["row_index"].isna().any():
-            df["row_index"] = range(len(df))
+            df["row_index"] = self._row_positions(len(df))
             log.debug("row_index_filled", count=len(df))
 
         return df
@@ -802,6 +858,9 @@ class ChemblAssayPipeline(ChemblPipelineBase):
             load_meta_store=self.load_meta_store,
             job_id=self.run_id,
             operator=self.pipeline_code,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
         )
 
         # Получить конфигурацию enrichment из config.chembl.assay.enrich
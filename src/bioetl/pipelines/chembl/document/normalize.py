@@ -4,16 +4,18 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Iterable, Mapping
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
-from bioetl.clients.client_chembl_common import ChemblClient
-from bioetl.core.frame import ensure_columns
+from bioetl.core.frame import ensure_columns, lookup_frame, lookup_keys, merge_lookup, unique_keys
 from bioetl.core.log_events import LogEvents
 from bioetl.core.logger import UnifiedLogger
 from bioetl.schemas.chembl_document_enrichment import DOCUMENT_TERMS_ENRICHMENT_SCHEMA
 
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from bioetl.clients.client_chembl_common import ChemblClient
+
 __all__ = ["enrich_with_document_terms", "aggregate_terms", "_escape_pipe"]
 
 
@@ -190,19 +192,8 @@ def enrich_with_document_terms(
         return DOCUMENT_TERMS_ENRICHMENT_SCHEMA.validate(prepared_missing, lazy=True)
 
     # Собрать уникальные document_chembl_id, dropna
-    doc_ids: list[str] = []
-    for _, row in df_docs.iterrows():
-        doc_id = row.get("document_chembl_id")
-
-        # Пропускаем NaN/None значения
-        if pd.isna(doc_id) or doc_id is None:
-            continue
-
-        # Преобразуем в строку
-        doc_id_str = str(doc_id).strip()
-
-        if doc_id_str:
-            doc_ids.append(doc_id_str)
+    doc_keys = lookup_keys(df_docs["document_chembl_id"])
+    doc_ids: list[str] = unique_keys(doc_keys)
 
     if not doc_ids:
         log.debug(LogEvents.ENRICHMENT_SKIPPED_NO_VALID_IDS)
@@ -214,7 +205,7 @@ def enrich_with_document_terms(
     sort = cfg.get("sort", "weight_desc")
 
     # Вызвать client.fetch_document_terms_by_ids
-    log.info(LogEvents.ENRICHMENT_FETCHING_TERMS, ids_count=len(set(doc_ids)))
+    log.info(LogEvents.ENRICHMENT_FETCHING_TERMS, ids_count=len(doc_ids))
     records_dict = client.fetch_document_terms_by_ids(
         ids=doc_ids,
         fields=list(fields),
@@ -229,42 +220,15 @@ def enrich_with_document_terms(
     # Агрегировать термины
     agg_result = aggregate_terms(all_records, sort=sort)
 
-    # Создать DataFrame для join
-    enrichment_data: list[dict[str, Any]] = []
-    for doc_id, term_weight in agg_result.items():
-        enrichment_data.append(
-            {
-                "document_chembl_id": doc_id,
-                "term": term_weight["term"],
-                "weight": term_weight["weight"],
-            }
-        )
-
-    if not enrichment_data:
+    if not agg_result:
         log.debug(LogEvents.ENRICHMENT_NO_RECORDS_FOUND)
         prepared = _ensure_term_columns(df_docs)
         return DOCUMENT_TERMS_ENRICHMENT_SCHEMA.validate(prepared, lazy=True)
 
-    df_enrich = pd.DataFrame(enrichment_data)
-
-    # Left-join обратно к df_docs на document_chembl_id
-    # Сохраняем исходный порядок строк через индекс
-    original_index = df_docs.index.copy()
-    df_result = df_docs.merge(
-        df_enrich,
-        on=["document_chembl_id"],
-        how="left",
-        suffixes=("", "_enrich"),
-    )
-
-    # Перенести значения из *_enrich в основные колонки
-    for col in ["term", "weight"]:
-        enrich_col = f"{col}_enrich"
-        if enrich_col in df_result.columns:
-            base_series = df_result[col] if col in df_result.columns else pd.Series([pd.NA] * len(df_result), index=df_result.index, dtype="object")
-            enrich_series = df_result[enrich_col]
-            df_result[col] = base_series.where(pd.notna(base_series), enrich_series)
-            df_result = df_result.drop(columns=[enrich_col])
+    # Left-join обратно к df_docs на document_chembl_id (порядок строк сохраняется);
+    # агрегированные термины заполняют только пропуски
+    lookup = lookup_frame(agg_result, ("term", "weight"))
+    df_result = merge_lookup(df_docs, doc_keys, lookup, how="fill")
 
     # Убедиться, что все новые колонки присутствуют (заполнить NA для отсутствующих)
     for col in ["term", "weight"]:
@@ -282,8 +246,6 @@ def enrich_with_document_terms(
             df_result.loc[na_mask, col] = ""
         df_result[col] = df_result[col].astype("string")
 
-    # Восстановить исходный порядок
-    df_result = df_result.reindex(original_index)
     df_result = _ensure_term_columns(df_result)
 
     log.info(LogEvents.ENRICHMENT_COMPLETED,
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import re
 import time
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from datetime import datetime, timezone
+from itertools import chain
 from numbers import Integral, Real
 from typing import Any, cast
 
@@ -14,7 +15,9 @@ import pandas as pd
 from bioetl.clients.chembl import ChemblClient
 from bioetl.config import DocumentSourceConfig, PipelineConfig
 from bioetl.core import UnifiedLogger
+from bioetl.core.frame import map_unique
 from bioetl.core.normalizers import StringRule, normalize_string_columns
+from bioetl.core.streaming import batch_records
 from bioetl.schemas.document import COLUMN_ORDER
 
 from ..chembl_base import CHEMBL_PIPELINE_EXTRACT_DOCSTRING, ChemblPipelineBase
@@ -66,6 +69,39 @@ class ChemblDocumentPipeline(ChemblPipelineBase):
         log = UnifiedLogger.get(__name__).bind(component=f"{self.pipeline_code}.extract")
         stage_start = time.perf_counter()
 
+        records: list[dict[str, Any]] = []
+        pages = 0
+        for page_items in self._iter_document_pages(log):
+            records.extend(page_items)
+            pages += 1
+
+        dataframe = self._document_listing_frame(records)
+
+        duration_ms = (time.perf_counter() - stage_start) * 1000.0
+        log.info(
+            "chembl_document.extract_summary",
+            rows=int(dataframe.shape[0]),
+            duration_ms=duration_ms,
+            chembl_release=self.chembl_release,
+            pages=pages,
+        )
+        return dataframe
+
+    def extract_all_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yield all document records page batch by page batch.
+
+        Pages are requested as the batches of ``runtime.chunk_rows`` records are
+        consumed, so the full listing is never held in memory.
+        """
+
+        log = UnifiedLogger.get(__name__).bind(component=f"{self.pipeline_code}.extract")
+        records = chain.from_iterable(self._iter_document_pages(log))
+        for batch in batch_records(records, self.config.runtime.chunk_rows):
+            yield self._document_listing_frame(batch)
+
+    def _iter_document_pages(self, log: Any) -> Iterator[list[dict[str, Any]]]:
+        """Yield the processed items of the ``/document.json`` listing page by page."""
+
         source_raw = self._resolve_source_config("chembl")
         source_config = DocumentSourceConfig.from_source(source_raw)
         base_url = self._resolve_base_url(cast(Mapping[str, Any], dict(source_config.parameters)))
@@ -78,6 +114,9 @@ class ChemblDocumentPipeline(ChemblPipelineBase):
             load_meta_store=self.load_meta_store,
             job_id=self.run_id,
             operator=self.pipeline_code,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
         )
         self.perform_source_handshake(
             chembl_client,
@@ -96,12 +135,6 @@ class ChemblDocumentPipeline(ChemblPipelineBase):
             select_fields = list(API_DOCUMENT_FIELDS)
         # Защита: добавить обязательные поля, если их нет
         select_fields = list(dict.fromkeys(list(select_fields) + list(MUST_HAVE_FIELDS)))
-        records: list[dict[str, Any]] = []
-        next_endpoint: str | None = "/document.json"
-        params: Mapping[str, Any] | None = {
-            "limit": page_size,
-            "only": ",".join(select_fields),
-        }
         parameter_filters = source_config.parameters.model_dump()
         filters_payload: dict[str, Any] = {
             "mode": "all",
@@ -120,64 +153,26 @@ class ChemblDocumentPipeline(ChemblPipelineBase):
             filters=compact_filters,
             requested_at_utc=datetime.now(timezone.utc),
         )
-        pages = 0
 
-        while next_endpoint:
-            page_start = time.perf_counter()
-            response = http_client.get(next_endpoint, params=params)
-            payload = self._coerce_mapping(response.json())
-            page_items = self._extract_page_items(
-                payload, items_keys=("documents", "data", "items", "results")
-            )
-
-            # Process nested fields for each item
-            processed_items: list[dict[str, Any]] = []
-            for item in page_items:
-                processed_item = self._extract_nested_fields(dict(item))
-                processed_items.append(processed_item)
-
-            if limit is not None:
-                remaining = max(limit - len(records), 0)
-                if remaining == 0:
-                    break
-                processed_items = processed_items[:remaining]
-
-            records.extend(processed_items)
-            pages += 1
-            page_duration_ms = (time.perf_counter() - page_start) * 1000.0
-            log.debug(
-                "chembl_document.page_fetched",
-                endpoint=next_endpoint,
-                batch_size=len(processed_items),
-                total_records=len(records),
-                duration_ms=page_duration_ms,
-            )
+        yield from self.iter_listing_pages(
+            http_client,
+            "/document.json",
+            base_url=base_url,
+            params={"limit": page_size, "only": ",".join(select_fields)},
+            limit=limit,
+            items_keys=("documents", "data", "items", "results"),
+            process_item=self._extract_nested_fields,
+        )
 
-            next_link = self._next_link(payload, base_url)
-            if not next_link or (limit is not None and len(records) >= limit):
-                break
-            log.info(
-                "chembl_document.next_link_resolved",
-                next_link=next_link,
-                base_url=base_url,
-            )
-            next_endpoint = next_link
-            params = None
+    @staticmethod
+    def _document_listing_frame(records: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+        """Build the frame of listed document ``records`` ordered by ID."""
 
         dataframe: pd.DataFrame = pd.DataFrame.from_records(records)  # pyright: ignore[reportUnknownMemberType]; type: ignore
         if dataframe.empty:
-            dataframe = pd.DataFrame({"document_chembl_id": pd.Series(dtype="string")})
-        elif "document_chembl_id" in dataframe.columns:
+            return pd.DataFrame({"document_chembl_id": pd.Series(dtype="string")})
+        if "document_chembl_id" in dataframe.columns:
             dataframe = dataframe.sort_values("document_chembl_id").reset_index(drop=True)
-
-        duration_ms = (time.perf_counter() - stage_start) * 1000.0
-        log.info(
-            "chembl_document.extract_summary",
-            rows=int(dataframe.shape[0]),
-            duration_ms=duration_ms,
-            chembl_release=self.chembl_release,
-            pages=pages,
-        )
         return dataframe
 
     def extract_by_ids(self, ids: Sequence[str]) -> pd.DataFrame:
@@ -208,6 +203,9 @@ class ChemblDocumentPipeline(ChemblPipelineBase):
             load_meta_store=self.load_meta_store,
             job_id=self.run_id,
             operator=self.pipeline_code,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
         )
         self.perform_source_handshake(
             chembl_client,
@@ -291,7 +289,8 @@ class ChemblDocumentPipeline(ChemblPipelineBase):
 
         # Enrichment: document_term fields
         if self._should_enrich_document_terms():
-            df = self._enrich_document_terms(df)
+            with self.profile_stage("enrich_document_terms"):
+                df = self._enrich_document_terms(df)
 
         # Add system fields
         df = self._add_system_fields(df, log)
@@ -368,7 +367,7 @@ class ChemblDocumentPipeline(ChemblPipelineBase):
 
         # Normalize DOI
         if "doi" in df.columns:
-            df["doi_clean"] = df["doi"].apply(self._normalize_doi)  # pyright: ignore[reportUnknownMemberType]
+            df["doi_clean"] = map_unique(df["doi"], self._normalize_doi)
 
         # Normalize PMID
         if "pubmed_id" in df.columns:
@@ -416,9 +415,7 @@ class ChemblDocumentPipeline(ChemblPipelineBase):
         # Normalize journal
         if "journal" in normalized_df.columns:
             journal_series: pd.Series[Any] = normalized_df["journal"]
-            normalized_df["journal"] = journal_series.map(
-                lambda value: self._normalize_journal(value)
-            )
+            normalized_df["journal"] = map_unique(journal_series, self._normalize_journal)
 
         # Normalize authors
         if "authors" in normalized_df.columns:
@@ -452,10 +449,11 @@ class ChemblDocumentPipeline(ChemblPipelineBase):
                 return data[1] if data is not None else 0
 
             authors_series: pd.Series[Any] = normalized_df["authors"]
-            normalized_result = authors_series.map(self._normalize_authors)
-            normalized_tuples = normalized_result.map(_to_author_tuple)
-            normalized_df["authors"] = normalized_tuples.map(_author_name_from_tuple)
-            normalized_df["authors_count"] = normalized_tuples.map(_author_count_from_tuple)
+            normalized_tuples = map_unique(
+                authors_series, lambda value: _to_author_tuple(self._normalize_authors(value))
+            )
+            normalized_df["authors"] = map_unique(normalized_tuples, _author_name_from_tuple)
+            normalized_df["authors_count"] = map_unique(normalized_tuples, _author_count_from_tuple)
 
         return normalized_df
 
@@ -623,6 +621,9 @@ class ChemblDocumentPipeline(ChemblPipelineBase):
             load_meta_store=self.load_meta_store,
             job_id=self.run_id,
             operator=self.pipeline_code,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
         )
 
         # Вызвать функцию обогащения
@@ -0,0 +1,242 @@
+"""Release-scoped protein classification index for the ChEMBL target pipeline."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+__all__ = ["ProteinClassificationIndex", "load_protein_classification_index"]
+
+_INDEX_VERSION = 1
+_LEVELS = tuple(f"l{level}" for level in range(1, 9))
+_CLASS_FIELDS = (
+    "protein_class_id",
+    "parent_id",
+    "pref_name",
+    "short_name",
+    "class_level",
+    "protein_class_desc",
+)
+
+
+class _Paginator(Protocol):
+    def paginate(
+        self,
+        endpoint: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int = 200,
+        items_key: str | None = None,
+    ) -> Iterable[Mapping[str, Any]]: ...
+
+
+def _text(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    normalized = str(value).strip()
+    return normalized or None
+
+
+def _class_level_key(class_obj: Mapping[str, Any]) -> tuple[bool, int]:
+    level = class_obj.get("class_level")
+    try:
+        return level is None, int(level) if level is not None else 0
+    except (TypeError, ValueError):
+        return True, 0
+
+
+@dataclass(frozen=True)
+class ProteinClassificationIndex:
+    """In-memory view of the ``protein_classification`` tree and component edges.
+
+    Attributes
+    ----------
+    classes:
+        ``protein_class_id`` → class object (node metadata plus its ``path``,
+        the expanded ``l1..l8`` hierarchy).
+    component_classes:
+        ``component_id`` → ``protein_class_id`` values from ``component_class``.
+    component_types:
+        ``component_id`` → ``component_type`` from ``component_sequence``.
+    """
+
+    classes: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+    component_classes: Mapping[str, tuple[str, ...]] = field(default_factory=dict)
+    component_types: Mapping[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def download(
+        cls, chembl_client: _Paginator, *, page_size: int = 1000
+    ) -> ProteinClassificationIndex:
+        """Bulk-download the four classification listings of the current release."""
+
+        nodes: dict[str, dict[str, Any]] = {}
+        for item in chembl_client.paginate(
+            "/protein_classification.json",
+            params={"limit": page_size},
+            page_size=page_size,
+            items_key="protein_classifications",
+        ):
+            class_id = _text(item.get("protein_class_id"))
+            if class_id is not None:
+                nodes[class_id] = {name: item.get(name) for name in _CLASS_FIELDS}
+                nodes[class_id]["protein_class_id"] = class_id
+
+        paths: dict[str, list[str]] = {}
+        for item in chembl_client.paginate(
+            "/protein_family_classification.json",
+            params={"limit": page_size},
+            page_size=page_size,
+            items_key="protein_family_classifications",
+        ):
+            class_id = _text(item.get("protein_class_id"))
+            if class_id is not None:
+                levels = (_text(item.get(level)) for level in _LEVELS)
+                paths[class_id] = [level for level in levels if level is not None]
+
+        component_classes: dict[str, set[str]] = {}
+        for item in chembl_client.paginate(
+            "/component_class.json",
+            params={"limit": page_size},
+            page_size=page_size,
+            items_key="component_classes",
+        ):
+            component_id = _text(item.get("component_id"))
+            class_id = _text(item.get("protein_class_id"))
+            if component_id is not None and class_id is not None:
+                component_classes.setdefault(component_id, set()).add(class_id)
+
+        component_types: dict[str, str] = {}
+        for item in chembl_client.paginate(
+            "/component_sequence.json",
+            params={"limit": page_size, "only": "component_id,component_type"},
+            page_size=page_size,
+            items_key="component_sequences",
+        ):
+            component_id = _text(item.get("component_id"))
+            component_type = _text(item.get("component_type"))
+            if component_id is not None and component_type is not None:
+                component_types[component_id] = component_type.upper()
+
+        classes = {
+            class_id: {**node, "path": paths.get(class_id) or _ancestor_path(nodes, class_id)}
+            for class_id, node in nodes.items()
+        }
+        return cls(
+            classes=classes,
+            component_classes={
+                key: tuple(sorted(value)) for key, value in component_classes.items()
+            },
+            component_types=component_types,
+        )
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> ProteinClassificationIndex:
+        """Rebuild the index from :meth:`to_payload` output."""
+
+        if payload.get("version") != _INDEX_VERSION:
+            msg = f"Unsupported protein classification index version: {payload.get('version')!r}"
+            raise ValueError(msg)
+        return cls(
+            classes={str(key): dict(value) for key, value in payload["classes"].items()},
+            component_classes={
+                str(key): tuple(value) for key, value in payload["component_classes"].items()
+            },
+            component_types={
+                str(key): str(value) for key, value in payload["component_types"].items()
+            },
+        )
+
+    def to_payload(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation of the index."""
+
+        return {
+            "version": _INDEX_VERSION,
+            "classes": {key: dict(value) for key, value in self.classes.items()},
+            "component_classes": {
+                key: list(value) for key, value in self.component_classes.items()
+            },
+            "component_types": dict(self.component_types),
+        }
+
+    def is_protein_component(self, component_id: str, component_type: object = None) -> bool:
+        """Return whether a component is a protein.
+
+        ``component_type`` from the ``target_component`` record takes
+        precedence over the indexed ``component_sequence`` type.
+        """
+
+        declared = _text(component_type)
+        if declared is not None:
+            return declared.upper() == "PROTEIN"
+        return self.component_types.get(component_id) == "PROTEIN"
+
+    def classes_for_components(self, component_ids: Iterable[str]) -> list[dict[str, Any]]:
+        """Return the distinct classes of ``component_ids`` ordered by ``class_level``."""
+
+        class_ids: set[str] = set()
+        for component_id in component_ids:
+            class_ids.update(self.component_classes.get(component_id, ()))
+        resolved = [
+            {**self.classes[class_id], "path": list(self.classes[class_id]["path"])}
+            for class_id in sorted(class_ids)
+            if class_id in self.classes
+        ]
+        resolved.sort(key=_class_level_key)
+        return resolved
+
+
+def _ancestor_path(nodes: Mapping[str, Mapping[str, Any]], class_id: str) -> list[str]:
+    """Expand ``l1..l8`` by walking ``parent_id`` up the tree.
+
+    Used when ``protein_family_classification`` has no row for a node. The
+    root (``class_level`` 0, "Protein class") is not part of the levels.
+    """
+
+    names: list[str] = []
+    seen: set[str] = set()
+    current: str | None = class_id
+    while current is not None and current in nodes and current not in seen:
+        seen.add(current)
+        node = nodes[current]
+        name = _text(node.get("pref_name"))
+        if name is not None and _text(node.get("class_level")) not in {None, "0"}:
+            names.append(name)
+        current = _text(node.get("parent_id"))
+    names.reverse()
+    return names[: len(_LEVELS)]
+
+
+def load_protein_classification_index(
+    chembl_client: _Paginator,
+    path: Path | None,
+) -> ProteinClassificationIndex:
+    """Return the index stored at ``path``, downloading and storing it when absent.
+
+    ``path`` is ``None`` when the release is unknown or caching is disabled;
+    the index is then downloaded and kept in memory only.
+    """
+
+    if path is not None and path.exists():
+        try:
+            return ProteinClassificationIndex.from_payload(
+                json.loads(path.read_text(encoding="utf-8"))
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+    index = ProteinClassificationIndex.download(chembl_client)
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(
+            json.dumps(index.to_payload(), ensure_ascii=False, sort_keys=True), encoding="utf-8"
+        )
+        os.replace(tmp_path, path)
+    return index
@@ -5,18 +5,23 @@ from __future__ import annotations
 import json
 import math
 import time
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from numbers import Integral, Real
+from pathlib import Path
 from typing import Any, cast
 
 import pandas as pd
 
 from bioetl.clients.chembl import ChemblClient
+from bioetl.clients.entities.client_target_component import ChemblTargetComponentEntityClient
 from bioetl.clients.target.chembl_target import ChemblTargetClient
 from bioetl.config import PipelineConfig, TargetSourceConfig
 from bioetl.core import UnifiedLogger
+from bioetl.core.concurrency import resolve_worker_count
+from bioetl.core.frame import map_unique
+from bioetl.core.lookup_store import release_directory
 from bioetl.core.normalizers import (
     IdentifierRule,
     StringNormalizationConfig,
@@ -24,9 +29,11 @@ from bioetl.core.normalizers import (
     normalize_identifier_columns,
     normalize_string_columns_with_config,
 )
+from bioetl.core.streaming import batch_records
 from bioetl.schemas.target import COLUMN_ORDER, TargetSchema
 
 from ..chembl_base import CHEMBL_PIPELINE_EXTRACT_DOCSTRING, ChemblPipelineBase
+from .protein_classification import ProteinClassificationIndex, load_protein_classification_index
 from .target_transform import serialize_target_arrays
 
 
@@ -37,6 +44,8 @@ class ChemblTargetPipeline(ChemblPipelineBase):
 
     def __init__(self, config: PipelineConfig, run_id: str) -> None:
         super().__init__(config, run_id)
+        self._target_components: dict[str, list[dict[str, Any]]] = {}
+        self._protein_classification_index: ProteinClassificationIndex | None = None
 
     # ------------------------------------------------------------------
     # Pipeline stages
@@ -57,6 +66,33 @@ class ChemblTargetPipeline(ChemblPipelineBase):
         log = UnifiedLogger.get(__name__).bind(component=self._component_for_stage("extract"))
         stage_start = time.perf_counter()
 
+        records = list(self._iter_target_records(log))
+        if self.config.cli.dry_run:
+            return pd.DataFrame()
+        dataframe = self._target_listing_frame(records)
+
+        duration_ms = (time.perf_counter() - stage_start) * 1000.0
+        log.info(
+            "chembl_target.extract_summary",
+            rows=int(dataframe.shape[0]),
+            duration_ms=duration_ms,
+            chembl_release=self.chembl_release,
+            limit=self.config.cli.limit,
+        )
+        return dataframe
+
+    def extract_all_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yield all target records ``runtime.chunk_rows`` at a time as they are paged."""
+
+        log = UnifiedLogger.get(__name__).bind(component=self._component_for_stage("extract"))
+        records = self._iter_target_records(log)
+        for batch in batch_records(records, self.config.runtime.chunk_rows):
+            yield self._target_listing_frame(batch)
+
+    def _iter_target_records(self, log: Any) -> Iterator[Mapping[str, Any]]:
+        """Yield the records of the ``/target.json`` listing as its pages arrive."""
+
+        stage_start = time.perf_counter()
         source_raw = self._resolve_source_config("chembl")
         source_config = TargetSourceConfig.from_source(source_raw)
         base_url = self._resolve_base_url(cast(Mapping[str, Any], dict(source_config.parameters)))
@@ -64,7 +100,12 @@ class ChemblTargetPipeline(ChemblPipelineBase):
             "chembl", base_url=base_url, client_name="chembl_target_http"
         )
 
-        chembl_client = ChemblClient(http_client)
+        chembl_client = ChemblClient(
+            http_client,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
+        )
         self.fetch_chembl_release(chembl_client, log)
 
         if self.config.cli.dry_run:
@@ -75,7 +116,7 @@ class ChemblTargetPipeline(ChemblPipelineBase):
                 duration_ms=duration_ms,
                 chembl_release=self.chembl_release,
             )
-            return pd.DataFrame()
+            return
 
         batch_size = source_config.batch_size
         limit = self.config.cli.limit
@@ -85,7 +126,6 @@ class ChemblTargetPipeline(ChemblPipelineBase):
         page_size = max(page_size, 1)
 
         select_fields = source_config.parameters.select_fields
-        records: list[Mapping[str, Any]] = []
 
         filters_payload = {
             "mode": "all",
@@ -105,25 +145,19 @@ class ChemblTargetPipeline(ChemblPipelineBase):
 
         # Используем специализированный клиент для target
         target_client = ChemblTargetClient(chembl_client, batch_size=min(page_size, 25))
-        for item in target_client.iterate_all(
+        yield from target_client.iterate_all(
             limit=limit,
             page_size=page_size,
             select_fields=select_fields,
-        ):
-            records.append(item)
+        )
+
+    @staticmethod
+    def _target_listing_frame(records: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+        """Build the frame of listed target ``records`` ordered by ID."""
 
         dataframe = pd.DataFrame.from_records(records)  # pyright: ignore[reportUnknownMemberType]
         if not dataframe.empty and "target_chembl_id" in dataframe.columns:
             dataframe = dataframe.sort_values("target_chembl_id").reset_index(drop=True)
-
-        duration_ms = (time.perf_counter() - stage_start) * 1000.0
-        log.info(
-            "chembl_target.extract_summary",
-            rows=int(dataframe.shape[0]),
-            duration_ms=duration_ms,
-            chembl_release=self.chembl_release,
-            limit=limit,
-        )
         return dataframe
 
     def extract_by_ids(self, ids: Sequence[str]) -> pd.DataFrame:
@@ -149,7 +183,12 @@ class ChemblTargetPipeline(ChemblPipelineBase):
             "chembl", base_url=base_url, client_name="chembl_target_http"
         )
 
-        chembl_client = ChemblClient(http_client)
+        chembl_client = ChemblClient(
+            http_client,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
+        )
         self.fetch_chembl_release(chembl_client, log)
 
         if self.config.cli.dry_run:
@@ -252,11 +291,13 @@ class ChemblTargetPipeline(ChemblPipelineBase):
 
         # Enrich with target_component data
         if not self.config.cli.dry_run:
-            df = self._enrich_target_components(df, log)
+            with self.profile_stage("enrich_target_components"):
+                df = self._enrich_target_components(df, log)
 
         # Enrich with protein_classification data
         if not self.config.cli.dry_run:
-            df = self._enrich_protein_classifications(df, log)
+            with self.profile_stage("enrich_protein_classifications"):
+                df = self._enrich_protein_classifications(df, log)
 
         # Normalize string fields
         df = self._normalize_string_fields(df, log)
@@ -316,6 +357,41 @@ class ChemblTargetPipeline(ChemblPipelineBase):
 
         return normalized_df
 
+    def _fetch_target_components(
+        self,
+        chembl_client: Any,
+        target_ids: Sequence[str],
+        log: Any,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch /target_component records grouped by target_chembl_id.
+
+        Components are requested in ``target_chembl_id__in`` batches with up to
+        ``runtime.parallelism`` batches in flight. Results are memoised on the
+        pipeline so that component and classification enrichment share one fetch.
+        """
+        missing = [
+            target_id for target_id in target_ids if target_id not in self._target_components
+        ]
+        if missing:
+            fetcher = ChemblTargetComponentEntityClient(chembl_client)
+            chunk_count = math.ceil(len(missing) / fetcher.CONFIG.chunk_size)
+            fetched = cast(
+                dict[str, list[dict[str, Any]]],
+                fetcher.fetch_by_ids(
+                    missing,
+                    fields=(),
+                    max_workers=resolve_worker_count(self.config.runtime.parallelism, chunk_count),
+                ),
+            )
+            for target_id in missing:
+                self._target_components[target_id] = fetched.get(target_id, [])
+            log.debug(
+                "target_components_fetched",
+                target_count=len(missing),
+                targets_with_components=sum(1 for target_id in missing if fetched.get(target_id)),
+            )
+        return {target_id: self._target_components.get(target_id, []) for target_id in target_ids}
+
     def _enrich_target_components(self, df: pd.DataFrame, log: Any) -> pd.DataFrame:
         """Enrich targets with component data from /target_component endpoint.
 
@@ -355,7 +431,12 @@ class ChemblTargetPipeline(ChemblPipelineBase):
         source_config = TargetSourceConfig.from_source_config(source_raw)
         base_url = self._resolve_base_url(cast(Mapping[str, Any], dict(source_config.parameters)))
         http_client, _ = self.prepare_chembl_client("chembl", base_url=base_url)
-        chembl_client = ChemblClient(http_client)
+        chembl_client = ChemblClient(
+            http_client,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
+        )
 
         if "target_chembl_id" not in df.columns:
             return df
@@ -373,31 +454,22 @@ class ChemblTargetPipeline(ChemblPipelineBase):
                 return False
             return normalized in target_ids_set
 
-        target_membership = df["target_chembl_id"].map(_is_target)
+        target_membership = map_unique(df["target_chembl_id"], _is_target)
 
         log.info("enrich_target_components_start", target_count=len(target_ids_to_enrich))
 
+        components_by_target = self._fetch_target_components(
+            chembl_client, target_ids_to_enrich, log
+        )
         for target_id in target_ids_to_enrich:
-            try:
-                components: list[str] = []
-                for item in chembl_client.paginate(
-                    "/target_component.json",
-                    params={"target_chembl_id": target_id},
-                    page_size=25,
-                    items_key="target_components",
-                ):
-                    accession = item.get("accession")
-                    if isinstance(accession, str) and accession.strip():
-                        components.append(accession.strip())
-
-                if components:
-                    component_map[target_id] = components
-            except Exception as exc:
-                log.warning(
-                    "target_component_fetch_error",
-                    target_chembl_id=target_id,
-                    error=str(exc),
-                )
+            components: list[str] = []
+            for item in components_by_target.get(target_id, []):
+                accession = item.get("accession")
+                if isinstance(accession, str) and accession.strip():
+                    components.append(accession.strip())
+
+            if components:
+                component_map[target_id] = components
 
         # Add uniprot_accessions column as JSON array (only for missing values)
         if "uniprot_accessions" in df.columns:
@@ -427,13 +499,17 @@ class ChemblTargetPipeline(ChemblPipelineBase):
 
         Extracts complete protein classification hierarchy with tree nodes and expanded paths l1..l8.
         Algorithm:
-        1. For each target, get components via /target_component.json
+        1. Get components for all targets via batched /target_component.json
+           (``target_chembl_id__in``)
         2. Filter only PROTEIN components (component_type = 'PROTEIN')
-        3. For each protein component, get classes via /component_class.json → protein_class_id
-        4. For each protein_class_id, get node metadata via /protein_classification.json
-        5. For each protein_class_id, get expanded path via /protein_family_classification.json → l1..l8
+        3. For each protein component, get protein_class_id values (component_class edges)
+        4. For each protein_class_id, get node metadata (protein_classification tree)
+        5. For each protein_class_id, get expanded path l1..l8 (protein_family_classification)
         6. Aggregate at TID level: protein_class_list (array) and protein_class_top (min class_level)
 
+        Steps 3-5 read :class:`ProteinClassificationIndex`, downloaded once per
+        release (see :meth:`_get_protein_classification_index`).
+
         Only enriches targets where protein_class_list or protein_class_top are missing.
         If data is already present from the main query, it will not be overwritten.
         """
@@ -466,7 +542,12 @@ class ChemblTargetPipeline(ChemblPipelineBase):
         source_config = TargetSourceConfig.from_source_config(source_raw)
         base_url = self._resolve_base_url(cast(Mapping[str, Any], dict(source_config.parameters)))
         http_client, _ = self.prepare_chembl_client("chembl", base_url=base_url)
-        chembl_client = ChemblClient(http_client)
+        chembl_client = ChemblClient(
+            http_client,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
+        )
 
         # Initialize columns if they don't exist
         if "protein_class_list" not in df.columns:
@@ -492,192 +573,51 @@ class ChemblTargetPipeline(ChemblPipelineBase):
                 return False
             return normalized in target_ids_set
 
-        target_membership = df["target_chembl_id"].map(_is_target)
+        target_membership = map_unique(df["target_chembl_id"], _is_target)
 
         log.info("enrich_protein_classifications_start", target_count=len(target_ids_to_enrich))
 
-        for target_id in target_ids_to_enrich:
-            try:
-                # Step 1: Get target components
-                component_ids: list[str] = []
-                for item in chembl_client.paginate(
-                    "/target_component.json",
-                    params={"target_chembl_id": target_id},
-                    page_size=25,
-                    items_key="target_components",
-                ):
-                    component_id = item.get("component_id")
-                    if component_id is not None:
-                        component_ids.append(str(component_id))
-
-                if not component_ids:
-                    continue
-
-                # Step 2: Filter only PROTEIN components
-                protein_component_ids: list[str] = []
-                for component_id in component_ids:
-                    try:
-                        # Get component_sequence to check component_type
-                        for seq_item in chembl_client.paginate(
-                            "/component_sequence.json",
-                            params={"component_id": component_id},
-                            page_size=25,
-                            items_key="component_sequences",
-                        ):
-                            component_type = seq_item.get("component_type")
-                            if (
-                                isinstance(component_type, str)
-                                and component_type.upper() == "PROTEIN"
-                            ):
-                                protein_component_ids.append(component_id)
-                                break
-                    except Exception as exc:
-                        log.debug(
-                            "component_sequence_fetch_error",
-                            target_chembl_id=target_id,
-                            component_id=component_id,
-                            error=str(exc),
-                        )
-
-                if not protein_component_ids:
-                    continue
-
-                # Step 3: Get protein_class_id for each protein component
-                protein_class_ids: set[str] = set()
-                for component_id in protein_component_ids:
-                    try:
-                        for class_item in chembl_client.paginate(
-                            "/component_class.json",
-                            params={"component_id": component_id},
-                            page_size=25,
-                            items_key="component_classes",
-                        ):
-                            protein_class_id = class_item.get("protein_class_id")
-                            if protein_class_id is not None:
-                                protein_class_ids.add(str(protein_class_id))
-                    except Exception as exc:
-                        log.debug(
-                            "component_class_fetch_error",
-                            target_chembl_id=target_id,
-                            component_id=component_id,
-                            error=str(exc),
-                        )
-
-                if not protein_class_ids:
-                    continue
-
-                # Step 4 & 5: Get metadata and paths for each protein_class_id
-                protein_classes: list[dict[str, Any]] = []
-                for protein_class_id in protein_class_ids:
-                    try:
-                        # Get node metadata
-                        node_metadata: dict[str, Any] | None = None
-                        for node_item in chembl_client.paginate(
-                            "/protein_classification.json",
-                            params={"protein_classification_id": protein_class_id},
-                            page_size=25,
-                            items_key="protein_classifications",
-                        ):
-                            node_metadata = {
-                                "protein_class_id": str(protein_class_id),
-                                "pref_name": node_item.get("pref_name"),
-                                "short_name": node_item.get("short_name"),
-                                "class_level": node_item.get("class_level"),
-                                "parent_id": node_item.get("parent_id"),
-                                "protein_class_desc": node_item.get("protein_class_desc"),
-                            }
-                            break
-
-                        # Get expanded path l1..l8
-                        path_levels: list[str | None] = [None] * 8
-                        try:
-                            for path_item in chembl_client.paginate(
-                                "/protein_family_classification.json",
-                                params={"protein_classification_id": protein_class_id},
-                                page_size=25,
-                                items_key="protein_family_classifications",
-                            ):
-                                for i in range(1, 9):
-                                    level_key = f"l{i}"
-                                    level_value = path_item.get(level_key)
-                                    if level_value is not None:
-                                        # Convert to string, handling NaN values
-                                        if isinstance(level_value, (float, int)):
-                                            if pd.isna(level_value):
-                                                path_levels[i - 1] = None
-                                            else:
-                                                path_levels[i - 1] = str(level_value)
-                                        else:
-                                            path_levels[i - 1] = str(level_value)
-                                break
-                        except Exception as exc:
-                            log.debug(
-                                "protein_family_classification_fetch_error",
-                                target_chembl_id=target_id,
-                                protein_class_id=protein_class_id,
-                                error=str(exc),
-                            )
-
-                        # Build complete class object
-                        if node_metadata:
-                            class_obj: dict[str, Any] = {
-                                "protein_class_id": node_metadata["protein_class_id"],
-                                "pref_name": node_metadata.get("pref_name"),
-                                "short_name": node_metadata.get("short_name"),
-                                "class_level": node_metadata.get("class_level"),
-                                "parent_id": node_metadata.get("parent_id"),
-                                "protein_class_desc": node_metadata.get("protein_class_desc"),
-                                "path": [level for level in path_levels if level is not None],
-                            }
-                            protein_classes.append(class_obj)
-                    except Exception as exc:
-                        log.warning(
-                            "protein_classification_fetch_error",
-                            target_chembl_id=target_id,
-                            protein_class_id=protein_class_id,
-                            error=str(exc),
-                        )
-
-                if protein_classes:
-                    # Deduplicate by protein_class_id (keep first occurrence)
-                    seen_ids: set[str] = set()
-                    unique_classes: list[dict[str, Any]] = []
-                    for class_obj in protein_classes:
-                        class_id = class_obj.get("protein_class_id")
-                        if class_id and class_id not in seen_ids:
-                            seen_ids.add(class_id)
-                            unique_classes.append(class_obj)
-
-                    # Sort by class_level for deterministic order
-                    unique_classes.sort(
-                        key=lambda x: (x.get("class_level") is None, x.get("class_level") or 0)
-                    )
+        # Step 1: Get target components in target_chembl_id__in batches
+        components_by_target = self._fetch_target_components(
+            chembl_client, target_ids_to_enrich, log
+        )
 
-                    classification_list_map[target_id] = unique_classes
-
-                    # Find top class (minimum class_level)
-                    top_class: dict[str, Any] | None = None
-                    min_level: int | None = None
-                    for class_obj in unique_classes:
-                        level = class_obj.get("class_level")
-                        if level is not None:
-                            try:
-                                level_int = int(level) if not isinstance(level, int) else level
-                                if min_level is None or level_int < min_level:
-                                    min_level = level_int
-                                    top_class = class_obj
-                            except (ValueError, TypeError):
-                                continue
-
-                    if top_class:
-                        classification_top_map[target_id] = top_class
+        # Steps 2-5 are dictionary lookups in the release-scoped classification index.
+        index = self._get_protein_classification_index(chembl_client, log)
 
-            except Exception as exc:
-                log.warning(
-                    "protein_classification_fetch_error",
-                    target_chembl_id=target_id,
-                    error=str(exc),
+        for target_id in target_ids_to_enrich:
+            # Step 2: Filter only PROTEIN components
+            protein_component_ids = [
+                str(item["component_id"])
+                for item in components_by_target.get(target_id, [])
+                if item.get("component_id") is not None
+                and index.is_protein_component(
+                    str(item["component_id"]), item.get("component_type")
                 )
+            ]
+            # Steps 3-5: classes of the components with their expanded l1..l8 paths
+            unique_classes = index.classes_for_components(protein_component_ids)
+            if not unique_classes:
+                continue
+
+            classification_list_map[target_id] = unique_classes
+
+            # Find top class (minimum class_level)
+            top_class: dict[str, Any] | None = None
+            min_level: int | None = None
+            for class_obj in unique_classes:
+                level = class_obj.get("class_level")
+                if level is not None:
+                    try:
+                        level_int = int(level) if not isinstance(level, int) else level
+                        if min_level is None or level_int < min_level:
+                            min_level = level_int
+                            top_class = class_obj
+                    except (ValueError, TypeError):
+                        continue
+
+            if top_class:
+                classification_top_map[target_id] = top_class
 
         # Add protein_class_list column (only for missing values)
         if "protein_class_list" in df.columns:
@@ -714,6 +654,43 @@ class ChemblTargetPipeline(ChemblPipelineBase):
         )
         return df
 
+    def _get_protein_classification_index(
+        self, chembl_client: Any, log: Any
+    ) -> ProteinClassificationIndex:
+        """Return the protein classification index of the current release.
+
+        The index is bulk-downloaded once per release, stored at
+        ``<paths.cache_root>/<release>/protein_classification.json`` and kept in
+        memory for the rest of the run. Without a known release or with
+        ``cache.enabled`` off it is downloaded but not stored. A failed
+        download yields an empty index, leaving the columns unset.
+        """
+        if self._protein_classification_index is not None:
+            return self._protein_classification_index
+        path: Path | None = None
+        release = self.chembl_release
+        if release and self.config.cache.enabled:
+            try:
+                path = (
+                    release_directory(self.config.paths.cache_root, release)
+                    / "protein_classification.json"
+                )
+            except ValueError:
+                path = None
+        try:
+            index = load_protein_classification_index(chembl_client, path)
+        except Exception as exc:
+            log.warning("protein_classification_index_failed", error=str(exc))
+            return ProteinClassificationIndex()
+        log.info(
+            "protein_classification_index_loaded",
+            protein_classes=len(index.classes),
+            components=len(index.component_classes),
+            path=str(path) if path is not None else None,
+        )
+        self._protein_classification_index = index
+        return index
+
     def _normalize_string_fields(self, df: pd.DataFrame, log: Any) -> pd.DataFrame:
         """Normalize string fields by trimming whitespace."""
         working_df = df.copy()
@@ -776,13 +753,13 @@ class ChemblTargetPipeline(ChemblPipelineBase):
 
         # Ensure component_count is Int64 (nullable integer)
         if "component_count" in df.columns:
-            coerced_component_count = df["component_count"].map(_coerce_nullable_int)
+            coerced_component_count = map_unique(df["component_count"], _coerce_nullable_int)
             df["component_count"] = coerced_component_count.astype("Int64")
 
         # Normalize species_group_flag: convert bool/str/int to Int64 (0 or 1)
         if "species_group_flag" in df.columns:
             try:
-                coerced_species_group_flag = df["species_group_flag"].map(_coerce_nullable_int)
+                coerced_species_group_flag = map_unique(df["species_group_flag"], _coerce_nullable_int)
                 df["species_group_flag"] = coerced_species_group_flag.astype("Int64")
             except (ValueError, TypeError) as exc:
                 log.warning("species_group_flag_conversion_failed", error=str(exc))
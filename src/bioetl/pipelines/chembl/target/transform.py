@@ -10,6 +10,7 @@ import numpy as np
 import numpy.typing as npt
 import pandas as pd
 
+from bioetl.core.frame import dict_fields_to_columns
 from bioetl.core.serialization import header_rows_serialize
 
 __all__ = [
@@ -21,6 +22,18 @@ __all__ = [
 
 JsonDict = dict[str, Any]
 
+_FLATTEN_SOURCE_FIELDS = ("target_components", "cross_references", "component_count")
+"""Record fields read by :func:`flatten_target_components`."""
+
+_FLATTENED_FIELDS = (
+    "uniprot_accessions",
+    "target_component_synonyms__flat",
+    "target_components__flat",
+    "cross_references__flat",
+    "component_count",
+)
+"""Fields returned by :func:`flatten_target_components`, in output order."""
+
 
 def _is_json_dict(value: Any) -> TypeGuard[JsonDict]:
     return isinstance(value, dict)
@@ -47,6 +60,31 @@ def _collect_dicts(source: Any) -> list[JsonDict]:
     return result
 
 
+def _none_if_missing(value: Any) -> Any:
+    """Return ``None`` for NaN-like scalars and empty or all-NaN arrays."""
+
+    # Handle array-like values: check if it's an array first
+    if isinstance(value, np.ndarray):
+        array_value = cast(npt.NDArray[Any], value)
+        if array_value.size == 0:
+            return None
+        try:
+            nan_mask = np.asarray(pd.isna(array_value), dtype=bool)
+        except (TypeError, ValueError):
+            # If isnan fails (e.g., string array), keep as is
+            return value
+        return None if bool(np.all(nan_mask)) else value
+    if pd.api.types.is_scalar(value):
+        try:
+            if pd.isna(value):
+                return None
+        except (TypeError, ValueError):
+            # If isna fails for this type, keep as is
+            pass
+    # For non-scalar, non-array values (like lists, dicts), keep as is
+    return value
+
+
 def flatten_target_components(rec: dict[str, Any]) -> dict[str, Any]:
     """Flatten nested target_components data into flat columns.
 
@@ -191,49 +229,24 @@ def serialize_target_arrays(df: pd.DataFrame, config: Any) -> pd.DataFrame:
     except (AttributeError, TypeError):
         pass
 
-    # Apply flatten to each row to extract nested data
+    # Flatten nested data in one pass over the columns (no per-row Series)
     if not df.empty:
-        # Convert DataFrame rows to dicts for flatten processing
-        flattened_data: list[dict[str, Any]] = []
-        for _, row in df.iterrows():
-            # Convert row to dict, handling NaN values
-            row_dict: dict[str, Any] = row.to_dict()  # pyright: ignore[reportUnknownMemberType]
-            # Replace NaN with None for proper dict handling
-            for key, value in row_dict.items():
-                # Handle array-like values: check if it's an array first
-                if isinstance(value, np.ndarray):
-                    array_value = cast(npt.NDArray[Any], value)
-                    # For arrays, check if empty or if all values are NaN
-                    if array_value.size == 0:
-                        row_dict[key] = None
-                    else:
-                        # Check if all values are NaN using numpy's isnan
-                        try:
-                            nan_mask = np.asarray(pd.isna(array_value), dtype=bool)
-                            if bool(np.all(nan_mask)):
-                                row_dict[key] = None
-                        except (TypeError, ValueError):
-                            # If isnan fails (e.g., string array), keep as is
-                            pass
-                    # Otherwise keep the array as is
-                elif pd.api.types.is_scalar(value):
-                    try:
-                        if pd.isna(value):
-                            row_dict[key] = None
-                    except (TypeError, ValueError):
-                        # If isna fails for this type, keep as is
-                        pass
-                # For non-scalar, non-array values (like lists, dicts), keep as is
-
-            # Apply flatten function
-            flattened = flatten_target_components(row_dict)
-
-            # Merge flattened fields into row dict
-            row_dict.update(flattened)
-            flattened_data.append(row_dict)
+        # Replace NaN with None for proper dict handling
+        columns = {
+            column: [_none_if_missing(value) for value in df[column].tolist()]
+            for column in df.columns
+        }
+        present = [field for field in _FLATTEN_SOURCE_FIELDS if field in columns]
+        flattened = dict_fields_to_columns(
+            (
+                flatten_target_components({field: columns[field][position] for field in present})
+                for position in range(len(df))
+            ),
+            _FLATTENED_FIELDS,
+        )
 
         # Recreate DataFrame with flattened fields
-        df = pd.DataFrame(flattened_data)
+        df = pd.DataFrame({**columns, **flattened})
 
     else:
         # Empty DataFrame: initialize flat columns
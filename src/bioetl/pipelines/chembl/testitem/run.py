@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from datetime import datetime, timezone
 from typing import Any, cast
 
@@ -19,6 +19,7 @@ from bioetl.config.testitem import TestItemSourceParameters
 from bioetl.core import UnifiedLogger
 from bioetl.core.api_client import UnifiedAPIClient
 from bioetl.core.normalizers import StringRule, StringStats, normalize_string_columns
+from bioetl.core.streaming import batch_records
 from bioetl.schemas.testitem import COLUMN_ORDER
 
 from ..chembl_base import CHEMBL_PIPELINE_EXTRACT_DOCSTRING, ChemblPipelineBase
@@ -135,6 +136,34 @@ class TestItemChemblPipeline(ChemblPipelineBase):
         log = UnifiedLogger.get(__name__).bind(component=self._component_for_stage("extract"))
         stage_start = time.perf_counter()
 
+        records = list(self._iter_testitem_records(log))
+        if self.config.cli.dry_run:
+            return pd.DataFrame()
+        dataframe = self._testitem_listing_frame(records)
+
+        duration_ms = (time.perf_counter() - stage_start) * 1000.0
+        log.info(
+            "chembl_testitem.extract_summary",
+            rows=int(dataframe.shape[0]),
+            duration_ms=duration_ms,
+            chembl_db_version=self._chembl_db_version,
+            api_version=self._api_version,
+            limit=self.config.cli.limit,
+        )
+        return dataframe
+
+    def extract_all_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yield all molecule records ``runtime.chunk_rows`` at a time as they are paged."""
+
+        log = UnifiedLogger.get(__name__).bind(component=self._component_for_stage("extract"))
+        records = self._iter_testitem_records(log)
+        for batch in batch_records(records, self.config.runtime.chunk_rows):
+            yield self._testitem_listing_frame(batch)
+
+    def _iter_testitem_records(self, log: BoundLogger) -> Iterator[Mapping[str, Any]]:
+        """Yield the records of the ``/molecule.json`` listing as its pages arrive."""
+
+        stage_start = time.perf_counter()
         source_raw = self._resolve_source_config("chembl")
         source_config = TestItemSourceConfig.from_source(source_raw)
         base_url = self._resolve_base_url(cast(Mapping[str, Any], dict(source_config.parameters)))
@@ -147,6 +176,9 @@ class TestItemChemblPipeline(ChemblPipelineBase):
             load_meta_store=self.load_meta_store,
             job_id=self.run_id,
             operator=self.pipeline_code,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
         )
         self._fetch_chembl_release(
             chembl_client,
@@ -163,7 +195,7 @@ class TestItemChemblPipeline(ChemblPipelineBase):
                 chembl_db_version=self._chembl_db_version,
                 api_version=self._api_version,
             )
-            return pd.DataFrame()
+            return
 
         limit = self.config.cli.limit
         page_size = self._resolve_page_size(source_config.page_size, limit)
@@ -171,7 +203,6 @@ class TestItemChemblPipeline(ChemblPipelineBase):
         if select_fields is not None:
             select_fields = list(dict.fromkeys([*select_fields, *MUST_HAVE_FIELDS]))
         log.debug("chembl_testitem.select_fields", fields=select_fields)
-        records: list[Mapping[str, Any]] = []
 
         filters_payload: dict[str, Any] = {
             "mode": "all",
@@ -193,28 +224,21 @@ class TestItemChemblPipeline(ChemblPipelineBase):
             batch_size=page_size,
             max_url_length=source_config.max_url_length,
         )
-        for item in testitem_client.iter(
+        yield from testitem_client.iter(
             limit=limit,
             page_size=page_size,
             select_fields=select_fields,
-        ):
-            records.append(item)
+        )
+
+    @staticmethod
+    def _testitem_listing_frame(records: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+        """Build the frame of listed molecule ``records`` ordered by ID."""
 
         dataframe = pd.DataFrame(records)
         if dataframe.empty:
-            dataframe = pd.DataFrame({"molecule_chembl_id": pd.Series(dtype="string")})
-        elif "molecule_chembl_id" in dataframe.columns:
+            return pd.DataFrame({"molecule_chembl_id": pd.Series(dtype="string")})
+        if "molecule_chembl_id" in dataframe.columns:
             dataframe = dataframe.sort_values("molecule_chembl_id").reset_index(drop=True)
-
-        duration_ms = (time.perf_counter() - stage_start) * 1000.0
-        log.info(
-            "chembl_testitem.extract_summary",
-            rows=int(dataframe.shape[0]),
-            duration_ms=duration_ms,
-            chembl_db_version=self._chembl_db_version,
-            api_version=self._api_version,
-            limit=limit,
-        )
         return dataframe
 
     def extract_by_ids(self, ids: Sequence[str]) -> pd.DataFrame:
@@ -245,6 +269,9 @@ class TestItemChemblPipeline(ChemblPipelineBase):
             load_meta_store=self.load_meta_store,
             job_id=self.run_id,
             operator=self.pipeline_code,
+            record_cache=self.get_record_cache(),
+            lookup_store=self.get_lookup_store(),
+            chembl_release=self.chembl_release,
         )
         self._fetch_chembl_release(
             chembl_client,
@@ -7,6 +7,7 @@ from typing import Any
 
 import pandas as pd
 
+from bioetl.core.frame import flatten_dict_column
 from bioetl.core.serialization import serialize_objects, serialize_simple_list
 
 __all__ = [
@@ -60,15 +61,8 @@ def flatten_object_col(
             df[f"{prefix}{f}"] = None
         return df
 
-    def row_to_dict(obj: Any) -> dict[str, Any]:
-        """Extract fields from nested object."""
-        if not isinstance(obj, dict):
-            return dict.fromkeys(fields)
-        return {f: obj.get(f) for f in fields}
-
-    # Apply transformation to extract nested fields
-    expanded = df[col].map(row_to_dict).apply(pd.Series)
-    expanded.columns = [f"{prefix}{c}" for c in expanded.columns]
+    # Extract all fields in one columnar pass (same dtypes as ``.apply(pd.Series)``)
+    expanded = flatten_dict_column(df[col], fields, prefix=prefix)
 
     # Drop original column and concatenate with expanded columns
     df = df.drop(columns=[col])
@@ -8,12 +8,15 @@ and data extraction utilities.
 from __future__ import annotations
 
 import time
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
 from typing import Any, Protocol, cast
 from urllib.parse import urlencode, urlparse
 
 import pandas as pd
+import yaml
 from structlog.stdlib import BoundLogger
 
 from bioetl.config.models.models import SourceConfig
@@ -21,10 +24,21 @@ from bioetl.config.pipeline_source import ChemblPipelineSourceConfig
 from bioetl.core import APIClientFactory
 from bioetl.core.api_client import UnifiedAPIClient
 from bioetl.core.logger import UnifiedLogger
+from bioetl.core.lookup_store import LookupStore
 from bioetl.core.mapping_utils import stringify_mapping
+from bioetl.core.output import read_dataset
+from bioetl.core.record_cache import RecordCache
+from bioetl.core.streaming import iter_frame_chunks
 
 from .base import PipelineBase
 from .common.release_tracker import ChemblHandshakeResult, ChemblReleaseMixin
+from .incremental import (
+    PreviousRunOutput,
+    ReleaseGatedPlan,
+    compute_change_log,
+    plan_release_gated_fetch,
+    summarise_change_log,
+)
 
 
 CHEMBL_PIPELINE_EXTRACT_DOCSTRING = (
@@ -64,6 +78,11 @@ class ChemblPipelineBase(ChemblReleaseMixin, PipelineBase):
         """
         super().__init__(config, run_id)
         self._client_factory = APIClientFactory(config)
+        self._record_cache: RecordCache | None = None
+        self._lookup_store: LookupStore | None = None
+        self._chembl_clients: dict[tuple[str, str], UnifiedAPIClient] = {}
+        self._release_gated_plan: ReleaseGatedPlan | None = None
+        self._release_gated_summary: dict[str, Any] | None = None
 
     def run_extract_stage(
         self,
@@ -71,14 +90,21 @@ class ChemblPipelineBase(ChemblReleaseMixin, PipelineBase):
         log: BoundLogger | None = None,
         event_name: str | None = None,
     ) -> pd.DataFrame:
-        """Execute the extract stage with shared CLI input handling."""
+        """Execute the extract stage with shared CLI input handling.
+
+        With ``runtime.release_gated`` enabled and a previous run available the
+        extraction is delegated to :meth:`extract_release_gated`.
+        """
 
         bound_log = log or UnifiedLogger.get(__name__).bind(
             component=self._component_for_stage("extract")
         )
         event = event_name or f"{self.pipeline_code}.extract_mode"
+        self._release_gated_plan = None
+        self._release_gated_summary = None
 
         input_file = getattr(self.config.cli, "input_file", None)
+        ids: list[str] = []
         if input_file:
             id_column_name = self._get_id_column_name()
             limit = getattr(self.config.cli, "limit", None)
@@ -88,16 +114,22 @@ class ChemblPipelineBase(ChemblReleaseMixin, PipelineBase):
                 limit=limit,
                 sample=sample,
             )
-            if ids:
-                extract_by_ids = getattr(self, "extract_by_ids", None)
-                if not callable(extract_by_ids):
-                    msg = (
-                        f"Pipeline '{self.pipeline_code}' does not implement extract_by_ids() "
-                        "but config.cli.input_file is provided."
-                    )
-                    raise NotImplementedError(msg)
-                bound_log.info(event, mode="batch", ids_count=len(ids))
-                return extract_by_ids(ids)
+
+        if self.config.runtime.release_gated:
+            gated = self.extract_release_gated(ids or None, log=bound_log, event=event)
+            if gated is not None:
+                return gated
+
+        if ids:
+            extract_by_ids = getattr(self, "extract_by_ids", None)
+            if not callable(extract_by_ids):
+                msg = (
+                    f"Pipeline '{self.pipeline_code}' does not implement extract_by_ids() "
+                    "but config.cli.input_file is provided."
+                )
+                raise NotImplementedError(msg)
+            bound_log.info(event, mode="batch", ids_count=len(ids))
+            return extract_by_ids(ids)
 
         bound_log.info(event, mode="full")
         extract_all = getattr(self, "extract_all", None)
@@ -106,6 +138,267 @@ class ChemblPipelineBase(ChemblReleaseMixin, PipelineBase):
             raise NotImplementedError(msg)
         return extract_all()
 
+    # ------------------------------------------------------------------
+    # Release-gated runs
+    # ------------------------------------------------------------------
+
+    def load_previous_output(self, log: BoundLogger | None = None) -> PreviousRunOutput | None:
+        """Return the dataset and ``meta.yaml`` of the most recent previous run.
+
+        The output directory of the current run is searched first, then
+        :attr:`pipeline_directory`. Returns ``None`` when no usable dataset is
+        found.
+        """
+
+        bound_log = log or UnifiedLogger.get(__name__).bind(
+            component=self._component_for_stage("extract")
+        )
+        directories: list[Path] = []
+        if self._run_output_path is not None:
+            output_path = self._run_output_path
+            directories.append(output_path if output_path.is_dir() else output_path.parent)
+        directories.append(self.pipeline_directory)
+
+        for directory in dict.fromkeys(directories):
+            stems = self.list_run_stems(directory)
+            if not stems:
+                continue
+            stem = stems[0]
+            dataset_path = directory / f"{stem}.{self.dataset_extension}"
+            dataframe = read_dataset(
+                dataset_path, config=self.config, dtypes=self._output_schema_dtypes()
+            )
+            required = (
+                self._get_id_column_name(),
+                self.config.determinism.hashing.row_hash_column,
+            )
+            missing = [column for column in required if column not in dataframe.columns]
+            if missing:
+                bound_log.warning(
+                    f"{self.pipeline_code}.release_gated_previous_unusable",
+                    dataset=str(dataset_path),
+                    missing_columns=missing,
+                )
+                return None
+            metadata: dict[str, Any] = {}
+            metadata_path = directory / f"{stem}_meta.yaml"
+            if metadata_path.exists():
+                loaded = yaml.safe_load(metadata_path.read_text(encoding="utf-8"))
+                if isinstance(loaded, Mapping):
+                    metadata = dict(cast(Mapping[str, Any], loaded))
+            return PreviousRunOutput(
+                stem=stem,
+                dataset_path=dataset_path,
+                dataframe=dataframe,
+                metadata=metadata,
+            )
+
+        bound_log.info(f"{self.pipeline_code}.release_gated_no_previous_run")
+        return None
+
+    def _output_schema_dtypes(self) -> dict[str, Any]:
+        """Return the dtypes of the output schema's columns, if a schema is configured."""
+
+        schema_entry = self._default_validation_schema_entry()
+        if schema_entry is None:
+            return {}
+        return {
+            name: column.dtype.type
+            for name, column in schema_entry.schema.columns.items()
+            if column.dtype is not None
+        }
+
+    def extract_release_gated(
+        self,
+        ids: Sequence[str] | None,
+        *,
+        log: BoundLogger,
+        event: str,
+    ) -> pd.DataFrame | None:
+        """Reuse the previous run's rows while the ChEMBL release is unchanged.
+
+        ChEMBL publishes no per-record modification dates, so the release is
+        the only change signal: with the same release only identifiers missing
+        from the previous dataset are fetched, after a release change the
+        requested identifiers (or the whole source) are fetched again.
+
+        Returns ``None`` when there is no previous run to build on, in which
+        case the regular extraction is performed.
+
+        Parameters
+        ----------
+        ids
+            Identifiers requested via ``cli.input_file``; ``None`` for a full run.
+        log
+            Logger bound to the extract stage.
+        event
+            Event name used to report the extraction mode.
+        """
+
+        previous = self.load_previous_output(log)
+        if previous is None:
+            return None
+
+        client, _ = self.prepare_chembl_client("chembl", client_name="chembl_client")
+        current_release = self.fetch_chembl_release(client, log)
+        plan = plan_release_gated_fetch(
+            previous,
+            id_column=self._get_id_column_name(),
+            requested_ids=ids,
+            current_release=current_release,
+        )
+        self._release_gated_plan = plan
+        log.info(
+            event,
+            mode="release_gated",
+            previous_dataset=str(previous.dataset_path),
+            previous_release=previous.release,
+            chembl_release=current_release,
+            fetch_ids=None if plan.fetch_ids is None else len(plan.fetch_ids),
+            carried_over=len(plan.carried_over),
+        )
+
+        if plan.fetch_ids is None:
+            return self.extract_all()
+        if not plan.fetch_ids:
+            return pd.DataFrame()
+        extracted = self.extract_by_ids(plan.fetch_ids)
+        # extract_by_ids() records only the re-fetched slice of the requested IDs.
+        filters = self._extract_metadata.get("filters")
+        if ids is not None and isinstance(filters, Mapping) and "requested_ids" in filters:
+            self._extract_metadata["filters"] = {**filters, "requested_ids": list(ids)}
+        return extracted
+
+    def merge_previous_output(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Append the rows carried over from the previous run to ``df``.
+
+        Hash columns and the ``load_meta_id`` derived from them are dropped
+        from the carried-over rows so that the write stage recomputes them for
+        the merged dataset as a whole, exactly as a full run would.
+        """
+
+        plan = self._release_gated_plan
+        if plan is None or plan.carried_over.empty:
+            return df
+        hashing = self.config.determinism.hashing
+        derived_columns = [
+            column
+            for column in (hashing.row_hash_column, hashing.business_key_column, "load_meta_id")
+            if column in plan.carried_over.columns
+        ]
+        carried_over = plan.carried_over.drop(columns=derived_columns)
+        if df.empty and len(df.columns) == 0:
+            return carried_over.reset_index(drop=True)
+        return pd.concat([carried_over, df], ignore_index=True)
+
+    def build_change_log(self, df: pd.DataFrame) -> pd.DataFrame | None:
+        """Return the keys added, changed or removed since the previous run.
+
+        Rows carried over unchanged are excluded from the comparison. Keys are
+        ``hash_business_key`` values when both datasets have them, otherwise
+        entity identifiers.
+        """
+
+        plan = self._release_gated_plan
+        id_column = self._get_id_column_name()
+        if plan is None or id_column not in df.columns:
+            return None
+        hashing = self.config.determinism.hashing
+        previous = plan.previous.dataframe
+        key_column = (
+            hashing.business_key_column
+            if hashing.business_key_fields
+            and hashing.business_key_column in previous.columns
+            and hashing.business_key_column in df.columns
+            else id_column
+        )
+        carried_ids = plan.carried_over[id_column].astype("string")
+        change_log = compute_change_log(
+            previous[~previous[id_column].astype("string").isin(carried_ids)],
+            df[~df[id_column].astype("string").isin(carried_ids)],
+            key_column=key_column,
+            row_hash_column=hashing.row_hash_column,
+            id_column=id_column,
+        )
+        summary = summarise_change_log(
+            change_log, current_keys=int(df[key_column].nunique(dropna=True))
+        )
+        self._release_gated_summary = {
+            "previous_dataset": plan.previous.dataset_path.name,
+            "previous_release": plan.previous.release,
+            "release_unchanged": plan.release_unchanged,
+            "fetched": "all" if plan.fetch_ids is None else len(plan.fetch_ids),
+            "carried_over": len(plan.carried_over),
+            **summary,
+        }
+        UnifiedLogger.get(__name__).info(
+            f"{self.pipeline_code}.release_gated_changes", **self._release_gated_summary
+        )
+        return change_log
+
+    def augment_metadata(
+        self,
+        metadata: Mapping[str, object],
+        df: pd.DataFrame,
+    ) -> Mapping[str, object]:
+        """Add the release-gated run summary to ``meta.yaml`` when available."""
+
+        enriched = dict(super().augment_metadata(metadata, df))
+        if self._release_gated_summary is not None:
+            enriched["release_gated"] = dict(self._release_gated_summary)
+        return enriched
+
+    def extract_chunks(self, *args: object, **kwargs: object) -> Iterator[pd.DataFrame]:
+        """Yield extracted records ``runtime.chunk_rows`` at a time.
+
+        With ``cli.input_file`` :meth:`extract_by_ids` is called for
+        ``chunk_rows`` input IDs at a time, otherwise the full listing comes
+        from :meth:`extract_all_chunks`.
+        """
+
+        log = UnifiedLogger.get(__name__).bind(component=self._component_for_stage("extract"))
+        input_file = getattr(self.config.cli, "input_file", None)
+        ids: list[str] = []
+        if input_file:
+            ids = self._read_input_ids(
+                id_column_name=self._get_id_column_name(),
+                limit=getattr(self.config.cli, "limit", None),
+                sample=getattr(self.config.cli, "sample", None),
+            )
+        if not ids and (args or kwargs):
+            # Legacy extract() arguments select the records themselves.
+            yield from super().extract_chunks(*args, **kwargs)
+            return
+        if not ids:
+            log.info(f"{self.pipeline_code}.extract_mode", mode="full_streaming")
+            yield from self.extract_all_chunks()
+            return
+
+        chunk_rows = self.config.runtime.chunk_rows
+        log.info(f"{self.pipeline_code}.extract_mode", mode="batch_streaming", ids_count=len(ids))
+        for start in range(0, len(ids), chunk_rows):
+            yield self.extract_by_ids(ids[start : start + chunk_rows])
+
+        # Each extract_by_ids() call records only its own slice of the requested IDs.
+        filters = self._extract_metadata.get("filters")
+        if isinstance(filters, Mapping) and "requested_ids" in filters:
+            self._extract_metadata["filters"] = {**filters, "requested_ids": list(ids)}
+
+    def extract_all_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yield the full listing in frames of at most ``runtime.chunk_rows`` rows.
+
+        The default slices the result of :meth:`extract_all`. Pipelines paging
+        through the listing override it, typically by feeding
+        :meth:`iter_listing_pages` into :func:`~bioetl.core.streaming.batch_records`,
+        so that only one page batch is held in memory.
+        """
+
+        extract_all = getattr(self, "extract_all", None)
+        if not callable(extract_all):
+            msg = f"Pipeline '{self.pipeline_code}' must implement extract_all()"
+            raise NotImplementedError(msg)
+        yield from iter_frame_chunks(extract_all(), self.config.runtime.chunk_rows)
+
     # ------------------------------------------------------------------
     # Configuration resolution methods
     # ------------------------------------------------------------------
@@ -284,6 +577,9 @@ class ChemblPipelineBase(ChemblReleaseMixin, PipelineBase):
     ) -> tuple[UnifiedAPIClient, str]:
         """Prepare and register a ChEMBL API client.
 
+        Registered clients are reused: later calls for the same source and base
+        URL return the client prepared first, whatever ``client_name`` they pass.
+
         Parameters
         ----------
         source_name
@@ -301,11 +597,65 @@ class ChemblPipelineBase(ChemblReleaseMixin, PipelineBase):
         source_config = self._resolve_source_config(source_name)
         parameters = getattr(source_config, "parameters", {})
         resolved_base_url = base_url or self._resolve_base_url(parameters)
+        key = (source_name, resolved_base_url)
+        client = self._chembl_clients.get(key)
+        if client is not None:
+            return client, resolved_base_url
         client = self._client_factory.for_source(source_name, base_url=resolved_base_url)
         if client_name:
-            self.register_client(client_name, client)
+            self._chembl_clients[key] = client
+            self.register_client(client_name, partial(self._close_chembl_client, key))
         return client, resolved_base_url
 
+    def _close_chembl_client(self, key: tuple[str, str]) -> None:
+        client = self._chembl_clients.pop(key, None)
+        if client is not None:
+            client.close()
+
+    def get_record_cache(self) -> RecordCache | None:
+        """Return the shared per-record cache, opening it on first use.
+
+        The cache lives at ``<paths.cache_root>/<cache.directory>/chembl_records.sqlite``
+        and is shared by all ChEMBL pipelines; entries are scoped by entity,
+        release and field selection. Returns ``None`` when ``cache.enabled`` is
+        false. The cache is closed together with registered clients.
+        """
+        cache_config = self.config.cache
+        if not cache_config.enabled:
+            return None
+        if self._record_cache is None:
+            directory_name = (cache_config.directory or "http_cache").strip() or "http_cache"
+            path = Path(self.config.paths.cache_root) / directory_name / "chembl_records.sqlite"
+            self._record_cache = RecordCache(path, ttl_seconds=int(cache_config.ttl))
+            self.register_client("chembl_record_cache", self._close_record_cache)
+        return self._record_cache
+
+    def _close_record_cache(self) -> None:
+        record_cache, self._record_cache = self._record_cache, None
+        if record_cache is not None:
+            record_cache.close()
+
+    def get_lookup_store(self) -> LookupStore | None:
+        """Return the release-scoped lookup store, opening it on first use.
+
+        Catalogs live at ``<paths.cache_root>/<release>/lookups.sqlite`` and are
+        shared by all ChEMBL pipelines; entity fetchers consult the store
+        before the record cache. Returns ``None`` unless both ``cache.enabled``
+        and ``cache.lookup_store`` are set.
+        """
+        cache_config = self.config.cache
+        if not (cache_config.enabled and cache_config.lookup_store):
+            return None
+        if self._lookup_store is None:
+            self._lookup_store = LookupStore(self.config.paths.cache_root)
+            self.register_client("chembl_lookup_store", self._close_lookup_store)
+        return self._lookup_store
+
+    def _close_lookup_store(self) -> None:
+        lookup_store, self._lookup_store = self._lookup_store, None
+        if lookup_store is not None:
+            lookup_store.close()
+
     # ------------------------------------------------------------------
     # ChEMBL release fetching
     # ------------------------------------------------------------------
@@ -518,6 +868,80 @@ class ChemblPipelineBase(ChemblReleaseMixin, PipelineBase):
         # Already a relative path
         return next_link
 
+    def iter_listing_pages(
+        self,
+        client: UnifiedAPIClient,
+        endpoint: str,
+        *,
+        base_url: str,
+        params: Mapping[str, Any] | None = None,
+        limit: int | None = None,
+        items_keys: Sequence[str] | None = None,
+        process_item: ProcessItemFn | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield the items of a paginated ChEMBL listing one page at a time.
+
+        ``page_meta.next`` links are followed until the listing ends or
+        ``limit`` items have been yielded. Pages are requested lazily, so a
+        caller consuming them in batches holds only the current batch.
+
+        Parameters
+        ----------
+        client
+            Unified API client instance.
+        endpoint
+            Listing endpoint path (e.g., "/activity.json").
+        base_url
+            Base URL of the API, used to make ``next`` links relative.
+        params
+            Query parameters of the first request.
+        limit
+            Optional limit on the total number of items.
+        items_keys
+            Optional keys to check for items in response (passed to _extract_page_items).
+        process_item
+            Optional callable to process each item.
+        """
+        log = UnifiedLogger.get(__name__).bind(component=self._component_for_stage("extract"))
+        next_endpoint: str | None = endpoint
+        query = params
+        fetched = 0
+
+        while next_endpoint:
+            page_start = time.perf_counter()
+            response = client.get(next_endpoint, params=query)
+            payload = self._coerce_mapping(response.json())
+            page_items = [
+                process_item(dict(item)) if process_item else dict(item)
+                for item in self._extract_page_items(payload, items_keys=items_keys)
+            ]
+            if limit is not None:
+                remaining = max(limit - fetched, 0)
+                if remaining == 0:
+                    break
+                page_items = page_items[:remaining]
+
+            fetched += len(page_items)
+            log.debug(
+                f"{self.pipeline_code}.page_fetched",
+                endpoint=next_endpoint,
+                batch_size=len(page_items),
+                total_records=fetched,
+                duration_ms=(time.perf_counter() - page_start) * 1000.0,
+            )
+            yield page_items
+
+            next_link = self._next_link(payload, base_url)
+            if not next_link or (limit is not None and fetched >= limit):
+                break
+            log.info(
+                f"{self.pipeline_code}.next_link_resolved",
+                next_link=next_link,
+                base_url=base_url,
+            )
+            next_endpoint = next_link
+            query = None
+
     # ------------------------------------------------------------------
     # Batch extraction utilities
     # ------------------------------------------------------------------
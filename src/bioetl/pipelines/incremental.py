@@ -0,0 +1,173 @@
+"""Helpers for runs built on a previous run's output.
+
+A release-gated run carries rows of the previous dataset over while the source
+release is unchanged, fetches the rest and records the differences between the
+two datasets in a compact change log.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+__all__ = [
+    "CHANGE_LOG_COLUMNS",
+    "PreviousRunOutput",
+    "ReleaseGatedPlan",
+    "compute_change_log",
+    "plan_release_gated_fetch",
+    "summarise_change_log",
+]
+
+CHANGE_LOG_COLUMNS = ("change", "key")
+"""Leading columns of the change log; the identifier column follows when known."""
+
+_CHANGE_ORDER = {"added": 0, "changed": 1, "removed": 2}
+
+
+@dataclass(frozen=True)
+class PreviousRunOutput:
+    """Dataset and ``meta.yaml`` payload of the previous run of a pipeline."""
+
+    stem: str
+    dataset_path: Path
+    dataframe: pd.DataFrame
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+
+    @property
+    def release(self) -> str | None:
+        """Return the source release recorded for the previous run."""
+
+        value = self.metadata.get("chembl_release")
+        return str(value) if value not in (None, "") else None
+
+
+@dataclass(frozen=True)
+class ReleaseGatedPlan:
+    """Which identifiers to fetch and which previous rows to carry over.
+
+    ``fetch_ids`` is ``None`` when the whole source has to be re-read.
+    """
+
+    previous: PreviousRunOutput
+    release_unchanged: bool
+    fetch_ids: list[str] | None
+    carried_over: pd.DataFrame
+
+
+def plan_release_gated_fetch(
+    previous: PreviousRunOutput,
+    *,
+    id_column: str,
+    requested_ids: Sequence[str] | None,
+    current_release: str | None,
+) -> ReleaseGatedPlan:
+    """Decide what a release-gated run has to fetch.
+
+    ChEMBL exposes no per-record change dates, only the release. While the
+    release matches the previous run's, previous rows are reused and only
+    identifiers missing from the previous dataset are fetched. After a release
+    change every requested identifier (or, without an ID list, the whole source)
+    is fetched again and the change log is derived from the row hashes.
+
+    Parameters
+    ----------
+    previous:
+        Output of the previous run.
+    id_column:
+        Column holding the entity identifier in the dataset.
+    requested_ids:
+        Identifiers requested via ``--input-file``; ``None`` for a full run.
+    current_release:
+        Release reported by the source for this run.
+    """
+
+    frame = previous.dataframe
+    release_unchanged = current_release is not None and previous.release == current_release
+    previous_ids = frame[id_column].astype("string")
+
+    if requested_ids is None:
+        if release_unchanged:
+            return ReleaseGatedPlan(previous, True, [], frame.reset_index(drop=True))
+        return ReleaseGatedPlan(previous, False, None, frame.iloc[0:0])
+
+    requested = list(dict.fromkeys(str(value) for value in requested_ids))
+    if release_unchanged:
+        known = set(previous_ids.dropna())
+        fetch_ids = [value for value in requested if value not in known]
+    else:
+        fetch_ids = requested
+    keep = previous_ids.isin(requested) & ~previous_ids.isin(fetch_ids)
+    carried_over = frame[keep.fillna(False).to_numpy(dtype=bool)].reset_index(drop=True)
+    return ReleaseGatedPlan(previous, release_unchanged, fetch_ids, carried_over)
+
+
+def compute_change_log(
+    previous: pd.DataFrame,
+    current: pd.DataFrame,
+    *,
+    key_column: str,
+    row_hash_column: str,
+    id_column: str | None = None,
+) -> pd.DataFrame:
+    """Return the keys added, changed or removed between two datasets.
+
+    A key is *changed* when the set of row hashes recorded for it differs.
+    Rows are ordered by change kind and key so the log is deterministic.
+    """
+
+    columns = [*CHANGE_LOG_COLUMNS]
+    if id_column and id_column != key_column:
+        columns.append(id_column)
+
+    def _pairs(frame: pd.DataFrame) -> pd.DataFrame:
+        pairs = pd.DataFrame(
+            {
+                "key": frame[key_column].astype("string"),
+                "row_hash": frame[row_hash_column].astype("string"),
+            }
+        )
+        if len(columns) > len(CHANGE_LOG_COLUMNS):
+            pairs[id_column] = frame[id_column].astype("string")
+        return pairs.drop_duplicates(subset=["key", "row_hash"])
+
+    previous_pairs = _pairs(previous)
+    current_pairs = _pairs(current)
+    previous_keys = pd.Index(previous_pairs["key"].dropna().unique())
+    current_keys = pd.Index(current_pairs["key"].dropna().unique())
+
+    merged = previous_pairs[["key", "row_hash"]].merge(
+        current_pairs[["key", "row_hash"]], how="outer", on=["key", "row_hash"], indicator=True
+    )
+    touched = pd.Index(merged.loc[merged["_merge"] != "both", "key"].dropna().unique())
+    common = previous_keys.intersection(current_keys)
+
+    def _entries(kind: str, keys: pd.Index, source: pd.DataFrame) -> pd.DataFrame:
+        selected = source[source["key"].isin(keys)].drop_duplicates(subset=["key"])
+        entries = selected.drop(columns=["row_hash"]).assign(change=kind)
+        return entries.reindex(columns=columns)
+
+    change_log = pd.concat(
+        [
+            _entries("added", current_keys.difference(previous_keys), current_pairs),
+            _entries("changed", touched.intersection(common), current_pairs),
+            _entries("removed", previous_keys.difference(current_keys), previous_pairs),
+        ],
+        ignore_index=True,
+    )
+    order = change_log["change"].map(_CHANGE_ORDER)
+    change_log = change_log.assign(_order=order).sort_values(by=["_order", "key"], kind="stable")
+    return change_log.drop(columns=["_order"]).reset_index(drop=True)
+
+
+def summarise_change_log(change_log: pd.DataFrame, *, current_keys: int) -> dict[str, int]:
+    """Return per-kind counts for ``meta.yaml`` including unchanged keys."""
+
+    counts = change_log["change"].value_counts()
+    summary = {kind: int(counts.get(kind, 0)) for kind in _CHANGE_ORDER}
+    summary["unchanged"] = current_keys - summary["added"] - summary["changed"]
+    return summary
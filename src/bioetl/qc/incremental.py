@@ -0,0 +1,263 @@
+"""Incremental QC statistics for chunked pipeline runs."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from bioetl.core.hashing import hash_frame_rows
+from bioetl.core.qc.units import QCUnits
+from bioetl.core.streaming import ExternalDistinctCounter
+
+from .metrics import (
+    CategoricalDistribution,
+    DuplicateStats,
+    categorical_distributions_from_counts,
+    categorical_value_counts,
+    duplicate_stats_from_counts,
+    missingness_from_counts,
+)
+from .report import (
+    correlation_report_from_matrix,
+    qc_metrics_payload_from_stats,
+    quality_report_from_stats,
+)
+
+__all__ = ["IncrementalQCAccumulator"]
+
+
+class IncrementalQCAccumulator:
+    """Accumulate QC statistics chunk by chunk with bounded memory.
+
+    The resulting artefacts have the layout of :func:`build_quality_report`,
+    :func:`build_qc_metrics_payload` and :func:`build_correlation_report`:
+
+    * duplicate counts are exact: row identities (or business keys) are hashed
+      and counted by :class:`~bioetl.core.streaming.ExternalDistinctCounter`;
+    * missingness and ``*_units``/``*_relation`` distributions are additive;
+    * correlations are Pearson coefficients over pairwise-complete rows, as in
+      :meth:`pandas.DataFrame.corr`, computed from accumulated co-moments.
+
+    IQR outliers need exact quantiles of whole columns and are not reported.
+    Chunks are expected to share the same columns.
+
+    Parameters
+    ----------
+    spill_directory:
+        Directory for the distinct-value spill files, owned by the caller.
+    business_key_fields:
+        Columns identifying a record for duplicate statistics; the whole row is
+        used when omitted.
+    track_correlation:
+        Accumulate co-moments for :meth:`correlation_matrix`; disable when the
+        correlation report is not requested.
+    """
+
+    def __init__(
+        self,
+        spill_directory: Path,
+        *,
+        business_key_fields: Sequence[str] | None = None,
+        track_correlation: bool = True,
+    ) -> None:
+        self._business_key_fields = list(business_key_fields) if business_key_fields else None
+        self._identities = ExternalDistinctCounter(Path(spill_directory) / "identities")
+        self._track_correlation = track_correlation
+        self._rows = 0
+        self._missing: dict[str, int] = {}
+        self._category_counts: dict[str, dict[str, int]] = {}
+        self._non_null: dict[str, int] = {}
+        self._corr_columns: list[str] = []
+        self._corr_shift: dict[str, float] = {}
+        self._pair_n = np.zeros((0, 0))
+        self._pair_sum = np.zeros((0, 0))
+        self._pair_sum_sq = np.zeros((0, 0))
+        self._pair_cross = np.zeros((0, 0))
+
+    @property
+    def row_count(self) -> int:
+        """Return the number of rows accumulated so far."""
+
+        return self._rows
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Fold ``df`` into the accumulated statistics."""
+
+        if df.empty:
+            return
+        self._update_identities(df)
+        self._update_missing(df)
+        self._update_categories(df)
+        if self._track_correlation:
+            self._update_correlation(df)
+        self._rows += len(df)
+
+    def duplicate_stats(self) -> DuplicateStats:
+        """Return duplicate statistics over all accumulated rows."""
+
+        return duplicate_stats_from_counts(
+            row_count=self._rows, deduplicated_count=self._identities.count()
+        )
+
+    def missingness(self) -> pd.DataFrame:
+        """Return missingness statistics in the layout of ``compute_missingness``."""
+
+        return missingness_from_counts(self._missing, total_rows=self._rows)
+
+    def units_distribution(self) -> CategoricalDistribution:
+        """Return ``*_units`` distributions in the layout of ``QCUnits.for_units``."""
+
+        return self._distribution(QCUnits.UNITS_SUFFIXES)
+
+    def relation_distribution(self) -> CategoricalDistribution:
+        """Return ``*_relation`` distributions in the layout of ``QCUnits.for_relation``."""
+
+        return self._distribution(QCUnits.RELATION_SUFFIXES)
+
+    def quality_report(self) -> pd.DataFrame:
+        """Return the quality report for all accumulated rows."""
+
+        return quality_report_from_stats(
+            duplicates=self.duplicate_stats(),
+            missing=self.missingness(),
+            units_distribution=self.units_distribution(),
+            relation_distribution=self.relation_distribution(),
+            outliers={},
+        )
+
+    def qc_metrics_payload(self) -> Mapping[str, Any]:
+        """Return the QC metrics payload for all accumulated rows."""
+
+        return qc_metrics_payload_from_stats(
+            duplicates=self.duplicate_stats(),
+            missing=self.missingness(),
+            units_distribution=self.units_distribution(),
+            relation_distribution=self.relation_distribution(),
+            outliers={},
+            business_key_fields=self._business_key_fields,
+        )
+
+    def correlation_matrix(self) -> pd.DataFrame | None:
+        """Return the numeric correlation matrix or ``None`` when not applicable."""
+
+        if len(self._corr_columns) < 2:
+            return None
+        order = np.argsort(self._corr_columns, kind="stable")
+        n = self._pair_n[np.ix_(order, order)]
+        sums = self._pair_sum[np.ix_(order, order)]
+        sums_sq = self._pair_sum_sq[np.ix_(order, order)]
+        cross = self._pair_cross[np.ix_(order, order)]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # sums[i, j] is the sum of column i over rows where i and j are both present
+            covariance = n * cross - sums * sums.T
+            variance = n * sums_sq - sums**2
+            correlation = covariance / np.sqrt(variance * variance.T)
+        correlation = np.clip(correlation, -1.0, 1.0)
+        diagonal = np.diag(variance) > 0
+        np.fill_diagonal(correlation, np.where(diagonal & (np.diag(n) > 1), 1.0, np.nan))
+        columns = [self._corr_columns[index] for index in order]
+        return pd.DataFrame(correlation, index=columns, columns=columns)
+
+    def correlation_report(self) -> pd.DataFrame | None:
+        """Return the correlation report for all accumulated rows."""
+
+        return correlation_report_from_matrix(self.correlation_matrix())
+
+    def _update_identities(self, df: pd.DataFrame) -> None:
+        fields = self._business_key_fields or sorted(str(column) for column in df.columns)
+        digests = hash_frame_rows(df, fields)
+        self._identities.add(pd.Series(digests, dtype="object"))
+
+    def _update_missing(self, df: pd.DataFrame) -> None:
+        for column in df.columns:
+            # Columns first seen in a later chunk were missing in earlier rows.
+            self._missing.setdefault(str(column), self._rows)
+        chunk_missing = df.isna().sum()
+        present = {str(column) for column in df.columns}
+        for column in self._missing:
+            if column in present:
+                self._missing[column] += int(chunk_missing[column])
+            else:
+                self._missing[column] += len(df)
+
+    def _update_categories(self, df: pd.DataFrame) -> None:
+        suffixes = (*QCUnits.UNITS_SUFFIXES, *QCUnits.RELATION_SUFFIXES)
+        for column in df.columns:
+            name = str(column)
+            if not any(name.endswith(suffix) for suffix in suffixes):
+                continue
+            if name not in self._category_counts:
+                self._category_counts[name] = defaultdict(int)
+                if self._rows:
+                    self._category_counts[name]["null"] += self._rows
+                self._non_null[name] = 0
+            series = df[column]
+            self._non_null[name] += int(series.notna().sum())
+            for value, count in categorical_value_counts(series).items():
+                self._category_counts[name][value] += count
+        for name, counts in self._category_counts.items():
+            if name not in df.columns:
+                counts["null"] += len(df)
+
+    def _distribution(self, suffixes: Sequence[str]) -> CategoricalDistribution:
+        counts = {
+            column: dict(values)
+            for column, values in self._category_counts.items()
+            if any(column.endswith(suffix) for suffix in suffixes)
+        }
+        return categorical_distributions_from_counts(
+            counts,
+            non_null_counts=self._non_null,
+            top_n=QCUnits.TOP_N,
+            ratio_precision=QCUnits.RATIO_PRECISION,
+            other_bucket_label=QCUnits.OTHER_BUCKET,
+        )
+
+    def _update_correlation(self, df: pd.DataFrame) -> None:
+        numeric = df.select_dtypes(include=["number", "bool"])
+        new_columns = [str(column) for column in numeric.columns if column not in self._corr_columns]
+        if new_columns:
+            self._grow_correlation(new_columns)
+        if not self._corr_columns:
+            return
+
+        values = np.full((len(df), len(self._corr_columns)), np.nan)
+        for index, column in enumerate(self._corr_columns):
+            if column not in numeric.columns:
+                continue
+            column_values = numeric[column].to_numpy(dtype="float64", na_value=np.nan)
+            if column not in self._corr_shift:
+                observed = column_values[~np.isnan(column_values)]
+                if observed.size == 0:
+                    continue
+                self._corr_shift[column] = float(observed[0])
+            # Shifting by a representative value keeps the one-pass sums well conditioned.
+            values[:, index] = column_values - self._corr_shift[column]
+
+        present = ~np.isnan(values)
+        mask = present.astype("float64")
+        filled = np.where(present, values, 0.0)
+        self._pair_n += mask.T @ mask
+        self._pair_sum += filled.T @ mask
+        self._pair_sum_sq += (filled**2).T @ mask
+        self._pair_cross += filled.T @ filled
+
+    def _grow_correlation(self, new_columns: Sequence[str]) -> None:
+        size = len(self._corr_columns) + len(new_columns)
+        width = len(self._corr_columns)
+
+        def _grow(matrix: np.ndarray) -> np.ndarray:
+            grown = np.zeros((size, size))
+            grown[:width, :width] = matrix
+            return grown
+
+        self._pair_n = _grow(self._pair_n)
+        self._pair_sum = _grow(self._pair_sum)
+        self._pair_sum_sq = _grow(self._pair_sum_sq)
+        self._pair_cross = _grow(self._pair_cross)
+        self._corr_columns.extend(new_columns)
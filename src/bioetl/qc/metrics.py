@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from decimal import ROUND_HALF_UP, Decimal
-from typing import TypedDict, cast
+from typing import Any, TypedDict, cast
 
 import pandas as pd
 from pandas._typing import Scalar
@@ -27,9 +27,13 @@ pd.StringDtype.__str__ = _string_dtype_repr  # type: ignore[assignment]
 
 __all__ = [
     "compute_duplicate_stats",
+    "duplicate_stats_from_counts",
     "compute_missingness",
     "compute_correlation_matrix",
     "compute_categorical_distributions",
+    "categorical_value_counts",
+    "categorical_distributions_from_counts",
+    "missingness_from_counts",
 ]
 
 
@@ -69,14 +73,30 @@ def compute_duplicate_stats(
     else:
         deduplicated = df.drop_duplicates(keep="first")
 
-    deduplicated_count = int(len(deduplicated))
-    duplicate_count = total_rows - deduplicated_count
-    duplicate_ratio = float(duplicate_count / total_rows) if total_rows else 0.0
+    return duplicate_stats_from_counts(
+        row_count=total_rows, deduplicated_count=int(len(deduplicated))
+    )
+
+
+def duplicate_stats_from_counts(*, row_count: int, deduplicated_count: int) -> DuplicateStats:
+    """Build duplicate statistics from a row count and a count of distinct identities.
+
+    Lets chunked callers that count identities externally report the same
+    layout as :func:`compute_duplicate_stats`.
+    """
 
+    if row_count == 0:
+        return DuplicateStats(
+            row_count=0,
+            duplicate_count=0,
+            duplicate_ratio=0.0,
+            deduplicated_count=0,
+        )
+    duplicate_count = row_count - deduplicated_count
     return DuplicateStats(
-        row_count=total_rows,
+        row_count=row_count,
         duplicate_count=duplicate_count,
-        duplicate_ratio=duplicate_ratio,
+        duplicate_ratio=float(duplicate_count / row_count),
         deduplicated_count=deduplicated_count,
     )
 
@@ -182,18 +202,77 @@ def compute_categorical_distributions(
         if any(column.endswith(suffix) for suffix in column_suffixes)
     ]
 
-    distributions: CategoricalDistribution = {}
-    for column in sorted(matched_columns):
+    counts: dict[str, dict[str, int]] = {}
+    non_null_counts: dict[str, int] = {}
+    for column in matched_columns:
         series = df[column]
-        non_null_count = int(series.notna().sum())
-        if non_null_count == 0:
+        non_null_counts[column] = int(series.notna().sum())
+        counts[column] = categorical_value_counts(series, value_normalizer=normalizer)
+
+    return categorical_distributions_from_counts(
+        counts,
+        non_null_counts=non_null_counts,
+        top_n=top_n,
+        ratio_precision=ratio_precision,
+        other_bucket_label=other_bucket_label,
+    )
+
+
+def categorical_value_counts(
+    series: pd.Series,
+    *,
+    value_normalizer: Callable[[Scalar | None], str] | None = None,
+) -> dict[str, int]:
+    """Return counts of normalised categories in ``series``.
+
+    Counts are additive, so chunked callers can sum them before calling
+    :func:`categorical_distributions_from_counts`.
+    """
+
+    normalizer: Callable[[Scalar | None], str] = value_normalizer or _default_value_normalizer
+    raw_counts = series.astype("object").value_counts(dropna=False, sort=False)
+    aggregated: dict[str, int] = defaultdict(int)
+    for raw_value, raw_count in raw_counts.items():
+        normalized_value = normalizer(cast(Scalar | None, raw_value))
+        aggregated[normalized_value] += int(raw_count)
+    return dict(aggregated)
+
+
+def categorical_distributions_from_counts(
+    counts: Mapping[str, Mapping[str, int]],
+    *,
+    non_null_counts: Mapping[str, int],
+    top_n: int = 20,
+    ratio_precision: int = 6,
+    other_bucket_label: str = "__other__",
+) -> CategoricalDistribution:
+    """Build distributions from per-column category counts.
+
+    Args:
+        counts: ``{column: {category: count}}`` как из :func:`categorical_value_counts`.
+        non_null_counts: Число непустых значений по колонкам; колонки без
+            непустых значений пропускаются.
+        top_n: Максимальное число категорий на колонку.
+        ratio_precision: Количество знаков после запятой для метрик долей.
+        other_bucket_label: Имя агрегированного bucket для редких категорий.
+
+    Returns:
+        Распределения в формате :func:`compute_categorical_distributions`.
+    """
+
+    if top_n <= 0:
+        msg = "top_n must be positive to maintain deterministic ordering"
+        raise ValueError(msg)
+    if ratio_precision < 0:
+        msg = "ratio_precision must be non-negative"
+        raise ValueError(msg)
+
+    distributions: CategoricalDistribution = {}
+    for column in sorted(counts):
+        if int(non_null_counts.get(column, 0)) == 0:
             continue
 
-        raw_counts = series.astype("object").value_counts(dropna=False, sort=False)
-        aggregated: dict[str, int] = defaultdict(int)
-        for raw_value, raw_count in raw_counts.items():
-            normalized_value = normalizer(cast(Scalar | None, raw_value))
-            aggregated[normalized_value] += int(raw_count)
+        aggregated = counts[column]
 
         # Determine priority order for top-N selection.
         prioritized = sorted(
@@ -204,7 +283,7 @@ def compute_categorical_distributions(
         if len(prioritized) > top_n:
             retained = prioritized[:top_n]
             remainder_count = sum(count for _, count in prioritized[top_n:])
-            merged: dict[str, int] = {key: count for key, count in retained}
+            merged: dict[str, int] = dict(retained)
             if remainder_count > 0:
                 merged[other_bucket_label] = merged.get(other_bucket_label, 0) + remainder_count
             final_items = merged.items()
@@ -242,10 +321,31 @@ def compute_categorical_distributions(
         distributions[column] = inner
 
     return distributions
+
+
 def compute_missingness(df: pd.DataFrame) -> pd.DataFrame:
     """Return per-column missing value statistics with stable ordering."""
 
-    if df.empty:
+    missing_count = df.isna().sum()
+    return missingness_from_counts(
+        {label: int(count) for label, count in missing_count.items()},
+        total_rows=int(len(df)),
+    )
+
+
+def missingness_from_counts(
+    missing_counts: Mapping[Any, int],
+    *,
+    total_rows: int,
+) -> pd.DataFrame:
+    """Return missingness statistics from per-column missing counts.
+
+    Produces the same frame as :func:`compute_missingness` for a dataframe with
+    ``total_rows`` rows; counts from several chunks can simply be summed.
+    """
+
+    column_dtype = pd.StringDtype(storage="python")
+    if total_rows == 0:
         result = pd.DataFrame(
             {
                 "column": pd.Series(dtype="string[python]"),
@@ -261,20 +361,17 @@ def compute_missingness(df: pd.DataFrame) -> pd.DataFrame:
             }
         )
 
-    column_dtype = pd.StringDtype(storage="python")
-
-    missing_count = df.isna().sum()
-    total_rows = int(len(df))
-    missing_count_int = missing_count.astype("int64")
-    missing_ratio = (missing_count / total_rows).astype("float64")
+    labels = list(missing_counts)
+    counts = pd.Series([int(missing_counts[label]) for label in labels], dtype="int64")
+    missing_ratio = (counts / total_rows).astype("float64")
 
-    column_labels: list[str] = [str(label) for label in missing_count.index]
+    column_labels: list[str] = [str(label) for label in labels]
     column_array = pd.array(column_labels, dtype=column_dtype)
 
     result = pd.DataFrame(
         {
             "column": column_array,
-            "missing_count": pd.Series(missing_count_int.values, dtype="int64"),
+            "missing_count": pd.Series(counts.values, dtype="int64"),
             "missing_ratio": pd.Series(missing_ratio.values, dtype="float64"),
         }
     )
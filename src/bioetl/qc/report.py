@@ -10,6 +10,7 @@ import pandas as pd
 from bioetl.core.qc.units import QCUnits
 
 from .metrics import (
+    CategoricalDistribution,
     DuplicateStats,
     compute_correlation_matrix,
     compute_duplicate_stats,
@@ -20,6 +21,9 @@ __all__ = [
     "build_quality_report",
     "build_correlation_report",
     "build_qc_metrics_payload",
+    "quality_report_from_stats",
+    "correlation_report_from_matrix",
+    "qc_metrics_payload_from_stats",
 ]
 
 
@@ -69,7 +73,29 @@ def build_quality_report(
 ) -> pd.DataFrame:
     """Return a deterministic tabular quality report for downstream persistence."""
 
-    duplicates = compute_duplicate_stats(df, business_key_fields=business_key_fields)
+    return quality_report_from_stats(
+        duplicates=compute_duplicate_stats(df, business_key_fields=business_key_fields),
+        missing=compute_missingness(df),
+        units_distribution=QCUnits.for_units(df),
+        relation_distribution=QCUnits.for_relation(df),
+        outliers=_detect_simple_outliers(df),
+    )
+
+
+def quality_report_from_stats(
+    *,
+    duplicates: DuplicateStats,
+    missing: pd.DataFrame,
+    units_distribution: CategoricalDistribution,
+    relation_distribution: CategoricalDistribution,
+    outliers: Mapping[str, Mapping[str, float | int]],
+) -> pd.DataFrame:
+    """Assemble the quality report from precomputed statistics.
+
+    Shared by :func:`build_quality_report` and chunked runs that accumulate the
+    statistics incrementally.
+    """
+
     rows: list[dict[str, Any]] = []
 
     summary_order: tuple[SummaryMetricKey, ...] = (
@@ -87,7 +113,6 @@ def build_quality_report(
             summary_row["count"] = int(metric_value)
         rows.append(summary_row)
 
-    missing = compute_missingness(df)
     if not missing.empty:
         missing_records = cast(Sequence[Mapping[str, Any]], missing.to_dict(orient="records"))
         for record in missing_records:
@@ -101,7 +126,6 @@ def build_quality_report(
                 }
             )
 
-    units_distribution = QCUnits.for_units(df)
     for column in sorted(units_distribution.keys()):
         for value, info in units_distribution[column].items():
             rows.append(
@@ -115,7 +139,6 @@ def build_quality_report(
                 }
             )
 
-    relation_distribution = QCUnits.for_relation(df)
     for column in sorted(relation_distribution.keys()):
         for value, info in relation_distribution[column].items():
             rows.append(
@@ -129,7 +152,7 @@ def build_quality_report(
                 }
             )
 
-    for column, info in _detect_simple_outliers(df).items():
+    for column, info in outliers.items():
         rows.append(
             {
                 "section": "outliers",
@@ -158,7 +181,12 @@ def build_quality_report(
 def build_correlation_report(df: pd.DataFrame) -> pd.DataFrame | None:
     """Return a correlation matrix suitable for deterministic persistence."""
 
-    correlation = compute_correlation_matrix(df)
+    return correlation_report_from_matrix(compute_correlation_matrix(df))
+
+
+def correlation_report_from_matrix(correlation: pd.DataFrame | None) -> pd.DataFrame | None:
+    """Format a correlation matrix as the persisted correlation report."""
+
     if correlation is None:
         return None
     correlation = correlation.reset_index(names="feature").rename_axis(columns=None)
@@ -173,11 +201,27 @@ def build_qc_metrics_payload(
 ) -> Mapping[str, Any]:
     """Return a flattened, deterministic mapping of QC metrics."""
 
-    duplicates: DuplicateStats = compute_duplicate_stats(
-        df,
+    return qc_metrics_payload_from_stats(
+        duplicates=compute_duplicate_stats(df, business_key_fields=business_key_fields),
+        missing=compute_missingness(df),
+        units_distribution=QCUnits.for_units(df),
+        relation_distribution=QCUnits.for_relation(df),
+        outliers=_detect_simple_outliers(df),
         business_key_fields=business_key_fields,
     )
-    missing = compute_missingness(df)
+
+
+def qc_metrics_payload_from_stats(
+    *,
+    duplicates: DuplicateStats,
+    missing: pd.DataFrame,
+    units_distribution: CategoricalDistribution,
+    relation_distribution: CategoricalDistribution,
+    outliers: Mapping[str, Mapping[str, float | int]],
+    business_key_fields: Sequence[str] | None = None,
+) -> Mapping[str, Any]:
+    """Assemble the QC metrics payload from precomputed statistics."""
+
     columns_with_missing = (
         missing.loc[missing["missing_count"] > 0, "column"].astype(str).tolist()
         if not missing.empty
@@ -185,10 +229,6 @@ def build_qc_metrics_payload(
     )
     total_missing = int(missing["missing_count"].sum()) if not missing.empty else 0
 
-    units_distribution = QCUnits.for_units(df)
-    relation_distribution = QCUnits.for_relation(df)
-    numeric_outliers = _detect_simple_outliers(df)
-
     payload: dict[str, Any] = {
         "row_count": duplicates["row_count"],
         "duplicate_count": duplicates["duplicate_count"],
@@ -205,7 +245,7 @@ def build_qc_metrics_payload(
             for column, distributions in sorted(relation_distribution.items(), key=lambda item: item[0])
         },
         "iqr_outliers": {
-            column: numeric_outliers[column] for column in sorted(numeric_outliers.keys())
+            column: dict(outliers[column]) for column in sorted(outliers.keys())
         },
     }
     if business_key_fields:
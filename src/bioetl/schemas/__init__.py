@@ -1,21 +1,18 @@
-"""Pandera schema registry used by BioETL pipelines."""
+"""Pandera schema registry used by BioETL pipelines.
+
+Built-in schemas are declared by module path and imported on first lookup;
+the ``Chembl*Schema`` and ``CHEMBL_*`` aliases below resolve lazily as well.
+"""
 
 from __future__ import annotations
 
 from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 import pandera as pa
 
-from . import (
-    chembl_activity_schema,
-    chembl_assay_schema,
-    chembl_document_schema,
-    chembl_target_schema,
-    chembl_testitem_schema,
-)
-
 __all__ = [
     "SchemaRegistryEntry",
     "SchemaRegistry",
@@ -36,23 +33,49 @@ __all__ = [
     "CHEMBL_ACTIVITY_PROPERTY_KEYS",
 ]
 
-ChemblActivitySchema = chembl_activity_schema.ActivitySchema
-CHEMBL_ACTIVITY_COLUMN_ORDER = chembl_activity_schema.COLUMN_ORDER
-CHEMBL_ACTIVITY_STANDARD_TYPES = chembl_activity_schema.STANDARD_TYPES
-CHEMBL_ACTIVITY_RELATIONS = chembl_activity_schema.RELATIONS
-CHEMBL_ACTIVITY_PROPERTY_KEYS = chembl_activity_schema.ACTIVITY_PROPERTY_KEYS
-
-ChemblAssaySchema = chembl_assay_schema.AssaySchema
-CHEMBL_ASSAY_COLUMN_ORDER = chembl_assay_schema.COLUMN_ORDER
-
-ChemblDocumentSchema = chembl_document_schema.DocumentSchema
-CHEMBL_DOCUMENT_COLUMN_ORDER = chembl_document_schema.COLUMN_ORDER
-
-ChemblTargetSchema = chembl_target_schema.TargetSchema
-CHEMBL_TARGET_COLUMN_ORDER = chembl_target_schema.COLUMN_ORDER
-
-ChemblTestItemSchema = chembl_testitem_schema.TestItemSchema
-CHEMBL_TESTITEM_COLUMN_ORDER = chembl_testitem_schema.COLUMN_ORDER
+_LAZY_ALIASES: dict[str, tuple[str, str]] = {
+    "ChemblActivitySchema": ("chembl_activity_schema", "ActivitySchema"),
+    "CHEMBL_ACTIVITY_COLUMN_ORDER": ("chembl_activity_schema", "COLUMN_ORDER"),
+    "CHEMBL_ACTIVITY_STANDARD_TYPES": ("chembl_activity_schema", "STANDARD_TYPES"),
+    "CHEMBL_ACTIVITY_RELATIONS": ("chembl_activity_schema", "RELATIONS"),
+    "CHEMBL_ACTIVITY_PROPERTY_KEYS": ("chembl_activity_schema", "ACTIVITY_PROPERTY_KEYS"),
+    "ChemblAssaySchema": ("chembl_assay_schema", "AssaySchema"),
+    "CHEMBL_ASSAY_COLUMN_ORDER": ("chembl_assay_schema", "COLUMN_ORDER"),
+    "ChemblDocumentSchema": ("chembl_document_schema", "DocumentSchema"),
+    "CHEMBL_DOCUMENT_COLUMN_ORDER": ("chembl_document_schema", "COLUMN_ORDER"),
+    "ChemblTargetSchema": ("chembl_target_schema", "TargetSchema"),
+    "CHEMBL_TARGET_COLUMN_ORDER": ("chembl_target_schema", "COLUMN_ORDER"),
+    "ChemblTestItemSchema": ("chembl_testitem_schema", "TestItemSchema"),
+    "CHEMBL_TESTITEM_COLUMN_ORDER": ("chembl_testitem_schema", "COLUMN_ORDER"),
+}
+
+if TYPE_CHECKING:
+    from .chembl_activity_schema import ACTIVITY_PROPERTY_KEYS as CHEMBL_ACTIVITY_PROPERTY_KEYS
+    from .chembl_activity_schema import COLUMN_ORDER as CHEMBL_ACTIVITY_COLUMN_ORDER
+    from .chembl_activity_schema import RELATIONS as CHEMBL_ACTIVITY_RELATIONS
+    from .chembl_activity_schema import STANDARD_TYPES as CHEMBL_ACTIVITY_STANDARD_TYPES
+    from .chembl_activity_schema import ActivitySchema as ChemblActivitySchema
+    from .chembl_assay_schema import COLUMN_ORDER as CHEMBL_ASSAY_COLUMN_ORDER
+    from .chembl_assay_schema import AssaySchema as ChemblAssaySchema
+    from .chembl_document_schema import COLUMN_ORDER as CHEMBL_DOCUMENT_COLUMN_ORDER
+    from .chembl_document_schema import DocumentSchema as ChemblDocumentSchema
+    from .chembl_target_schema import COLUMN_ORDER as CHEMBL_TARGET_COLUMN_ORDER
+    from .chembl_target_schema import TargetSchema as ChemblTargetSchema
+    from .chembl_testitem_schema import COLUMN_ORDER as CHEMBL_TESTITEM_COLUMN_ORDER
+    from .chembl_testitem_schema import TestItemSchema as ChemblTestItemSchema
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve schema aliases by importing their module on first access."""
+
+    target = _LAZY_ALIASES.get(name)
+    if target is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    module_name, attr = target
+    value = getattr(import_module(f"{__name__}.{module_name}"), attr)
+    globals()[name] = value
+    return value
 
 
 def _clone_schema_with_metadata(
@@ -115,11 +138,55 @@ class SchemaRegistryEntry:
     schema: pa.DataFrameSchema
 
 
+@dataclass(frozen=True, slots=True)
+class _DeclaredSchema:
+    """Module attributes of a schema that is registered on first lookup."""
+
+    module_path: str
+    schema_attr: str
+    version_attr: str
+    column_order_attr: str
+
+
 class SchemaRegistry:
     """In-memory registry of Pandera schemas."""
 
     def __init__(self) -> None:
         self._entries: MutableMapping[str, SchemaRegistryEntry] = {}
+        self._declared: MutableMapping[str, _DeclaredSchema] = {}
+
+    def declare(
+        self,
+        identifier: str,
+        *,
+        module_path: str,
+        schema_attr: str,
+        version_attr: str = "SCHEMA_VERSION",
+        column_order_attr: str = "COLUMN_ORDER",
+    ) -> None:
+        """Declare a schema to be imported and registered on first lookup."""
+
+        if identifier in self._entries or identifier in self._declared:
+            msg = f"Schema '{identifier}' is already registered"
+            raise ValueError(msg)
+        self._declared[identifier] = _DeclaredSchema(
+            module_path=module_path,
+            schema_attr=schema_attr,
+            version_attr=version_attr,
+            column_order_attr=column_order_attr,
+        )
+
+    def _load_declared(self, identifier: str) -> SchemaRegistryEntry:
+        declared = self._declared.pop(identifier)
+        module = import_module(declared.module_path)
+        schema: pa.DataFrameSchema = getattr(module, declared.schema_attr)
+        return self.register(
+            identifier,
+            schema=schema,
+            version=str(getattr(module, declared.version_attr)),
+            column_order=getattr(module, declared.column_order_attr),
+            name=getattr(schema, "name", identifier.split(".")[-1]),
+        )
 
     def register(
         self,
@@ -136,7 +203,7 @@ class SchemaRegistry:
             msg = f"Schema '{identifier}' version must be string."
             raise TypeError(msg)
 
-        if identifier in self._entries:
+        if identifier in self._entries or identifier in self._declared:
             msg = f"Schema '{identifier}' is already registered"
             raise ValueError(msg)
 
@@ -195,6 +262,8 @@ class SchemaRegistry:
 
         if identifier in self._entries:
             return self._entries[identifier]
+        if identifier in self._declared:
+            return self._load_declared(identifier)
 
         module_path, attr = _split_identifier(identifier)
         module = import_module(module_path)
@@ -220,8 +289,13 @@ class SchemaRegistry:
         )
 
     def as_mapping(self) -> Mapping[str, SchemaRegistryEntry]:
-        """Return a read-only mapping view of registered schemas."""
+        """Return a read-only mapping view of registered schemas.
+
+        Declared schemas that were not looked up yet are imported first.
+        """
 
+        for identifier in list(self._declared):
+            self._load_declared(identifier)
         return dict(self._entries)
 
 
@@ -241,72 +315,35 @@ def _split_identifier(identifier: str) -> tuple[str, str]:
 SCHEMA_REGISTRY = SchemaRegistry()
 
 
-def _register_builtin_schema(
-    *,
-    identifier: str,
-    module_path: str,
-    schema_attr: str,
-    version_attr: str,
-    column_order_attr: str,
-) -> None:
-    """Import module lazily and register declared schema."""
-
-    module = import_module(module_path)
-    schema: pa.DataFrameSchema = getattr(module, schema_attr)
-    version = getattr(module, version_attr)
-    column_order = getattr(module, column_order_attr)
-    name = getattr(schema, "name", identifier.split(".")[-1])
-
-    SCHEMA_REGISTRY.register(
-        identifier,
-        schema=schema,
-        version=str(version),
-        column_order=column_order,
-        name=name,
-    )
-
-
-_register_builtin_schema(
-    identifier="bioetl.schemas.chembl_activity_schema.ActivitySchema",
+SCHEMA_REGISTRY.declare(
+    "bioetl.schemas.chembl_activity_schema.ActivitySchema",
     module_path="bioetl.schemas.chembl_activity_schema",
     schema_attr="ActivitySchema",
-    version_attr="SCHEMA_VERSION",
-    column_order_attr="COLUMN_ORDER",
 )
-_register_builtin_schema(
-    identifier="bioetl.schemas.chembl_testitem_schema.TestItemSchema",
+SCHEMA_REGISTRY.declare(
+    "bioetl.schemas.chembl_testitem_schema.TestItemSchema",
     module_path="bioetl.schemas.chembl_testitem_schema",
     schema_attr="TestItemSchema",
-    version_attr="SCHEMA_VERSION",
-    column_order_attr="COLUMN_ORDER",
 )
-_register_builtin_schema(
-    identifier="bioetl.schemas.chembl_assay_schema.AssaySchema",
+SCHEMA_REGISTRY.declare(
+    "bioetl.schemas.chembl_assay_schema.AssaySchema",
     module_path="bioetl.schemas.chembl_assay_schema",
     schema_attr="AssaySchema",
-    version_attr="SCHEMA_VERSION",
-    column_order_attr="COLUMN_ORDER",
 )
-_register_builtin_schema(
-    identifier="bioetl.schemas.chembl_document_schema.DocumentSchema",
+SCHEMA_REGISTRY.declare(
+    "bioetl.schemas.chembl_document_schema.DocumentSchema",
     module_path="bioetl.schemas.chembl_document_schema",
     schema_attr="DocumentSchema",
-    version_attr="SCHEMA_VERSION",
-    column_order_attr="COLUMN_ORDER",
 )
-_register_builtin_schema(
-    identifier="bioetl.schemas.chembl_target_schema.TargetSchema",
+SCHEMA_REGISTRY.declare(
+    "bioetl.schemas.chembl_target_schema.TargetSchema",
     module_path="bioetl.schemas.chembl_target_schema",
     schema_attr="TargetSchema",
-    version_attr="SCHEMA_VERSION",
-    column_order_attr="COLUMN_ORDER",
 )
-_register_builtin_schema(
-    identifier="bioetl.schemas.chembl_metadata_schema.LoadMetaSchema",
+SCHEMA_REGISTRY.declare(
+    "bioetl.schemas.chembl_metadata_schema.LoadMetaSchema",
     module_path="bioetl.schemas.chembl_metadata_schema",
     schema_attr="LoadMetaSchema",
-    version_attr="SCHEMA_VERSION",
-    column_order_attr="COLUMN_ORDER",
 )
 
 
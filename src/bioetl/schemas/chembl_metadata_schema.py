@@ -4,8 +4,7 @@ from __future__ import annotations
 
 import json
 from collections.abc import Iterable
-from datetime import datetime
-from typing import Any, cast
+from typing import Any
 
 import pandas as pd
 import pandera as pa
@@ -84,31 +83,14 @@ def _validate_optional_json_series(series: pd.Series) -> bool:
     return bool(non_null.map(_is_valid_json_string).all())
 
 
-def _coerce_timestamp(value: Any) -> datetime | None:
-    if isinstance(value, pd.Series):
-        if value.empty:
-            return None
-        try:
-            scalar_value = cast(Any, value.item())
-        except ValueError:
-            return None
-        return _coerce_timestamp(scalar_value)
-    if isinstance(value, pd.Timestamp):
-        return value.to_pydatetime()
-    if isinstance(value, datetime):
-        return value
-    return None
-
-
-def _time_window_consistent(row: pd.Series[Any], **_: Any) -> bool:
-    start = _coerce_timestamp(row.get("request_started_at"))
-    finish = _coerce_timestamp(row.get("request_finished_at"))
-    ingested = _coerce_timestamp(row.get("ingested_at"))
-
-    if not (start and finish and ingested):
-        return False
+def _time_window_consistent(frame: pd.DataFrame, **_: Any) -> pd.Series[bool]:
+    """Return per row whether ``request_started_at <= request_finished_at <= ingested_at``."""
 
-    return start <= finish <= ingested
+    start = pd.to_datetime(frame["request_started_at"], utc=True)
+    finish = pd.to_datetime(frame["request_finished_at"], utc=True)
+    ingested = pd.to_datetime(frame["ingested_at"], utc=True)
+    # Comparisons with NaT are False, so missing timestamps fail the check.
+    return (start <= finish) & (finish <= ingested)
 
 
 CF = SchemaColumnFactory
@@ -0,0 +1,196 @@
+"""Запуск бенчмарков ``tests/benchmarks`` и сравнение с сохранённым baseline."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from bioetl.core.log_events import LogEvents
+from bioetl.core.logger import UnifiedLogger
+from bioetl.tools import get_project_root
+
+__all__ = [
+    "BENCHMARK_BASELINE_PATH",
+    "BenchmarkComparison",
+    "BenchmarkRegressionReport",
+    "check_benchmark_regressions",
+    "compare_benchmarks",
+    "load_benchmark_stats",
+    "run_benchmarks",
+]
+
+
+PROJECT_ROOT = get_project_root()
+BENCHMARKS_DIR = PROJECT_ROOT / "tests" / "benchmarks"
+BENCHMARK_BASELINE_PATH = PROJECT_ROOT / "artifacts" / "benchmarks" / "baseline.json"
+BENCHMARK_ROWS_ENV = "BIOETL_BENCHMARK_ROWS"
+
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    """Сравнение одного бенчмарка с baseline (время в секундах)."""
+
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+    @property
+    def regressed(self) -> bool:
+        return self.ratio > 1.0 + self.threshold
+
+
+@dataclass(frozen=True)
+class BenchmarkRegressionReport:
+    """Итог проверки: сравнения, новые бенчмарки и путь к результатам."""
+
+    comparisons: tuple[BenchmarkComparison, ...]
+    new_benchmarks: tuple[str, ...]
+    results_path: Path
+    baseline_saved: bool
+
+    @property
+    def regressions(self) -> tuple[BenchmarkComparison, ...]:
+        return tuple(item for item in self.comparisons if item.regressed)
+
+
+def load_benchmark_stats(path: Path, *, stat: str = "median") -> dict[str, float]:
+    """Читает JSON pytest-benchmark и возвращает ``fullname -> stats[stat]``."""
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    stats: dict[str, float] = {}
+    for entry in payload.get("benchmarks", []):
+        value = entry.get("stats", {}).get(stat)
+        if value is None:
+            raise KeyError(f"Statistic '{stat}' is missing for benchmark {entry.get('fullname')}")
+        stats[str(entry.get("fullname") or entry["name"])] = float(value)
+    return stats
+
+
+def compare_benchmarks(
+    baseline: Mapping[str, float],
+    current: Mapping[str, float],
+    *,
+    threshold: float,
+) -> list[BenchmarkComparison]:
+    """Сравнивает общие бенчмарки; регрессия — замедление больше ``threshold``."""
+
+    if threshold < 0:
+        raise ValueError("threshold must be non-negative")
+    return [
+        BenchmarkComparison(
+            name=name,
+            baseline=baseline[name],
+            current=current[name],
+            threshold=threshold,
+        )
+        for name in sorted(current)
+        if name in baseline
+    ]
+
+
+def run_benchmarks(
+    output_json: Path,
+    *,
+    rows: str | None = None,
+    pytest_args: Sequence[str] = (),
+) -> int:
+    """Запускает ``pytest --benchmark-only`` и пишет JSON результатов."""
+
+    command = [
+        sys.executable,
+        "-m",
+        "pytest",
+        str(BENCHMARKS_DIR),
+        "--benchmark-only",
+        f"--benchmark-json={output_json}",
+        "--no-cov",
+        "-q",
+        *pytest_args,
+    ]
+    env = dict(os.environ)
+    if rows:
+        env[BENCHMARK_ROWS_ENV] = rows
+    log = UnifiedLogger.get(__name__)
+    log.info(LogEvents.RUNNING_PYTEST, command=command, cwd=str(PROJECT_ROOT), rows=rows)
+    result = subprocess.run(command, cwd=PROJECT_ROOT, env=env, check=False)
+    log.info(LogEvents.PYTEST_FINISHED, returncode=result.returncode)
+    return result.returncode
+
+
+def check_benchmark_regressions(
+    *,
+    baseline_path: Path = BENCHMARK_BASELINE_PATH,
+    threshold: float = 0.2,
+    stat: str = "median",
+    rows: str | None = None,
+    results_path: Path | None = None,
+    save_baseline: bool = False,
+) -> BenchmarkRegressionReport:
+    """Сравнивает результаты бенчмарков с baseline и при необходимости обновляет его.
+
+    Parameters
+    ----------
+    baseline_path:
+        JSON pytest-benchmark, принятый за эталон.
+    threshold:
+        Допустимое относительное замедление (``0.2`` — на 20 %).
+    stat:
+        Статистика pytest-benchmark для сравнения (``median``, ``mean``, ``min``).
+    rows:
+        Размеры датасетов для ``BIOETL_BENCHMARK_ROWS`` (``"10k,100k"``).
+    results_path:
+        Готовый JSON результатов; без него бенчмарки запускаются заново, а
+        результаты сохраняются в ``latest.json`` рядом с baseline.
+    save_baseline:
+        Записать текущие результаты в ``baseline_path``. Отсутствующий baseline
+        создаётся всегда.
+    """
+
+    log = UnifiedLogger.get(__name__)
+    if results_path is None:
+        results_path = baseline_path.parent / "latest.json"
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        returncode = run_benchmarks(results_path, rows=rows)
+        if returncode != 0 or not results_path.exists():
+            raise RuntimeError(f"Benchmark run failed with exit code {returncode}")
+
+    current = load_benchmark_stats(results_path, stat=stat)
+    baseline_saved = save_baseline or not baseline_path.exists()
+    if baseline_saved:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        if results_path.resolve() != baseline_path.resolve():
+            shutil.copyfile(results_path, baseline_path)
+        log.info(LogEvents.BENCHMARK_BASELINE_SAVED, path=str(baseline_path), count=len(current))
+        baseline = current
+    else:
+        baseline = load_benchmark_stats(baseline_path, stat=stat)
+
+    comparisons = compare_benchmarks(baseline, current, threshold=threshold)
+    new_benchmarks = tuple(sorted(name for name in current if name not in baseline))
+    report = BenchmarkRegressionReport(
+        comparisons=tuple(comparisons),
+        new_benchmarks=new_benchmarks,
+        results_path=results_path,
+        baseline_saved=baseline_saved,
+    )
+    for item in report.regressions:
+        log.warning(
+            LogEvents.BENCHMARK_REGRESSION_DETECTED,
+            benchmark=item.name,
+            baseline=item.baseline,
+            current=item.current,
+            ratio=round(item.ratio, 3),
+            threshold=threshold,
+        )
+    return report
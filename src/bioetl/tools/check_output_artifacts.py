@@ -38,6 +38,30 @@ def _git_diff_cached(path: str) -> list[Path]:
     return [Path(line) for line in files]
 
 
+def _iter_artifact_sizes(output_dir: Path) -> list[tuple[Path, int]]:
+    """Return ``(path, size)`` for every artifact under ``output_dir``.
+
+    Hive-partitioned Parquet datasets (directories named ``*.parquet``) are
+    reported as a single artifact whose size is the sum of their parts.
+    """
+
+    dataset_dirs = sorted(path for path in output_dir.rglob("*.parquet") if path.is_dir())
+    artifacts: list[tuple[Path, int]] = []
+    for dataset_dir in dataset_dirs:
+        if any(parent in dataset_dirs for parent in dataset_dir.parents):
+            continue
+        size = sum(part.stat().st_size for part in dataset_dir.rglob("*") if part.is_file())
+        artifacts.append((dataset_dir, size))
+
+    for file_path in output_dir.rglob("*"):
+        if not file_path.is_file() or file_path.name in IGNORED_NAMES:
+            continue
+        if any(parent in dataset_dirs for parent in file_path.parents):
+            continue
+        artifacts.append((file_path, file_path.stat().st_size))
+    return artifacts
+
+
 def check_output_artifacts(max_bytes: int = MAX_BYTES) -> list[str]:
     """Возвращает список ошибок, связанных с артефактами в data/output."""
 
@@ -70,12 +94,9 @@ def check_output_artifacts(max_bytes: int = MAX_BYTES) -> list[str]:
 
     oversized: list[tuple[Path, int]] = []
     if output_dir.exists():
-        for file_path in output_dir.rglob("*"):
-            if not file_path.is_file() or file_path.name in IGNORED_NAMES:
-                continue
-            size = file_path.stat().st_size
+        for artifact_path, size in _iter_artifact_sizes(output_dir):
             if size > max_bytes:
-                oversized.append((file_path.relative_to(repo_root), size))
+                oversized.append((artifact_path.relative_to(repo_root), size))
 
     if oversized:
         formatted = "\n".join(f"  - {path} ({size / 1_000_000:.2f} MB)" for path, size in oversized)
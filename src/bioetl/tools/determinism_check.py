@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import filecmp
 import json
 import subprocess
 import sys
@@ -16,6 +17,7 @@ from bioetl.tools import get_project_root
 
 __all__ = [
     "DeterminismRunResult",
+    "compare_dataset_outputs",
     "run_determinism_check",
 ]
 
@@ -124,6 +126,64 @@ def compare_logs(
     return len(differences) == 0, differences
 
 
+def _dataset_files(root: Path) -> dict[str, Path]:
+    """Map relative paths to CSV and Parquet files (including partition parts)."""
+
+    if not root.exists():
+        return {}
+    return {
+        path.relative_to(root).as_posix(): path
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and path.suffix in {".csv", ".parquet"}
+    }
+
+
+def _compare_parquet_files(left: Path, right: Path) -> str | None:
+    import pyarrow.parquet as pq
+
+    left_table = pq.read_table(str(left))
+    right_table = pq.read_table(str(right))
+    if not left_table.schema.equals(right_table.schema, check_metadata=False):
+        return "schema mismatch"
+    if not left_table.equals(right_table):
+        return "content mismatch"
+    left_meta = pq.ParquetFile(str(left)).metadata
+    right_meta = pq.ParquetFile(str(right)).metadata
+    left_groups = [left_meta.row_group(i).num_rows for i in range(left_meta.num_row_groups)]
+    right_groups = [right_meta.row_group(i).num_rows for i in range(right_meta.num_row_groups)]
+    if left_groups != right_groups:
+        return f"row group layout mismatch: {left_groups} vs {right_groups}"
+    return None
+
+
+def compare_dataset_outputs(output_dir1: Path, output_dir2: Path) -> list[str]:
+    """Compare datasets written by two runs and return human-readable differences.
+
+    CSV files are compared byte-for-byte. Parquet files (including hive
+    partition parts) are compared by schema, table content and row-group
+    layout, which is stable across runs even if writer metadata differs.
+    """
+
+    files1 = _dataset_files(output_dir1)
+    files2 = _dataset_files(output_dir2)
+    differences: list[str] = []
+
+    for name in sorted(files1.keys() ^ files2.keys()):
+        run = "run1" if name in files1 else "run2"
+        differences.append(f"Dataset {name}: only present in {run}")
+
+    for name in sorted(files1.keys() & files2.keys()):
+        left, right = files1[name], files2[name]
+        if left.suffix == ".parquet":
+            problem = _compare_parquet_files(left, right)
+        else:
+            problem = None if filecmp.cmp(left, right, shallow=False) else "content mismatch"
+        if problem:
+            differences.append(f"Dataset {name}: {problem}")
+
+    return differences
+
+
 @dataclass(frozen=True)
 class DeterminismRunResult:
     """Result payload of a single determinism verification run."""
@@ -149,7 +209,8 @@ def _write_report(report_path: Path, results: dict[str, DeterminismRunResult]) -
     with tmp.open("w", encoding="utf-8") as handle:
         handle.write("# Determinism Check Report\n\n")
         handle.write(
-            "**Purpose**: Verify that pipeline runs produce identical structured logs.\n\n"
+            "**Purpose**: Verify that pipeline runs produce identical structured logs "
+            "and datasets (CSV and Parquet).\n\n"
         )
         handle.write(f"**Total pipelines tested**: {len(results)}\n\n")
         handle.write(f"- ✅ Deterministic: {total_deterministic}\n")
@@ -245,6 +306,10 @@ def run_determinism_check(
             logs1 = extract_structured_logs(stdout1, stderr1)
             logs2 = extract_structured_logs(stdout2, stderr2)
             are_identical, differences = compare_logs(logs1, logs2)
+            dataset_differences = compare_dataset_outputs(output_dir1, output_dir2)
+            if dataset_differences:
+                differences.extend(dataset_differences)
+                are_identical = False
 
             if are_identical:
                 log.info(LogEvents.PIPELINE_DETERMINISTIC, pipeline=pipeline_name, log_count=len(logs1))
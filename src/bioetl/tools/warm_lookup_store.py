@@ -0,0 +1,90 @@
+"""Предзаполнение хранилища справочников ChEMBL для релиза."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from bioetl.clients.client_chembl_base import EntityConfig, group_records_by_id
+from bioetl.clients.entities.client_assay_class_map import ChemblAssayClassMapEntityClient
+from bioetl.clients.entities.client_assay_classification import (
+    ChemblAssayClassificationEntityClient,
+)
+from bioetl.clients.entities.client_data_validity import ChemblDataValidityEntityClient
+from bioetl.core.logger import UnifiedLogger
+from bioetl.core.lookup_store import LookupStore
+
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from bioetl.clients.client_chembl_common import ChemblClient
+
+__all__ = ["WARMABLE_LOOKUPS", "LookupWarmError", "warm_lookup_store"]
+
+# Справочники, которые целиком выгружаются постраничным обходом эндпоинта.
+# Крупные сущности (molecule, assay) заполняются по мере запросов пайплайнов.
+WARMABLE_LOOKUPS: Mapping[str, EntityConfig] = {
+    "data_validity_lookup": ChemblDataValidityEntityClient.CONFIG,
+    "assay_classification": ChemblAssayClassificationEntityClient.CONFIG,
+    "assay_class_map": ChemblAssayClassMapEntityClient.CONFIG,
+}
+
+
+class LookupWarmError(RuntimeError):
+    """Хранилище нельзя заполнить для запрошенного релиза."""
+
+
+def warm_lookup_store(
+    chembl_client: ChemblClient,
+    store: LookupStore,
+    *,
+    release: str,
+    entities: Sequence[str] | None = None,
+    page_size: int = 1000,
+) -> dict[str, int]:
+    """Выгрузить справочники ``entities`` в каталог ``release``.
+
+    Записи сохраняются со всеми полями и поэтому обслуживают любой набор
+    ``only=`` в пайплайнах.
+
+    Returns
+    -------
+    dict[str, int]
+        Число идентификаторов, записанных для каждого справочника.
+
+    Raises
+    ------
+    LookupWarmError
+        Если API отдаёт другой релиз или справочник неизвестен.
+    """
+
+    selected = list(entities) if entities else list(WARMABLE_LOOKUPS)
+    unknown = sorted(set(selected) - set(WARMABLE_LOOKUPS))
+    if unknown:
+        msg = f"Unknown lookups {unknown}; expected any of {sorted(WARMABLE_LOOKUPS)}"
+        raise LookupWarmError(msg)
+
+    chembl_client.handshake()
+    served_release = chembl_client.chembl_release
+    if served_release != release:
+        msg = f"ChEMBL API serves release {served_release!r}, not the requested {release!r}"
+        raise LookupWarmError(msg)
+
+    log = UnifiedLogger.get(__name__).bind(component="warm_lookup_store", release=release)
+    written: dict[str, int] = {}
+    for name in selected:
+        config = WARMABLE_LOOKUPS[name]
+        records: list[dict[str, Any]] = [
+            dict(record)
+            for record in chembl_client.paginate(
+                config.endpoint,
+                params={"limit": page_size},
+                page_size=page_size,
+                items_key=config.items_key,
+            )
+        ]
+        record_ids = {
+            str(record[config.id_key]) for record in records if record.get(config.id_key)
+        }
+        grouped = group_records_by_id(records, config.id_key, record_ids)
+        written[name] = store.put_many(config.cache_namespace, grouped, release=release)
+        log.info("warm_lookup_store.entity_done", entity=name, records=len(records))
+    return written
@@ -0,0 +1,79 @@
+"""Fixtures for the offline pipeline benchmark suite.
+
+Benchmarks only run with ``--benchmark-only`` (or ``--benchmark-enable``) so the
+regular ``pytest`` run stays fast. Dataset sizes come from
+``BIOETL_BENCHMARK_ROWS`` (comma-separated, ``k``/``M`` suffixes allowed), e.g.
+``BIOETL_BENCHMARK_ROWS=10k,100k,1M``.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from bioetl.config import PipelineConfig
+from bioetl.core.client_registry import reset_client_registry
+from tests.benchmarks.datasets import load_pipeline_config
+
+BENCHMARK_ROWS_ENV = "BIOETL_BENCHMARK_ROWS"
+DEFAULT_BENCHMARK_ROWS = "10k"
+
+_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+
+def parse_row_counts(raw: str) -> list[int]:
+    """Parse ``"10k,100k,1M"`` into ``[10000, 100000, 1000000]``."""
+
+    counts: list[int] = []
+    for token in raw.split(","):
+        token = token.strip().lower().replace("_", "")
+        if not token:
+            continue
+        multiplier = _SUFFIXES.get(token[-1], 1)
+        digits = token[:-1] if token[-1] in _SUFFIXES else token
+        counts.append(int(float(digits) * multiplier))
+    return sorted(set(counts))
+
+
+def benchmark_row_counts() -> list[int]:
+    """Dataset sizes requested via ``BIOETL_BENCHMARK_ROWS``."""
+
+    return parse_row_counts(os.environ.get(BENCHMARK_ROWS_ENV, DEFAULT_BENCHMARK_ROWS))
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    benchmarks_dir = Path(__file__).parent
+    enabled = bool(
+        config.getoption("benchmark_only", False) or config.getoption("benchmark_enable", False)
+    )
+    skip = pytest.mark.skip(reason="benchmarks run only with --benchmark-only")
+    for item in items:
+        if benchmarks_dir not in Path(str(item.fspath)).parents:
+            continue
+        item.add_marker(pytest.mark.benchmark)
+        if not enabled:
+            item.add_marker(skip)
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "rows" in metafunc.fixturenames:
+        counts = benchmark_row_counts()
+        metafunc.parametrize("rows", counts, ids=[f"{count}rows" for count in counts])
+
+
+@pytest.fixture(autouse=True)
+def _isolated_client_registry() -> Generator[None, None, None]:
+    """Drop shared HTTP transports after each benchmark."""
+
+    yield
+    reset_client_registry()
+
+
+@pytest.fixture
+def activity_config() -> PipelineConfig:
+    """Bundled activity config; its hashing policy covers the core benchmarks."""
+
+    return load_pipeline_config("activity_chembl")
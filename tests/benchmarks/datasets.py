@@ -0,0 +1,305 @@
+"""Synthetic ChEMBL-shaped datasets and an offline transport for benchmarks.
+
+Records are tiled from the repository fixtures (``tests/bioetl/data``) and the
+vocabulary of :mod:`bioetl.tools.chembl_stub`; primary identifiers are rewritten so
+every row stays unique at 10k/100k/1M rows.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from bioetl.config import PipelineConfig, read_pipeline_config
+from bioetl.tools.chembl_stub import get_offline_new_client
+
+__all__ = [
+    "ENTITY_ENDPOINTS",
+    "StubChemblTransport",
+    "activity_frame",
+    "entity_records",
+    "load_pipeline_config",
+    "synthetic_frame",
+]
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = PROJECT_ROOT / "tests" / "bioetl" / "data"
+CONFIGS_DIR = PROJECT_ROOT / "configs" / "pipelines"
+
+ENTITY_ENDPOINTS: dict[str, tuple[str, str]] = {
+    "activity_chembl": ("/activity.json", "activities"),
+    "assay_chembl": ("/assay.json", "assays"),
+    "document_chembl": ("/document.json", "documents"),
+    "target_chembl": ("/target.json", "targets"),
+    "testitem_chembl": ("/molecule.json", "molecules"),
+}
+"""Entity endpoint and ``items_key`` served for each registered pipeline."""
+
+_STANDARD_UNITS = ("nM", "uM", "mM", "pM", "ug.mL-1")
+_STANDARD_RELATIONS = ("=", "<", ">", "<=", ">=")
+_STANDARD_TYPES = ("Ki", "EC50", "Kd")
+
+
+def load_pipeline_config(pipeline: str) -> PipelineConfig:
+    """Read the bundled config of ``pipeline`` (``<entity>_chembl``)."""
+
+    entity = pipeline.removesuffix("_chembl")
+    return read_pipeline_config(CONFIGS_DIR / entity / f"{pipeline}.yaml")
+
+
+def _chembl_ids(start: int, rows: int) -> np.ndarray:
+    return np.char.add("CHEMBL", np.arange(start, start + rows).astype(str))
+
+
+def _offline_values(resource: str, column: str) -> list[Any]:
+    records = getattr(get_offline_new_client(), resource).filter()
+    return [record[column] for record in records if record.get(column) is not None]
+
+
+def _activity_templates() -> list[dict[str, Any]]:
+    payload = json.loads((DATA_DIR / "sample_activity_data_raw.json").read_text("utf-8"))
+    return [dict(record) for record in payload]
+
+
+def _assay_templates() -> list[dict[str, Any]]:
+    base: dict[str, Any] = {
+        "description": "Synthetic assay",
+        "assay_type": _offline_values("assay", "assay_type")[0],
+        "assay_type_description": "Binding",
+        "assay_test_type": "In vitro",
+        "assay_category": "ADMET",
+        "assay_organism": "Homo sapiens",
+        "assay_tax_id": 9606,
+        "assay_strain": None,
+        "assay_tissue": "Whole organism",
+        "assay_cell_type": None,
+        "assay_subcellular_fraction": None,
+        "src_id": 1,
+        "src_assay_id": "SRC1",
+        "cell_chembl_id": None,
+        "tissue_chembl_id": "CHEMBL400",
+        "assay_group": "Group 1",
+        "confidence_score": 8,
+        "confidence_description": "High confidence",
+        "variant_sequence": None,
+    }
+    return [
+        {
+            **base,
+            "assay_classifications": [
+                {"assay_class_id": "BAO_0000015", "class_name": "Binding"},
+                {"assay_class_id": "BAO_0000016", "class_name": "Functional"},
+            ],
+            "assay_parameters": [
+                {"parameter_name": "Kd", "parameter_value": "10.5"},
+                {"parameter_name": "IC50", "parameter_value": "20.3"},
+            ],
+        },
+        {**base, "assay_type": "F", "assay_classifications": [], "assay_parameters": []},
+        {**base, "assay_classifications": None, "assay_parameters": None},
+    ]
+
+
+def _target_templates() -> list[dict[str, Any]]:
+    base: dict[str, Any] = {
+        "pref_name": "Synthetic target",
+        "target_type": _offline_values("target", "target_type")[0],
+        "organism": "Homo sapiens",
+        "tax_id": "9606",
+        "species_group_flag": 0,
+    }
+    return [
+        {
+            **base,
+            "cross_references": [
+                {"xref_id": "X1", "xref_name": "N1", "xref_src": "SRC"},
+                {"xref_id": "X2", "xref_name": "N2", "xref_src": "SRC"},
+            ],
+            "target_components": [
+                {
+                    "component_id": 1,
+                    "accession": "P12345",
+                    "component_type": "PROTEIN",
+                    "organism": "Homo sapiens",
+                    "tax_id": 9606,
+                    "target_component_synonyms": [
+                        {"syn_type": "GENE_SYMBOL", "synonyms": ["EGFR", "ERBB1"]},
+                    ],
+                }
+            ],
+        },
+        {**base, "species_group_flag": 1, "cross_references": None, "target_components": None},
+    ]
+
+
+def _document_templates() -> list[dict[str, Any]]:
+    return [
+        {
+            "doc_type": "Publication",
+            "journal": "Journal of Test",
+            "journal_full_title": "Journal of Test - Full Title",
+            "doi": "10.1000/test",
+            "src_id": "1",
+            "title": "Synthetic document",
+            "abstract": "Abstract of a synthetic document",
+            "year": 2023,
+            "journal_abbrev": "J. Test",
+            "volume": "1",
+            "issue": "2",
+            "first_page": "10",
+            "last_page": "15",
+            "pubmed_id": 1000000,
+            "authors": "Author A, Author B",
+        }
+    ]
+
+
+def _testitem_templates() -> list[dict[str, Any]]:
+    return [
+        {
+            "pref_name": "Synthetic molecule",
+            "molecule_type": "Small molecule",
+            "max_phase": 0,
+            "structure_type": "MOL",
+            "molecule_hierarchy": {"molecule_chembl_id": None, "parent_chembl_id": None},
+            "molecule_properties": {"full_mwt": 100.0, "alogp": 2.5, "hbd": 1, "hba": 2},
+            "molecule_structures": {"canonical_smiles": "CCO", "standard_inchi_key": None},
+            "molecule_synonyms": [{"molecule_synonym": "Synth", "syn_type": "TRADE_NAME"}],
+            "atc_classifications": ["A01AA", "A01AB"],
+            "cross_references": [{"xref_id": "1", "xref_src": "PubChem"}],
+        }
+    ]
+
+
+def synthetic_frame(templates: Sequence[Mapping[str, Any]], rows: int) -> pd.DataFrame:
+    """Tile ``templates`` into a frame with ``rows`` rows."""
+
+    frame = pd.DataFrame(list(templates))
+    positions = np.arange(rows) % len(frame)
+    return frame.iloc[positions].reset_index(drop=True)
+
+
+def activity_frame(rows: int) -> pd.DataFrame:
+    """Raw activity rows with varied units, relations and measurement values."""
+
+    frame = synthetic_frame(_activity_templates(), rows)
+    index = np.arange(rows)
+    units = np.array([*_offline_values("activity", "standard_units"), *_STANDARD_UNITS])
+    types = np.array([*_offline_values("activity", "standard_type"), *_STANDARD_TYPES])
+    relations = np.array([*_offline_values("activity", "standard_relation"), *_STANDARD_RELATIONS])
+    frame["activity_id"] = index + 1
+    frame["record_id"] = index + 100
+    frame["molecule_chembl_id"] = _chembl_ids(1, rows)
+    frame["testitem_chembl_id"] = frame["molecule_chembl_id"]
+    frame["assay_chembl_id"] = np.char.add("CHEMBL", (100 + index // 25).astype(str))
+    frame["standard_units"] = units[index % len(units)]
+    frame["standard_type"] = types[index % len(types)]
+    frame["standard_relation"] = relations[index % len(relations)]
+    frame["standard_value"] = np.round(1.0 + (index % 997) * 0.37, 3)
+    frame["bao_format"] = _offline_values("activity", "bao_format")[0]
+    frame["row_subtype"] = "activity"
+    frame["row_index"] = 0
+    return frame
+
+
+def _entity_frame(pipeline: str, rows: int) -> pd.DataFrame:
+    if pipeline == "activity_chembl":
+        return activity_frame(rows).drop(columns=["row_subtype", "row_index"])
+    builders = {
+        "assay_chembl": (_assay_templates, "assay_chembl_id", 100),
+        "document_chembl": (_document_templates, "document_chembl_id", 1000),
+        "target_chembl": (_target_templates, "target_chembl_id", 100),
+        "testitem_chembl": (_testitem_templates, "molecule_chembl_id", 1),
+    }
+    templates, id_column, start = builders[pipeline]
+    frame = synthetic_frame(templates(), rows)
+    frame[id_column] = _chembl_ids(start, rows)
+    if pipeline == "assay_chembl":
+        frame["target_chembl_id"] = _chembl_ids(200, rows)
+        frame["document_chembl_id"] = _chembl_ids(300, rows)
+    if pipeline == "document_chembl":
+        frame["pubmed_id"] = np.arange(1_000_000, 1_000_000 + rows)
+    return frame
+
+
+@lru_cache(maxsize=8)
+def entity_records(pipeline: str, rows: int) -> tuple[Mapping[str, Any], ...]:
+    """Records served by :class:`StubChemblTransport` for ``pipeline`` (cached)."""
+
+    frame = _entity_frame(pipeline, rows).astype(object)
+    frame = frame.where(frame.notna(), None)
+    return tuple(frame.to_dict(orient="records"))
+
+
+@dataclass
+class _StubResponse:
+    payload: Mapping[str, Any]
+    status_code: int = 200
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def json(self) -> Mapping[str, Any]:
+        return self.payload
+
+
+class StubChemblTransport:
+    """In-memory stand-in for :class:`~bioetl.core.api_client.UnifiedAPIClient`.
+
+    Serves ``status.json`` and offset-paginated pages of ``records`` for
+    ``endpoint``; every other endpoint answers with an empty page so
+    enrichment lookups stay offline.
+    """
+
+    base_url = "https://offline.chembl.stub/chembl/api/data"
+
+    def __init__(
+        self,
+        endpoint: str,
+        items_key: str,
+        records: Sequence[Mapping[str, Any]],
+        *,
+        release: str = "CHEMBL_36",
+    ) -> None:
+        self._endpoint = endpoint
+        self._items_key = items_key
+        self._records = records
+        self._status = {"chembl_db_version": release, "api_version": "2.0"}
+
+    def get(self, url: str, params: Mapping[str, Any] | None = None, **_: Any) -> _StubResponse:
+        if "status" in url:
+            return _StubResponse(self._status)
+        parts = urlsplit(url)
+        if not parts.path.rstrip("/").endswith(self._endpoint.strip("/")):
+            return _StubResponse({"page_meta": {"next": None, "total_count": 0}})
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        query.update({key: str(value) for key, value in (params or {}).items()})
+        limit = int(query.get("limit", 1000))
+        offset = int(query.get("offset", 0))
+        page = list(self._records[offset : offset + limit])
+        next_offset = offset + limit
+        next_url = (
+            f"{self._endpoint.lstrip('/')}?limit={limit}&offset={next_offset}"
+            if next_offset < len(self._records)
+            else None
+        )
+        return _StubResponse(
+            {
+                "page_meta": {
+                    "limit": limit,
+                    "offset": offset,
+                    "next": next_url,
+                    "total_count": len(self._records),
+                },
+                self._items_key: page,
+            }
+        )
+
+    def close(self) -> None:
+        return None
@@ -0,0 +1,24 @@
+"""Benchmarks for ChEMBL pagination over the offline transport."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from bioetl.clients.client_chembl_common import ChemblClient
+from tests.benchmarks.datasets import ENTITY_ENDPOINTS, StubChemblTransport, entity_records
+
+
+@pytest.mark.benchmark(group="clients.paginate")
+@pytest.mark.parametrize("pipeline", sorted(ENTITY_ENDPOINTS))
+def test_chembl_paginate(benchmark: Any, rows: int, pipeline: str) -> None:
+    endpoint, items_key = ENTITY_ENDPOINTS[pipeline]
+    transport = StubChemblTransport(endpoint, items_key, entity_records(pipeline, rows))
+
+    def _drain() -> int:
+        client = ChemblClient(transport)  # type: ignore[arg-type]
+        records = client.paginate(endpoint, params={}, page_size=1000, items_key=items_key)
+        return sum(1 for _ in records)
+
+    assert benchmark(_drain) == rows
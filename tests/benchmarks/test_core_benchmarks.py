@@ -0,0 +1,91 @@
+"""Benchmarks for the core helpers shared by every pipeline stage."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from bioetl.config import PipelineConfig
+from bioetl.core.frame import flatten_dict_column, map_unique
+from bioetl.core.hashing import hash_frame_rows
+from bioetl.core.output import ensure_hash_columns, write_dataset_atomic
+from bioetl.core.serialization import serialize_array_fields
+from tests.benchmarks.datasets import activity_frame, entity_records
+
+
+def _assay_frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame(list(entity_records("assay_chembl", rows)))
+
+
+@pytest.mark.benchmark(group="core.hashing")
+def test_ensure_hash_columns(benchmark: Any, rows: int, activity_config: PipelineConfig) -> None:
+    frame = activity_frame(rows)
+
+    result = benchmark(ensure_hash_columns, frame, config=activity_config)
+
+    assert result["hash_row"].notna().all()
+    assert result["hash_business_key"].str.len().eq(64).all()
+
+
+@pytest.mark.benchmark(group="core.hashing")
+def test_hash_frame_rows(benchmark: Any, rows: int) -> None:
+    frame = activity_frame(rows)
+    columns = list(frame.columns)
+
+    hashes = benchmark(hash_frame_rows, frame, columns, algorithm="sha256")
+
+    assert len(hashes) == rows
+
+
+@pytest.mark.benchmark(group="core.serialization")
+def test_serialize_array_fields(benchmark: Any, rows: int) -> None:
+    frame = _assay_frame(rows)
+
+    result = benchmark(serialize_array_fields, frame, ["assay_classifications", "assay_parameters"])
+
+    assert result["assay_classifications"].dtype == "string"
+
+
+@pytest.mark.benchmark(group="core.frame")
+def test_flatten_dict_column(benchmark: Any, rows: int) -> None:
+    frame = pd.DataFrame(list(entity_records("testitem_chembl", rows)))
+    fields = ["full_mwt", "alogp", "hbd", "hba"]
+
+    result = benchmark(
+        flatten_dict_column, frame["molecule_properties"], fields, prefix="molecule_properties__"
+    )
+
+    assert list(result.columns) == [f"molecule_properties__{field}" for field in fields]
+
+
+@pytest.mark.benchmark(group="core.frame")
+def test_map_unique(benchmark: Any, rows: int) -> None:
+    frame = activity_frame(rows)
+
+    result = benchmark(
+        map_unique, frame["standard_units"], lambda value: str(value).strip().lower()
+    )
+
+    assert len(result) == len(frame)
+
+
+@pytest.mark.benchmark(group="core.write")
+@pytest.mark.parametrize("output_format", ["csv", "parquet"])
+def test_write_dataset_atomic(
+    benchmark: Any,
+    rows: int,
+    output_format: str,
+    activity_config: PipelineConfig,
+    tmp_path: Path,
+) -> None:
+    config = activity_config.model_copy(deep=True)
+    config.materialization.default_format = output_format  # type: ignore[assignment]
+    frame = ensure_hash_columns(activity_frame(rows), config=config)
+    path = tmp_path / f"activity.{output_format}"
+
+    benchmark(write_dataset_atomic, frame, path, config=config)
+
+    assert path.exists()
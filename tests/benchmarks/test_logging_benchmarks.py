@@ -0,0 +1,70 @@
+"""Per-event cost of the structured logger in its output modes.
+
+Each round emits ``_EVENTS`` ``http.request.completed`` events to ``os.devnull``
+and waits for the sink to drain, so the reported mean divided by ``_EVENTS`` is
+the cost of one event. ``sync_callsite_all`` reproduces the former setup with
+call-site capture on every event.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+
+from bioetl.core.log_events import LogEvents
+from bioetl.core.logger import LogConfig, LogSamplingRule, UnifiedLogger, shutdown_logging
+
+_EVENTS = 1_000
+
+_CONFIGS: dict[str, LogConfig] = {
+    "sync_callsite_all": LogConfig(callsite_level="DEBUG"),
+    "sync": LogConfig(),
+    "async": LogConfig(async_sink=True),
+    "async_sampled": LogConfig(
+        async_sink=True,
+        sampling={LogEvents.HTTP_REQUEST_COMPLETED.value: LogSamplingRule(rate=0.1)},
+    ),
+}
+
+
+@pytest.fixture
+def devnull_stderr(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    with open(os.devnull, "w", encoding="utf-8") as stream:
+        monkeypatch.setattr(sys, "stderr", stream)
+        yield
+        shutdown_logging()
+    UnifiedLogger.configure()
+
+
+@pytest.mark.benchmark(group="core.logging")
+@pytest.mark.parametrize("mode", sorted(_CONFIGS))
+def test_log_event_cost(benchmark: Any, mode: str, devnull_stderr: None) -> None:
+    UnifiedLogger.configure(_CONFIGS[mode])
+    log = UnifiedLogger.get(__name__).bind(
+        run_id="bench",
+        pipeline="activity_chembl",
+        stage="extract",
+        dataset="activity",
+        component="http",
+        trace_id="trace",
+        span_id="span",
+    )
+
+    def _emit() -> None:
+        for attempt in range(_EVENTS):
+            log.info(
+                LogEvents.HTTP_REQUEST_COMPLETED,
+                method="GET",
+                url="/activity.json",
+                status_code=200,
+                attempt=attempt,
+                duration_ms=12.5,
+            )
+        UnifiedLogger.flush()
+
+    benchmark.extra_info["events_per_round"] = _EVENTS
+    benchmark(_emit)
@@ -0,0 +1,105 @@
+"""Stage benchmarks (extract/transform/validate/write) for every registered pipeline.
+
+Pipelines are built from :data:`bioetl.cli.cli_registry.COMMAND_REGISTRY` with
+their bundled configs; ``APIClientFactory.for_source`` is patched to serve the
+synthetic datasets, so no stage touches the network.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from bioetl.cli.cli_registry import COMMAND_REGISTRY
+from bioetl.core.client_factory import APIClientFactory
+from bioetl.core.logger import UnifiedLogger
+from bioetl.pipelines.base import PipelineBase
+from tests.benchmarks.datasets import (
+    ENTITY_ENDPOINTS,
+    StubChemblTransport,
+    activity_frame,
+    entity_records,
+    load_pipeline_config,
+)
+
+PIPELINES = tuple(sorted(COMMAND_REGISTRY))
+ROUNDS = 3
+
+
+@pytest.fixture(params=PIPELINES)
+def pipeline_name(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+def _offline_pipeline(name: str, rows: int, monkeypatch: pytest.MonkeyPatch) -> PipelineBase:
+    endpoint, items_key = ENTITY_ENDPOINTS[name]
+    transport = StubChemblTransport(endpoint, items_key, entity_records(name, rows))
+    monkeypatch.setattr(APIClientFactory, "for_source", lambda self, *args, **kwargs: transport)
+    command = COMMAND_REGISTRY[name]()
+    return command.pipeline_class(load_pipeline_config(name), run_id="benchmark")
+
+
+@pytest.fixture
+def offline_pipeline(
+    pipeline_name: str, rows: int, monkeypatch: pytest.MonkeyPatch, benchmark: Any
+) -> PipelineBase:
+    benchmark.group = pipeline_name
+    return _offline_pipeline(pipeline_name, rows, monkeypatch)
+
+
+def _bench_stage(benchmark: Any, stage: Any, frame: pd.DataFrame) -> Any:
+    """Time ``stage`` on a fresh copy of ``frame`` per round."""
+
+    return benchmark.pedantic(
+        stage, setup=lambda: ((frame.copy(),), {}), rounds=ROUNDS, iterations=1
+    )
+
+
+def test_extract(benchmark: Any, offline_pipeline: PipelineBase) -> None:
+    frame = benchmark.pedantic(offline_pipeline.extract, rounds=ROUNDS, iterations=1)
+
+    assert not frame.empty
+
+
+def test_transform(benchmark: Any, offline_pipeline: PipelineBase) -> None:
+    raw = offline_pipeline.extract()
+
+    result = _bench_stage(benchmark, offline_pipeline.transform, raw)
+
+    assert not result.empty
+
+
+def test_validate(benchmark: Any, offline_pipeline: PipelineBase) -> None:
+    transformed = offline_pipeline.transform(offline_pipeline.extract())
+
+    result = _bench_stage(benchmark, offline_pipeline.validate, transformed)
+
+    assert len(result) == len(transformed)
+
+
+def test_write(benchmark: Any, offline_pipeline: PipelineBase, tmp_path: Path) -> None:
+    validated = offline_pipeline.validate(offline_pipeline.transform(offline_pipeline.extract()))
+    counter = iter(range(ROUNDS))
+
+    def _write(frame: pd.DataFrame) -> Any:
+        return offline_pipeline.write(frame, tmp_path / f"round-{next(counter)}")
+
+    result = _bench_stage(benchmark, _write, validated)
+
+    assert result is not None
+
+
+@pytest.mark.benchmark(group="activity_chembl")
+def test_activity_normalize_measurements(
+    benchmark: Any, rows: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pipeline = _offline_pipeline("activity_chembl", rows, monkeypatch)
+    frame = activity_frame(rows)
+    log = UnifiedLogger.get(__name__)
+
+    result = benchmark(pipeline._normalize_measurements, frame, log)  # pyright: ignore[reportAttributeAccessIssue]
+
+    assert len(result) == rows
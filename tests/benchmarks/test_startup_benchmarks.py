@@ -0,0 +1,39 @@
+"""Cold-start benchmark for the ``bioetl`` CLI.
+
+Each round imports :mod:`bioetl.cli.cli_app` in a fresh interpreter, which is
+what ``bioetl --help``, every xdist worker and every short-lived job pay
+before doing any work. The mean must stay within
+``BIOETL_CLI_IMPORT_BUDGET_S`` seconds (default ``1.5``).
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+IMPORT_BUDGET_ENV = "BIOETL_CLI_IMPORT_BUDGET_S"
+DEFAULT_IMPORT_BUDGET_S = 1.5
+
+
+def _import_cli_app() -> None:
+    subprocess.run(
+        [sys.executable, "-c", "import bioetl.cli.cli_app"],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.benchmark(group="cli.startup")
+def test_cli_app_cold_import(benchmark: Any) -> None:
+    budget = float(os.environ.get(IMPORT_BUDGET_ENV, DEFAULT_IMPORT_BUDGET_S))
+
+    benchmark.pedantic(_import_cli_app, rounds=5, iterations=1, warmup_rounds=1)
+
+    assert benchmark.stats.stats.mean <= budget, (
+        f"bioetl.cli.cli_app import took {benchmark.stats.stats.mean:.2f}s "
+        f"(budget {budget:.2f}s, {IMPORT_BUDGET_ENV})"
+    )
@@ -0,0 +1,55 @@
+"""Cold-start checks for the ``bioetl`` CLI entry point."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Модули, которые не должны загружаться при построении CLI (``--help``, ``list``).
+HEAVY_MODULES = (
+    "pandas",
+    "pandera",
+    "pyarrow",
+    "requests",
+    "httpx",
+    "bioetl.pipelines.base",
+    "bioetl.schemas",
+    "bioetl.clients",
+)
+
+
+def _modules_loaded_by(statement: str) -> list[str]:
+    script = (
+        "import json, sys\n"
+        f"{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return list(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+
+@pytest.mark.unit
+def test_cli_app_import_defers_pipeline_modules() -> None:
+    """Building the Typer app registers commands without importing pipelines."""
+
+    assert _modules_loaded_by("import bioetl.cli.cli_app") == []
+
+
+@pytest.mark.unit
+def test_command_registry_resolves_pipeline_class_on_first_use() -> None:
+    """Registry entries keep a dotted path until ``pipeline_class`` is accessed."""
+
+    statement = (
+        "from bioetl.cli.cli_registry import COMMAND_REGISTRY\n"
+        "configs = [build() for build in COMMAND_REGISTRY.values()]\n"
+        "assert all(config.pipeline_path for config in configs)"
+    )
+    assert _modules_loaded_by(statement) == []
@@ -308,6 +308,7 @@ def test_update_pipeline_config_from_cli(tmp_path: Path) -> None:
         fail_on_schema_drift=False,
         validate_columns=False,
         output_dir=tmp_path / "out",
+        profile=True,
     )
 
     assert config.cli.dry_run is True
@@ -317,6 +318,7 @@ def test_update_pipeline_config_from_cli(tmp_path: Path) -> None:
     assert config.cli.golden == str(tmp_path / "golden.parquet")
     assert config.cli.fail_on_schema_drift is False
     assert config.cli.validate_columns is False
+    assert config.cli.profiling is True
     assert config.validation.strict is False
     assert config.materialization.root == str(tmp_path / "out")
 
@@ -4,6 +4,7 @@ import typer
 from typer.testing import CliRunner
 
 from bioetl.cli.tools import audit_docs as audit_docs_cli
+from bioetl.cli.tools import benchmark_regression as benchmark_regression_cli
 from bioetl.cli.tools import build_vocab_store as build_vocab_store_cli
 from bioetl.cli.tools import catalog_code_symbols as catalog_code_symbols_cli
 from bioetl.cli.tools import check_comments as check_comments_cli
@@ -22,6 +23,7 @@ from bioetl.cli.tools import vocab_audit as vocab_audit_cli
 
 CLI_APPS: list[tuple[str, typer.Typer]] = [
     ("bioetl-audit-docs", audit_docs_cli.app),
+    ("bioetl-benchmark-regression", benchmark_regression_cli.app),
     ("bioetl-build-vocab-store", build_vocab_store_cli.app),
     ("bioetl-catalog-code-symbols", catalog_code_symbols_cli.app),
     ("bioetl-check-comments", check_comments_cli.app),
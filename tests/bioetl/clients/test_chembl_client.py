@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
+from pytest_httpserver import HTTPServer
 
 from bioetl.clients.client_chembl_common import ChemblClient, _resolve_status_endpoint
+from bioetl.config.models.policies import HTTPClientConfig
 from bioetl.core.api_client import UnifiedAPIClient
+from bioetl.core.async_api_client import AsyncUnifiedAPIClient
 
 
 @pytest.fixture
@@ -238,3 +244,41 @@ class TestChemblClient:
 
         # Should call handshake (which calls get) and then paginate
         assert mock_api_client.get.call_count >= 1
+
+    def test_apaginate_follows_pages_on_async_client(
+        self, mock_api_client: MagicMock, httpserver: HTTPServer
+    ) -> None:
+        """Async pagination runs the handshake and follows ``page_meta.next``."""
+        httpserver.expect_request("/chembl/api/data/status.json").respond_with_json(
+            {"chembl_db_version": "ChEMBL_35", "api_version": "2.0"}
+        )
+        httpserver.expect_request(
+            "/chembl/api/data/activity.json", query_string="limit=2"
+        ).respond_with_json(
+            {
+                "page_meta": {"next": "/chembl/api/data/activity.json?limit=2&offset=2"},
+                "activities": [{"id": 1}, {"id": 2}],
+            }
+        )
+        httpserver.expect_request(
+            "/chembl/api/data/activity.json", query_string="limit=2&offset=2"
+        ).respond_with_json({"page_meta": {"next": None}, "activities": [{"id": 3}]})
+        async_client = AsyncUnifiedAPIClient(
+            HTTPClientConfig(), base_url=httpserver.url_for("/chembl/api/data")
+        )
+        client = ChemblClient(mock_api_client, async_client=async_client)
+
+        async def _collect() -> list[Mapping[str, Any]]:
+            async with async_client:
+                return [
+                    item
+                    async for item in client.apaginate(
+                        "/activity.json", params={}, page_size=2, items_key="activities"
+                    )
+                ]
+
+        items = asyncio.run(_collect())
+
+        assert [item["id"] for item in items] == [1, 2, 3]
+        assert client.chembl_release == "ChEMBL_35"
+        mock_api_client.get.assert_not_called()
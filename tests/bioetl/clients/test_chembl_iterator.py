@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest  # type: ignore[reportMissingImports]
@@ -13,6 +14,7 @@ from bioetl.clients.client_chembl_iterator import (
     ChemblEntityIteratorBase,
     _resolve_status_endpoint,
 )
+from bioetl.core.record_cache import RecordCache
 
 
 @pytest.fixture
@@ -157,3 +159,36 @@ class TestChemblEntityIterator:
         assert iterator._coerce_page_size(10) == 10
         assert iterator._coerce_page_size(100) == 25
 
+    def test_iterate_by_ids_order_does_not_depend_on_cache(
+        self,
+        chembl_config: EntityConfig,
+        mock_logger: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Ensure cached and fetched records are yielded in requested ID order."""
+        api = {entity_id: {"entity_id": entity_id} for entity_id in ("E1", "E2", "E3")}
+        chembl_client = MagicMock()
+        chembl_client.handshake.return_value = {"chembl_db_version": "34"}
+        # The API answers in its own order, not in the order of the filter.
+        chembl_client.paginate.side_effect = lambda *_, params, **__: iter(
+            [api[entity_id] for entity_id in reversed(params["entity_id__in"].split(","))]
+        )
+        ids = ["E1", "E2", "E3"]
+
+        with RecordCache(tmp_path / "records.sqlite") as cache:
+            iterator = ChemblEntityIterator(
+                chembl_client,
+                chembl_config,
+                batch_size=25,
+                max_url_length=128,
+                record_cache=cache,
+            )
+            iterator.handshake()
+            cache.put_many(chembl_config.cache_namespace, {"E2": [api["E2"]]}, release="34")
+
+            partly_cached = list(iterator.iterate_by_ids(ids))
+            cached = list(iterator.iterate_by_ids(ids))
+
+        assert partly_cached == cached == [api[entity_id] for entity_id in ids]
+        chembl_client.paginate.assert_called_once()
+        assert chembl_client.paginate.call_args.kwargs["params"]["entity_id__in"] == "E1,E3"
@@ -27,6 +27,10 @@ ENTITY_IMPORTS: tuple[tuple[str, str], ...] = (
         "ChemblAssayClassificationEntityClient",
     ),
     ("bioetl.clients.entities.client_compound_record", "ChemblCompoundRecordEntityClient"),
+    (
+        "bioetl.clients.entities.client_target_component",
+        "ChemblTargetComponentEntityClient",
+    ),
 )
 
 
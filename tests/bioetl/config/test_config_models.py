@@ -58,6 +58,22 @@ def test_logging_config_context_fields() -> None:
     assert "env" in config.context_fields
 
 
+@pytest.mark.unit
+def test_logging_config_sampling() -> None:
+    config = LoggingConfig.model_validate(
+        {
+            "async_sink": True,
+            "sampling": {"http.request.completed": {"rate": 0.1, "max_per_second": 50}},
+        }
+    )
+
+    assert config.callsite_level == "WARNING"
+    assert config.async_sink is True
+    assert math.isclose(config.sampling["http.request.completed"].rate, 0.1, rel_tol=1e-12)
+    with pytest.raises(ValidationError):
+        LoggingConfig.model_validate({"sampling": {"http.request.completed": {"rate": 2}}})
+
+
 @pytest.mark.unit
 def test_telemetry_config_sampling() -> None:
     config = TelemetryConfig(
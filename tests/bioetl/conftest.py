@@ -27,6 +27,7 @@ from bioetl.config.models.models import PostprocessConfig
 from bioetl.config.models.models import SourceConfig
 from bioetl.config.models.models import ValidationConfig
 from bioetl.core.api_client import UnifiedAPIClient
+from bioetl.core.client_registry import reset_client_registry
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 SRC_DIR = PROJECT_ROOT / "src"
@@ -45,6 +46,14 @@ def _load_json(relative_path: str) -> Any:
         return json.load(stream)
 
 
+@pytest.fixture(autouse=True)  # type: ignore[misc]
+def _isolated_client_registry() -> Generator[None, None, None]:
+    """Drop shared HTTP transports (and circuit breaker state) after each test."""
+
+    yield
+    reset_client_registry()
+
+
 @pytest.fixture  # type: ignore[misc]
 def tmp_output_dir(tmp_path: Path) -> Path:
     """Temporary directory for pipeline output artifacts."""
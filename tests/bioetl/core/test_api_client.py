@@ -8,19 +8,40 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
+from pydantic import ValidationError
+from pytest_httpserver import HTTPServer
 from requests import Response
 
 from bioetl.config.models.policies import (
+    AdaptiveRateLimitConfig,
     CircuitBreakerConfig,
     HTTPClientConfig,
     RateLimitConfig,
+    RetryConfig,
 )
 from bioetl.core.api_client import (
+    AdaptiveRateLimiter,
     CircuitBreaker,
     CircuitBreakerOpenError,
     TokenBucketLimiter,
     UnifiedAPIClient,
+    build_rate_limiter,
+    parse_retry_after,
+    reset_adaptive_rate_limiters,
 )
+from bioetl.core.metrics import get_metrics_registry
+
+
+def _adaptive_config(**adaptive: Any) -> HTTPClientConfig:
+    settings: dict[str, Any] = {"enabled": True, "min_rate": 1.0, "max_rate": 20.0}
+    settings.update(adaptive)
+    return HTTPClientConfig(
+        rate_limit=RateLimitConfig(
+            max_calls=10, period=1.0, adaptive=AdaptiveRateLimitConfig(**settings)
+        ),
+        rate_limit_jitter=False,
+        retries=RetryConfig(total=1, backoff_multiplier=0.01, backoff_max=0.05),
+    )
 
 
 @pytest.mark.unit
@@ -70,6 +91,139 @@ class TestTokenBucketLimiter:
         assert duration >= 0.5  # Should wait at least half the period
 
 
+@pytest.mark.unit
+class TestAdaptiveRateLimiter:
+    """Test suite for AdaptiveRateLimiter and build_rate_limiter."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_limiters(self) -> Any:
+        reset_adaptive_rate_limiters()
+        yield
+        reset_adaptive_rate_limiters()
+
+    def _limiter(self, **overrides: Any) -> AdaptiveRateLimiter:
+        settings: dict[str, Any] = {
+            "min_rate": 1.0,
+            "max_rate": 20.0,
+            "burst": 10,
+            "increase": 2.0,
+            "target_p95_latency": 0.5,
+            "target_error_rate": 0.1,
+            "window": 4,
+            "jitter": False,
+            "host": "example.org",
+        }
+        settings.update(overrides)
+        return AdaptiveRateLimiter(10.0, **settings)
+
+    def test_initial_rate_is_clamped(self) -> None:
+        assert self._limiter(max_rate=5.0).rate == 5.0
+        assert self._limiter(min_rate=15.0).rate == 15.0
+
+    def test_invalid_bounds(self) -> None:
+        with pytest.raises(ValueError, match="min_rate"):
+            self._limiter(min_rate=30.0)
+        with pytest.raises(ValidationError, match="min_rate"):
+            AdaptiveRateLimitConfig(min_rate=5.0, max_rate=1.0)
+
+    def test_increases_after_healthy_window(self) -> None:
+        limiter = self._limiter()
+        for _ in range(3):
+            limiter.record(200, 0.1)
+        assert limiter.rate == 10.0
+
+        limiter.record(404, 0.1)
+
+        assert limiter.rate == 12.0
+        assert limiter.period == pytest.approx(10 / 12)
+
+    def test_holds_when_latency_or_errors_exceed_targets(self) -> None:
+        limiter = self._limiter()
+        for latency in (0.1, 0.1, 0.1, 0.9):
+            limiter.record(200, latency)
+        for status in (200, 200, 200, None):
+            limiter.record(status, 0.1)
+
+        assert limiter.rate == 10.0
+
+    def test_backs_off_once_per_congestion_event(self) -> None:
+        limiter = self._limiter()
+        limiter.record(429, 0.2)
+        # Already in flight when the rate was cut: no second decrease.
+        limiter.record(503, 0.2)
+        assert limiter.rate == 5.0
+
+        time.sleep(0.01)
+        limiter.record(503, 0.001)
+
+        assert limiter.rate == 2.5
+        assert get_metrics_registry().gauge("bioetl_rate_limiter_rate").value(
+            host="example.org"
+        ) == 2.5
+
+    def test_rate_stays_within_bounds(self) -> None:
+        limiter = self._limiter(decrease_factor=0.1)
+        limiter.record(429, 0.0)
+        assert limiter.rate == 1.0
+
+        limiter = self._limiter(increase=50.0)
+        for _ in range(4):
+            limiter.record(200, 0.0)
+        assert limiter.rate == 20.0
+
+    def test_retry_after_holds_callers(self) -> None:
+        limiter = self._limiter()
+        limiter.record(200, 0.0, retry_after=0.2)
+
+        start = time.monotonic()
+        waited = limiter.acquire()
+
+        assert limiter.rate == 5.0
+        assert waited >= 0.15
+        assert time.monotonic() - start >= 0.15
+
+    def test_build_rate_limiter_shares_per_host(self) -> None:
+        config = _adaptive_config()
+        first = build_rate_limiter(config, base_url="https://www.ebi.ac.uk/chembl/api")
+        second = build_rate_limiter(config, base_url="https://WWW.EBI.AC.UK/other")
+
+        assert isinstance(first, AdaptiveRateLimiter)
+        assert first is second
+        assert build_rate_limiter(config, base_url="https://rest.uniprot.org") is not first
+        fixed = build_rate_limiter(HTTPClientConfig(), base_url="https://www.ebi.ac.uk")
+        assert type(fixed) is TokenBucketLimiter
+
+    def test_default_max_rate_is_configured_rate(self) -> None:
+        limiter = build_rate_limiter(_adaptive_config(max_rate=None), base_url="http://h")
+
+        assert isinstance(limiter, AdaptiveRateLimiter)
+        assert limiter.max_rate == limiter.rate == 10.0
+
+    def test_parse_retry_after(self) -> None:
+        assert parse_retry_after(" 7 ") == 7.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_client_feeds_back_retried_throttling(self, httpserver: HTTPServer) -> None:
+        """Throttled attempts retried inside urllib3 still cut the shared rate."""
+        httpserver.expect_ordered_request("/item").respond_with_data("busy", status=503)
+        httpserver.expect_ordered_request("/item").respond_with_json({"ok": True})
+        config = _adaptive_config()
+        client = UnifiedAPIClient(config, base_url=httpserver.url_for("/"))
+        other = UnifiedAPIClient(config, base_url=httpserver.url_for("/other"))
+        try:
+            assert client.request_json("GET", "/item") == {"ok": True}
+        finally:
+            client.close()
+            other.close()
+
+        limiter = client._rate_limiter  # pyright: ignore[reportPrivateUsage]
+        assert isinstance(limiter, AdaptiveRateLimiter)
+        assert limiter is other._rate_limiter  # pyright: ignore[reportPrivateUsage]
+        assert limiter.rate == 5.0
+
+
 @pytest.mark.unit
 class TestUnifiedAPIClient:
     """Test suite for UnifiedAPIClient."""
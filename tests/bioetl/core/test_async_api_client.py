@@ -0,0 +1,172 @@
+"""Unit tests for AsyncUnifiedAPIClient against a local stub server."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+import requests
+from pytest_httpserver import HTTPServer
+
+from bioetl.config.models.policies import (
+    AdaptiveRateLimitConfig,
+    CircuitBreakerConfig,
+    HTTPClientConfig,
+    RateLimitConfig,
+    RetryConfig,
+)
+from bioetl.core.api_client import (
+    AdaptiveRateLimiter,
+    CircuitBreakerOpenError,
+    reset_adaptive_rate_limiters,
+)
+from bioetl.core.async_api_client import AsyncUnifiedAPIClient
+
+
+def _config(**overrides: Any) -> HTTPClientConfig:
+    settings: dict[str, Any] = {
+        "timeout_sec": 5.0,
+        "connect_timeout_sec": 2.0,
+        "read_timeout_sec": 2.0,
+        "retries": RetryConfig(total=2, backoff_multiplier=0.01, backoff_max=0.05),
+        "rate_limit": RateLimitConfig(max_calls=1000, period=1.0),
+        "rate_limit_jitter": False,
+    }
+    settings.update(overrides)
+    return HTTPClientConfig(**settings)
+
+
+def _run(client: AsyncUnifiedAPIClient, coroutine: Any) -> Any:
+    async def _main() -> Any:
+        async with client:
+            return await coroutine(client)
+
+    return asyncio.run(_main())
+
+
+@pytest.mark.unit
+class TestAsyncUnifiedAPIClient:
+    """Test suite for AsyncUnifiedAPIClient."""
+
+    def test_request_json_resolves_base_url(self, httpserver: HTTPServer) -> None:
+        """Relative endpoints are joined to the base URL and params are sent."""
+        httpserver.expect_request(
+            "/api/data/molecule.json", query_string="limit=5"
+        ).respond_with_json({"molecules": [{"id": 1}]})
+        client = AsyncUnifiedAPIClient(_config(), base_url=httpserver.url_for("/api/data"))
+
+        payload = _run(
+            client, lambda c: c.request_json("GET", "molecule.json", params={"limit": 5})
+        )
+
+        assert payload == {"molecules": [{"id": 1}]}
+
+    def test_retries_statuses_and_honours_retry_after(self, httpserver: HTTPServer) -> None:
+        """Retryable statuses are retried; ``Retry-After`` is respected."""
+        httpserver.expect_ordered_request("/status.json").respond_with_data(
+            "busy", status=503, headers={"Retry-After": "0"}
+        )
+        httpserver.expect_ordered_request("/status.json").respond_with_data("oops", status=502)
+        httpserver.expect_ordered_request("/status.json").respond_with_json({"ok": True})
+        client = AsyncUnifiedAPIClient(_config(), base_url=httpserver.url_for("/"))
+
+        response = _run(client, lambda c: c.get("/status.json"))
+
+        assert response.json() == {"ok": True}
+        assert len(httpserver.log) == 3
+
+    def test_error_status_raises_requests_http_error(self, httpserver: HTTPServer) -> None:
+        """Non-retryable error statuses raise the same exception as the sync client."""
+        httpserver.expect_request("/missing").respond_with_data("nope", status=404)
+        client = AsyncUnifiedAPIClient(_config(), base_url=httpserver.url_for("/"))
+
+        with pytest.raises(requests.HTTPError) as excinfo:
+            _run(client, lambda c: c.get("/missing"))
+
+        assert excinfo.value.response.status_code == 404
+        assert len(httpserver.log) == 1
+
+    def test_connection_errors_map_to_requests_exceptions(self) -> None:
+        """Transport failures surface as ``requests.ConnectionError``."""
+        client = AsyncUnifiedAPIClient(
+            _config(retries=RetryConfig(total=0)), base_url="http://127.0.0.1:9"
+        )
+
+        with pytest.raises(requests.ConnectionError):
+            _run(client, lambda c: c.get("/status.json"))
+
+    def test_circuit_breaker_opens_after_failures(self, httpserver: HTTPServer) -> None:
+        """Failed logical requests trip the shared circuit breaker."""
+        httpserver.expect_request("/boom").respond_with_data("nope", status=400)
+        config = _config(circuit_breaker=CircuitBreakerConfig(failure_threshold=2, timeout=60.0))
+        client = AsyncUnifiedAPIClient(config, base_url=httpserver.url_for("/"))
+
+        async def _scenario(c: AsyncUnifiedAPIClient) -> list[type[BaseException]]:
+            raised: list[type[BaseException]] = []
+            for _ in range(3):
+                try:
+                    await c.get("/boom")
+                except requests.RequestException as exc:
+                    raised.append(type(exc))
+            return raised
+
+        raised = _run(client, _scenario)
+
+        assert raised == [requests.HTTPError, requests.HTTPError, CircuitBreakerOpenError]
+        assert len(httpserver.log) == 2
+
+    def test_concurrent_requests_share_rate_limiter(self, httpserver: HTTPServer) -> None:
+        """Many coroutines run on one client; the token bucket bounds the rate."""
+        httpserver.expect_request("/item").respond_with_json({"ok": True})
+        config = _config(rate_limit=RateLimitConfig(max_calls=10, period=0.2))
+        client = AsyncUnifiedAPIClient(config, base_url=httpserver.url_for("/"))
+
+        async def _scenario(c: AsyncUnifiedAPIClient) -> tuple[int, float]:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            results = await asyncio.gather(*(c.request_json("GET", "/item") for _ in range(25)))
+            return len(results), loop.time() - start
+
+        count, elapsed = _run(client, _scenario)
+
+        assert count == 25
+        assert len(httpserver.log) == 25
+        assert elapsed >= 0.4
+
+    def test_retry_after_cuts_adaptive_rate(self, httpserver: HTTPServer) -> None:
+        """Every attempt, including retried 429s, is reported to the adaptive limiter."""
+        httpserver.expect_ordered_request("/item").respond_with_data(
+            "slow down", status=429, headers={"Retry-After": "0"}
+        )
+        httpserver.expect_ordered_request("/item").respond_with_json({"ok": True})
+        adaptive = AdaptiveRateLimitConfig(enabled=True, min_rate=1.0, max_rate=100.0)
+        config = _config(
+            rate_limit=RateLimitConfig(max_calls=1000, period=1.0, adaptive=adaptive)
+        )
+        reset_adaptive_rate_limiters()
+        try:
+            client = AsyncUnifiedAPIClient(config, base_url=httpserver.url_for("/"))
+            payload = _run(client, lambda c: c.request_json("GET", "/item"))
+        finally:
+            reset_adaptive_rate_limiters()
+
+        limiter = client._rate_limiter  # pyright: ignore[reportPrivateUsage]
+        assert payload == {"ok": True}
+        assert isinstance(limiter, AdaptiveRateLimiter)
+        assert limiter.rate == 50.0
+
+    def test_long_urls_use_method_override(self, httpserver: HTTPServer) -> None:
+        """Queries longer than ``max_url_length`` are sent as POST with an override."""
+        httpserver.expect_request(
+            "/activity.json",
+            method="POST",
+            headers={"X-HTTP-Method-Override": "GET"},
+        ).respond_with_json({"activities": []})
+        client = AsyncUnifiedAPIClient(_config(max_url_length=64), base_url=httpserver.url_for("/"))
+
+        response = _run(
+            client, lambda c: c.get("/activity.json", params={"activity_id__in": "1," * 40})
+        )
+
+        assert response.json() == {"activities": []}
@@ -0,0 +1,102 @@
+"""Unit tests for chunked Pandera validation."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pandera as pa
+import pytest
+from pandera import Check, Column, DataFrameSchema
+from pandera.errors import SchemaErrors
+
+from bioetl.core.chunked_validation import (
+    cross_row_schema,
+    row_level_schema,
+    validate_in_chunks,
+)
+
+
+def _schema() -> DataFrameSchema:
+    return DataFrameSchema(
+        {
+            "chembl_id": Column(
+                pa.String, checks=[Check.str_matches(r"^CHEMBL\d+$")], unique=True
+            ),
+            "value": Column(pa.Float64, checks=[Check.ge(0)], nullable=True, coerce=True),
+        },
+        strict=True,
+    )
+
+
+def _frame(size: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "chembl_id": [f"CHEMBL{i}" for i in range(size)],
+            "value": [float(i) for i in range(size)],
+        }
+    )
+
+
+@pytest.mark.unit
+class TestSchemaSplit:
+    """Test suite for row_level_schema and cross_row_schema."""
+
+    def test_unique_moves_to_cross_row_schema(self) -> None:
+        schema = _schema()
+
+        row_schema = row_level_schema(schema)
+        cross_schema = cross_row_schema(schema)
+
+        assert row_schema.columns["chembl_id"].unique is False
+        assert len(row_schema.columns["chembl_id"].checks) == 1
+        assert cross_schema is not None
+        assert list(cross_schema.columns) == ["chembl_id"]
+        assert schema.columns["chembl_id"].unique is True
+
+    def test_no_cross_row_schema_without_frame_wide_checks(self) -> None:
+        schema = DataFrameSchema({"value": Column(pa.Float64, checks=[Check.ge(0)])})
+
+        assert cross_row_schema(schema) is None
+
+
+@pytest.mark.unit
+class TestValidateInChunks:
+    """Test suite for validate_in_chunks."""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_matches_single_pass_on_valid_frame(self, max_workers: int) -> None:
+        df = _frame(10)
+
+        validated = validate_in_chunks(_schema(), df, chunk_rows=3, max_workers=max_workers)
+
+        pd.testing.assert_frame_equal(validated, _schema().validate(df, lazy=True))
+
+    def test_failure_cases_merge_in_chunk_order(self) -> None:
+        df = _frame(10)
+        df.loc[[1, 8], "value"] = -1.0
+        df.loc[5, "chembl_id"] = "bad"
+
+        with pytest.raises(SchemaErrors) as single:
+            _schema().validate(df, lazy=True)
+        with pytest.raises(SchemaErrors) as chunked:
+            validate_in_chunks(_schema(), df, chunk_rows=3, max_workers=2)
+
+        expected = single.value.failure_cases.reset_index(drop=True)
+        actual = chunked.value.failure_cases.reset_index(drop=True)
+        pd.testing.assert_frame_equal(
+            actual[["column", "check", "index"]], expected[["column", "check", "index"]]
+        )
+
+    def test_duplicates_across_chunks_are_reported(self) -> None:
+        df = _frame(6)
+        df.loc[5, "chembl_id"] = "CHEMBL0"
+
+        with pytest.raises(SchemaErrors) as excinfo:
+            validate_in_chunks(_schema(), df, chunk_rows=2)
+
+        failure_cases = excinfo.value.failure_cases
+        assert set(failure_cases["check"]) == {"field_uniqueness"}
+        assert sorted(failure_cases["index"].tolist()) == [0, 5]
+
+    def test_rejects_non_positive_chunk_rows(self) -> None:
+        with pytest.raises(ValueError, match="chunk_rows"):
+            validate_in_chunks(_schema(), _frame(2), chunk_rows=0)
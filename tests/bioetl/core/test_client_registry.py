@@ -0,0 +1,141 @@
+"""Unit tests for the shared HTTP client registry."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from bioetl.config import PipelineConfig
+from bioetl.config.models.models import PipelineMetadata, SourceConfig
+from bioetl.config.models.policies import HTTPClientConfig, HTTPConfig, RateLimitConfig
+from bioetl.core.client_factory import APIClientFactory
+from bioetl.core.client_registry import (
+    ClientKey,
+    ClientRegistry,
+    get_client_registry,
+    reset_client_registry,
+)
+
+
+@pytest.fixture
+def pipeline_config() -> PipelineConfig:
+    """Pipeline config with two sources on different HTTP profiles."""
+    return PipelineConfig(  # type: ignore[call-arg]
+        version=1,
+        pipeline=PipelineMetadata(  # type: ignore[call-arg]
+            name="test_pipeline",
+            version="1.0.0",
+            description="Test pipeline",
+        ),
+        http=HTTPConfig(
+            default=HTTPClientConfig(pool_maxsize=4),
+            profiles={"slow": HTTPClientConfig(rate_limit=RateLimitConfig(max_calls=1))},
+        ),
+        sources={
+            "chembl": SourceConfig(  # type: ignore[call-arg,dict-item]
+                enabled=True,
+                parameters={"base_url": "https://www.ebi.ac.uk/chembl/api/data"},
+            ),
+            "other": SourceConfig(  # type: ignore[call-arg,dict-item]
+                enabled=True,
+                http_profile="slow",
+                parameters={"base_url": "https://example.com/api"},
+            ),
+        },
+    )
+
+
+@pytest.mark.unit
+class TestClientRegistry:
+    """Test suite for ClientRegistry and its use by APIClientFactory."""
+
+    def test_clients_for_same_upstream_share_transport(
+        self, pipeline_config: PipelineConfig
+    ) -> None:
+        """Session, rate limiter and circuit breaker are shared per upstream."""
+        registry = ClientRegistry()
+        factory = APIClientFactory(pipeline_config, registry=registry)
+        base_url = "https://www.ebi.ac.uk/chembl/api/data"
+
+        first = factory.for_source("chembl", base_url=base_url)
+        second = APIClientFactory(pipeline_config, registry=registry).for_source(
+            "chembl", base_url=base_url + "/"
+        )
+        other = factory.for_source("other", base_url="https://example.com/api")
+
+        assert first._session is second._session
+        assert first._rate_limiter is second._rate_limiter
+        assert first._circuit_breaker is second._circuit_breaker
+        assert other._session is not first._session
+        assert other._rate_limiter.max_calls == 1
+        assert len(registry) == 2
+        adapter = first._session.get_adapter(base_url)
+        assert adapter._pool_maxsize == 4  # type: ignore[attr-defined]
+
+    def test_closing_client_keeps_pooled_session(self, pipeline_config: PipelineConfig) -> None:
+        """Closing a client releases its lease; the registry owns the session."""
+        registry = ClientRegistry()
+        factory = APIClientFactory(pipeline_config, registry=registry)
+        client = factory.for_source("chembl", base_url="https://example.org")
+        key = ClientKey.for_config(client.config, source="chembl", base_url="https://example.org")
+        transport = registry.acquire(key, client.config)
+        assert transport.session is client._session
+        assert transport.leases == 2
+
+        client.close()
+        client.close()
+        registry.release(transport)
+
+        assert transport.leases == 0
+        assert factory.for_source("chembl", base_url="https://example.org")._session is (
+            transport.session
+        )
+
+        registry.close()
+        assert len(registry) == 0
+        assert factory.for_source("chembl", base_url="https://example.org")._session is not (
+            transport.session
+        )
+
+    def test_default_registry_is_process_wide(self) -> None:
+        """The default registry is reused until it is reset."""
+        registry = get_client_registry()
+        assert get_client_registry() is registry
+
+        reset_client_registry()
+
+        assert get_client_registry() is not registry
+
+    def test_key_distinguishes_settings(self) -> None:
+        """Diverging HTTP settings never share a transport."""
+        base = ClientKey.for_config(
+            HTTPClientConfig(), source="chembl", base_url="https://example.org/"
+        )
+        same = ClientKey.for_config(
+            HTTPClientConfig(), source="chembl", base_url="https://example.org"
+        )
+        slower = ClientKey.for_config(
+            HTTPClientConfig(rate_limit=RateLimitConfig(max_calls=1)),
+            source="chembl",
+            base_url="https://example.org",
+        )
+
+        assert base == same
+        assert base != slower
+
+    def test_async_clients_share_limiter_and_breaker(self, pipeline_config: PipelineConfig) -> None:
+        """Async clients reuse the limiter and breaker of the blocking clients."""
+        registry = ClientRegistry()
+        factory = APIClientFactory(pipeline_config, registry=registry)
+        base_url = "https://www.ebi.ac.uk/chembl/api/data"
+
+        blocking = factory.for_source("chembl", base_url=base_url)
+        async_client = factory.for_source_async("chembl", base_url=base_url)
+
+        assert async_client._rate_limiter is blocking._rate_limiter
+        assert async_client._circuit_breaker is blocking._circuit_breaker
+        assert len(registry) == 1
+        asyncio.run(async_client.aclose())
+        key = ClientKey.for_config(blocking.config, source="chembl", base_url=base_url)
+        assert registry.acquire(key, blocking.config).leases == 2
@@ -0,0 +1,108 @@
+"""Unit tests for bounded, order-preserving concurrency helpers."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from structlog.contextvars import bind_contextvars, get_contextvars, unbind_contextvars
+
+from bioetl.core.concurrency import bounded_ordered_map, resolve_worker_count
+
+
+@pytest.mark.unit
+class TestResolveWorkerCount:
+    """Test suite for resolve_worker_count."""
+
+    @pytest.mark.parametrize(
+        ("parallelism", "tasks", "expected"),
+        [
+            (None, 10, 1),
+            (0, 10, 1),
+            (4, 0, 1),
+            (4, 1, 1),
+            (4, 2, 2),
+            (4, 10, 4),
+        ],
+    )
+    def test_bounds(self, parallelism: int | None, tasks: int, expected: int) -> None:
+        assert resolve_worker_count(parallelism, tasks) == expected
+
+
+@pytest.mark.unit
+class TestBoundedOrderedMap:
+    """Test suite for bounded_ordered_map."""
+
+    def test_preserves_input_order(self) -> None:
+        def _slow_for_small(value: int) -> int:
+            time.sleep(0.001 * (20 - value))
+            return value * 2
+
+        result = list(bounded_ordered_map(_slow_for_small, range(20), max_workers=4))
+
+        assert result == [value * 2 for value in range(20)]
+
+    def test_sequential_when_single_worker(self) -> None:
+        threads: set[str] = set()
+
+        def _record(value: int) -> int:
+            threads.add(threading.current_thread().name)
+            return value
+
+        assert list(bounded_ordered_map(_record, [1, 2, 3], max_workers=1)) == [1, 2, 3]
+        assert threads == {threading.current_thread().name}
+
+    def test_limits_tasks_in_flight(self) -> None:
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+        consumed: list[int] = []
+
+        def _generate() -> object:
+            for value in range(30):
+                consumed.append(value)
+                yield value
+
+        def _work(value: int) -> int:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.002)
+            with lock:
+                active -= 1
+            return value
+
+        iterator = bounded_ordered_map(_work, _generate(), max_workers=3, max_in_flight=3)
+        first = next(iterator)
+
+        assert first == 0
+        assert len(consumed) <= 4
+        assert list(iterator) == list(range(1, 30))
+        assert peak <= 3
+
+    def test_propagates_exceptions_in_order(self) -> None:
+        def _fail_on_three(value: int) -> int:
+            if value == 3:
+                raise ValueError("boom")
+            return value
+
+        iterator = bounded_ordered_map(_fail_on_three, range(6), max_workers=2)
+
+        assert [next(iterator) for _ in range(3)] == [0, 1, 2]
+        with pytest.raises(ValueError, match="boom"):
+            next(iterator)
+
+    def test_copies_logging_context_into_workers(self) -> None:
+        bind_contextvars(run_id="run-123")
+        try:
+            seen = list(
+                bounded_ordered_map(
+                    lambda _: get_contextvars().get("run_id"), range(4), max_workers=2
+                )
+            )
+        finally:
+            unbind_contextvars("run_id")
+
+        assert seen == ["run-123"] * 4
@@ -0,0 +1,64 @@
+"""Unit tests for dependency-ordered enrichment stages."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from bioetl.core.enrichment import EnrichmentStage, enrichment_waves, merge_enrichment_lookups
+
+
+def _stage(name: str, *columns: str, depends_on: tuple[str, ...] = ()) -> EnrichmentStage:
+    return EnrichmentStage(name=name, func=lambda df: df, columns=columns, depends_on=depends_on)
+
+
+@pytest.mark.unit
+class TestEnrichmentWaves:
+    """Test suite for enrichment_waves."""
+
+    def test_independent_stages_share_one_wave(self) -> None:
+        stages = [_stage("a", "x"), _stage("b", "y"), _stage("c", "z", depends_on=("a",))]
+
+        waves = enrichment_waves(stages)
+
+        assert [[stage.name for stage in wave] for wave in waves] == [["a", "b"], ["c"]]
+
+    def test_unknown_dependencies_are_satisfied(self) -> None:
+        waves = enrichment_waves([_stage("a", "x", depends_on=("missing",))])
+
+        assert [[stage.name for stage in wave] for wave in waves] == [["a"]]
+
+    def test_rejects_cycles_and_shared_columns(self) -> None:
+        with pytest.raises(ValueError, match="cycle"):
+            enrichment_waves(
+                [_stage("a", "x", depends_on=("b",)), _stage("b", "y", depends_on=("a",))]
+            )
+        with pytest.raises(ValueError, match="produced by both"):
+            enrichment_waves([_stage("a", "x"), _stage("b", "x")])
+
+
+@pytest.mark.unit
+class TestMergeEnrichmentLookups:
+    """Test suite for merge_enrichment_lookups."""
+
+    def test_replaces_in_place_and_appends_new_columns(self) -> None:
+        df = pd.DataFrame({"id": [1, 2, 3], "x": [None, "b", None]}, index=[10, 20, 30])
+        lookup_x = pd.DataFrame({"x": ["a", "b", "c"], "noise": [0, 0, 0]})
+        lookup_y = pd.DataFrame({"y": pd.array([7, None, 9], dtype="Int64")})
+
+        merged = merge_enrichment_lookups(
+            df, [(_stage("a", "x"), lookup_x), (_stage("b", "y", "z"), lookup_y)]
+        )
+
+        assert list(merged.columns) == ["id", "x", "y", "z"]
+        assert merged.index.tolist() == [10, 20, 30]
+        assert merged["x"].tolist() == ["a", "b", "c"]
+        assert str(merged["y"].dtype) == "Int64"
+        assert merged["z"].isna().all()
+        assert df["x"].isna().sum() == 2
+
+    def test_rejects_row_count_mismatch(self) -> None:
+        df = pd.DataFrame({"id": [1, 2]})
+
+        with pytest.raises(ValueError, match="returned 1 rows"):
+            merge_enrichment_lookups(df, [(_stage("a", "x"), pd.DataFrame({"x": [1]}))])
@@ -0,0 +1,287 @@
+"""Unit tests for the columnar frame helpers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bioetl.core.frame import (
+    dict_fields_to_columns,
+    flatten_dict_column,
+    lookup_frame,
+    lookup_keys,
+    map_unique,
+    merge_lookup,
+    unique_keys,
+)
+
+
+def _apply_series(values: pd.Series, fields: list[str], prefix: str) -> pd.DataFrame:
+    """Row-by-row reference implementation the columnar flattener replaces."""
+
+    def row_to_dict(obj: Any) -> dict[str, Any]:
+        if not isinstance(obj, dict):
+            return dict.fromkeys(fields)
+        return {field: obj.get(field) for field in fields}
+
+    expanded = values.map(row_to_dict).apply(pd.Series)
+    expanded.columns = [f"{prefix}{column}" for column in expanded.columns]
+    return expanded
+
+
+@pytest.mark.unit
+class TestFlattenDictColumn:
+    """Test suite for flatten_dict_column and dict_fields_to_columns."""
+
+    def test_dict_fields_to_columns(self) -> None:
+        """Fields are extracted per column; non-dicts yield ``None``."""
+        columns = dict_fields_to_columns([{"a": 1, "b": "x"}, None, {"b": "y"}], ["a", "b"])
+
+        assert columns == {"a": [1, None, None], "b": ["x", None, "y"]}
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [{"full_mwt": 100.5, "hbd": 1, "hba": 2}, {"full_mwt": None, "hbd": 3, "hba": 4}],
+            [{"hbd": 1, "hba": 2}, {"hbd": 3, "hba": 4}],
+            [{"smiles": "CCO", "inchi": None}, None, np.nan, {"smiles": "C", "inchi": "X"}],
+            [{"flag": True, "hbd": 1}, {"flag": False, "hbd": 2}],
+            [{"flag": True}, {"flag": 2}],
+            [{"parent": "CHEMBL1", "hbd": 1, "extra": [1, 2]}, {"parent": None, "hbd": None}],
+            [None, None],
+        ],
+    )
+    def test_matches_row_wise_apply(self, values: list[Any]) -> None:
+        """Columns, values and dtypes equal ``map(...).apply(pd.Series)``."""
+        series = pd.Series(values, index=range(10, 10 + len(values)), dtype=object)
+        fields = ["full_mwt", "hbd", "hba", "smiles", "inchi", "flag", "parent", "extra"]
+
+        result = flatten_dict_column(series, fields, prefix="p__")
+
+        pd.testing.assert_frame_equal(result, _apply_series(series, fields, "p__"))
+
+    def test_empty_series_keeps_requested_columns(self) -> None:
+        """An empty column still yields every prefixed field."""
+        result = flatten_dict_column(pd.Series([], dtype=object), ["a", "b"], prefix="x__")
+
+        assert list(result.columns) == ["x__a", "x__b"]
+        assert result.empty
+
+
+class _CountingFunc:
+    def __init__(self, func: Any) -> None:
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, value: Any) -> Any:
+        self.calls += 1
+        return self.func(value)
+
+
+@pytest.mark.unit
+class TestMapUnique:
+    """Test suite for map_unique."""
+
+    @pytest.mark.parametrize(
+        ("values", "func"),
+        [
+            (pd.Series([" a", "b", None, " a", np.nan, "b"], dtype=object), repr),
+            (pd.Series(["x", None, "x", "y"], dtype="str"), lambda value: value == "x"),
+            (
+                pd.Series([1.0, np.nan, 1.0, 2.5]),
+                lambda value: int(value) if value == value else None,
+            ),
+            (pd.Series([1, True, 1.0, "1"], dtype=object), lambda value: type(value).__name__),
+            (pd.Series([[1, 2], {"k": 1}, [1, 2], None], dtype=object), repr),
+            (pd.Series([1, None, 2], dtype="Int64"), str),
+            (pd.Series(["x", "y", "x"], dtype="category"), str.upper),
+        ],
+    )
+    @pytest.mark.parametrize("na_action", [None, "ignore"])
+    def test_matches_series_map(self, values: pd.Series, func: Any, na_action: Any) -> None:
+        """Values, dtype, index and name match ``Series.map``."""
+        values = values.set_axis(range(10, 10 + len(values))).rename("column")
+
+        pd.testing.assert_series_equal(
+            map_unique(values, func, na_action=na_action), values.map(func, na_action=na_action)
+        )
+
+    def test_calls_func_once_per_unique_value(self) -> None:
+        """Duplicated hashable and unhashable values are evaluated once."""
+        func = _CountingFunc(repr)
+        values = pd.Series(["a", "b"] * 50 + [[1], [1], {"k": 1}] * 10, dtype=object)
+
+        map_unique(values, func)
+
+        assert func.calls == 4
+
+    @pytest.mark.parametrize(("cache_size", "expected_calls"), [(None, 6), (1, 6), (2, 2)])
+    def test_unhashable_cache_is_bounded(self, cache_size: int | None, expected_calls: int) -> None:
+        """The LRU for unhashable values evicts least recently used payloads."""
+        func = _CountingFunc(len)
+        values = pd.Series([[1], [1, 2], [1], [1, 2], [1], [1, 2]], dtype=object)
+
+        result = map_unique(values, func, unhashable_cache_size=cache_size)
+
+        assert result.tolist() == [1, 2, 1, 2, 1, 2]
+        assert func.calls == expected_calls
+
+    def test_long_arrays_with_equal_repr_are_distinct(self) -> None:
+        """Arrays whose truncated ``repr`` matches are not merged."""
+        changed = np.zeros(2000)
+        changed[1000] = 5
+        values = pd.Series([np.zeros(2000), changed, np.zeros(2000)], dtype=object)
+
+        result = map_unique(values, lambda value: float(value.sum()))
+
+        assert repr(values[0]) == repr(values[1])
+        assert result.tolist() == [0.0, 5.0, 0.0]
+
+    def test_unhashable_values_are_compared_by_type(self) -> None:
+        """Containers with equal ``==`` but different element types stay apart."""
+        func = _CountingFunc(repr)
+        values = pd.Series(
+            [[1], [1.0], [True], {"k": 1}, {"k": 1.0}, np.array([1]), np.array([1.0]), [1]],
+            dtype=object,
+        )
+
+        result = map_unique(values, func)
+
+        assert result.tolist() == [repr(value) for value in values]
+        assert func.calls == 7
+
+
+def _iterrows_fill(
+    df: pd.DataFrame, key_column: str, records: dict[str, dict[str, Any]], column: str
+) -> list[Any]:
+    """Row-by-row reference: fill missing ``column`` values from ``records``."""
+
+    values: list[Any] = []
+    for _, row in df.iterrows():
+        current = row.get(column)
+        key = row.get(key_column)
+        record = None
+        if key is not None and not pd.isna(key) and str(key).strip():
+            record = records.get(str(key).strip())
+        incoming = record.get(column) if record else None
+        values.append(incoming if pd.isna(current) and incoming is not None else current)
+    return values
+
+
+@pytest.mark.unit
+class TestLookupJoin:
+    """Test suite for lookup_keys, unique_keys, lookup_frame and merge_lookup."""
+
+    def test_lookup_keys_normalises_blank_and_missing(self) -> None:
+        """Keys are stripped strings; ``None``, NaN and blanks become NA."""
+        values = pd.Series([" a1", None, np.nan, "  ", "A1", 7], index=[5, 5, 6, 7, 8, 9])
+
+        keys = lookup_keys(values, upper=True)
+
+        assert keys.index.tolist() == [5, 5, 6, 7, 8, 9]
+        assert keys.tolist()[:1] == ["A1"]
+        assert keys.isna().tolist() == [False, True, True, True, False, False]
+        assert unique_keys(keys) == ["A1", "7"]
+
+    def test_lookup_keys_custom_normalize(self) -> None:
+        """``normalize`` replaces the string conversion; empty results are NA."""
+        values = pd.Series([10.0, "10", None, 2.5])
+
+        keys = lookup_keys(values, normalize=lambda value: "" if pd.isna(value) else "k")
+
+        assert keys.isna().tolist() == [False, False, True, False]
+        assert unique_keys(keys) == ["k"]
+
+    def test_unique_keys_for_composite_keys(self) -> None:
+        """Composite keys are tuples; rows with a missing part are skipped."""
+        keys = pd.DataFrame({"m": ["M1", "M1", None, "M2"], "d": ["D1", "D1", "D2", "D2"]})
+
+        assert unique_keys(keys) == [("M1", "D1"), ("M2", "D2")]
+
+    def test_lookup_frame_fields(self) -> None:
+        """Fields are record names or callables; non-mapping records give ``None``."""
+        lookup = lookup_frame(
+            {"A": {"name": "x", "n": 1}, "B": None},
+            {"name": "name", "double": lambda record: record["n"] * 2 if record else None},
+        )
+
+        assert lookup.index.tolist() == ["A", "B"]
+        assert lookup["name"].tolist()[0] == "x"
+        assert pd.isna(lookup["name"].iloc[1])
+        assert lookup["double"].tolist()[0] == 2
+
+    def test_fill_matches_row_wise_join(self) -> None:
+        """``fill`` equals the iterrows lookup it replaces, index and order included."""
+        records = {"A": {"v": "va"}, "B": {"v": None}, "C": {"v": "vc"}}
+        df = pd.DataFrame(
+            {"k": [" A", "B", None, "C", "A", "Z"], "v": [None, "keep", None, "keep", None, None]},
+            index=[3, 3, 1, 0, 9, 2],
+        )
+
+        result = merge_lookup(df, lookup_keys(df["k"]), lookup_frame(records, ("v",)))
+
+        assert result.index.tolist() == df.index.tolist()
+        assert result["k"].tolist() == df["k"].tolist()
+        assert result["v"].tolist() == _iterrows_fill(df, "k", records, "v")
+
+    @pytest.mark.parametrize(
+        ("how", "expected"),
+        [
+            ("fill", ["old", "va", "old", None]),
+            ("update", ["va", "va", "old", None]),
+            ("replace", ["va", "va", None, None]),
+        ],
+    )
+    def test_how(self, how: Any, expected: list[Any]) -> None:
+        """Existing columns are combined according to ``how``."""
+        df = pd.DataFrame({"k": ["A", "A", "B", None], "v": ["old", None, "old", None]})
+        lookup = lookup_frame({"A": {"v": "va"}, "B": {"v": None}}, ("v",))
+
+        result = merge_lookup(df, lookup_keys(df["k"]), lookup, how=how)
+
+        assert [None if pd.isna(value) else value for value in result["v"]] == expected
+
+    def test_fill_blank_is_missing(self) -> None:
+        """Blank strings are filled only with ``blank_is_missing``; NA never overwrites."""
+        df = pd.DataFrame({"k": ["A", "B"], "v": pd.array([" ", ""], dtype="string")})
+        lookup = lookup_frame({"A": {"v": "va"}, "B": {"v": None}}, ("v",))
+
+        plain = merge_lookup(df, lookup_keys(df["k"]), lookup)
+        blank = merge_lookup(df, lookup_keys(df["k"]), lookup, blank_is_missing=True)
+
+        assert plain["v"].tolist() == [" ", ""]
+        assert blank["v"].tolist() == ["va", ""]
+        assert blank["v"].dtype == df["v"].dtype
+
+    def test_composite_keys_and_new_columns(self) -> None:
+        """Tuple keys join on several columns; absent columns are added."""
+        df = pd.DataFrame({"m": ["M1", "M2", None], "d": ["D1", "D1", "D1"]})
+        keys = pd.DataFrame({column: lookup_keys(df[column]) for column in df.columns})
+        lookup = lookup_frame({("M1", "D1"): {"name": "n1"}}, ("name",))
+
+        result = merge_lookup(df, keys, lookup)
+
+        assert result["name"].tolist()[0] == "n1"
+        assert result["name"].isna().tolist() == [False, True, True]
+
+    def test_incompatible_extension_dtype_falls_back_to_object(self) -> None:
+        """Values an extension dtype rejects are written through ``object``."""
+        df = pd.DataFrame({"k": ["A", "B"], "flag": pd.array([None, True], dtype="boolean")})
+        lookup = lookup_frame({"A": {"flag": "1"}}, ("flag",))
+
+        result = merge_lookup(df, lookup_keys(df["k"]), lookup)
+
+        assert result["flag"].dtype == object
+        assert result["flag"].tolist() == ["1", True]
+
+    def test_empty_lookup(self) -> None:
+        """An empty lookup adds NA columns and keeps existing values."""
+        df = pd.DataFrame({"k": ["A"], "v": ["keep"]})
+
+        result = merge_lookup(df, lookup_keys(df["k"]), lookup_frame({}, ("v", "w")))
+
+        assert result["v"].tolist() == ["keep"]
+        assert result["w"].isna().all()
@@ -2,9 +2,58 @@
 
 from __future__ import annotations
 
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pandas as pd
 import pytest
 
-from bioetl.core.hashing import compute_hash, hash_from_mapping
+from bioetl.core import hashing
+from bioetl.core.hashing import compute_hash, hash_frame_rows, hash_from_mapping
+
+
+def _reference_row_hashes(frame: pd.DataFrame, fields: list[str]) -> list[str]:
+    return [
+        hash_from_mapping(dict(zip(fields, values, strict=True)), fields)
+        for values in frame[fields].itertuples(index=False, name=None)
+    ]
+
+
+@pytest.fixture
+def mixed_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "text": [" Foo ", "BAR", None, "", "İstanbul", "ß"],
+            "string": pd.Series(["a", pd.NA, " B ", "c", "d", "e"], dtype="string"),
+            "int": [1, 2, 3, -4, 0, 10**12],
+            "nullable_int": pd.Series([1, None, 3, 4, None, 6], dtype="Int64"),
+            "float": [1.5, float("nan"), 1e16, -0.0, float("inf"), 1e-7],
+            "bool": [True, False, True, False, True, False],
+            "nullable_bool": pd.Series([True, None, False, True, None, False], dtype="boolean"),
+            "timestamp": pd.to_datetime(
+                [
+                    "2024-01-01T00:00:00",
+                    None,
+                    "2024-06-30T12:34:56.789",
+                    "2000-01-01",
+                    "1999-12-31",
+                    "2024-01-01",
+                ],
+                format="ISO8601",
+            ),
+            "timestamp_tz": pd.to_datetime(["2024-01-01T00:00:00Z"] * 5 + [None], utc=True),
+            "objects": [
+                ["b", "a"],
+                {"B": 1, "a": None},
+                [None, None],
+                [],
+                date(2024, 1, 2),
+                datetime(2024, 1, 2, 3, 4, tzinfo=timezone.utc),
+            ],
+            "mixed": [1, "x", 2.5, None, np.nan, b" Bytes "],
+            "category": pd.Series(["x", "y", None, "x", "y", "z"], dtype="category"),
+        }
+    )
 
 
 @pytest.mark.unit
@@ -38,3 +87,51 @@ def test_hash_from_mapping_returns_digest() -> None:
     digest = hash_from_mapping(mapping, ["id", "value"], algorithm="sha256")
 
     assert len(digest) == 64
+
+
+@pytest.mark.unit
+class TestHashFrameRows:
+    """Parity of the columnar engine with :func:`hash_from_mapping`."""
+
+    def test_matches_per_row_hashing(self, mixed_frame: pd.DataFrame) -> None:
+        fields = list(mixed_frame.columns)
+
+        assert hash_frame_rows(mixed_frame, fields) == _reference_row_hashes(mixed_frame, fields)
+
+    @pytest.mark.parametrize("field", ["text", "float", "timestamp_tz", "objects", "mixed"])
+    def test_matches_per_column(self, mixed_frame: pd.DataFrame, field: str) -> None:
+        assert hash_frame_rows(mixed_frame, [field]) == _reference_row_hashes(
+            mixed_frame, [field]
+        )
+
+    def test_alternative_algorithm(self, mixed_frame: pd.DataFrame) -> None:
+        fields = ["text", "int"]
+        expected = [
+            hash_from_mapping(dict(zip(fields, values, strict=True)), fields, algorithm="md5")
+            for values in mixed_frame[fields].itertuples(index=False, name=None)
+        ]
+
+        assert hash_frame_rows(mixed_frame, fields, algorithm="md5") == expected
+
+    def test_empty_field_list_matches_compute_hash(self, mixed_frame: pd.DataFrame) -> None:
+        assert hash_frame_rows(mixed_frame, []) == [compute_hash([])] * len(mixed_frame)
+
+    def test_missing_field_raises(self, mixed_frame: pd.DataFrame) -> None:
+        with pytest.raises(KeyError, match="Fields required"):
+            hash_frame_rows(mixed_frame, ["absent"])
+
+    def test_unsupported_algorithm_raises(self, mixed_frame: pd.DataFrame) -> None:
+        with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+            hash_frame_rows(mixed_frame, ["text"], algorithm="not-a-hash")
+
+    def test_process_pool_preserves_row_order(
+        self, mixed_frame: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(hashing, "_PARALLEL_MIN_ROWS", 4)
+        frame = pd.concat([mixed_frame] * 3, ignore_index=True)
+        frame["int"] = range(len(frame))
+        fields = list(frame.columns)
+
+        assert hash_frame_rows(frame, fields, max_workers=2) == _reference_row_hashes(
+            frame, fields
+        )
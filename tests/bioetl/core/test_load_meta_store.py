@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -86,3 +87,100 @@ def test_update_pagination_requires_active_id(tmp_path: Path) -> None:
     store = LoadMetaStore(tmp_path)
     with pytest.raises(KeyError):
         store.update_pagination("missing", {"page": 1})
+
+
+def _finish(store: LoadMetaStore, records_fetched: int) -> str:
+    load_meta_id = store.begin_record(
+        "chembl_rest",
+        "https://www.ebi.ac.uk/chembl/api/data/activity",
+        {"offset": records_fetched},
+        source_release="36",
+    )
+    store.finish_record(load_meta_id, status="success", records_fetched=records_fetched)
+    return load_meta_id
+
+
+def test_buffered_store_writes_one_file_per_run(tmp_path: Path) -> None:
+    store = LoadMetaStore(tmp_path, run_id="run-1", flush_rows=2)
+    ids = [_finish(store, count) for count in range(5)]
+
+    meta_dir = tmp_path / "load_meta"
+    assert (meta_dir / "run-1.journal.jsonl").exists()
+    assert not (meta_dir / "run-1.parquet").exists()
+
+    published = store.close()
+
+    assert published == meta_dir / "run-1.parquet"
+    assert sorted(path.name for path in meta_dir.iterdir()) == ["run-1.parquet"]
+    pq = pytest.importorskip("pyarrow.parquet")
+    metadata = pq.ParquetFile(published).metadata
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [2, 2, 1]
+    frame = _read_parquet(published)
+    LoadMetaSchema.validate(frame, lazy=True)
+    assert frame["load_meta_id"].tolist() == ids
+    assert frame["records_fetched"].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_buffered_store_close_without_records(tmp_path: Path) -> None:
+    store = LoadMetaStore(tmp_path, run_id="run-1")
+
+    assert store.close() is None
+    assert list((tmp_path / "load_meta").iterdir()) == []
+
+
+def test_buffered_store_recovers_unflushed_journal(tmp_path: Path) -> None:
+    crashed = LoadMetaStore(tmp_path, run_id="crashed", flush_rows=2)
+    ids = [_finish(crashed, count) for count in range(3)]
+    meta_dir = tmp_path / "load_meta"
+    with (meta_dir / "crashed.journal.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write('{"load_meta_id": "trunc')
+    # A dead process releases its journal lock.
+    crashed._journal.close()  # pyright: ignore[reportOptionalMemberAccess, reportPrivateUsage]
+
+    LoadMetaStore(tmp_path, run_id="next-run")
+
+    assert sorted(path.name for path in meta_dir.iterdir()) == ["crashed.parquet"]
+    frame = _read_parquet(meta_dir / "crashed.parquet")
+    LoadMetaSchema.validate(frame, lazy=True)
+    assert frame["load_meta_id"].tolist() == ids
+
+
+def test_buffered_store_keeps_journal_of_live_run(tmp_path: Path) -> None:
+    live = LoadMetaStore(tmp_path, run_id="live", flush_rows=2)
+    ids = [_finish(live, count) for count in range(3)]
+    meta_dir = tmp_path / "load_meta"
+
+    other = LoadMetaStore(tmp_path, run_id="other")
+
+    assert other.recover_journals() == []
+    assert (meta_dir / "live.journal.jsonl").exists()
+    assert (meta_dir / "live.parquet.partial").exists()
+    ids.append(_finish(live, 3))
+    assert live.close() == meta_dir / "live.parquet"
+    assert _read_parquet(meta_dir / "live.parquet")["load_meta_id"].tolist() == ids
+
+
+def test_buffered_store_is_safe_to_share_between_threads(tmp_path: Path) -> None:
+    store = LoadMetaStore(tmp_path, run_id="threaded", flush_rows=20)
+
+    def _worker(worker: int) -> list[str]:
+        ids: list[str] = []
+        for count in range(300):
+            load_meta_id = store.begin_record(
+                "chembl_rest",
+                "https://www.ebi.ac.uk/chembl/api/data/activity",
+                {"worker": worker, "offset": count},
+            )
+            store.update_pagination(load_meta_id, {"page_index": count}, records_fetched_delta=1)
+            store.finish_record(load_meta_id, status="success", records_fetched=1)
+            ids.append(load_meta_id)
+        return ids
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        expected = [load_meta_id for ids in executor.map(_worker, range(8)) for load_meta_id in ids]
+
+    target = store.close()
+    assert target == tmp_path / "load_meta" / "threaded.parquet"
+    frame = _read_parquet(target)
+    assert len(frame) == 2400
+    assert set(frame["load_meta_id"]) == set(expected)
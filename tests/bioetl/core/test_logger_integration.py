@@ -1,17 +1,30 @@
 import json
+import logging
+import multiprocessing
+import sys
 from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import pytest
+import structlog
 
 from bioetl.core.log_events import LogEvents
-from bioetl.core.logger import LogConfig, LogFormat, UnifiedLogger
+from bioetl.core.logger import (
+    LogConfig,
+    LogFormat,
+    LogSamplingRule,
+    UnifiedLogger,
+    _EventSampler,
+    shutdown_logging,
+)
 
 
 @pytest.fixture(autouse=True)
 def reset_logger_context() -> Generator[None, None, None]:
     UnifiedLogger.reset()
     yield
+    shutdown_logging()
     UnifiedLogger.reset()
 
 
@@ -74,3 +87,155 @@ def test_unified_logger_key_value_output(capfd: Any) -> None:
     assert "stage='run'" in line
     assert "cli.run.finish" in line
     assert "rows=10" in line
+
+
+def _payloads(err: str) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in err.strip().splitlines()]
+
+
+def test_unified_logger_callsite_only_for_warnings(capfd: Any) -> None:
+    UnifiedLogger.configure(LogConfig(format=LogFormat.JSON, level="INFO"))
+    logger = _bind_mandatory(UnifiedLogger.get(__name__))
+
+    logger.info("routine.event.done")
+    logger.warning("unusual.event.seen")
+
+    info, warning = _payloads(capfd.readouterr().err)
+    assert "lineno" not in info and "pathname" not in info
+    assert warning["func_name"] == "test_unified_logger_callsite_only_for_warnings"
+    assert warning["pathname"].endswith("test_logger_integration.py")
+
+
+def test_unified_logger_samples_routine_events(capfd: Any) -> None:
+    UnifiedLogger.configure(
+        LogConfig(
+            format=LogFormat.JSON,
+            level="INFO",
+            sampling={"http.request.*": LogSamplingRule(rate=0.25)},
+        )
+    )
+    logger = _bind_mandatory(UnifiedLogger.get(__name__))
+
+    for attempt in range(8):
+        logger.info(LogEvents.HTTP_REQUEST_COMPLETED, attempt=attempt)
+        logger.warning(LogEvents.HTTP_REQUEST_RETRY, attempt=attempt)
+
+    payloads = _payloads(capfd.readouterr().err)
+    completed = [item for item in payloads if item["message"] == "http.request.completed"]
+    retries = [item for item in payloads if item["message"] == "http.request.retry"]
+    assert [item["attempt"] for item in completed] == [3, 7]
+    assert [item["sampled_out"] for item in completed] == [3, 3]
+    assert len(retries) == 8
+
+
+def test_event_sampler_rate_limit() -> None:
+    now = [0.0]
+    sampler = _EventSampler(
+        {"load.meta.page": LogSamplingRule(max_per_second=2)}, clock=lambda: now[0]
+    )
+
+    def emit() -> dict[str, Any] | None:
+        try:
+            return dict(sampler(None, "info", {"event": "load.meta.page"}))
+        except structlog.DropEvent:
+            return None
+
+    first_second = [emit() for _ in range(5)]
+    now[0] = 1.0
+    after_refill = emit()
+
+    assert [item is not None for item in first_second] == [True, True, False, False, False]
+    assert after_refill == {"event": "load.meta.page", "sampled_out": 3}
+    assert sampler(None, "error", {"event": "load.meta.page"}) == {"event": "load.meta.page"}
+
+
+def test_log_sampling_rule_validation() -> None:
+    with pytest.raises(ValueError):
+        LogSamplingRule(rate=1.5)
+    with pytest.raises(ValueError):
+        LogSamplingRule(max_per_second=0)
+
+
+def test_unified_logger_async_sink(capfd: Any) -> None:
+    UnifiedLogger.configure(
+        LogConfig(format=LogFormat.JSON, level="INFO", async_sink=True, batch_size=3)
+    )
+    logger = _bind_mandatory(UnifiedLogger.get(__name__))
+
+    for index in range(10):
+        logger.info(LogEvents.CLI_RUN_FINISH, index=index)
+    with UnifiedLogger.scoped(run_id="run-2"):
+        logging.getLogger("third_party").warning("plain %s", "record")
+    UnifiedLogger.flush()
+
+    payloads = _payloads(capfd.readouterr().err)
+    assert [item["index"] for item in payloads[:10]] == list(range(10))
+    assert payloads[10]["message"] == "plain record"
+    assert payloads[10]["run_id"] == "run-2"
+
+
+def test_unified_logger_async_sink_stamps_stdlib_records_at_creation(capfd: Any) -> None:
+    UnifiedLogger.configure(LogConfig(format=LogFormat.JSON, level="INFO", async_sink=True))
+    record = logging.makeLogRecord(
+        {
+            "name": "third_party",
+            "levelno": logging.WARNING,
+            "levelname": "WARNING",
+            "msg": "queued",
+            "created": 1_700_000_000.5,
+        }
+    )
+
+    logging.getLogger("third_party").handle(record)
+    UnifiedLogger.flush()
+
+    (payload,) = _payloads(capfd.readouterr().err)
+    assert payload["message"] == "queued"
+    assert payload["timestamp"] == "2023-11-14T22:13:20.500000Z"
+
+
+def test_unified_logger_writes_synchronously_after_shutdown(capfd: Any) -> None:
+    UnifiedLogger.configure(
+        LogConfig(format=LogFormat.JSON, level="INFO", async_sink=True, queue_size=4)
+    )
+    logger = _bind_mandatory(UnifiedLogger.get(__name__))
+    shutdown_logging()
+
+    # More records than queue_size: nothing drains the queue once the sink has stopped.
+    for index in range(10):
+        logger.info(LogEvents.CLI_RUN_FINISH, index=index)
+
+    payloads = _payloads(capfd.readouterr().err)
+    assert [item["index"] for item in payloads] == list(range(10))
+
+
+def _log_from_worker(worker: int) -> int:
+    logger = _bind_mandatory(UnifiedLogger.get(__name__))
+    for index in range(20):
+        logger.info(LogEvents.CLI_RUN_FINISH, worker=worker, index=index)
+    logging.getLogger("third_party").warning("worker %s done", worker)
+    return worker
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fork start method is POSIX-only")
+def test_unified_logger_async_sink_in_forked_workers(capfd: Any) -> None:
+    UnifiedLogger.configure(
+        LogConfig(format=LogFormat.JSON, level="INFO", async_sink=True, queue_size=4)
+    )
+    _bind_mandatory(UnifiedLogger.get(__name__)).info(LogEvents.CLI_RUN_FINISH, worker=-1)
+
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+        # More records than queue_size: the inherited queue has no sink thread to drain it.
+        assert sorted(executor.map(_log_from_worker, range(2), timeout=30)) == [0, 1]
+    UnifiedLogger.flush()
+
+    payloads = _payloads(capfd.readouterr().err)
+    for worker in range(2):
+        records = [item for item in payloads if item.get("worker") == worker]
+        assert [item["index"] for item in records] == list(range(20))
+    assert {item["message"] for item in payloads if "done" in item["message"]} == {
+        "worker 0 done",
+        "worker 1 done",
+    }
+    assert any(item.get("worker") == -1 for item in payloads)
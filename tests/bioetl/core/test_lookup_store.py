@@ -0,0 +1,70 @@
+"""Unit tests for the release-scoped lookup store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bioetl.core.lookup_store import LookupStore
+
+
+@pytest.mark.unit
+class TestLookupStore:
+    """Test suite for LookupStore."""
+
+    def test_catalog_per_release(self, tmp_path: Path) -> None:
+        with LookupStore(tmp_path) as store:
+            store.put_many("molecule", {"CHEMBL1": [{"a": 1}]}, release="ChEMBL_35", fields=["a"])
+
+            assert store.get_many("molecule", ["CHEMBL1"], release="ChEMBL_36", fields=["a"]) == {}
+            assert store.get_many("molecule", ["CHEMBL1"], release=None, fields=["a"]) == {}
+
+        assert (tmp_path / "ChEMBL_35" / "lookups.sqlite").exists()
+
+    def test_wider_entry_serves_narrower_selection(self, tmp_path: Path) -> None:
+        with LookupStore(tmp_path) as store:
+            store.put_many(
+                "assay",
+                {"CHEMBL1": [{"a": 1, "b": 2, "c": 3}], "CHEMBL2": []},
+                release="36",
+                fields=["a", "b", "c"],
+            )
+
+            hits = store.get_many("assay", ["CHEMBL1", "CHEMBL2"], release="36", fields=["b", "a"])
+            wider = store.get_many("assay", ["CHEMBL1"], release="36", fields=["a", "d"])
+
+        assert hits == {"CHEMBL1": [{"a": 1, "b": 2}], "CHEMBL2": []}
+        assert wider == {}
+
+    def test_narrow_write_keeps_wider_entry(self, tmp_path: Path) -> None:
+        with LookupStore(tmp_path) as store:
+            store.put_many("assay", {"1": [{"a": 1, "b": 2}]}, release="36")
+            written = store.put_many("assay", {"1": [{"a": 1}]}, release="36", fields=["a"])
+            store.put_many("assay", {"2": [{"a": 1}]}, release="36", fields=["a"])
+            widened = store.put_many(
+                "assay", {"2": [{"a": 1, "b": 2}]}, release="36", fields=["a", "b"]
+            )
+
+            assert store.get_many("assay", ["1", "2"], release="36", fields=["b"]) == {
+                "1": [{"b": 2}],
+                "2": [{"b": 2}],
+            }
+
+        assert written == 0
+        assert widened == 1
+
+    def test_persists_without_expiry(self, tmp_path: Path) -> None:
+        with LookupStore(tmp_path) as store:
+            store.put_many("data_validity", {"x": [{"d": "x"}]}, release="36")
+
+        with LookupStore(tmp_path) as reopened:
+            assert reopened.get_many("data_validity", ["x"], release="36") == {"x": [{"d": "x"}]}
+            assert reopened.count("data_validity", release="36") == 1
+
+    def test_rejects_release_outside_root(self, tmp_path: Path) -> None:
+        store = LookupStore(tmp_path)
+
+        with pytest.raises(ValueError, match="release"):
+            store.path_for("../escape")
+        assert store.put_many("assay", {"1": []}, release="../escape") == 0
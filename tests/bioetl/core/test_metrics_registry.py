@@ -0,0 +1,317 @@
+"""Unit tests for the metrics registry and its exporters."""
+
+from __future__ import annotations
+
+import io
+import json
+import time
+import urllib.request
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from bioetl.config.models import CircuitBreakerConfig, TelemetryConfig
+from bioetl.core.api_client import CircuitBreaker
+from bioetl.core.metrics import (
+    MetricsRegistry,
+    endpoint_label,
+    get_metrics_registry,
+    observe_http_request,
+    record_cache_lookup,
+    record_stage,
+    reset_metrics_registry,
+)
+from bioetl.core.metrics_export import (
+    ConsoleMetricsExporter,
+    OTLPHttpMetricsExporter,
+    OTLPJsonFileExporter,
+    PrometheusFileExporter,
+    PrometheusHTTPExporter,
+    create_metrics_exporter,
+    render_otlp_json,
+    render_prometheus,
+)
+from bioetl.core.record_cache import RecordCache
+
+_RESOURCE = {"service.name": "bioetl", "bioetl.pipeline": "activity"}
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry() -> Iterator[None]:
+    reset_metrics_registry()
+    yield
+    reset_metrics_registry()
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    registry = MetricsRegistry()
+    registry.counter("jobs_total", "Processed jobs.").inc(3, queue="a")
+    registry.gauge("queue_depth", "Queue depth.").set(7, queue="a")
+    histogram = registry.histogram("latency_seconds", "Latency.", unit="s", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value, route="/x")
+    return registry
+
+
+@pytest.mark.unit
+class TestMetricsRegistry:
+    """Test suite for the registry and its instruments."""
+
+    def test_instruments_are_shared_by_name(self) -> None:
+        registry = MetricsRegistry()
+        registry.counter("hits_total").inc(kind="a")
+        registry.counter("hits_total").inc(2, kind="a")
+
+        assert registry.counter("hits_total").value(kind="a") == 3
+        assert registry.counter("hits_total").value(kind="b") == 0
+
+    def test_kind_mismatch_raises(self) -> None:
+        registry = MetricsRegistry()
+        registry.counter("things")
+
+        with pytest.raises(ValueError, match="things"):
+            registry.gauge("things")
+
+    def test_histogram_buckets(self, registry: MetricsRegistry) -> None:
+        family = next(item for item in registry.collect() if item.name == "latency_seconds")
+        (point,) = family.points
+
+        assert family.buckets == (0.1, 1.0)
+        assert point.bucket_counts == (2, 1, 1)
+        assert point.count == 4
+        assert point.sum == pytest.approx(2.65)
+        assert (point.min, point.max) == (0.05, 2.0)
+
+    def test_gauge_set_max_keeps_peak(self) -> None:
+        gauge = MetricsRegistry().gauge("peak")
+        gauge.set_max(5, stage="a")
+        gauge.set_max(3, stage="a")
+
+        assert gauge.value(stage="a") == 5
+
+    def test_clear_resets_series(self, registry: MetricsRegistry) -> None:
+        started = registry.start_time_ns
+        registry.clear()
+
+        assert registry.collect() == []
+        assert registry.start_time_ns >= started
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            (
+                "https://www.ebi.ac.uk/chembl/api/data/molecule/CHEMBL25.json",
+                "/chembl/api/data/molecule/{id}",
+            ),
+            ("https://rest.uniprot.org/uniprotkb/search?query=P12345", "/uniprotkb/search"),
+            ("https://api.crossref.org/v1/works/10.1000/xyz123", "/v1/works/{id}/{id}"),
+            ("/activity.json", "/activity.json"),
+        ],
+    )
+    def test_endpoint_label(self, url: str, expected: str) -> None:
+        assert endpoint_label(url) == expected
+
+
+@pytest.mark.unit
+class TestInstrumentationHelpers:
+    """Test suite for the helpers used by clients, caches and pipelines."""
+
+    def test_http_request_latency(self) -> None:
+        observe_http_request("chembl", "get", "https://host/api/activity/42", 200, 0.2)
+
+        histogram = get_metrics_registry().histogram("bioetl_http_request_duration_seconds")
+        assert histogram.count(
+            client="chembl", method="GET", endpoint="/api/activity/{id}", status=200
+        ) == 1
+
+    def test_cache_hit_ratio_is_cumulative(self) -> None:
+        record_cache_lookup("record_cache", "activity", hits=3, misses=1)
+        record_cache_lookup("record_cache", "activity", hits=0, misses=4)
+
+        registry = get_metrics_registry()
+        assert registry.gauge("bioetl_cache_hit_ratio").value(
+            cache="record_cache", entity="activity"
+        ) == pytest.approx(3 / 8)
+
+    def test_record_stage(self) -> None:
+        record_stage("activity", "extract", duration_seconds=2.0, rows=100, peak_memory_bytes=10)
+        record_stage("activity", "extract", duration_seconds=1.0, rows=50, peak_memory_bytes=5)
+
+        registry = get_metrics_registry()
+        labels = {"pipeline": "activity", "stage": "extract"}
+        assert registry.counter("bioetl_stage_rows_total").value(**labels) == 150
+        assert registry.gauge("bioetl_stage_rows_per_second").value(**labels) == 50
+        assert registry.gauge("bioetl_stage_peak_memory_bytes").value(**labels) == 10
+
+    def test_circuit_breaker_transitions(self) -> None:
+        breaker = CircuitBreaker(
+            CircuitBreakerConfig(failure_threshold=1, timeout=0.01), name="chembl"
+        )
+
+        def _fail() -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            breaker.call(_fail)
+        time.sleep(0.02)
+        breaker.call(lambda: None)
+
+        transitions = get_metrics_registry().counter("bioetl_circuit_breaker_transitions_total")
+        for state in ("open", "half-open", "closed"):
+            assert transitions.value(name="chembl", state=state) == 1
+
+    def test_record_cache_lookups(self, tmp_path: Path) -> None:
+        with RecordCache(tmp_path / "records.sqlite") as cache:
+            cache.put_many("activity", {"1": [{"activity_id": 1}]}, release="R", fields=None)
+            cache.get_many("activity", ["1", "2"], release="R", fields=None)
+
+        lookups = get_metrics_registry().counter("bioetl_cache_lookups_total")
+        labels = {"cache": "record_cache", "entity": "activity"}
+        assert lookups.value(result="hit", **labels) == 1
+        assert lookups.value(result="miss", **labels) == 1
+
+
+@pytest.mark.unit
+class TestRenderers:
+    """Test suite for the Prometheus text and OTLP JSON renderers."""
+
+    def test_prometheus_text(self, registry: MetricsRegistry) -> None:
+        text = render_prometheus(registry.collect())
+
+        assert "# HELP jobs_total Processed jobs.\n# TYPE jobs_total counter\n" in text
+        assert 'jobs_total{queue="a"} 3.0\n' in text
+        assert "# TYPE queue_depth gauge\n" in text
+        assert 'latency_seconds_bucket{route="/x",le="0.1"} 2\n' in text
+        assert 'latency_seconds_bucket{route="/x",le="1.0"} 3\n' in text
+        assert 'latency_seconds_bucket{route="/x",le="+Inf"} 4\n' in text
+        assert 'latency_seconds_count{route="/x"} 4\n' in text
+        assert text.endswith("\n")
+
+    def test_prometheus_escapes_label_values(self) -> None:
+        registry = MetricsRegistry()
+        registry.counter("odd_total").inc(path='a"b\\c\nd')
+
+        assert 'odd_total{path="a\\"b\\\\c\\nd"} 1.0' in render_prometheus(registry.collect())
+
+    def test_otlp_json(self, registry: MetricsRegistry) -> None:
+        payload = render_otlp_json(
+            registry.collect(), resource=_RESOURCE, start_time_ns=1, time_ns=2
+        )
+
+        (resource_metrics,) = payload["resourceMetrics"]
+        assert {"key": "service.name", "value": {"stringValue": "bioetl"}} in resource_metrics[
+            "resource"
+        ]["attributes"]
+        (scope,) = resource_metrics["scopeMetrics"]
+        metrics = {metric["name"]: metric for metric in scope["metrics"]}
+
+        counter = metrics["jobs_total"]["sum"]
+        assert counter["isMonotonic"] is True
+        assert counter["aggregationTemporality"] == 2
+        assert counter["dataPoints"][0]["asDouble"] == 3
+        assert metrics["queue_depth"]["gauge"]["dataPoints"][0]["asDouble"] == 7
+        point = metrics["latency_seconds"]["histogram"]["dataPoints"][0]
+        assert point["count"] == "4"
+        assert point["bucketCounts"] == ["2", "1", "1"]
+        assert point["explicitBounds"] == [0.1, 1.0]
+        assert (point["startTimeUnixNano"], point["timeUnixNano"]) == ("1", "2")
+        json.dumps(payload)
+
+
+@pytest.mark.unit
+class TestExporters:
+    """Test suite for the exporters and their selection from ``telemetry``."""
+
+    def test_prometheus_file(self, registry: MetricsRegistry, tmp_path: Path) -> None:
+        path = tmp_path / "out" / "run.prom"
+        PrometheusFileExporter(path).export(registry)
+
+        assert path.read_text(encoding="utf-8") == render_prometheus(registry.collect())
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_otlp_file(self, registry: MetricsRegistry, tmp_path: Path) -> None:
+        path = tmp_path / "run.otlp.json"
+        OTLPJsonFileExporter(path, resource=_RESOURCE).export(registry)
+
+        assert json.loads(path.read_text(encoding="utf-8"))["resourceMetrics"]
+
+    def test_console(self, registry: MetricsRegistry) -> None:
+        stream = io.StringIO()
+        ConsoleMetricsExporter(stream).export(registry)
+
+        assert "jobs_total" in stream.getvalue()
+
+    def test_prometheus_http(self, registry: MetricsRegistry) -> None:
+        exporter = PrometheusHTTPExporter(registry, port=0)
+        try:
+            host, port = exporter.address
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+        finally:
+            exporter.close()
+
+        assert content_type.startswith("text/plain")
+        assert body == render_prometheus(registry.collect())
+
+    def test_otlp_http_posts_json(self, registry: MetricsRegistry) -> None:
+        calls: list[dict[str, Any]] = []
+
+        class _Response:
+            def raise_for_status(self) -> None:
+                return None
+
+        class _Session:
+            def post(self, url: str, **kwargs: Any) -> _Response:
+                calls.append({"url": url, **kwargs})
+                return _Response()
+
+        exporter = OTLPHttpMetricsExporter(
+            "http://collector:4318", resource=_RESOURCE, session=_Session()
+        )
+        exporter.export(registry)
+
+        (call,) = calls
+        assert call["url"] == "http://collector:4318/v1/metrics"
+        assert call["headers"]["Content-Type"] == "application/json"
+        assert json.loads(call["data"])["resourceMetrics"]
+
+    def test_create_exporter(self, tmp_path: Path) -> None:
+        def _create(**telemetry: Any) -> Any:
+            return create_metrics_exporter(
+                TelemetryConfig(**telemetry),
+                registry=get_metrics_registry(),
+                default_directory=tmp_path,
+                stem="activity_20240101",
+                resource=_RESOURCE,
+            )
+
+        assert _create(enabled=False, exporter="prometheus") is None
+        assert _create(enabled=True, exporter="jaeger") is None
+        assert _create(enabled=True) is None
+
+        prometheus = _create(enabled=True, exporter="prometheus")
+        assert isinstance(prometheus, PrometheusFileExporter)
+        assert prometheus.path == tmp_path / "activity_20240101_metrics.prom"
+
+        otlp = _create(enabled=True, exporter="OTLP", endpoint=str(tmp_path / "m.json"))
+        assert isinstance(otlp, OTLPJsonFileExporter)
+        assert otlp.path == tmp_path / "m.json"
+
+        otlp_http = _create(enabled=True, exporter="otlp", endpoint="https://collector/")
+        assert isinstance(otlp_http, OTLPHttpMetricsExporter)
+        assert otlp_http.endpoint == "https://collector/v1/metrics"
+
+        assert isinstance(_create(enabled=True, exporter="console"), ConsoleMetricsExporter)
+
+        server = _create(enabled=True, exporter="prometheus", endpoint="http://127.0.0.1:0")
+        try:
+            assert isinstance(server, PrometheusHTTPExporter)
+        finally:
+            server.close()
+
+        with pytest.raises(ValueError, match="statsd"):
+            _create(enabled=True, exporter="statsd")
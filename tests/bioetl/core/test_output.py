@@ -21,9 +21,14 @@ from bioetl.config.models.models import MaterializationConfig
 from bioetl.config.models.models import ValidationConfig
 from bioetl.core.output import (
     DeterministicWriteArtifacts,
+    StreamingDatasetWriter,
+    arrow_schema,
     ensure_hash_columns,
     prepare_dataframe,
+    read_dataset,
+    resolve_output_format,
     serialise_metadata,
+    unify_arrow_schemas,
     write_dataset_atomic,
     write_frame_like,
     write_yaml_atomic,
@@ -198,6 +203,206 @@ class TestOutput:
         assert output_path.exists()
         assert output_path.parent.exists()
 
+    def test_write_dataset_atomic_parquet(
+        self, output_config: PipelineConfig, sample_dataframe: pd.DataFrame, tmp_path: Path
+    ) -> None:
+        """Parquet targets are written with pyarrow and are byte-stable across runs."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        output_config.io.output.row_group_size = 2
+        frame = sample_dataframe.assign(kind=["x", "x", "x"], mixed=[1, "a", None])
+        first = tmp_path / "first.parquet"
+        second = tmp_path / "second.parquet"
+
+        write_dataset_atomic(frame, first, config=output_config)
+        write_dataset_atomic(frame, second, config=output_config)
+
+        assert first.read_bytes() == second.read_bytes()
+        assert not first.with_suffix(first.suffix + ".tmp").exists()
+        metadata = pq.ParquetFile(first).metadata
+        assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [2, 1]
+        loaded = pq.read_table(first).to_pandas()
+        assert loaded["id"].tolist() == [3, 1, 2]
+        assert loaded["mixed"].iloc[:2].tolist() == ["1", "a"]
+        assert pd.isna(loaded["mixed"].iloc[2])
+
+    def test_write_dataset_atomic_parquet_partitioned(
+        self, output_config: PipelineConfig, tmp_path: Path
+    ) -> None:
+        """partition_by produces a hive layout that replaces the previous run."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        output_config.io.output.partition_by = ("year",)
+        output_path = tmp_path / "dataset.parquet"
+        frame = pd.DataFrame({"id": [1, 2, 3, 4], "year": [2021, 2020, None, 2021]})
+
+        write_dataset_atomic(frame.iloc[:1], output_path, config=output_config)
+        write_dataset_atomic(frame, output_path, config=output_config)
+
+        partitions = sorted(path.name for path in output_path.iterdir())
+        assert partitions == ["year=2020.0", "year=2021.0", "year=__HIVE_DEFAULT_PARTITION__"]
+        part = pq.read_table(output_path / "year=2021.0" / "part-00000.parquet").to_pandas()
+        assert part.columns.tolist() == ["id"]
+        assert part["id"].tolist() == [1, 4]
+        assert not output_path.with_name("dataset.parquet.old").exists()
+
+    def test_write_dataset_atomic_partition_column_missing(
+        self, output_config: PipelineConfig, sample_dataframe: pd.DataFrame, tmp_path: Path
+    ) -> None:
+        """Missing partition columns are reported before anything is replaced."""
+        pytest.importorskip("pyarrow")
+        output_config.io.output.partition_by = ("year",)
+
+        with pytest.raises(KeyError, match="Partition columns missing"):
+            write_dataset_atomic(sample_dataframe, tmp_path / "out.parquet", config=output_config)
+
+    def test_read_dataset_round_trips_csv(
+        self, output_config: PipelineConfig, sample_dataframe: pd.DataFrame, tmp_path: Path
+    ) -> None:
+        """Datasets written as CSV are read back with missing values restored."""
+        output_path = tmp_path / "output.csv"
+        frame = sample_dataframe.assign(note=["x", None, "z"])
+        write_dataset_atomic(frame, output_path, config=output_config)
+
+        loaded = read_dataset(output_path, config=output_config)
+
+        assert loaded["id"].tolist() == [3, 1, 2]
+        assert loaded["note"].isna().tolist() == [False, True, False]
+
+    def test_read_dataset_csv_with_dtypes(
+        self, output_config: PipelineConfig, tmp_path: Path
+    ) -> None:
+        """Columns with given dtypes are parsed as those dtypes instead of inferred."""
+        output_path = tmp_path / "output.csv"
+        frame = pd.DataFrame(
+            {
+                "count": pd.array([1, None, 3], dtype="Int64"),
+                "code": pd.array(["007", None, "1e3"], dtype="string"),
+                "flag": pd.array([True, None, False], dtype="boolean"),
+                "seen_at": pd.to_datetime(
+                    ["2024-01-01T00:00:00Z", None, "2024-01-03T12:30:00Z"], utc=True
+                ),
+            }
+        )
+        write_dataset_atomic(frame, output_path, config=output_config)
+        dtypes = {
+            "count": pd.Int64Dtype(),
+            "code": pd.StringDtype(),
+            "flag": pd.BooleanDtype(),
+            "seen_at": frame["seen_at"].dtype,
+        }
+
+        loaded = read_dataset(output_path, config=output_config, dtypes=dtypes)
+        inferred = read_dataset(output_path, config=output_config)
+
+        pd.testing.assert_frame_equal(
+            loaded.sort_values("count").reset_index(drop=True),
+            frame.sort_values("count").reset_index(drop=True),
+            check_like=True,
+        )
+        assert inferred["count"].dtype == "float64"
+        assert 7 in inferred["code"].tolist()
+
+    def test_read_dataset_partitioned_parquet(
+        self, output_config: PipelineConfig, tmp_path: Path
+    ) -> None:
+        """Partition columns are restored from the hive directory names."""
+        pytest.importorskip("pyarrow")
+        output_config.io.output.partition_by = ("year",)
+        output_path = tmp_path / "dataset.parquet"
+        frame = pd.DataFrame({"id": [1, 2, 3], "year": [2021, 2020, None]})
+        write_dataset_atomic(frame, output_path, config=output_config)
+
+        loaded = read_dataset(output_path, config=output_config)
+
+        by_id = loaded.sort_values("id").reset_index(drop=True)
+        assert by_id["id"].tolist() == [1, 2, 3]
+        assert by_id["year"].iloc[:2].astype(str).tolist() == ["2021.0", "2020.0"]
+        assert pd.isna(by_id["year"].iloc[2])
+
+    def test_streaming_writer_csv_matches_atomic_write(
+        self, output_config: PipelineConfig, sample_dataframe: pd.DataFrame, tmp_path: Path
+    ) -> None:
+        """Appending chunks yields the same CSV as writing the whole frame."""
+        expected = tmp_path / "expected.csv"
+        streamed = tmp_path / "streamed.csv"
+        write_dataset_atomic(sample_dataframe, expected, config=output_config)
+
+        with StreamingDatasetWriter(streamed, config=output_config) as writer:
+            writer.write(sample_dataframe.iloc[:2])
+            writer.write(sample_dataframe.iloc[2:])
+
+        assert writer.rows_written == 3
+        assert streamed.read_bytes() == expected.read_bytes()
+        assert not streamed.with_suffix(".csv.tmp").exists()
+
+    def test_streaming_writer_parquet_row_groups(
+        self, output_config: PipelineConfig, tmp_path: Path
+    ) -> None:
+        """Row groups follow io.output.row_group_size regardless of chunk boundaries."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        output_config.io.output.row_group_size = 4
+        chunks = [
+            pd.DataFrame({"id": [1, 2, 3], "note": [None, None, None]}),
+            pd.DataFrame({"id": [4, 5, 6, 7, 8], "note": ["a", None, "b", "c", "d"]}),
+            pd.DataFrame({"id": [9, 10], "note": ["e", "f"]}),
+        ]
+        output_path = tmp_path / "dataset.parquet"
+        schema = unify_arrow_schemas([arrow_schema(chunk) for chunk in chunks])
+
+        with StreamingDatasetWriter(output_path, config=output_config, schema=schema) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+
+        metadata = pq.ParquetFile(output_path).metadata
+        assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [
+            4,
+            4,
+            2,
+        ]
+        loaded = pq.read_table(output_path).to_pandas()
+        assert loaded["id"].tolist() == list(range(1, 11))
+        assert loaded["note"].isna().tolist() == [True, True, True, False, True] + [False] * 5
+        assert loaded["note"].dropna().tolist() == ["a", "b", "c", "d", "e", "f"]
+
+    def test_streaming_writer_partitioned(
+        self, output_config: PipelineConfig, tmp_path: Path
+    ) -> None:
+        """Partitioned output gets one part file per partition and row group."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        output_config.io.output.partition_by = ("year",)
+        output_config.io.output.row_group_size = 2
+        output_path = tmp_path / "dataset.parquet"
+        frame = pd.DataFrame({"id": [1, 2, 3, 4], "year": [2021, 2020, 2021, 2021]})
+
+        with StreamingDatasetWriter(output_path, config=output_config) as writer:
+            writer.write(frame.iloc[:3])
+            writer.write(frame.iloc[3:])
+
+        parts = sorted(path.name for path in (output_path / "year=2021").iterdir())
+        assert parts == ["part-00000.parquet", "part-00001.parquet"]
+        loaded = pq.read_table(output_path / "year=2021").to_pandas()
+        assert sorted(loaded["id"].tolist()) == [1, 3, 4]
+
+    def test_streaming_writer_discards_output_on_error(
+        self, output_config: PipelineConfig, sample_dataframe: pd.DataFrame, tmp_path: Path
+    ) -> None:
+        """An exception inside the block leaves the previous dataset untouched."""
+        output_path = tmp_path / "dataset.csv"
+        output_path.write_text("previous\n", encoding="utf-8")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            with StreamingDatasetWriter(output_path, config=output_config) as writer:
+                writer.write(sample_dataframe)
+                raise RuntimeError("boom")
+
+        assert output_path.read_text(encoding="utf-8") == "previous\n"
+        assert not output_path.with_suffix(".csv.tmp").exists()
+
+    def test_resolve_output_format(self, output_config: PipelineConfig) -> None:
+        """The dataset format follows io.output.format."""
+        assert resolve_output_format(output_config) == "csv"
+        output_config.io.output.format = "parquet"
+        assert resolve_output_format(output_config) == "parquet"
+
     def test_write_yaml_atomic(self, tmp_path: Path) -> None:
         """Test writing YAML atomically."""
         output_path = tmp_path / "output.yaml"
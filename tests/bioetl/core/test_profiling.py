@@ -0,0 +1,92 @@
+"""Unit tests for the per-stage profiler behind ``--profile``."""
+
+from __future__ import annotations
+
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+import yaml
+
+from bioetl.core.profiling import StageProfiler, profile_artifact_paths
+
+
+def _busy(seconds: float) -> int:
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+@pytest.mark.unit
+class TestStageProfiler:
+    """Test suite for StageProfiler."""
+
+    def test_nested_stages_record_durations_and_memory(self) -> None:
+        """Nested stages are keyed by path and propagate peak memory upwards."""
+        profiler = StageProfiler(sample_interval=0.001)
+        profiler.start()
+        try:
+            with profiler.stage("transform"):
+                with profiler.stage("enrich_assay"):
+                    payload = bytearray(4 * 1024 * 1024)
+                    del payload
+                _busy(0.01)
+            with profiler.stage("transform"):
+                pass
+        finally:
+            profiler.stop()
+
+        stages = profiler.stages
+        assert set(stages) == {"transform", "transform/enrich_assay"}
+        assert stages["transform"].calls == 2
+        assert stages["transform/enrich_assay"].calls == 1
+        assert stages["transform/enrich_assay"].peak_traced_bytes >= 4 * 1024 * 1024
+        assert (
+            stages["transform"].peak_traced_bytes
+            >= stages["transform/enrich_assay"].peak_traced_bytes
+        )
+        assert stages["transform"].duration_ms >= stages["transform/enrich_assay"].duration_ms
+        assert stages["transform"].peak_rss_bytes is None or stages["transform"].peak_rss_bytes > 0
+        assert not tracemalloc.is_tracing()
+
+    def test_write_emits_pstats_collapsed_stacks_and_summary(self, tmp_path: Path) -> None:
+        """Artifacts are written under the run stem next to ``meta.yaml``."""
+        profiler = StageProfiler(sample_interval=0.001)
+        profiler.start()
+        try:
+            with profiler.stage("extract"):
+                _busy(0.05)
+        finally:
+            profiler.stop()
+        paths = profile_artifact_paths(tmp_path, "activity_20240101")
+
+        written = profiler.write(paths)
+
+        assert written == paths
+        assert paths["profile_stats"].name == "activity_20240101_profile.pstats"
+        functions = {name for _, _, name in pstats.Stats(str(paths["profile_stats"])).stats}
+        assert "_busy" in functions
+        stacks = paths["profile_stacks"].read_text(encoding="utf-8").splitlines()
+        assert stacks
+        assert all(line.startswith("extract;") for line in stacks)
+        assert any("test_profiling.py:_busy" in line for line in stacks)
+        summary = yaml.safe_load(paths["profile_summary"].read_text(encoding="utf-8"))
+        assert summary["stages"]["extract"]["calls"] == 1
+        assert summary["samples"] == sum(int(line.rsplit(" ", 1)[1]) for line in stacks)
+
+    def test_keeps_tracemalloc_started_by_caller(self) -> None:
+        """A tracemalloc session owned by the caller survives ``stop()``."""
+        tracemalloc.start()
+        try:
+            profiler = StageProfiler()
+            profiler.start()
+            with profiler.stage("validate"):
+                pass
+            profiler.stop()
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
@@ -0,0 +1,104 @@
+"""Unit tests for the per-record SQLite cache."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from bioetl.core.record_cache import RecordCache, fields_signature
+
+
+@pytest.mark.unit
+class TestFieldsSignature:
+    """Test suite for fields_signature."""
+
+    def test_order_insensitive(self) -> None:
+        assert fields_signature(["b", "a"]) == fields_signature(["a", "b", "a"])
+
+    def test_all_fields_marker(self) -> None:
+        assert fields_signature(None) == fields_signature([]) == "*"
+
+    def test_distinct_selections_differ(self) -> None:
+        assert fields_signature(["a"]) != fields_signature(["a", "b"])
+
+
+@pytest.mark.unit
+class TestRecordCache:
+    """Test suite for RecordCache."""
+
+    def test_roundtrip_independent_of_batch_composition(self, tmp_path: Path) -> None:
+        with RecordCache(tmp_path / "records.sqlite") as cache:
+            written = cache.put_many(
+                "activity",
+                {"1": [{"activity_id": 1}], "2": [{"activity_id": 2}], "3": []},
+                release="CHEMBL_36",
+                fields=["activity_id"],
+            )
+            hits = cache.get_many(
+                "activity", ["3", "2", "4"], release="CHEMBL_36", fields=["activity_id"]
+            )
+
+        assert written == 3
+        assert hits == {"2": [{"activity_id": 2}], "3": []}
+
+    def test_scoped_by_release_fields_and_entity(self, tmp_path: Path) -> None:
+        with RecordCache(tmp_path / "records.sqlite") as cache:
+            cache.put_many("activity", {"1": {"v": 1}}, release="35", fields=["a"])
+
+            assert cache.get_many("activity", ["1"], release="36", fields=["a"]) == {}
+            assert cache.get_many("activity", ["1"], release="35", fields=["b"]) == {}
+            assert cache.get_many("assay", ["1"], release="35", fields=["a"]) == {}
+            assert cache.get_many("activity", ["1"], release="35", fields=["a"]) == {
+                "1": {"v": 1}
+            }
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "nested" / "records.sqlite"
+        with RecordCache(path) as cache:
+            cache.put_many("molecule", {"CHEMBL1": {"x": 1}}, release="36")
+
+        with RecordCache(path) as reopened:
+            assert reopened.get_many("molecule", ["CHEMBL1"], release="36") == {
+                "CHEMBL1": {"x": 1}
+            }
+
+    def test_expired_entries_are_misses(self, tmp_path: Path) -> None:
+        path = tmp_path / "records.sqlite"
+        with RecordCache(path, ttl_seconds=60) as cache:
+            cache.put_many("activity", {"1": {"v": 1}, "2": {"v": 2}}, release="36")
+
+        connection = sqlite3.connect(path)
+        connection.execute(
+            "UPDATE records SET stored_at = ? WHERE record_id = '1'", (time.time() - 120,)
+        )
+        connection.commit()
+        connection.close()
+
+        with RecordCache(path, ttl_seconds=60) as cache:
+            assert cache.get_many("activity", ["1", "2"], release="36") == {"2": {"v": 2}}
+
+    def test_large_lookup_is_chunked(self, tmp_path: Path) -> None:
+        records = {str(index): {"id": index} for index in range(2_500)}
+        with RecordCache(tmp_path / "records.sqlite") as cache:
+            cache.put_many("activity", records, release="36")
+            hits = cache.get_many("activity", list(records), release="36")
+
+        assert hits == records
+
+    def test_corrupted_store_reports_miss(self, tmp_path: Path) -> None:
+        path = tmp_path / "records.sqlite"
+        with RecordCache(path) as cache:
+            cache.put_many("activity", {"1": {"v": 1}}, release="36")
+            connection = sqlite3.connect(path)
+            connection.execute("DROP TABLE records")
+            connection.commit()
+            connection.close()
+
+            assert cache.get_many("activity", ["1"], release="36") == {}
+            assert cache.put_many("activity", {"1": {"v": 1}}, release="36") == 0
+
+        assert os.path.exists(path)
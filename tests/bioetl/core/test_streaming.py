@@ -0,0 +1,143 @@
+"""Unit tests for the bounded-memory streaming helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bioetl.core.streaming import (
+    ExternalDistinctCounter,
+    ExternalSorter,
+    batch_records,
+    iter_frame_chunks,
+    rebatch_frames,
+)
+
+
+@pytest.mark.unit
+class TestFrameChunks:
+    """Test suite for iter_frame_chunks and rebatch_frames."""
+
+    def test_iter_frame_chunks_slices_in_order(self) -> None:
+        df = pd.DataFrame({"id": range(7)})
+
+        chunks = list(iter_frame_chunks(df, 3))
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        assert chunks[1].index.tolist() == [0, 1, 2]
+        assert pd.concat(chunks)["id"].tolist() == list(range(7))
+
+    def test_iter_frame_chunks_keeps_empty_frame_columns(self) -> None:
+        chunks = list(iter_frame_chunks(pd.DataFrame(columns=["id", "value"]), 3))
+
+        assert len(chunks) == 1
+        assert chunks[0].columns.tolist() == ["id", "value"]
+
+    def test_rebatch_frames(self) -> None:
+        frames = [
+            pd.DataFrame({"id": range(start, end)}) for start, end in [(0, 2), (2, 2), (2, 9)]
+        ]
+
+        batches = list(rebatch_frames(frames, 4))
+
+        assert [len(batch) for batch in batches] == [4, 4, 1]
+        assert pd.concat(batches)["id"].tolist() == list(range(9))
+
+    def test_batch_records_consumes_lazily(self) -> None:
+        consumed: list[int] = []
+
+        def records() -> Iterator[dict[str, int]]:
+            for index in range(7):
+                consumed.append(index)
+                yield {"id": index}
+
+        batches = batch_records(records(), 3)
+        first = next(batches)
+
+        assert [record["id"] for record in first] == [0, 1, 2]
+        assert consumed == [0, 1, 2]
+        assert [len(batch) for batch in batches] == [3, 1]
+        assert list(batch_records([], 3)) == []
+
+    def test_invalid_sizes(self) -> None:
+        with pytest.raises(ValueError, match="chunk_rows must be positive"):
+            list(iter_frame_chunks(pd.DataFrame({"id": [1]}), 0))
+        with pytest.raises(ValueError, match="rows must be positive"):
+            list(rebatch_frames([], 0))
+        with pytest.raises(ValueError, match="rows must be positive"):
+            list(batch_records([], 0))
+
+
+@pytest.mark.unit
+class TestExternalSorter:
+    """Test suite for ExternalSorter."""
+
+    @pytest.mark.parametrize("batch_rows", [1, 3, 50])
+    def test_matches_stable_sort(self, tmp_path: Path, batch_rows: int) -> None:
+        rng = np.random.default_rng(7)
+        frame = pd.DataFrame(
+            {
+                "key": rng.integers(0, 5, size=60),
+                "value": pd.array(rng.integers(0, 4, size=60), dtype="Int64"),
+                "position": range(60),
+            }
+        )
+        frame.loc[frame.index % 11 == 0, "value"] = pd.NA
+        sorter = ExternalSorter(
+            tmp_path,
+            by=["value", "key"],
+            ascending=[False, True],
+            na_position="first",
+            batch_rows=batch_rows,
+        )
+        for chunk in iter_frame_chunks(frame, 13):
+            sorter.add(chunk)
+
+        merged = pd.concat(list(sorter.iter_sorted()), ignore_index=True)
+
+        expected = frame.sort_values(
+            by=["value", "key"], ascending=[False, True], na_position="first", kind="stable"
+        ).reset_index(drop=True)
+        pd.testing.assert_frame_equal(merged, expected)
+        assert sorter.row_count == 60
+        assert sorter.run_count == 5
+
+    def test_without_keys_preserves_input_order(self, tmp_path: Path) -> None:
+        sorter = ExternalSorter(tmp_path, batch_rows=2)
+        sorter.add(pd.DataFrame({"id": [3, 1, 2]}))
+        sorter.add(pd.DataFrame({"id": [0]}))
+
+        merged = pd.concat(list(sorter.iter_sorted()), ignore_index=True)
+
+        assert merged["id"].tolist() == [3, 1, 2, 0]
+
+    def test_missing_sort_column(self, tmp_path: Path) -> None:
+        sorter = ExternalSorter(tmp_path, by=["id"])
+
+        with pytest.raises(KeyError, match="Sort columns missing"):
+            sorter.add(pd.DataFrame({"value": [1]}))
+
+
+@pytest.mark.unit
+class TestExternalDistinctCounter:
+    """Test suite for ExternalDistinctCounter."""
+
+    def test_counts_like_nunique(self, tmp_path: Path) -> None:
+        values = pd.Series(["a", "b", None, "a", "c", None, "b", "d"], dtype="object")
+        counter = ExternalDistinctCounter(tmp_path, buckets=3)
+        counter.add(values.iloc[:3])
+        counter.add(values.iloc[3:])
+
+        assert counter.count() == values.nunique(dropna=False)
+        assert counter.total == len(values)
+        assert counter.has_missing is True
+
+    def test_empty(self, tmp_path: Path) -> None:
+        counter = ExternalDistinctCounter(tmp_path)
+
+        assert counter.count() == 0
+        assert counter.has_missing is False
@@ -0,0 +1,47 @@
+"""Unit tests for the SQLite cache of validated row hashes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from bioetl.core.validation_cache import ValidationCache, validation_cache_key
+
+
+@pytest.mark.unit
+class TestValidationCacheKey:
+    """Test suite for validation_cache_key."""
+
+    def test_scoped_by_version_and_options(self) -> None:
+        base = validation_cache_key("activity", "1.0.0", strict=True, coerce=True)
+
+        assert base != validation_cache_key("activity", "1.1.0", strict=True, coerce=True)
+        assert base != validation_cache_key("activity", "1.0.0", strict=False, coerce=True)
+        assert base != validation_cache_key("activity", "1.0.0", strict=True, coerce=False)
+
+
+@pytest.mark.unit
+class TestValidationCache:
+    """Test suite for ValidationCache."""
+
+    def test_contains_reports_hashes_added_for_the_same_key(self, tmp_path: Path) -> None:
+        with ValidationCache(tmp_path / "validation.sqlite") as cache:
+            stored = cache.add("schema@1", ["a", "b", "a", None])
+
+            mask = cache.contains("schema@1", ["b", "c", None, "a", pd.NA])
+
+            assert stored == 2
+            assert mask.tolist() == [True, False, False, True, False]
+            assert not cache.contains("schema@2", ["a", "b"]).any()
+
+    def test_persists_between_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "nested" / "validation.sqlite"
+        with ValidationCache(path) as cache:
+            cache.add("schema@1", [f"hash-{index}" for index in range(2000)])
+
+        with ValidationCache(path) as cache:
+            mask = cache.contains("schema@1", ["hash-0", "hash-1999", "missing"])
+
+        assert mask.tolist() == [True, True, False]
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -355,3 +356,63 @@ class TestActivityMoleculeJoin:
             "compound_name",
         ]
         assert list(result.columns) == expected_columns
+
+    def test_join_activity_with_molecule_matches_row_by_row_join(
+        self,
+        mock_chembl_client: ChemblClient,
+    ) -> None:
+        """Keys and name fallbacks match the former ``iterrows`` implementation."""
+        compound_records = {
+            "10": {"record_id": 10, "compound_name": "FromRec", "compound_key": "RK10"},
+            "11": {"record_id": 11, "compound_name": None, "compound_key": "RK11"},
+            "12": {"record_id": "12", "compound_name": "N12", "compound_key": "K12"},
+        }
+        mock_chembl_client.paginate = MagicMock(  # type: ignore[method-assign]
+            side_effect=lambda *_, params, **__: iter(
+                [
+                    compound_records[record_id]
+                    for record_id in str(params["record_id__in"]).split(",")
+                    if record_id in compound_records
+                ]
+            )
+        )
+        mock_chembl_client.fetch_molecules_by_ids = MagicMock(  # type: ignore[method-assign]
+            return_value={
+                "M1": {"pref_name": "ASPIRIN"},
+                "M2": {"pref_name": None, "molecule_synonyms": [{"molecule_synonym": " syn "}]},
+            }
+        )
+        activity_df = pd.DataFrame(
+            {
+                "activity_id": [1, 2, 3, 4, 5, 6, 7],
+                "molecule_chembl_id": ["M1", "m2", "M3", "M4", None, "M1", "M5"],
+                "record_id": [10.0, 11, np.nan, 10, None, 12, 99],
+            },
+            index=[70, 60, 50, 40, 30, 20, 10],
+        )
+
+        result = join_activity_with_molecule(activity_df, mock_chembl_client, {})
+
+        def _values(series: pd.Series) -> list[Any]:
+            return [None if pd.isna(value) else value for value in series.tolist()]
+
+        assert result["activity_id"].tolist() == [1, 2, 3, 4, 5, 6, 7]
+        assert _values(result["molecule_name"]) == [
+            "ASPIRIN",
+            "m2",
+            "M3",
+            "M4",
+            None,
+            "ASPIRIN",
+            "M5",
+        ]
+        assert _values(result["compound_key"]) == ["RK10", "RK11", None, "RK10", None, "K12", None]
+        assert _values(result["compound_name"]) == [
+            "FromRec",
+            None,
+            None,
+            "FromRec",
+            None,
+            "N12",
+            None,
+        ]
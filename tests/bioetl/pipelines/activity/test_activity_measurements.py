@@ -0,0 +1,90 @@
+"""Unit tests for the factorised activity measurement normalisers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from bioetl.core.utils.vocab_store import read_vocab_store
+from bioetl.pipelines.chembl.activity.measurements import (
+    UnitLookup,
+    normalize_measurement_values,
+    normalize_relations,
+    normalize_units,
+    strip_values,
+)
+
+_DICTIONARIES = Path(__file__).resolve().parents[4] / "configs" / "dictionaries"
+
+
+@pytest.fixture(scope="module")
+def unit_lookup() -> UnitLookup:
+    return UnitLookup.from_vocab_store(read_vocab_store(_DICTIONARIES))
+
+
+@pytest.mark.unit
+class TestUnitLookup:
+    """Test suite for the dictionary-seeded unit lookup."""
+
+    def test_dictionary_aliases_map_to_canonical_units(self, unit_lookup: UnitLookup) -> None:
+        """Aliases from activity_units/standard_units resolve to the pipeline forms."""
+        values = pd.Series(
+            ["nM", "nanomolar", "n M", "μM", "µM", "uM", " UM ", "micromolar", "mM", "MM"]
+            + ["pM", "picomolar", "percent", "pct", "ratios", "NANOMOLAR"]
+        )
+
+        normalized = normalize_units(values, unit_lookup)
+
+        assert normalized.tolist() == (
+            ["nM", "nM", "nM", "μM", "μM", "μM", "μM", "μM", "mM", "mM"]
+            + ["pM", "pM", "%", "%", "ratio", "nM"]
+        )
+
+    def test_unknown_units_are_not_rewritten_by_substring(self, unit_lookup: UnitLookup) -> None:
+        """Only exact spellings are replaced: ``um`` inside ``umol/kg`` stays intact."""
+        values = pd.Series(["umol/kg", "nmol/mg", "ug.mL-1", " mg/kg "])
+
+        normalized = normalize_units(values, unit_lookup)
+
+        assert normalized.tolist() == ["umol/kg", "nmol/mg", "ug.mL-1", "mg/kg"]
+
+    def test_case_insensitive_fallback_skips_ambiguous_spellings(self) -> None:
+        """Spellings that differ only by case keep their exact-match meaning."""
+        lookup = UnitLookup.from_synonyms({"mM": "mM", "Mm": "Mm", "NM": "nM"})
+
+        assert lookup.resolve("nm") == "nM"
+        assert lookup.resolve("Mm") == "Mm"
+        assert lookup.resolve("MM") == "MM"
+
+
+@pytest.mark.unit
+class TestMeasurementNormalizers:
+    """Test suite for value/relation normalisers operating on unique values."""
+
+    def test_values_are_parsed_once_per_unique_and_broadcast(self) -> None:
+        """Repeated values share one parse and keep the original index."""
+        values = pd.Series(
+            ["10.5", " 5.3 ", "10-20", "1,000", "invalid", "10.5"], index=list("abcdef")
+        )
+
+        normalized = normalize_measurement_values(values)
+
+        assert list(normalized.index) == list("abcdef")
+        assert normalized.tolist()[:4] == [10.5, 5.3, 10.0, 1000.0]
+        assert pd.isna(normalized["e"])
+        assert normalized["f"] == 10.5
+
+    def test_missing_values_stay_missing(self) -> None:
+        """NA codes from factorisation map back to missing values."""
+        normalized = normalize_relations(pd.Series(["≤", None, " = ", "≠"]))
+
+        assert normalized.iloc[0] == "<="
+        assert pd.isna(normalized.iloc[1])
+        assert normalized.iloc[2] == "="
+        assert normalized.iloc[3] == "~"
+
+    def test_strip_values(self) -> None:
+        """Values are stringified and trimmed."""
+        assert strip_values(pd.Series([" IC50 ", "Ki", 5])).tolist() == ["IC50", "Ki", "5"]
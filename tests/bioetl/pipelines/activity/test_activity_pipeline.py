@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
@@ -543,7 +545,8 @@ class TestChemblActivityPipelineTransformations:
         response_batch_two.json.return_value = {
             "activities": [{"activity_id": 3, "standard_type": "IC50"}]
         }
-        client.get.side_effect = [response_batch_one, response_batch_two]
+        responses = {"1,2": response_batch_one, "3": response_batch_two}
+        client.get.side_effect = lambda endpoint, params: responses[params["activity_id__in"]]
 
         result = pipeline._extract_from_chembl(dataset, client, batch_size=2)  # type: ignore[reportPrivateUsage]
 
@@ -562,6 +565,94 @@ class TestChemblActivityPipelineTransformations:
         assert cached_stats is not None
         assert cached_stats["cache_hits"] == 3
 
+    def test_extract_from_chembl_record_cache_fetches_only_missing_ids(
+        self,
+        pipeline_config_fixture: PipelineConfig,
+        run_id: str,
+        tmp_path: Path,
+    ) -> None:
+        """Overlapping ID sets reuse cached records regardless of batch layout."""
+
+        pipeline_config_fixture.paths.cache_root = str(tmp_path)
+        pipeline_config_fixture.runtime.parallelism = 1
+        pipeline = ChemblActivityPipeline(config=pipeline_config_fixture, run_id=run_id)
+        pipeline._update_release("33")  # type: ignore[reportPrivateUsage]
+
+        def _respond(endpoint: str, params: dict[str, Any]) -> MagicMock:
+            ids = params["activity_id__in"].split(",")
+            response = MagicMock()
+            response.json.return_value = {
+                "activities": [
+                    {"activity_id": int(value), "standard_type": "IC50"} for value in ids
+                ]
+            }
+            return response
+
+        warm_client = MagicMock()
+        warm_client.get.side_effect = _respond
+        pipeline._extract_from_chembl(  # type: ignore[reportPrivateUsage]
+            pd.DataFrame({"activity_id": [1, 2, 3]}), warm_client, batch_size=2
+        )
+
+        client = MagicMock()
+        client.get.side_effect = _respond
+        result = pipeline._extract_from_chembl(  # type: ignore[reportPrivateUsage]
+            pd.DataFrame({"activity_id": [4, 3, 2, 1]}), client, batch_size=3
+        )
+
+        assert sorted(result["activity_id"]) == [1, 2, 3, 4]
+        requested = [call.kwargs["params"]["activity_id__in"] for call in client.get.call_args_list]
+        assert requested == ["4"]
+        stats = pipeline._last_batch_extract_stats  # type: ignore[reportPrivateUsage]
+        assert stats is not None
+        assert stats["cache_hits"] == 3
+        assert stats["api_calls"] == 1
+
+    def test_extract_from_chembl_concurrent_batches_preserve_order(
+        self,
+        pipeline_config_fixture: PipelineConfig,
+        run_id: str,
+        tmp_path: Path,
+    ) -> None:
+        """Batches fetched by parallel workers are reassembled in activity_id order."""
+
+        pipeline_config_fixture.paths.cache_root = str(tmp_path)
+        pipeline_config_fixture.cache.enabled = False
+        pipeline_config_fixture.runtime.parallelism = 4
+        pipeline = ChemblActivityPipeline(config=pipeline_config_fixture, run_id=run_id)
+        pipeline._update_release("33")  # type: ignore[reportPrivateUsage]
+
+        activity_ids = list(range(1, 41))
+        dataset = pd.DataFrame({"activity_id": activity_ids})
+        thread_names: set[str] = set()
+        lock = threading.Lock()
+
+        def _respond(endpoint: str, params: dict[str, Any]) -> MagicMock:
+            keys = [int(key) for key in params["activity_id__in"].split(",")]
+            # Later batches answer faster so completion order differs from submission order.
+            time.sleep(0.001 * (50 - keys[0]))
+            with lock:
+                thread_names.add(threading.current_thread().name)
+            response = MagicMock()
+            response.json.return_value = {
+                "activities": [{"activity_id": key, "standard_type": "IC50"} for key in keys]
+            }
+            return response
+
+        client = MagicMock()
+        client.get.side_effect = _respond
+
+        result = pipeline._extract_from_chembl(dataset, client, batch_size=3)  # type: ignore[reportPrivateUsage]
+
+        assert list(result["activity_id"]) == activity_ids
+        assert client.get.call_count == 14
+        assert len(thread_names) > 1
+        stats = pipeline._last_batch_extract_stats  # type: ignore[reportPrivateUsage]
+        assert stats is not None
+        assert stats["batches"] == 14
+        assert stats["success"] == 40
+        assert stats["api_calls"] == 14
+
     def test_extract_from_chembl_handles_request_error(
         self,
         pipeline_config_fixture: PipelineConfig,
@@ -0,0 +1,100 @@
+"""Unit tests for the activity quality report rows and their accumulator."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from bioetl.core.streaming import iter_frame_chunks
+from bioetl.pipelines.chembl.activity.quality import (
+    ActivityQCAccumulator,
+    ActivityQCCounts,
+    append_activity_rows,
+)
+from bioetl.qc.report import build_qc_metrics_payload, build_quality_report
+
+
+@pytest.fixture
+def activity_frame() -> pd.DataFrame:
+    """Activities with repeated ids, malformed foreign keys and tied distributions."""
+
+    rng = np.random.default_rng(11)
+    size = 50
+    molecules = [f"CHEMBL{index}" for index in range(size)]
+    molecules[3] = "BAD-ID"
+    molecules[17] = None  # type: ignore[call-overload]
+    return pd.DataFrame(
+        {
+            "activity_id": [index % 43 for index in range(size)],
+            "row_index": list(range(size)),
+            "molecule_chembl_id": molecules,
+            "assay_chembl_id": [None] * size,
+            "standard_type": rng.choice(["IC50", "Ki", "EC50"], size=size),
+            "standard_units": rng.choice(["nM", "uM", None], size=size),
+            "standard_value": rng.normal(100.0, 20.0, size=size),
+        }
+    )
+
+
+def _expected_report(df: pd.DataFrame) -> pd.DataFrame:
+    counts = ActivityQCCounts()
+    counts.update(df)
+    report = append_activity_rows(
+        build_quality_report(df, business_key_fields=["activity_id"]), counts
+    )
+    # Streaming runs do not report IQR outliers.
+    return report[report["section"] != "outliers"].reset_index(drop=True)
+
+
+@pytest.mark.unit
+class TestActivityQCCounts:
+    """Test suite for ActivityQCCounts."""
+
+    def test_rows(self, activity_frame: pd.DataFrame) -> None:
+        counts = ActivityQCCounts()
+        counts.update(activity_frame)
+        rows = counts.rows()
+
+        (foreign_key,) = [row for row in rows if row["section"] == "foreign_key"]
+        assert foreign_key["column"] == "molecule_chembl_id"
+        assert (foreign_key["valid_count"], foreign_key["invalid_count"]) == (48, 1)
+        assert foreign_key["value"] == pytest.approx(48 / 49)
+
+        types = [row for row in rows if row["metric"] == "standard_type_count"]
+        expected = activity_frame["standard_type"].value_counts()
+        assert {row["value"]: row["count"] for row in types} == expected.to_dict()
+        assert [row["count"] for row in types] == sorted(expected.tolist(), reverse=True)
+
+    def test_chunked_counts_match_whole_frame(self, activity_frame: pd.DataFrame) -> None:
+        whole = ActivityQCCounts()
+        whole.update(activity_frame)
+        chunked = ActivityQCCounts()
+        for chunk in iter_frame_chunks(activity_frame, 7):
+            chunked.update(chunk)
+
+        assert chunked.rows() == whole.rows()
+
+
+@pytest.mark.unit
+class TestActivityQCAccumulator:
+    """Test suite for ActivityQCAccumulator."""
+
+    def test_matches_in_memory_report(self, activity_frame: pd.DataFrame, tmp_path: Path) -> None:
+        business_key = ["activity_id", "row_index"]
+        accumulator = ActivityQCAccumulator(tmp_path, business_key_fields=business_key)
+        for chunk in iter_frame_chunks(activity_frame, 9):
+            accumulator.update(chunk)
+
+        report = accumulator.quality_report()
+        assert_frame_equal(report, _expected_report(activity_frame), check_dtype=False)
+        summary = report[report["section"] == "summary"].set_index("metric")["count"]
+        assert summary["duplicate_count"] == 7
+
+        # The QC metrics keep the configured business key.
+        metrics = dict(accumulator.qc_metrics_payload())
+        expected = dict(build_qc_metrics_payload(activity_frame, business_key_fields=business_key))
+        assert metrics["duplicate_count"] == expected["duplicate_count"] == 0
@@ -0,0 +1,114 @@
+"""Streaming runs of the activity pipeline against an offline ChEMBL transport."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from tests.benchmarks.datasets import (
+    ENTITY_ENDPOINTS,
+    StubChemblTransport,
+    entity_records,
+    load_pipeline_config,
+)
+
+from bioetl.config import PipelineConfig
+from bioetl.core.client_factory import APIClientFactory
+from bioetl.pipelines.base import PipelineBase
+from bioetl.pipelines.chembl.activity.run import ChemblActivityPipeline
+
+ROWS = 45
+
+
+class _CountingTransport(StubChemblTransport):
+    """Transport recording the activity listing pages it serves."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.listing_requests = 0
+
+    def get(self, url: str, params: Any = None, **kwargs: Any) -> Any:
+        if "activity" in url:
+            self.listing_requests += 1
+        return super().get(url, params=params, **kwargs)
+
+
+@pytest.fixture
+def transport(monkeypatch: pytest.MonkeyPatch) -> _CountingTransport:
+    endpoint, items_key = ENTITY_ENDPOINTS["activity_chembl"]
+    stub = _CountingTransport(endpoint, items_key, entity_records("activity_chembl", ROWS))
+    monkeypatch.setattr(APIClientFactory, "for_source", lambda self, *args, **kwargs: stub)
+    return stub
+
+
+@pytest.fixture
+def activity_config(tmp_path: Path) -> PipelineConfig:
+    config = load_pipeline_config("activity_chembl")
+    config.cli.input_file = None
+    config.paths.output_root = str(tmp_path / "output")
+    config.runtime.chunk_rows = 10
+    config.io.output.format = "csv"
+    return config
+
+
+def _without_outliers(path: Path | None) -> pd.DataFrame:
+    assert path is not None
+    report = pd.read_csv(path)
+    # Streaming runs do not report IQR outliers.
+    return report[report["section"] != "outliers"].reset_index(drop=True)
+
+
+@pytest.mark.unit
+class TestActivityStreaming:
+    """Activity runs through ``PipelineBase._run_streaming``."""
+
+    def test_run_streams_and_matches_in_memory_run(
+        self,
+        activity_config: PipelineConfig,
+        transport: _CountingTransport,
+        tmp_path: Path,
+    ) -> None:
+        in_memory = ChemblActivityPipeline(activity_config, run_id="activity-run").run(
+            tmp_path / "memory"
+        )
+        expected_dataset = in_memory.dataset_path.read_bytes()
+        expected_report = _without_outliers(in_memory.write_result.quality_report)
+
+        streaming_config = activity_config.model_copy(deep=True)
+        streaming_config.runtime.streaming = True
+        pipeline = ChemblActivityPipeline(streaming_config, run_id="activity-run")
+        assert pipeline._streaming_enabled(MagicMock())  # type: ignore[reportPrivateUsage]
+        with patch.object(
+            PipelineBase,
+            "_run_streaming",
+            autospec=True,
+            side_effect=PipelineBase._run_streaming,  # type: ignore[reportPrivateUsage]
+        ) as run_streaming:
+            streaming = pipeline.run(tmp_path / "streaming")
+
+        run_streaming.assert_called_once()
+        assert streaming.records == in_memory.records == ROWS
+        assert streaming.dataset_path.read_bytes() == expected_dataset
+        pd.testing.assert_frame_equal(
+            _without_outliers(streaming.write_result.quality_report), expected_report
+        )
+
+    def test_full_listing_is_paged_lazily(
+        self, activity_config: PipelineConfig, transport: _CountingTransport
+    ) -> None:
+        pipeline = ChemblActivityPipeline(activity_config, run_id="activity-run")
+
+        chunks = pipeline.extract_chunks()
+        first = next(chunks)
+
+        # batch_size 20 per page: the first 10 rows need only the first page.
+        assert len(first) == 10
+        assert transport.listing_requests == 1
+        rest = list(chunks)
+        assert [len(chunk) for chunk in rest] == [10, 10, 10, 5]
+        assert transport.listing_requests == 3
+        ids = pd.concat([first, *rest])["activity_id"].tolist()
+        assert ids == list(range(1, ROWS + 1))
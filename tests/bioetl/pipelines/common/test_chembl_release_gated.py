@@ -0,0 +1,132 @@
+"""End-to-end tests for the release-gated mode of ``ChemblPipelineBase``."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pandera as pa
+import pytest
+import yaml
+
+from bioetl.config import PipelineConfig
+from bioetl.pipelines.chembl_base import ChemblPipelineBase
+
+RELEASE = "CHEMBL_35"
+
+# Nullable integers with gaps and numeric-looking strings are re-inferred as
+# floats and integers when a CSV dataset is read back without dtypes.
+SOURCE = pd.DataFrame(
+    {
+        "activity_id": pd.array([1, 2, 3, 4], dtype="Int64"),
+        "standard_units": pd.array(["nM", None, "007", "1e3"], dtype="string"),
+        "target_count": pd.array([1, None, 3, None], dtype="Int64"),
+        "pchembl_value": [5.5, None, 7.25, 6.0],
+    }
+)
+
+OUTPUT_SCHEMA = pa.DataFrameSchema(
+    {
+        "activity_id": pa.Column(pd.Int64Dtype()),
+        "standard_units": pa.Column(pd.StringDtype(), nullable=True),
+        "target_count": pa.Column(pd.Int64Dtype(), nullable=True),
+        "pchembl_value": pa.Column(float, nullable=True),
+        "hash_row": pa.Column(pd.StringDtype()),
+        "load_meta_id": pa.Column(pd.StringDtype()),
+    }
+)
+
+
+class _ReleaseGatedPipeline(ChemblPipelineBase):
+    """Pipeline serving ``SOURCE`` through the pipeline's ChEMBL client."""
+
+    def __init__(self, config: PipelineConfig, run_id: str) -> None:
+        super().__init__(config, run_id)
+        self.release_clients: list[Any] = []
+
+    def extract(self, *args: object, **kwargs: object) -> pd.DataFrame:
+        return self.run_extract_stage()
+
+    def extract_all(self) -> pd.DataFrame:
+        client, _ = self.prepare_chembl_client("chembl", client_name="chembl_activity_client")
+        self.fetch_chembl_release(client)
+        return SOURCE.copy()
+
+    def extract_by_ids(self, ids: Sequence[str]) -> pd.DataFrame:
+        client, _ = self.prepare_chembl_client("chembl", client_name="chembl_activity_client")
+        self.fetch_chembl_release(client)
+        selected = SOURCE["activity_id"].astype("string").isin(list(ids))
+        return SOURCE[selected.to_numpy(dtype=bool)].reset_index(drop=True)
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.copy()
+
+    def fetch_chembl_release(self, client: Any, log: Any = None) -> str | None:
+        self.release_clients.append(client)
+        self.record_extract_metadata(chembl_release=RELEASE)
+        return RELEASE
+
+
+@pytest.fixture
+def gated_config(pipeline_config_fixture: PipelineConfig, tmp_path: Path) -> PipelineConfig:
+    """Configuration validating ``SOURCE`` against ``OUTPUT_SCHEMA``."""
+
+    config = pipeline_config_fixture.model_copy(deep=True)
+    config.validation.schema_out = f"{__name__}:OUTPUT_SCHEMA"
+    config.determinism.sort.by = ["activity_id"]
+    config.determinism.sort.ascending = [True]
+    config.io.output.format = "csv"
+    config.paths.input_root = str(tmp_path)
+    return config
+
+
+def _run(config: PipelineConfig, output_dir: Path, ids: Sequence[int], *, gated: bool) -> Any:
+    input_file = output_dir.parent / f"{output_dir.name}_ids.csv"
+    pd.DataFrame({"activity_id": list(ids)}).to_csv(input_file, index=False)
+    run_config = config.model_copy(deep=True)
+    run_config.cli.input_file = str(input_file)
+    run_config.runtime.release_gated = gated
+    pipeline = _ReleaseGatedPipeline(config=run_config, run_id="test-run-12345")
+    result = pipeline.run(output_dir)
+    return pipeline, result
+
+
+@pytest.mark.unit
+class TestReleaseGatedRun:
+    """Release-gated runs against a previous run's dataset."""
+
+    def test_output_matches_full_run(self, gated_config: PipelineConfig, tmp_path: Path) -> None:
+        """Carried-over rows are written exactly as a full run writes them."""
+        _, full = _run(gated_config, tmp_path / "full", [1, 2, 3, 4], gated=False)
+        expected = full.dataset_path.read_bytes()
+        _run(gated_config, tmp_path / "gated", [1, 2, 3], gated=False)
+
+        pipeline, gated = _run(gated_config, tmp_path / "gated", [1, 2, 3, 4], gated=True)
+
+        assert gated.dataset_path.read_bytes() == expected
+        metadata = yaml.safe_load(gated.write_result.metadata.read_text(encoding="utf-8"))
+        summary = metadata["release_gated"]
+        assert summary["release_unchanged"] is True
+        assert summary["carried_over"] == 3
+        assert summary["fetched"] == 1
+        assert (summary["added"], summary["changed"], summary["removed"]) == (1, 0, 0)
+        # The release handshake goes through the client the extraction uses.
+        handshake, extraction = pipeline.release_clients
+        assert extraction is handshake
+
+    def test_prepare_chembl_client_reuses_registered_client(
+        self, gated_config: PipelineConfig, run_id: str
+    ) -> None:
+        """Repeated preparation returns the registered client instead of a new one."""
+        pipeline = _ReleaseGatedPipeline(config=gated_config, run_id=run_id)
+
+        first, _ = pipeline.prepare_chembl_client("chembl", client_name="chembl_client")
+        second, _ = pipeline.prepare_chembl_client("chembl", client_name="chembl_activity_client")
+
+        assert second is first
+        assert list(pipeline._registered_clients) == ["chembl_client"]  # type: ignore[reportPrivateUsage]
+        pipeline._cleanup_registered_clients()  # type: ignore[reportPrivateUsage]
+        third, _ = pipeline.prepare_chembl_client("chembl", client_name="chembl_client")
+        assert third is not first
@@ -0,0 +1,238 @@
+"""Parity tests for the enrichment joins built on ``bioetl.core.frame`` lookups.
+
+Expected values are the outputs of the former row-by-row (``iterrows``)
+implementations on the same fixture data.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from bioetl.pipelines.chembl.activity.normalize import (
+    enrich_with_assay,
+    enrich_with_compound_record,
+    enrich_with_data_validity,
+)
+from bioetl.pipelines.chembl.assay.normalize import (
+    enrich_with_assay_classifications,
+    enrich_with_assay_parameters,
+)
+from bioetl.pipelines.chembl.document.normalize import enrich_with_document_terms
+
+_COMPOUND_RECORDS: dict[str, dict[str, Any]] = {
+    "10": {"record_id": 10, "compound_name": "FromRec", "compound_key": "RK10"},
+    "11": {"record_id": 11, "compound_name": None, "compound_key": "RK11"},
+    "12": {"record_id": "12", "compound_name": "N12", "compound_key": "K12"},
+}
+
+
+class FakeLookupClient:
+    """Fixture ChEMBL client answering every enrichment lookup."""
+
+    def fetch_assays_by_ids(self, ids, fields, page_limit):  # type: ignore[no-untyped-def]
+        return {
+            "A1": {"assay_organism": "Homo sapiens", "assay_tax_id": "9606"},
+            "A2": {"assay_organism": None, "assay_tax_id": 10090},
+        }
+
+    def fetch_compound_records_by_pairs(self, pairs, fields, page_limit):  # type: ignore[no-untyped-def]
+        return {
+            ("M1", "D1"): {"compound_name": " Aspirin ", "compound_key": "K1", "curated": True},
+            ("M2", "D2"): {"pref_name": "Alt", "STANDARD_INCHI_KEY": "K2", "curated": False},
+            ("M3", "D3"): {"compound_name": "", "compound_key": None, "curated": None},
+        }
+
+    def paginate(
+        self,
+        endpoint: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int = 200,
+        items_key: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        requested = str((params or {}).get("record_id__in", "")).split(",")
+        return iter([_COMPOUND_RECORDS[rid] for rid in requested if rid in _COMPOUND_RECORDS])
+
+    def fetch_data_validity_lookup(self, comments, fields, page_limit):  # type: ignore[no-untyped-def]
+        return {
+            comment: {"description": f"desc-{comment}"}
+            for comment in comments
+            if comment != "Unknown"
+        }
+
+    def fetch_assay_class_map_by_assay_ids(self, ids, fields, page_limit):  # type: ignore[no-untyped-def]
+        return {
+            "A1": [{"assay_class_id": 1}, {"assay_class_id": "2"}],
+            "A2": [{"assay_class_id": None}],
+            "A4": [{"assay_class_id": "9"}],
+        }
+
+    def fetch_assay_classifications_by_class_ids(self, class_ids, fields, page_limit):  # type: ignore[no-untyped-def]
+        return {"1": {"l1": "L1", "l2": "L2", "l3": None, "pref_name": "P"}}
+
+    def fetch_assay_parameters_by_assay_ids(self, ids, fields, page_limit, active_only):  # type: ignore[no-untyped-def]
+        return {"A1": [{"type": "T", "relation": "=", "value": 1.5}], "A3": []}
+
+    def fetch_document_terms_by_ids(self, ids, fields, page_limit):  # type: ignore[no-untyped-def]
+        return {
+            "D1": [
+                {"document_chembl_id": "D1", "term": "a", "weight": 2},
+                {"document_chembl_id": "D1", "term": "b|c", "weight": 5},
+            ],
+            "D2": [{"document_chembl_id": "D2", "term": "x", "weight": None}],
+        }
+
+
+def _values(series: pd.Series) -> list[Any]:
+    return [None if pd.isna(value) else value for value in series.tolist()]
+
+
+@pytest.fixture
+def client() -> Any:
+    return FakeLookupClient()
+
+
+@pytest.fixture
+def activity_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "activity_id": [1, 2, 3, 4, 5, 6, 7],
+            "assay_chembl_id": ["A1", "A2", None, "A1", "", "A9", "a1"],
+            "molecule_chembl_id": ["M1", "m2", "M3", "M4", None, "M1", "M5"],
+            "document_chembl_id": ["D1", "D2", "D3", None, "D9", " ", "D1"],
+            "record_id": ["10", "11", "12", "10", None, "12", "99"],
+            "data_validity_comment": ["Valid", None, "Unknown", "Valid", "  ", "Outside", None],
+        },
+        index=[70, 60, 50, 40, 30, 20, 10],
+    )
+
+
+@pytest.mark.unit
+class TestActivityLookupJoins:
+    """Test suite for the activity enrichment joins."""
+
+    def test_enrich_with_assay(self, client: Any, activity_df: pd.DataFrame) -> None:
+        """Assay fields are joined per row, keeping index and order."""
+        result = enrich_with_assay(activity_df, client, {})
+
+        assert result.index.tolist() == activity_df.index.tolist()
+        assert _values(result["assay_organism"]) == [
+            "Homo sapiens",
+            None,
+            None,
+            "Homo sapiens",
+            None,
+            None,
+            None,
+        ]
+        assert _values(result["assay_tax_id"]) == [9606, 10090, None, 9606, None, None, None]
+
+    def test_enrich_with_compound_record(self, client: Any, activity_df: pd.DataFrame) -> None:
+        """Pair matches take precedence; record_id fills the remaining rows."""
+        result = enrich_with_compound_record(activity_df, client, {})
+
+        assert _values(result["compound_name"]) == [
+            "Aspirin",
+            "Alt",
+            "N12",
+            "FromRec",
+            None,
+            "N12",
+            None,
+        ]
+        assert _values(result["compound_key"]) == ["K1", "K2", "K12", "RK10", None, "K12", None]
+        assert _values(result["curated"]) == [True, False, None, None, None, None, None]
+        assert result["removed"].isna().all()
+        assert "_row_id" not in result.columns
+
+    def test_enrich_with_compound_record_keeps_filled_values(
+        self, client: Any, activity_df: pd.DataFrame
+    ) -> None:
+        """Existing names survive; blanks are filled only by the record_id fallback."""
+        activity_df["compound_name"] = pd.array(
+            [None, "keep", "", None, None, None, ""], dtype="string"
+        )
+
+        result = enrich_with_compound_record(activity_df, client, {})
+
+        assert _values(result["compound_name"]) == [
+            "Aspirin",
+            "keep",
+            "",
+            "FromRec",
+            None,
+            "N12",
+            "",
+        ]
+
+    def test_enrich_with_data_validity(self, client: Any, activity_df: pd.DataFrame) -> None:
+        """Descriptions come from the lookup, falling back to the comment itself."""
+        result = enrich_with_data_validity(activity_df, client, {})
+
+        assert _values(result["data_validity_description"]) == [
+            "desc-Valid",
+            None,
+            "Unknown",
+            "desc-Valid",
+            None,
+            "desc-Outside",
+            None,
+        ]
+        assert not [column for column in result.columns if column.endswith("_enrich")]
+
+
+@pytest.mark.unit
+class TestAssayAndDocumentLookupJoins:
+    """Test suite for the assay and document enrichment joins."""
+
+    def test_enrich_with_assay_classifications(self, client: Any) -> None:
+        """Assays without mappings are cleared, unresolved mappings keep values."""
+        df = pd.DataFrame(
+            {
+                "assay_chembl_id": ["A1", "A2", None, " A1 ", "A3", "A4"],
+                "assay_classifications": ["old", "old2", None, None, "keep", None],
+                "assay_class_id": ["x", "y", None, None, "z", None],
+            }
+        )
+
+        result = enrich_with_assay_classifications(df, client, {})
+
+        merged = (
+            '[{"assay_class_id": "1", "l1": "L1", "l2": "L2", "l3": null, "pref_name": "P"}, '
+            '{"assay_class_id": "2"}]'
+        )
+        assert _values(result["assay_classifications"]) == [
+            merged,
+            "old2",
+            None,
+            merged,
+            None,
+            '[{"assay_class_id": "9"}]',
+        ]
+        assert _values(result["assay_class_id"]) == ["1;2", "y", None, "1;2", None, "9"]
+
+    def test_enrich_with_assay_parameters_duplicate_index(self, client: Any) -> None:
+        """Parameters land on matching rows even when index labels repeat."""
+        df = pd.DataFrame({"assay_chembl_id": ["A1", "A2", "A3", None]}, index=[5, 5, 1, 0])
+
+        result = enrich_with_assay_parameters(df, client, {"fields": ["type", "value"]})
+
+        assert _values(result["assay_parameters"]) == [
+            '[{"type": "T", "value": 1.5}]',
+            None,
+            None,
+            None,
+        ]
+
+    def test_enrich_with_document_terms(self, client: Any) -> None:
+        """Aggregated terms join per document; unmatched rows get empty strings."""
+        df = pd.DataFrame({"document_chembl_id": ["D1", "D2", None, "D3", "D1"]})
+
+        result = enrich_with_document_terms(df, client, {})
+
+        assert result["term"].tolist() == ["b\\|c|a", "x", "", "", "b\\|c|a"]
+        assert result["weight"].tolist() == ["5|2", "", "", "", "5|2"]
@@ -0,0 +1,146 @@
+"""Unit tests for release-gated run helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from bioetl.pipelines.incremental import (
+    PreviousRunOutput,
+    compute_change_log,
+    plan_release_gated_fetch,
+    summarise_change_log,
+)
+
+
+@pytest.fixture
+def previous_output() -> PreviousRunOutput:
+    """Previous run with four records recorded for release CHEMBL_35."""
+    frame = pd.DataFrame(
+        {
+            "assay_chembl_id": ["CHEMBL1", "CHEMBL2", "CHEMBL3", "CHEMBL4"],
+            "hash_business_key": ["k1", "k2", "k3", "k4"],
+            "hash_row": ["r1", "r2", "r3", "r4"],
+        }
+    )
+    return PreviousRunOutput(
+        stem="assay_chembl_20240101",
+        dataset_path=Path("assay_chembl_20240101.csv"),
+        dataframe=frame,
+        metadata={"chembl_release": "CHEMBL_35"},
+    )
+
+
+@pytest.mark.unit
+class TestPlanIncrementalFetch:
+    """Test suite for plan_release_gated_fetch."""
+
+    def test_same_release_fetches_only_unknown_ids(
+        self, previous_output: PreviousRunOutput
+    ) -> None:
+        """Known IDs are carried over and IDs no longer requested are dropped."""
+        plan = plan_release_gated_fetch(
+            previous_output,
+            id_column="assay_chembl_id",
+            requested_ids=["CHEMBL1", "CHEMBL2", "CHEMBL9", "CHEMBL2"],
+            current_release="CHEMBL_35",
+        )
+
+        assert plan.release_unchanged is True
+        assert plan.fetch_ids == ["CHEMBL9"]
+        assert plan.carried_over["assay_chembl_id"].tolist() == ["CHEMBL1", "CHEMBL2"]
+
+    def test_release_change_refetches_requested_ids(
+        self, previous_output: PreviousRunOutput
+    ) -> None:
+        """After a release change nothing is carried over."""
+        plan = plan_release_gated_fetch(
+            previous_output,
+            id_column="assay_chembl_id",
+            requested_ids=["CHEMBL1", "CHEMBL9"],
+            current_release="CHEMBL_36",
+        )
+
+        assert plan.release_unchanged is False
+        assert plan.fetch_ids == ["CHEMBL1", "CHEMBL9"]
+        assert plan.carried_over.empty
+
+    def test_full_run(self, previous_output: PreviousRunOutput) -> None:
+        """Full runs reuse everything or re-read the whole source."""
+        unchanged = plan_release_gated_fetch(
+            previous_output,
+            id_column="assay_chembl_id",
+            requested_ids=None,
+            current_release="CHEMBL_35",
+        )
+        unknown_release = plan_release_gated_fetch(
+            previous_output,
+            id_column="assay_chembl_id",
+            requested_ids=None,
+            current_release=None,
+        )
+
+        assert unchanged.fetch_ids == []
+        assert len(unchanged.carried_over) == 4
+        assert unknown_release.fetch_ids is None
+        assert unknown_release.carried_over.empty
+
+
+@pytest.mark.unit
+class TestComputeChangeLog:
+    """Test suite for compute_change_log and summarise_change_log."""
+
+    def test_classifies_added_changed_and_removed_keys(self) -> None:
+        """Keys are classified by presence and by their row hashes."""
+        previous = pd.DataFrame(
+            {
+                "assay_chembl_id": ["CHEMBL1", "CHEMBL2", "CHEMBL3", "CHEMBL4"],
+                "hash_business_key": ["k1", "k2", "k3", "k4"],
+                "hash_row": ["r1", "r2", "r3", "r4"],
+            }
+        )
+        current = pd.DataFrame(
+            {
+                "assay_chembl_id": ["CHEMBL5", "CHEMBL3", "CHEMBL2", "CHEMBL1"],
+                "hash_business_key": ["k5", "k3", "k2", "k1"],
+                "hash_row": ["r5", "r3", "r2-new", "r1"],
+            }
+        )
+
+        change_log = compute_change_log(
+            previous,
+            current,
+            key_column="hash_business_key",
+            row_hash_column="hash_row",
+            id_column="assay_chembl_id",
+        )
+
+        assert change_log.columns.tolist() == ["change", "key", "assay_chembl_id"]
+        assert change_log.to_dict("records") == [
+            {"change": "added", "key": "k5", "assay_chembl_id": "CHEMBL5"},
+            {"change": "changed", "key": "k2", "assay_chembl_id": "CHEMBL2"},
+            {"change": "removed", "key": "k4", "assay_chembl_id": "CHEMBL4"},
+        ]
+        assert summarise_change_log(change_log, current_keys=4) == {
+            "added": 1,
+            "changed": 1,
+            "removed": 1,
+            "unchanged": 2,
+        }
+
+    def test_identical_datasets_produce_empty_log(self) -> None:
+        """Row order does not matter when nothing changed."""
+        frame = pd.DataFrame({"activity_id": [2, 1], "hash_row": ["b", "a"]})
+
+        change_log = compute_change_log(
+            frame,
+            frame.iloc[::-1],
+            key_column="activity_id",
+            row_hash_column="hash_row",
+            id_column="activity_id",
+        )
+
+        assert change_log.empty
+        assert change_log.columns.tolist() == ["change", "key"]
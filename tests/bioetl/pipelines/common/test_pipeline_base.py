@@ -7,10 +7,24 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import pandas as pd
+import pandera as pa
 import pytest
+import yaml
 
 from bioetl.config import PipelineConfig
+from bioetl.core.enrichment import EnrichmentStage
 from bioetl.pipelines.base import PipelineBase, RunArtifacts
+from bioetl.qc.incremental import IncrementalQCAccumulator
+
+POSITIONED_SCHEMA = pa.DataFrameSchema(
+    {
+        "id": pa.Column(int),
+        "value": pa.Column(int),
+        "row_index": pa.Column(pd.Int64Dtype()),
+        "hash_row": pa.Column(pd.StringDtype()),
+        "load_meta_id": pa.Column(pd.StringDtype()),
+    }
+)
 
 
 class TestPipeline(PipelineBase):
@@ -307,6 +321,120 @@ class TestPipelineBase:
         assert pipeline._validation_summary.get("schema_valid") is False  # type: ignore[reportPrivateUsage]
         assert "error" in pipeline._validation_summary  # type: ignore[reportPrivateUsage]
 
+    def test_validate_incremental_skips_rows_validated_before(
+        self,
+        pipeline_config_fixture: PipelineConfig,
+        run_id: str,
+        sample_activity_data: pd.DataFrame,
+        tmp_path: Path,
+    ) -> None:
+        """Rows whose hash_row passed the same schema version are not re-checked."""
+        pipeline_config_fixture.validation.schema_out = (
+            "bioetl.schemas.chembl_activity_schema:ActivitySchema"
+        )
+        pipeline_config_fixture.validation.incremental = True
+        pipeline_config_fixture.paths.cache_root = str(tmp_path / "cache")
+        pipeline_config_fixture.determinism.sort.by = ["activity_id"]
+        pipeline_config_fixture.determinism.sort.ascending = [True]
+        sample = sample_activity_data.copy()
+        # Только строки, проходящие схему без отката coerce, попадают в кэш.
+        for column in ("assay_tax_id", "record_id", "src_id"):
+            sample[column] = sample[column].fillna(1).astype("int64")
+
+        first = TestPipeline(config=pipeline_config_fixture, run_id=run_id)
+        baseline = first.validate(sample.copy())
+        first._cleanup_registered_clients()  # type: ignore[reportPrivateUsage]
+        assert first._validation_summary is not None  # type: ignore[reportPrivateUsage]
+        assert first._validation_summary["cached_rows"] == 0  # type: ignore[reportPrivateUsage]
+
+        second = TestPipeline(config=pipeline_config_fixture, run_id=run_id)
+        revalidated = second.validate(sample.copy())
+        assert second._validation_summary is not None  # type: ignore[reportPrivateUsage]
+        assert second._validation_summary["cached_rows"] == len(sample)  # type: ignore[reportPrivateUsage]
+        pd.testing.assert_frame_equal(
+            revalidated.drop(columns=["load_meta_id"], errors="ignore"),
+            baseline.drop(columns=["load_meta_id"], errors="ignore"),
+        )
+
+        changed = sample.copy()
+        changed.loc[changed.index[0], "standard_value"] = -1.0
+        second.config.cli.fail_on_schema_drift = False
+        second.validate(changed)
+        summary = second._validation_summary  # type: ignore[reportPrivateUsage]
+
+        assert summary is not None
+        assert summary["cached_rows"] == len(sample) - 1
+        assert summary["schema_valid"] is False
+        assert "error" in summary
+
+        # Проверки уникальности видят весь фрейм, даже если все строки в кэше.
+        second.validate(pd.concat([sample, sample.iloc[[0]]], ignore_index=True))
+        duplicated = second._validation_summary  # type: ignore[reportPrivateUsage]
+        second._cleanup_registered_clients()  # type: ignore[reportPrivateUsage]
+
+        assert duplicated is not None
+        assert duplicated["cached_rows"] == len(sample) + 1
+        assert duplicated["schema_valid"] is False
+
+    def test_validate_in_chunks_matches_single_pass(
+        self,
+        pipeline_config_fixture: PipelineConfig,
+        run_id: str,
+        sample_activity_data: pd.DataFrame,
+    ) -> None:
+        """validation.chunk_rows does not change the validated frame."""
+        pipeline_config_fixture.validation.schema_out = (
+            "bioetl.schemas.chembl_activity_schema:ActivitySchema"
+        )
+        pipeline_config_fixture.determinism.sort.by = ["activity_id"]
+        pipeline_config_fixture.determinism.sort.ascending = [True]
+
+        baseline = TestPipeline(config=pipeline_config_fixture, run_id=run_id).validate(
+            sample_activity_data.copy()
+        )
+        pipeline_config_fixture.validation.chunk_rows = 1
+        pipeline_config_fixture.validation.workers = 2
+        chunked = TestPipeline(config=pipeline_config_fixture, run_id=run_id).validate(
+            sample_activity_data.copy()
+        )
+
+        pd.testing.assert_frame_equal(
+            chunked.drop(columns=["load_meta_id"], errors="ignore"),
+            baseline.drop(columns=["load_meta_id"], errors="ignore"),
+        )
+
+    def test_execute_enrichment_stages_merges_waves(
+        self,
+        pipeline_config_fixture: PipelineConfig,
+        run_id: str,
+    ) -> None:
+        """Independent stages see the base frame; dependants see earlier waves."""
+        pipeline_config_fixture.runtime.parallelism = 4
+        pipeline = TestPipeline(config=pipeline_config_fixture, run_id=run_id)
+        df = pd.DataFrame({"id": [1, 2, 3]})
+        graph = [
+            EnrichmentStage(
+                "double", lambda frame: frame.assign(double=frame["id"] * 2), ("double",)
+            ),
+            EnrichmentStage(
+                "name", lambda frame: frame.assign(name=frame["id"].map(str)), ("name",)
+            ),
+            EnrichmentStage(
+                "total",
+                lambda frame: frame.assign(total=frame["id"] + frame["double"]),
+                ("total",),
+                depends_on=("double",),
+            ),
+        ]
+
+        enriched = pipeline.execute_enrichment_stages(df, graph=graph)
+        subset = pipeline.execute_enrichment_stages(df, stages=["name"], graph=graph)
+
+        assert list(enriched.columns) == ["id", "double", "name", "total"]
+        assert enriched["total"].tolist() == [3, 6, 9]
+        assert list(df.columns) == ["id"]
+        assert list(subset.columns) == ["id", "name"]
+
     def test_write(
         self,
         pipeline_config_fixture: PipelineConfig,
@@ -364,6 +492,25 @@ class TestPipelineBase:
         assert "validate" in result.stage_durations_ms
         assert "write" in result.stage_durations_ms
 
+    def test_run_with_profile_writes_profile_artifacts(
+        self, pipeline_config_fixture: PipelineConfig, run_id: str, tmp_output_dir: Path
+    ) -> None:
+        """``--profile`` lists pstats/collapsed/summary artifacts next to the dataset."""
+        pipeline_config_fixture.validation.schema_out = None
+        pipeline_config_fixture.cli.profiling = True
+        pipeline = TestPipeline(config=pipeline_config_fixture, run_id=run_id)
+
+        result = pipeline.run(Path(tmp_output_dir))
+
+        extras = result.write_result.extras
+        assert {"profile_stats", "profile_stacks", "profile_summary"} <= set(extras)
+        for key in ("profile_stats", "profile_stacks", "profile_summary"):
+            assert extras[key].exists()
+            assert extras[key].parent == result.write_result.dataset.parent
+        summary = yaml.safe_load(extras["profile_summary"].read_text(encoding="utf-8"))
+        assert {"extract", "transform", "validate", "write"} <= set(summary["stages"])
+        assert pipeline._profiler is None  # type: ignore[reportPrivateUsage]
+
     def test_cli_sample_application(
         self, pipeline_config_fixture: PipelineConfig, run_id: str
     ) -> None:
@@ -392,6 +539,156 @@ class TestPipelineBase:
         # The dataset name depends on the date tag, which is derived from config
         assert "activity_chembl_extended_" in result.write_result.dataset.name
 
+    def test_run_streaming_matches_in_memory_run(
+        self, pipeline_config_fixture: PipelineConfig, run_id: str, tmp_path: Path
+    ) -> None:
+        """Streaming mode writes the same dataset and QC as the in-memory run."""
+        pipeline_config_fixture.validation.schema_out = None
+        pipeline_config_fixture.determinism.sort.by = ["value", "id"]
+        pipeline_config_fixture.determinism.sort.ascending = [False, True]
+        pipeline_config_fixture.determinism.hashing.business_key_fields = ("id",)
+
+        class ShuffledPipeline(TestPipeline):
+            def extract(self, *args: object, **kwargs: object) -> pd.DataFrame:
+                ids = [(index * 7) % 23 for index in range(23)]
+                return pd.DataFrame({"id": ids, "value": [index % 5 for index in ids]})
+
+        in_memory = ShuffledPipeline(config=pipeline_config_fixture, run_id=run_id).run(
+            tmp_path / "memory", extended=True
+        )
+        streaming_config = pipeline_config_fixture.model_copy(deep=True)
+        streaming_config.runtime.streaming = True
+        streaming_config.runtime.chunk_rows = 4
+        streaming = ShuffledPipeline(config=streaming_config, run_id=run_id).run(
+            tmp_path / "streaming", extended=True
+        )
+
+        assert streaming.records == in_memory.records == 23
+        assert streaming.dataset_path.read_bytes() == in_memory.dataset_path.read_bytes()
+        assert streaming.write_result.quality_report is not None
+        assert in_memory.write_result.quality_report is not None
+        assert (
+            streaming.write_result.quality_report.read_bytes()
+            == in_memory.write_result.quality_report.read_bytes()
+        )
+        assert streaming.write_result.metadata is not None
+        metadata = yaml.safe_load(streaming.write_result.metadata.read_text())
+        assert metadata["row_count"] == 23
+        assert metadata["hashing"]["hash_business_key"]["unique"] == 23
+
+    def test_run_streaming_continues_row_positions(
+        self, pipeline_config_fixture: PipelineConfig, run_id: str, tmp_path: Path
+    ) -> None:
+        """Row indexes and synthesized load_meta_id values do not restart per chunk."""
+        pipeline_config_fixture.validation.schema_out = f"{__name__}:POSITIONED_SCHEMA"
+        pipeline_config_fixture.determinism.sort.by = ["id"]
+        pipeline_config_fixture.determinism.sort.ascending = [True]
+        pipeline_config_fixture.determinism.hashing.business_key_fields = ("id",)
+
+        class PositionedPipeline(TestPipeline):
+            def extract(self, *args: object, **kwargs: object) -> pd.DataFrame:
+                return pd.DataFrame({"id": list(range(10)), "value": [7] * 10})
+
+            def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+                return df.copy()
+
+        in_memory = PositionedPipeline(config=pipeline_config_fixture, run_id=run_id).run(
+            tmp_path / "memory"
+        )
+        expected = in_memory.dataset_path.read_bytes()
+        streaming_config = pipeline_config_fixture.model_copy(deep=True)
+        streaming_config.runtime.streaming = True
+        streaming_config.runtime.chunk_rows = 4
+        streaming = PositionedPipeline(config=streaming_config, run_id=run_id).run(
+            tmp_path / "streaming"
+        )
+
+        assert streaming.dataset_path.read_bytes() == expected
+        written = pd.read_csv(streaming.dataset_path)
+        assert written["row_index"].tolist() == list(range(10))
+        assert written["load_meta_id"].is_unique
+
+    def test_run_streaming_with_qc_override_needs_accumulator(
+        self, pipeline_config_fixture: PipelineConfig, run_id: str, tmp_output_dir: Path
+    ) -> None:
+        """A quality report override streams only together with ``build_qc_accumulator``."""
+        pipeline_config_fixture.validation.schema_out = None
+        pipeline_config_fixture.runtime.streaming = True
+        pipeline_config_fixture.runtime.chunk_rows = 2
+
+        class ReportPipeline(TestPipeline):
+            def build_quality_report(self, df: pd.DataFrame) -> pd.DataFrame:
+                return pd.DataFrame({"section": ["summary"], "rows": [len(df)]})
+
+        class AccumulatingPipeline(ReportPipeline):
+            def build_qc_accumulator(
+                self, spill_directory: Path, *, track_correlation: bool
+            ) -> IncrementalQCAccumulator:
+                return RowCountAccumulator(spill_directory, track_correlation=track_correlation)
+
+        class RowCountAccumulator(IncrementalQCAccumulator):
+            def quality_report(self) -> pd.DataFrame:
+                return pd.DataFrame({"section": ["summary"], "rows": [self.row_count]})
+
+        report_pipeline = ReportPipeline(config=pipeline_config_fixture, run_id=run_id)
+        accumulating = AccumulatingPipeline(config=pipeline_config_fixture, run_id=run_id)
+        log = MagicMock()
+
+        assert not report_pipeline._streaming_enabled(log)  # type: ignore[reportPrivateUsage]
+        assert accumulating._streaming_enabled(log)  # type: ignore[reportPrivateUsage]
+        result = accumulating.run(Path(tmp_output_dir))
+
+        assert result.records == 3
+        assert result.write_result.quality_report is not None
+        report = pd.read_csv(result.write_result.quality_report)
+        assert report["rows"].tolist() == [3]
+
+    def test_run_streaming_falls_back_with_cli_sample(
+        self, pipeline_config_fixture: PipelineConfig, run_id: str, tmp_output_dir: Path
+    ) -> None:
+        """Sampling needs the whole dataset, so streaming is disabled."""
+        pipeline_config_fixture.validation.schema_out = None
+        pipeline_config_fixture.runtime.streaming = True
+        pipeline_config_fixture.cli.sample = 2
+        pipeline = TestPipeline(config=pipeline_config_fixture, run_id=run_id)
+
+        result = pipeline.run(Path(tmp_output_dir))
+
+        assert result.records == 2
+        assert len(result.dataframe) == 2
+
+    def test_run_merges_previous_output_and_writes_change_log(
+        self, pipeline_config_fixture: PipelineConfig, run_id: str, tmp_output_dir: Path
+    ) -> None:
+        """Incremental hooks add carried-over rows and emit the change log."""
+        pipeline_config_fixture.validation.schema_out = None
+        pipeline_config_fixture.determinism.sort.by = ["id"]
+        pipeline_config_fixture.determinism.sort.ascending = [True]
+
+        class DeltaPipeline(TestPipeline):
+            def merge_previous_output(self, df: pd.DataFrame) -> pd.DataFrame:
+                carried = pd.DataFrame(
+                    {"id": [0], "value": [0], "value_doubled": [0], "activity_id": [0]}
+                )
+                return pd.concat([carried, df], ignore_index=True)
+
+            def build_change_log(self, df: pd.DataFrame) -> pd.DataFrame | None:
+                return pd.DataFrame({"change": ["added"], "key": [str(df["id"].max())]})
+
+        pipeline = DeltaPipeline(config=pipeline_config_fixture, run_id=run_id)
+
+        result = pipeline.run(Path(tmp_output_dir))
+
+        assert result.records == 4
+        assert result.dataframe["id"].tolist() == [0, 1, 2, 3]
+        change_log_path = result.write_result.extras["change_log"]
+        assert change_log_path.name == f"{result.dataset_path.stem}_changes.csv"
+        assert result.additional_datasets["change_log"] == change_log_path
+        assert pd.read_csv(change_log_path).to_dict("records") == [
+            {"change": "added", "key": 3}
+        ]
+        assert pipeline.list_run_stems(Path(tmp_output_dir)) == [result.dataset_path.stem]
+
     def test_run_error_handling(
         self, pipeline_config_fixture: PipelineConfig, run_id: str, tmp_output_dir: Path
     ) -> None:
@@ -0,0 +1,96 @@
+"""Unit tests for the protein classification index of the target pipeline."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from bioetl.pipelines.chembl.target.protein_classification import (
+    ProteinClassificationIndex,
+    load_protein_classification_index,
+)
+
+_LISTINGS: dict[str, list[dict[str, Any]]] = {
+    "/protein_classification.json": [
+        {"protein_class_id": 0, "parent_id": None, "pref_name": "Protein class", "class_level": 0},
+        {"protein_class_id": 1, "parent_id": 0, "pref_name": "Enzyme", "class_level": 1},
+        {"protein_class_id": 2, "parent_id": 1, "pref_name": "Kinase", "class_level": 2},
+        {"protein_class_id": 3, "parent_id": 1, "pref_name": "Protease", "class_level": 2},
+    ],
+    "/protein_family_classification.json": [
+        {"protein_class_id": 2, "l1": "Enzyme", "l2": "Kinase", "l3": None},
+    ],
+    "/component_class.json": [
+        {"component_id": 10, "protein_class_id": 2},
+        {"component_id": 10, "protein_class_id": 1},
+        {"component_id": 11, "protein_class_id": 3},
+    ],
+    "/component_sequence.json": [
+        {"component_id": 10, "component_type": "PROTEIN"},
+        {"component_id": 12, "component_type": "DNA"},
+    ],
+}
+
+
+class _ListingClient:
+    def __init__(self) -> None:
+        self.endpoints: list[str] = []
+
+    def paginate(
+        self,
+        endpoint: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int = 200,
+        items_key: str | None = None,
+    ) -> Iterator[Mapping[str, Any]]:
+        self.endpoints.append(endpoint)
+        return iter(_LISTINGS[endpoint])
+
+
+@pytest.mark.unit
+class TestProteinClassificationIndex:
+    """Test suite for ProteinClassificationIndex."""
+
+    def test_download_reads_each_listing_once(self) -> None:
+        client = _ListingClient()
+
+        index = ProteinClassificationIndex.download(client)
+
+        assert sorted(client.endpoints) == sorted(_LISTINGS)
+        assert index.component_classes["10"] == ("1", "2")
+        assert index.classes["2"]["path"] == ["Enzyme", "Kinase"]
+        # Без строки protein_family_classification путь строится по parent_id.
+        assert index.classes["3"]["path"] == ["Enzyme", "Protease"]
+
+    def test_classes_for_components_sorted_by_level(self) -> None:
+        index = ProteinClassificationIndex.download(_ListingClient())
+
+        classes = index.classes_for_components(["10", "11", "99"])
+
+        assert [item["protein_class_id"] for item in classes] == ["1", "2", "3"]
+        assert classes[0]["path"] == ["Enzyme"]
+
+    def test_is_protein_component_prefers_declared_type(self) -> None:
+        index = ProteinClassificationIndex.download(_ListingClient())
+
+        assert index.is_protein_component("10")
+        assert not index.is_protein_component("12")
+        assert not index.is_protein_component("13")
+        assert index.is_protein_component("12", "protein")
+
+    def test_load_stores_index_and_reuses_it(self, tmp_path: Path) -> None:
+        path = tmp_path / "ChEMBL_36" / "protein_classification.json"
+        first_client = _ListingClient()
+        second_client = _ListingClient()
+
+        first = load_protein_classification_index(first_client, path)
+        second = load_protein_classification_index(second_client, path)
+
+        assert path.exists()
+        assert len(first_client.endpoints) == 4
+        assert second_client.endpoints == []
+        assert second == first
@@ -319,3 +319,65 @@ class TestChemblTargetPipeline:
         # Data should not be overwritten
         assert result["protein_class_list"].iloc[0] == '[{"protein_class_id": "1"}]'
         assert result["protein_class_top"].iloc[0] == '{"protein_class_id": "1"}'
+
+    def test_enrich_protein_classifications_batches_components_and_memoises(
+        self,
+        pipeline_config_fixture: PipelineConfig,
+        run_id: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Components are fetched in one batch; classification listings are read once."""
+        pipeline = ChemblTargetPipeline(config=pipeline_config_fixture, run_id=run_id)  # type: ignore[reportAbstractUsage]
+
+        df = pd.DataFrame({"target_chembl_id": ["CHEMBL1", "CHEMBL2"]})
+        calls: list[tuple[str, dict[str, Any]]] = []
+        responses: dict[str, list[dict[str, Any]]] = {
+            "/target_component.json": [
+                {"target_chembl_id": "CHEMBL1", "component_id": 7, "accession": "P1"},
+                {"target_chembl_id": "CHEMBL2", "component_id": 7, "accession": "P1"},
+            ],
+            "/component_sequence.json": [{"component_id": 7, "component_type": "PROTEIN"}],
+            "/component_class.json": [{"component_id": 7, "protein_class_id": 3}],
+            "/protein_classification.json": [
+                {"protein_class_id": 3, "pref_name": "Kinase", "class_level": 2}
+            ],
+            "/protein_family_classification.json": [
+                {"protein_class_id": 3, "l1": "Enzyme", "l2": "Kinase"}
+            ],
+        }
+
+        class _StubChemblClient:
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                return None
+
+            def paginate(
+                self, endpoint: str, *, params: dict[str, Any], **__: Any
+            ) -> Iterator[dict[str, Any]]:
+                calls.append((endpoint, dict(params)))
+                return iter(responses[endpoint])
+
+        monkeypatch.setattr("bioetl.pipelines.target.target.ChemblClient", _StubChemblClient)
+
+        from bioetl.core.logger import UnifiedLogger
+
+        log = UnifiedLogger.get(__name__)
+        result = pipeline._enrich_protein_classifications(
+            df, log
+        )  # noqa: SLF001  # type: ignore[arg-type]
+
+        endpoints = [endpoint for endpoint, _ in calls]
+        assert endpoints.count("/target_component.json") == 1
+        assert endpoints.count("/component_class.json") == 1
+        assert endpoints.count("/protein_classification.json") == 1
+        component_params = next(p for e, p in calls if e == "/target_component.json")
+        assert sorted(component_params["target_chembl_id__in"].split(",")) == [
+            "CHEMBL1",
+            "CHEMBL2",
+        ]
+        assert result["protein_class_list"].iloc[0] == result["protein_class_list"].iloc[1]
+        assert '"path": ["Enzyme", "Kinase"]' in result["protein_class_list"].iloc[0]
+
+        # Component enrichment reuses the memoised /target_component batch
+        calls.clear()
+        pipeline._enrich_target_components(df, log)  # noqa: SLF001  # type: ignore[arg-type]
+        assert calls == []
@@ -0,0 +1,83 @@
+"""Unit tests for incremental QC statistics."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from bioetl.core.streaming import iter_frame_chunks
+from bioetl.qc.incremental import IncrementalQCAccumulator
+from bioetl.qc.report import (
+    build_correlation_report,
+    build_qc_metrics_payload,
+    build_quality_report,
+)
+
+
+@pytest.fixture
+def qc_frame() -> pd.DataFrame:
+    """Frame with duplicates, gaps, units, relations and numeric columns."""
+
+    rng = np.random.default_rng(3)
+    size = 40
+    value = rng.normal(100.0, 25.0, size=size)
+    value[::7] = np.nan
+    return pd.DataFrame(
+        {
+            "id": [index % 31 for index in range(size)],
+            "value": value,
+            "score": value * 0.5 + rng.normal(0.0, 1.0, size=size),
+            "standard_units": rng.choice(["nM", "uM", None], size=size),
+            "standard_relation": rng.choice(["=", "<", ">"], size=size),
+        }
+    )
+
+
+@pytest.mark.unit
+class TestIncrementalQCAccumulator:
+    """Test suite for IncrementalQCAccumulator."""
+
+    def test_matches_in_memory_reports(self, qc_frame: pd.DataFrame, tmp_path: Path) -> None:
+        accumulator = IncrementalQCAccumulator(tmp_path, business_key_fields=["id"])
+        for chunk in iter_frame_chunks(qc_frame, 9):
+            accumulator.update(chunk)
+
+        expected_quality = build_quality_report(qc_frame, business_key_fields=["id"])
+        expected_quality = expected_quality[expected_quality["section"] != "outliers"]
+        assert_frame_equal(
+            accumulator.quality_report().reset_index(drop=True),
+            expected_quality.reset_index(drop=True),
+            check_dtype=False,
+        )
+
+        expected_metrics = dict(build_qc_metrics_payload(qc_frame, business_key_fields=["id"]))
+        metrics = dict(accumulator.qc_metrics_payload())
+        expected_metrics["iqr_outliers"] = {}
+        assert metrics == expected_metrics
+
+        correlation = accumulator.correlation_report()
+        expected_correlation = build_correlation_report(qc_frame)
+        assert correlation is not None and expected_correlation is not None
+        assert_frame_equal(correlation, expected_correlation, atol=1e-9)
+
+    def test_duplicate_rows_without_business_key(self, tmp_path: Path) -> None:
+        accumulator = IncrementalQCAccumulator(tmp_path)
+        accumulator.update(pd.DataFrame({"id": [1, 2], "value": ["a", "b"]}))
+        accumulator.update(pd.DataFrame({"id": [2, 3], "value": ["b", "c"]}))
+
+        stats = accumulator.duplicate_stats()
+
+        assert stats["row_count"] == 4
+        assert stats["duplicate_count"] == 1
+        assert stats["deduplicated_count"] == 3
+
+    def test_correlation_tracking_disabled(self, qc_frame: pd.DataFrame, tmp_path: Path) -> None:
+        accumulator = IncrementalQCAccumulator(tmp_path, track_correlation=False)
+        accumulator.update(qc_frame)
+
+        assert accumulator.correlation_report() is None
+        assert accumulator.row_count == len(qc_frame)
@@ -137,6 +137,25 @@ def test_schema_registry_dynamic_import(monkeypatch: pytest.MonkeyPatch) -> None
     assert entry.column_order == ("id", "value")
 
 
+def test_schema_registry_declared_schema_loads_on_first_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = ModuleType("tests.schemas.declared_module")
+    module.DeclaredSchema = _build_simple_schema()
+    module.SCHEMA_VERSION = "2.0.0"
+    module.COLUMN_ORDER = ("id", "value")
+
+    registry = SchemaRegistry()
+    registry.declare("pkg.declared.Schema", module_path=module.__name__, schema_attr="DeclaredSchema")
+    with pytest.raises(ValueError, match="already registered"):
+        registry.declare("pkg.declared.Schema", module_path=module.__name__, schema_attr="X")
+
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    entry = registry.as_mapping()["pkg.declared.Schema"]
+    assert entry.version == "2.0.0"
+    assert registry.get("pkg.declared.Schema") is entry
+
+
 def test_split_identifier_errors() -> None:
     with pytest.raises(ValueError):
         _split_identifier("invalid")
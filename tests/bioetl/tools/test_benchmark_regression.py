@@ -0,0 +1,121 @@
+"""Тесты для `bioetl.tools.benchmark_regression`."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+import bioetl.tools.benchmark_regression as benchmark_regression
+from bioetl.cli.tools import benchmark_regression as benchmark_regression_cli
+
+
+def _write_results(path: Path, medians: dict[str, float]) -> Path:
+    payload = {
+        "benchmarks": [
+            {
+                "name": name.split("::")[-1],
+                "fullname": name,
+                "stats": {"median": value, "min": value},
+            }
+            for name, value in medians.items()
+        ]
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+@pytest.mark.unit
+def test_compare_benchmarks_flags_slowdowns_beyond_threshold() -> None:
+    """Замедление сверх порога — регрессия, новые бенчмарки не сравниваются."""
+
+    comparisons = benchmark_regression.compare_benchmarks(
+        {"a": 1.0, "b": 1.0},
+        {"a": 1.1, "b": 1.5, "c": 9.0},
+        threshold=0.2,
+    )
+
+    assert [(item.name, item.regressed) for item in comparisons] == [("a", False), ("b", True)]
+    assert comparisons[1].ratio == pytest.approx(1.5)
+
+
+@pytest.mark.unit
+def test_load_benchmark_stats_rejects_unknown_statistic(tmp_path: Path) -> None:
+    """Отсутствующая статистика приводит к понятной ошибке."""
+
+    path = _write_results(tmp_path / "results.json", {"t.py::test_a": 0.5})
+
+    assert benchmark_regression.load_benchmark_stats(path) == {"t.py::test_a": 0.5}
+    with pytest.raises(KeyError):
+        benchmark_regression.load_benchmark_stats(path, stat="p99")
+
+
+@pytest.mark.unit
+def test_check_saves_missing_baseline_then_detects_regression(tmp_path: Path) -> None:
+    """Первый прогон создаёт baseline, следующий сравнивается с ним."""
+
+    baseline = tmp_path / "benchmarks" / "baseline.json"
+    first = _write_results(tmp_path / "first.json", {"t.py::test_a": 1.0, "t.py::test_b": 2.0})
+    second = _write_results(tmp_path / "second.json", {"t.py::test_a": 1.5, "t.py::test_b": 2.0})
+
+    initial = benchmark_regression.check_benchmark_regressions(
+        baseline_path=baseline, results_path=first
+    )
+    report = benchmark_regression.check_benchmark_regressions(
+        baseline_path=baseline, results_path=second, threshold=0.25
+    )
+
+    assert initial.baseline_saved is True
+    assert initial.regressions == ()
+    assert baseline.exists()
+    assert report.baseline_saved is False
+    assert [item.name for item in report.regressions] == ["t.py::test_a"]
+
+
+@pytest.mark.unit
+def test_check_runs_benchmarks_when_results_missing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Без готовых результатов запускается pytest, JSON кладётся рядом с baseline."""
+
+    calls: list[tuple[Path, str | None]] = []
+
+    def fake_run(output_json: Path, *, rows: str | None = None) -> int:
+        calls.append((output_json, rows))
+        _write_results(output_json, {"t.py::test_a": 1.0})
+        return 0
+
+    monkeypatch.setattr(benchmark_regression, "run_benchmarks", fake_run)
+    baseline = tmp_path / "baseline.json"
+
+    report = benchmark_regression.check_benchmark_regressions(
+        baseline_path=baseline, rows="10k,100k"
+    )
+
+    assert calls == [(tmp_path / "latest.json", "10k,100k")]
+    assert report.results_path == tmp_path / "latest.json"
+    assert report.baseline_saved is True
+
+
+@pytest.mark.unit
+def test_cli_exit_code_reflects_regressions(tmp_path: Path) -> None:
+    """CLI возвращает 1 при регрессии и 0 в пределах порога."""
+
+    runner = CliRunner()
+    baseline = _write_results(tmp_path / "baseline.json", {"t.py::test_a": 1.0})
+    slower = _write_results(tmp_path / "slower.json", {"t.py::test_a": 1.3})
+
+    failed = runner.invoke(
+        benchmark_regression_cli.app,
+        ["--baseline", str(baseline), "--results", str(slower), "--threshold", "0.2"],
+    )
+    passed = runner.invoke(
+        benchmark_regression_cli.app,
+        ["--baseline", str(baseline), "--results", str(slower), "--threshold", "0.5"],
+    )
+
+    assert failed.exit_code == 1
+    assert "t.py::test_a" in failed.stdout
+    assert passed.exit_code == 0
@@ -83,3 +83,27 @@ def test_check_output_artifacts_passes_when_clean(
     assert errors == []
     assert facade.logger.records[-1][0] == "info"
 
+
+
+def test_check_output_artifacts_sums_partitioned_parquet(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo_root = tmp_path / "repo"
+    dataset_dir = repo_root / "data" / "output" / "_activity" / "activity.parquet"
+    for index in range(3):
+        partition = dataset_dir / f"assay_chembl_id=CHEMBL{index}"
+        partition.mkdir(parents=True)
+        (partition / "part-00000.parquet").write_bytes(b"0" * 4)
+
+    facade = LoggerFacade()
+    monkeypatch.setattr("bioetl.tools.check_output_artifacts.UnifiedLogger", facade)
+    monkeypatch.setattr("bioetl.tools.check_output_artifacts.get_project_root", lambda: repo_root)
+    monkeypatch.setattr("bioetl.tools.check_output_artifacts._git_ls_files", lambda path: [])
+    monkeypatch.setattr("bioetl.tools.check_output_artifacts._git_diff_cached", lambda path: [])
+
+    errors = check_output_artifacts(max_bytes=10)
+
+    assert len(errors) == 1
+    assert "activity.parquet (0.00 MB)" in errors[0]
+    assert "part-00000" not in errors[0]
@@ -120,3 +120,33 @@ def test_run_determinism_check_success(
     assert result.run2_exit_code == 0
     assert result.differences == ()
 
+
+
+@pytest.mark.unit
+def test_compare_dataset_outputs_handles_csv_and_parquet(tmp_path: Path) -> None:
+    """CSV сравнивается побайтно, Parquet — по схеме и содержимому."""
+
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    run1 = tmp_path / "run1"
+    run2 = tmp_path / "run2"
+    for run_dir in (run1, run2):
+        (run_dir / "data.parquet" / "year=2020").mkdir(parents=True)
+        (run_dir / "report.csv").write_text("a\n1\n", encoding="utf-8")
+    pd.DataFrame({"id": [1, 2]}).to_parquet(run1 / "data.parquet" / "year=2020" / "part-00000.parquet")
+    pd.DataFrame({"id": [1, 2]}).to_parquet(run2 / "data.parquet" / "year=2020" / "part-00000.parquet")
+
+    assert determinism_check.compare_dataset_outputs(run1, run2) == []
+
+    pd.DataFrame({"id": [2, 1]}).to_parquet(run2 / "data.parquet" / "year=2020" / "part-00000.parquet")
+    (run2 / "report.csv").write_text("a\n2\n", encoding="utf-8")
+    (run2 / "extra.csv").write_text("a\n", encoding="utf-8")
+
+    differences = determinism_check.compare_dataset_outputs(run1, run2)
+
+    assert differences == [
+        "Dataset extra.csv: only present in run2",
+        "Dataset data.parquet/year=2020/part-00000.parquet: content mismatch",
+        "Dataset report.csv: content mismatch",
+    ]
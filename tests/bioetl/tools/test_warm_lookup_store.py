@@ -0,0 +1,83 @@
+"""Tests for prefilling the release-scoped lookup store."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+
+from bioetl.clients.entities.client_data_validity import ChemblDataValidityEntityClient
+from bioetl.core.lookup_store import LookupStore
+from bioetl.tools.warm_lookup_store import LookupWarmError, warm_lookup_store
+
+if TYPE_CHECKING:
+    from bioetl.clients.client_chembl_common import ChemblClient
+
+
+class _FakeChemblClient:
+    """Serves fixed listings and records every paginate call."""
+
+    def __init__(self, release: str, lookup_store: LookupStore | None = None) -> None:
+        self.chembl_release = release
+        self.lookup_store = lookup_store
+        self.record_cache = None
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def handshake(self) -> Mapping[str, Any]:
+        return {"chembl_db_version": self.chembl_release}
+
+    def paginate(
+        self,
+        endpoint: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        page_size: int = 200,
+        items_key: str | None = None,
+    ) -> Iterator[Mapping[str, Any]]:
+        self.calls.append((endpoint, dict(params or {})))
+        if endpoint == "/data_validity_lookup.json":
+            yield {"data_validity_comment": "Outside typical range", "description": "d1"}
+            yield {"data_validity_comment": "Potential missing data", "description": "d2"}
+
+
+@pytest.mark.unit
+class TestWarmLookupStore:
+    """Test suite for warm_lookup_store."""
+
+    def test_prefilled_lookup_serves_entity_fetches(self, tmp_path: Path) -> None:
+        with LookupStore(tmp_path) as store:
+            warm_client = _FakeChemblClient("ChEMBL_36")
+            written = warm_lookup_store(
+                cast("ChemblClient", warm_client),
+                store,
+                release="ChEMBL_36",
+                entities=["data_validity_lookup"],
+            )
+
+            pipeline_client = _FakeChemblClient("ChEMBL_36", lookup_store=store)
+            fetched = ChemblDataValidityEntityClient(pipeline_client).fetch_by_ids(
+                ["Outside typical range"], ["data_validity_comment"]
+            )
+
+        assert written == {"data_validity_lookup": 2}
+        assert pipeline_client.calls == []
+        assert fetched == {
+            "Outside typical range": {"data_validity_comment": "Outside typical range"}
+        }
+
+    def test_release_mismatch_is_rejected(self, tmp_path: Path) -> None:
+        with LookupStore(tmp_path) as store, pytest.raises(LookupWarmError, match="ChEMBL_35"):
+            warm_lookup_store(
+                cast("ChemblClient", _FakeChemblClient("ChEMBL_36")), store, release="ChEMBL_35"
+            )
+
+    def test_unknown_lookup_is_rejected(self, tmp_path: Path) -> None:
+        with LookupStore(tmp_path) as store, pytest.raises(LookupWarmError, match="molecule"):
+            warm_lookup_store(
+                cast("ChemblClient", _FakeChemblClient("ChEMBL_36")),
+                store,
+                release="ChEMBL_36",
+                entities=["molecule"],
+            )